@@ -9,6 +9,8 @@ Usage:
     python -m agent_logic.cli --help
     python -m agent_logic.cli validate path/to/proof.json
     python -m agent_logic.cli --log-level DEBUG validate path/to/proof.json
+    python -m agent_logic.cli convert path/to/proof.json out.json --layout dag
+    python -m agent_logic.cli validate path/to/corpus.algs --id 42
 """
 
 import argparse
@@ -17,6 +19,7 @@ import logging
 import sys
 
 from agent_logic.proofs.proof_system import Proof
+from agent_logic.serialization.proof_store import ProofStore
 from agent_logic.utils.logger import set_global_log_level
 
 
@@ -47,7 +50,29 @@ def parse_args():
 
     # Validate proof command
     validate_parser = subparsers.add_parser("validate", help="Validate a proof")
-    validate_parser.add_argument("proof_file", type=str, help="Path to proof JSON file")
+    validate_parser.add_argument(
+        "proof_file", type=str, help="Path to proof JSON file or proof store"
+    )
+    validate_parser.add_argument(
+        "--id",
+        dest="proof_ids",
+        type=int,
+        action="append",
+        help="Proof id to validate when reading a proof store (repeatable; default: all)",
+    )
+
+    # Convert proof command
+    convert_parser = subparsers.add_parser(
+        "convert", help="Rewrite a proof JSON file in another layout"
+    )
+    convert_parser.add_argument("proof_file", type=str, help="Path to proof JSON file")
+    convert_parser.add_argument("output_file", type=str, help="Path of the file to write")
+    convert_parser.add_argument(
+        "--layout",
+        choices=["tree", "dag"],
+        default="dag",
+        help="tree: one nested expression per step; dag: shared node table",
+    )
 
     return parser.parse_args()
 
@@ -57,7 +82,8 @@ def validate_proof(proof_file, debug=False):
     Validate a proof from a JSON file.
 
     Loads a proof from a JSON file and checks if it is valid
-    according to the specified inference rules.
+    according to the specified inference rules. Proof store archives
+    are recognized by their header and validated with ``validate_store``.
 
     Args:
         proof_file: Path to the JSON file containing the proof.
@@ -65,12 +91,11 @@ def validate_proof(proof_file, debug=False):
 
     Returns:
         Exit code (0 for success, 1 for invalid proof, 2 for errors).
-
-    Raises:
-        FileNotFoundError: If the proof file doesn't exist.
-        json.JSONDecodeError: If the file contains invalid JSON.
     """
     try:
+        if ProofStore.is_store(proof_file):
+            return validate_store(proof_file, debug=debug)
+
         with open(proof_file, "r") as f:
             data = json.load(f)
 
@@ -94,6 +119,68 @@ def validate_proof(proof_file, debug=False):
         return 2
 
 
+def validate_store(store_file, proof_ids=None, debug=False):
+    """
+    Validate proofs held in a proof store.
+
+    Proofs are fetched one at a time from the memory-mapped store, so
+    archives larger than memory can be checked.
+
+    Args:
+        store_file: Path to the proof store data file.
+        proof_ids: Ids of the proofs to check; all proofs when None.
+        debug: Whether to enable debug mode in the proof validation.
+
+    Returns:
+        Exit code (0 if every proof is valid, 1 if any is invalid, 2 for errors).
+    """
+    try:
+        with ProofStore(store_file) as store:
+            ids = range(len(store)) if proof_ids is None else proof_ids
+            invalid = []
+            for proof_id in ids:
+                proof = store.get(proof_id)
+                proof.debug = debug
+                if not proof.is_valid():
+                    invalid.append(proof_id)
+                    print(f"❌ Proof {proof_id} is invalid")
+
+        if invalid:
+            print(f"❌ {len(invalid)} of {len(ids)} proofs are invalid")
+            return 1
+        print(f"✅ All {len(ids)} proofs are valid")
+        return 0
+    except Exception as e:
+        print(f"Error validating proof store: {e}")
+        return 2
+
+
+def convert_proof(proof_file, output_file, layout="dag"):
+    """
+    Convert a proof JSON file between the tree and shared DAG layouts.
+
+    Args:
+        proof_file: Path to the JSON file containing the proof (either layout).
+        output_file: Path of the JSON file to write.
+        layout: "tree" for nested statements, "dag" for a shared node table.
+
+    Returns:
+        Exit code (0 for success, 2 for errors).
+    """
+    try:
+        with open(proof_file, "r") as f:
+            proof = Proof.from_dict(json.load(f))
+
+        with open(output_file, "w") as f:
+            json.dump(proof.to_dict(shared=layout == "dag"), f)
+
+        print(f"✅ Wrote {len(proof.steps)} steps to {output_file}")
+        return 0
+    except Exception as e:
+        print(f"Error converting proof: {e}")
+        return 2
+
+
 def main():
     """
     Main entry point for the CLI.
@@ -111,7 +198,11 @@ def main():
     set_global_log_level(log_level)
 
     if args.command == "validate":
+        if args.proof_ids:
+            return validate_store(args.proof_file, proof_ids=args.proof_ids, debug=args.debug)
         return validate_proof(args.proof_file, debug=args.debug)
+    elif args.command == "convert":
+        return convert_proof(args.proof_file, args.output_file, layout=args.layout)
     else:
         print("Please specify a command. Use --help for more information.")
         return 1
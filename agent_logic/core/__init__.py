@@ -9,20 +9,28 @@ Classes:
     Proposition: A basic propositional variable
     Not: Logical negation operation
     BinaryOp: Base class for binary logical operations (And, Or, Implies, etc.)
+    NaryOp: Flat n-ary conjunctions and disjunctions (AndN, OrN)
     Quantifier: Base class for quantified expressions
     Predicate: Representation of predicate expressions
     Function: Representation of function terms
+    ExpressionFactory: Hash-consing builder for shared expression nodes
 """
 
 from agent_logic.core.base import LogicalExpression
+from agent_logic.core.factory import ExpressionBuilder, ExpressionFactory
 from agent_logic.core.functions import Function
 from agent_logic.core.operations import (
     And,
+    AndN,
     BinaryOp,
     Iff,
     Implies,
+    NaryOp,
+    Nand,
+    Nor,
     Not,
     Or,
+    OrN,
     Proposition,
     Xor,
 )
@@ -32,6 +40,9 @@ from agent_logic.core.quantifiers import Exists, ForAll, Quantifier
 __all__ = [
     # Base classes
     "LogicalExpression",
+    # Construction
+    "ExpressionBuilder",
+    "ExpressionFactory",
     # Propositional logic
     "Proposition",
     "Not",
@@ -41,6 +52,11 @@ __all__ = [
     "Implies",
     "Iff",
     "Xor",
+    "Nand",
+    "Nor",
+    "NaryOp",
+    "AndN",
+    "OrN",
     # Predicate logic
     "Quantifier",
     "ForAll",
@@ -8,10 +8,47 @@ including evaluation, variable extraction, and serialization.
 
 from __future__ import annotations
 
-from typing import Dict, List
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
 
 from pydantic import BaseModel
 
+# Slot setters used to build instances without running validation.
+_set_dict = BaseModel.__dict__["__dict__"].__set__
+_set_fields_set = BaseModel.__dict__["__pydantic_fields_set__"].__set__
+_set_extra = BaseModel.__dict__["__pydantic_extra__"].__set__
+_set_private = BaseModel.__dict__["__pydantic_private__"].__set__
+
+# Serialization registry: "type" tag -> class, and tag -> trusted decoder.
+# A trusted decoder receives the node's dictionary and a callable decoding
+# child dictionaries, and builds the node without validation.
+TrustedDecoder = Callable[[Dict, Callable[[Dict], Any]], Any]
+_TYPE_REGISTRY: Dict[str, type] = {}
+_TRUSTED_DECODERS: Dict[str, TrustedDecoder] = {}
+
+
+def construct_unchecked(cls: type, fields: Dict) -> Any:
+    """
+    Creates a pydantic model instance from field values that are known to be valid.
+
+    Args:
+        cls: The model class.
+        fields: Complete mapping of field names to values; it is adopted
+                as the instance ``__dict__`` without copying.
+
+    Returns:
+        The new instance.
+    """
+    instance = object.__new__(cls)
+    _set_dict(instance, fields)
+    _set_fields_set(instance, set(fields))
+    _set_extra(instance, None)
+    _set_private(instance, None)
+    return instance
+
+
+def _decode_trusted(data: Dict) -> Any:
+    return _TRUSTED_DECODERS[data["type"]](data, _decode_trusted)
+
 
 class LogicalExpression(BaseModel):
     """
@@ -26,6 +63,56 @@ class LogicalExpression(BaseModel):
 
     model_config = {"arbitrary_types_allowed": True}
 
+    def __setattr__(self, name: str, value) -> None:
+        # Drop derived data cached in the instance dict (e.g. fingerprints).
+        self.__dict__.pop("_fingerprint", None)
+        super().__setattr__(name, value)
+
+    def model_copy(self, *, update=None, deep: bool = False):
+        """Copies the model without carrying over cached derived data."""
+        copy = super().model_copy(update=update, deep=deep)
+        copy.__dict__.pop("_fingerprint", None)
+        return copy
+
+    @classmethod
+    def _from_fields(cls, fields: Dict) -> LogicalExpression:
+        """
+        Creates an instance from field values that are already known to be valid.
+
+        This skips pydantic validation entirely and is reserved for code that
+        builds nodes from trusted components (parsers, transformations).
+
+        Args:
+            fields: Complete mapping of field names to values; it is adopted
+                    as the instance ``__dict__`` without copying.
+
+        Returns:
+            The new instance.
+        """
+        return construct_unchecked(cls, fields)
+
+    @staticmethod
+    def register_type(
+        tag: str, expression_type: type, trusted_decoder: Optional[TrustedDecoder] = None
+    ) -> None:
+        """
+        Registers a serialized ``"type"`` tag for dictionary deserialization.
+
+        Args:
+            tag: Value of the ``"type"`` field identifying the node kind.
+            expression_type: Class whose ``from_dict`` handles validated input.
+            trusted_decoder: Optional builder used for trusted input; it receives
+                             the node dictionary and a function decoding children.
+        """
+        _TYPE_REGISTRY[tag] = expression_type
+        if trusted_decoder is not None:
+            _TRUSTED_DECODERS[tag] = trusted_decoder
+
+    @staticmethod
+    def trusted_decoder(tag: str) -> Optional[TrustedDecoder]:
+        """Returns the trusted decoder registered for a ``"type"`` tag, if any."""
+        return _TRUSTED_DECODERS.get(tag)
+
     def evaluate(self, context: Dict[str, bool]) -> bool:
         """
         Recursively evaluates the expression under a given truth assignment.
@@ -42,6 +129,31 @@ class LogicalExpression(BaseModel):
         """
         raise NotImplementedError
 
+    def partial_evaluate(self, assignment: Dict[str, bool]) -> Union[LogicalExpression, bool]:
+        """
+        Evaluates the expression under a partial truth assignment.
+
+        Known variables are replaced by their values and constants are folded
+        through the connectives, leaving a residual expression over the
+        unassigned variables only. Subtrees that contain no assigned variable
+        are returned as-is (not copied), and shared subtrees are processed once.
+        The result depends only on the expression and the assignment, so it can
+        be cached per (expression, assignment) pair.
+
+        Args:
+            assignment: Truth values for some of the variables.
+                       Example: {"P": True}
+
+        Returns:
+            True or False if the assignment decides the expression, otherwise
+            the residual expression.
+        """
+        return self._partial(assignment, {})
+
+    def _partial(self, assignment: Dict[str, bool], memo: Dict[int, Any]) -> Union[LogicalExpression, bool]:
+        """Partial evaluation step; node types without variables to fold return themselves."""
+        return self
+
     def variables(self) -> List[str]:
         """
         Recursively extracts all variables in the expression.
@@ -79,13 +191,18 @@ class LogicalExpression(BaseModel):
         raise NotImplementedError
 
     @classmethod
-    def from_dict(cls, data: Dict) -> LogicalExpression:
+    def from_dict(cls, data: Dict, trusted: bool = False) -> LogicalExpression:
         """
         Recursively reconstructs an expression from a dictionary.
 
+        The node class is looked up in the type registry by the ``"type"``
+        field. With ``trusted=True`` nodes are built without pydantic
+        validation; use it only for data this package serialized itself.
+
         Args:
             data: Dictionary representation of a logical expression.
                  Must include a 'type' field.
+            trusted: Skip validation for input known to be well formed.
 
         Returns:
             Reconstructed logical expression.
@@ -96,19 +213,50 @@ class LogicalExpression(BaseModel):
         """
         if not isinstance(data, dict):
             raise ValueError(f"Expected dictionary but got {type(data)}")
-
-        # Import here to avoid circular imports
-        from agent_logic.core.operations import BinaryOp, Not, Proposition
-
         if "type" not in data:
             raise ValueError(f"Missing 'type' in expression data: {data}")
 
-        exp_type = data["type"]
-        if exp_type == "Proposition":
-            return Proposition.from_dict(data)
-        elif exp_type == "Not":
-            return Not.from_dict(data)
-        elif exp_type == "BinaryOp":
-            return BinaryOp.from_dict(data)
-        else:
-            raise ValueError(f"Unknown expression type: {exp_type}")
+        if trusted:
+            try:
+                return _decode_trusted(data)
+            except (KeyError, TypeError) as e:
+                raise ValueError(f"Malformed trusted expression data: {e}") from None
+        expression_type = _TYPE_REGISTRY.get(data["type"])
+        if expression_type is None:
+            raise ValueError(f"Unknown expression type: {data['type']}")
+        return expression_type.from_dict(data)
+
+    @staticmethod
+    def from_dicts(items: Iterable[Dict], trusted: bool = False) -> List[LogicalExpression]:
+        """
+        Reconstructs many expressions at once.
+
+        Args:
+            items: Dictionary representations of expressions.
+            trusted: Skip validation for input known to be well formed.
+
+        Returns:
+            The reconstructed expressions, in order.
+
+        Raises:
+            ValueError: If any item is not a valid expression dictionary.
+        """
+        if not trusted:
+            return [LogicalExpression.from_dict(item) for item in items]
+        try:
+            return [_decode_trusted(item) for item in items]
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Malformed trusted expression data: {e}") from None
+
+    @staticmethod
+    def to_dicts(expressions: Iterable[LogicalExpression]) -> List[Dict]:
+        """
+        Serializes many expressions at once.
+
+        Args:
+            expressions: Expressions to convert.
+
+        Returns:
+            Their dictionary representations, in order.
+        """
+        return [expression.to_dict() for expression in expressions]
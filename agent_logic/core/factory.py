@@ -0,0 +1,185 @@
+"""
+Expression construction module.
+
+This module provides builders used by parsers and transformations to create
+expression nodes:
+- ExpressionBuilder: Creates a fresh node for every request
+- ExpressionFactory: Hash-conses nodes so structurally equal subexpressions
+  are represented by a single shared object
+
+Builders are used by parsers whose output is valid by construction, so
+nodes are created without re-running pydantic validation. Nodes returned by
+an ExpressionFactory are shared between every expression built through it
+and must therefore be treated as immutable.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Sequence
+
+from agent_logic.core.base import LogicalExpression
+from agent_logic.core.functions import Relation
+from agent_logic.core.operations import BinaryOp, NaryOp, Not, Proposition
+from agent_logic.core.quantifiers import ExistentialQuantifier, UniversalQuantifier
+
+
+class ExpressionBuilder:
+    """Creates expression nodes without sharing."""
+
+    def proposition(self, name: str) -> Proposition:
+        """Builds an atomic proposition."""
+        return Proposition._from_fields({"name": name})
+
+    def relation(self, name: str, parameters: List[str]) -> Relation:
+        """Builds a predicate relation R(x, y, ...)."""
+        return Relation._from_fields({"name": name, "parameters": list(parameters)})
+
+    def negation(self, operand: LogicalExpression) -> Not:
+        """Builds a negation."""
+        return Not._from_fields({"operand": operand})
+
+    def binary(
+        self, operator: str, left: LogicalExpression, right: LogicalExpression
+    ) -> BinaryOp:
+        """Builds a binary operation."""
+        return BinaryOp._from_fields({"left": left, "right": right, "operator": operator})
+
+    def nary(self, operator: str, operands: Sequence[LogicalExpression]) -> NaryOp:
+        """Builds an n-ary conjunction or disjunction."""
+        return NaryOp._from_fields({"operands": tuple(operands), "operator": operator})
+
+    def universal(self, variable: str, body) -> UniversalQuantifier:
+        """Builds a universally quantified formula."""
+        return UniversalQuantifier(variable=variable, predicate=body)
+
+    def existential(self, variable: str, body) -> ExistentialQuantifier:
+        """Builds an existentially quantified formula."""
+        return ExistentialQuantifier(variable=variable, predicate=body)
+
+
+class ExpressionFactory(ExpressionBuilder):
+    """
+    Hash-consing expression builder.
+
+    Every node is looked up in a unique table keyed by its operator and the
+    identities of its (already unique) children, so building the same
+    subexpression twice returns the same object and equality of factory-built
+    expressions reduces to identity.
+
+    Example:
+        >>> factory = ExpressionFactory()
+        >>> p = factory.proposition("P")
+        >>> factory.negation(p) is factory.negation(factory.proposition("P"))
+        True
+    """
+
+    def __init__(self):
+        self._table: Dict[tuple, object] = {}
+
+    def __len__(self) -> int:
+        """Returns the number of distinct nodes created so far."""
+        return len(self._table)
+
+    def proposition(self, name: str) -> Proposition:
+        key = ("Proposition", name)
+        node = self._table.get(key)
+        if node is None:
+            node = self._table[key] = ExpressionBuilder.proposition(self, name)
+        return node
+
+    def relation(self, name: str, parameters: List[str]) -> Relation:
+        key = ("Relation", name, tuple(parameters))
+        node = self._table.get(key)
+        if node is None:
+            node = self._table[key] = ExpressionBuilder.relation(self, name, parameters)
+        return node
+
+    def negation(self, operand: LogicalExpression) -> Not:
+        key = ("Not", id(operand))
+        node = self._table.get(key)
+        if node is None:
+            node = self._table[key] = ExpressionBuilder.negation(self, operand)
+        return node
+
+    def binary(
+        self, operator: str, left: LogicalExpression, right: LogicalExpression
+    ) -> BinaryOp:
+        key = (operator, id(left), id(right))
+        node = self._table.get(key)
+        if node is None:
+            node = self._table[key] = ExpressionBuilder.binary(self, operator, left, right)
+        return node
+
+    def nary(self, operator: str, operands: Sequence[LogicalExpression]) -> NaryOp:
+        key = ("NaryOp", operator) + tuple(id(operand) for operand in operands)
+        node = self._table.get(key)
+        if node is None:
+            node = self._table[key] = ExpressionBuilder.nary(self, operator, operands)
+        return node
+
+    def universal(self, variable: str, body) -> UniversalQuantifier:
+        key = ("FORALL", variable, id(body))
+        node = self._table.get(key)
+        if node is None:
+            node = self._table[key] = UniversalQuantifier(variable=variable, predicate=body)
+        return node
+
+    def existential(self, variable: str, body) -> ExistentialQuantifier:
+        key = ("EXISTS", variable, id(body))
+        node = self._table.get(key)
+        if node is None:
+            node = self._table[key] = ExistentialQuantifier(variable=variable, predicate=body)
+        return node
+
+    def intern(self, expression):
+        """
+        Rebuilds an existing expression from shared factory nodes.
+
+        Args:
+            expression: Any expression tree or DAG.
+
+        Returns:
+            The structurally equal expression built from this factory's nodes.
+
+        Raises:
+            ValueError: If the expression contains unsupported node types.
+        """
+        done: Dict[int, object] = {}
+        stack = [(expression, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if id(node) in done:
+                continue
+            if isinstance(node, Proposition):
+                done[id(node)] = self.proposition(node.name)
+            elif isinstance(node, Relation):
+                done[id(node)] = self.relation(node.name, node.parameters)
+            elif isinstance(node, Not):
+                if expanded:
+                    done[id(node)] = self.negation(done[id(node.operand)])
+                else:
+                    stack.extend(((node, True), (node.operand, False)))
+            elif isinstance(node, BinaryOp):
+                if expanded:
+                    done[id(node)] = self.binary(
+                        node.operator, done[id(node.left)], done[id(node.right)]
+                    )
+                else:
+                    stack.extend(((node, True), (node.right, False), (node.left, False)))
+            elif isinstance(node, NaryOp):
+                if expanded:
+                    done[id(node)] = self.nary(
+                        node.operator, [done[id(operand)] for operand in node.operands]
+                    )
+                else:
+                    stack.append((node, True))
+                    stack.extend((operand, False) for operand in reversed(node.operands))
+            elif isinstance(node, (UniversalQuantifier, ExistentialQuantifier)):
+                if expanded:
+                    build = self.universal if node.type == "FORALL" else self.existential
+                    done[id(node)] = build(node.variable, done[id(node.predicate)])
+                else:
+                    stack.extend(((node, True), (node.predicate, False)))
+            else:
+                raise ValueError(f"Cannot intern expression type: {type(node).__name__}")
+        return done[id(expression)]
@@ -4,7 +4,7 @@ from typing import Any, Callable, Dict, List
 
 from pydantic import BaseModel, Field
 
-from agent_logic.core.base import LogicalExpression
+from agent_logic.core.base import LogicalExpression, construct_unchecked
 
 
 class Function(BaseModel):
@@ -48,6 +48,10 @@ class Relation(LogicalExpression):
         key = f"{self.name}({', '.join(self.parameters)})"
         return context.get(key, False)
 
+    def _partial(self, assignment: Dict[str, bool], memo: Dict[int, Any]) -> Any:
+        key = f"{self.name}({', '.join(self.parameters)})"
+        return assignment.get(key, self)
+
     def variables(self) -> List[str]:
         return self.parameters
 
@@ -60,3 +64,13 @@ class Relation(LogicalExpression):
     @classmethod
     def from_dict(cls, data: Dict) -> Relation:
         return cls(name=data["name"], parameters=data["parameters"])
+
+
+LogicalExpression.register_type("Function", Function)
+LogicalExpression.register_type(
+    "Relation",
+    Relation,
+    lambda data, decode: construct_unchecked(
+        Relation, {"name": data["name"], "parameters": list(data["parameters"])}
+    ),
+)
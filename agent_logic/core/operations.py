@@ -4,16 +4,17 @@ Core logical operations module.
 This module implements the fundamental logical operations:
 - Proposition: Represents atomic propositions (variables)
 - Not: Represents logical negation (¬)
-- BinaryOp: Represents binary operations (AND, OR, IMPLIES, IFF)
+- BinaryOp: Represents binary operations (AND, OR, IMPLIES, IFF, XOR, NAND, NOR)
+- NaryOp: Represents flat conjunctions and disjunctions of any number of operands
 
 These classes form the building blocks of logical expressions and formulas.
 """
 
-from typing import Dict, List, Literal
+from typing import Any, Callable, Dict, Iterable, List, Literal, Tuple, Union
 
 from pydantic import Field
 
-from agent_logic.core.base import LogicalExpression
+from agent_logic.core.base import LogicalExpression, construct_unchecked
 
 
 class Proposition(LogicalExpression):
@@ -47,6 +48,9 @@ class Proposition(LogicalExpression):
             raise ValueError(f"No truth value provided for proposition {self.name}")
         return context[self.name]
 
+    def _partial(self, assignment: Dict[str, bool], memo: Dict[int, Any]) -> Union[LogicalExpression, bool]:
+        return assignment.get(self.name, self)
+
     def variables(self) -> List[str]:
         """
         Returns the list of variables in the proposition.
@@ -119,6 +123,14 @@ class Not(LogicalExpression):
         """
         return not self.operand.evaluate(context)
 
+    def _partial(self, assignment: Dict[str, bool], memo: Dict[int, Any]) -> Union[LogicalExpression, bool]:
+        result = memo.get(id(self))
+        if result is None:
+            operand = self.operand._partial(assignment, memo)
+            result = self if operand is self.operand else _negate(operand)
+            memo[id(self)] = result
+        return result
+
     def variables(self) -> List[str]:
         """
         Returns the list of variables in the NOT expression.
@@ -162,26 +174,40 @@ class Not(LogicalExpression):
         Raises:
             ValueError: If the data is invalid or contains an unknown operand type.
         """
-        if "operand" in data:
-            # Get the operand type from the operand data
-            if "type" in data["operand"]:
-                operand_type_name = data["operand"]["type"]
-                if operand_type_name == "Proposition":
-                    operand = Proposition.from_dict(data["operand"])
-                elif operand_type_name == "Not":
-                    operand = Not.from_dict(data["operand"])
-                elif operand_type_name == "BinaryOp":
-                    operand = BinaryOp.from_dict(data["operand"])
-                else:
-                    raise ValueError(f"Unknown operand type: {operand_type_name}")
-                return cls(operand=operand)
+        if isinstance(data.get("operand"), dict):
+            return cls(operand=LogicalExpression.from_dict(data["operand"]))
 
         raise ValueError("Invalid NOT expression data")
 
 
+# Binary operator truth functions on already evaluated operands.
+BINARY_TRUTH_FUNCTIONS: Dict[str, Callable[[bool, bool], bool]] = {
+    "AND": lambda left, right: left and right,
+    "OR": lambda left, right: left or right,
+    "IMPLIES": lambda left, right: not left or right,
+    "IFF": lambda left, right: left == right,
+    "XOR": lambda left, right: left != right,
+    "NAND": lambda left, right: not (left and right),
+    "NOR": lambda left, right: not (left or right),
+}
+
+# Binary operator dispatch: operator -> evaluator(left, right, context).
+# Each evaluator looks at the left operand first and only evaluates the right
+# operand when the left one does not decide the result.
+BINARY_EVALUATORS: Dict[str, Callable[[LogicalExpression, LogicalExpression, Dict[str, bool]], bool]] = {
+    "AND": lambda left, right, context: left.evaluate(context) and right.evaluate(context),
+    "OR": lambda left, right, context: left.evaluate(context) or right.evaluate(context),
+    "IMPLIES": lambda left, right, context: not left.evaluate(context) or right.evaluate(context),
+    "IFF": lambda left, right, context: left.evaluate(context) == right.evaluate(context),
+    "XOR": lambda left, right, context: left.evaluate(context) != right.evaluate(context),
+    "NAND": lambda left, right, context: not (left.evaluate(context) and right.evaluate(context)),
+    "NOR": lambda left, right, context: not (left.evaluate(context) or right.evaluate(context)),
+}
+
+
 class BinaryOp(LogicalExpression):
     """
-    Represents binary logical operations (AND, OR, IMPLIES, IFF).
+    Represents binary logical operations (AND, OR, IMPLIES, IFF, XOR, NAND, NOR).
 
     Binary operations take two logical expressions as operands and combine
     them according to the specified operator.
@@ -194,16 +220,22 @@ class BinaryOp(LogicalExpression):
                  - "OR": logical disjunction (∨)
                  - "IMPLIES": logical implication (→)
                  - "IFF": logical biconditional (↔)
+                 - "XOR": exclusive disjunction (⊕)
+                 - "NAND": negated conjunction (↑)
+                 - "NOR": negated disjunction (↓)
     """
 
     left: LogicalExpression
     right: LogicalExpression
-    operator: Literal["AND", "OR", "IMPLIES", "IFF"]
+    operator: Literal["AND", "OR", "IMPLIES", "IFF", "XOR", "NAND", "NOR"]
 
     def evaluate(self, context: Dict[str, bool]) -> bool:
         """
         Evaluates the binary operation given a truth assignment.
 
+        AND, OR, IMPLIES, NAND and NOR skip the right operand when the left
+        one already decides the result.
+
         Args:
             context: Dictionary mapping variable names to truth values.
                     Example: {"P": True, "Q": False}
@@ -214,19 +246,32 @@ class BinaryOp(LogicalExpression):
         Raises:
             ValueError: If the operator is unknown.
         """
-        left_val = self.left.evaluate(context)
-        right_val = self.right.evaluate(context)
-
-        if self.operator == "AND":
-            return left_val and right_val
-        elif self.operator == "OR":
-            return left_val or right_val
-        elif self.operator == "IMPLIES":
-            return (not left_val) or right_val
-        elif self.operator == "IFF":
-            return left_val == right_val
-        else:
+        evaluator = BINARY_EVALUATORS.get(self.operator)
+        if evaluator is None:
             raise ValueError(f"Unknown operator: {self.operator}")
+        return evaluator(self.left, self.right, context)
+
+    def _partial(self, assignment: Dict[str, bool], memo: Dict[int, Any]) -> Union[LogicalExpression, bool]:
+        result = memo.get(id(self))
+        if result is not None:
+            return result
+        left = self.left._partial(assignment, memo)
+        right = self.right._partial(assignment, memo)
+        truth = BINARY_TRUTH_FUNCTIONS[self.operator]
+        if isinstance(left, bool) and isinstance(right, bool):
+            result = truth(left, right)
+        elif isinstance(left, bool):
+            result = _residual(truth(left, True), truth(left, False), right)
+        elif isinstance(right, bool):
+            result = _residual(truth(True, right), truth(False, right), left)
+        elif left is self.left and right is self.right:
+            result = self
+        else:
+            result = construct_unchecked(
+                BinaryOp, {"left": left, "right": right, "operator": self.operator}
+            )
+        memo[id(self)] = result
+        return result
 
     def variables(self) -> List[str]:
         """
@@ -278,36 +323,11 @@ class BinaryOp(LogicalExpression):
             ValueError: If the data is invalid or contains unknown operand types.
         """
         if all(k in data for k in ["left", "right", "operator"]):
-            # Parse left operand
-            if "type" in data["left"]:
-                left_type_name = data["left"]["type"]
-                if left_type_name == "Proposition":
-                    left = Proposition.from_dict(data["left"])
-                elif left_type_name == "Not":
-                    left = Not.from_dict(data["left"])
-                elif left_type_name == "BinaryOp":
-                    left = BinaryOp.from_dict(data["left"])
-                else:
-                    raise ValueError(f"Unknown left operand type: {left_type_name}")
-            else:
-                raise ValueError("Missing left operand type")
-
-            # Parse right operand
-            if "type" in data["right"]:
-                right_type_name = data["right"]["type"]
-                if right_type_name == "Proposition":
-                    right = Proposition.from_dict(data["right"])
-                elif right_type_name == "Not":
-                    right = Not.from_dict(data["right"])
-                elif right_type_name == "BinaryOp":
-                    right = BinaryOp.from_dict(data["right"])
-                else:
-                    raise ValueError(f"Unknown right operand type: {right_type_name}")
-            else:
-                raise ValueError("Missing right operand type")
-
-            # Create BinaryOp
-            return cls(left=left, right=right, operator=data["operator"])
+            return cls(
+                left=LogicalExpression.from_dict(data["left"]),
+                right=LogicalExpression.from_dict(data["right"]),
+                operator=data["operator"],
+            )
 
         raise ValueError("Invalid binary operation data")
 
@@ -371,16 +391,334 @@ class Xor(BinaryOp):
         """Initialize a XOR operation with left and right operands."""
         super().__init__(left=left, right=right, operator="XOR")
 
+
+class Nand(BinaryOp):
+    """
+    Represents negated conjunction (NAND, ↑).
+
+    Returns True unless both operands are True.
+    """
+
+    def __init__(self, left: LogicalExpression, right: LogicalExpression):
+        """Initialize a NAND operation with left and right operands."""
+        super().__init__(left=left, right=right, operator="NAND")
+
+
+class Nor(BinaryOp):
+    """
+    Represents negated disjunction (NOR, ↓).
+
+    Returns True if both operands are False.
+    """
+
+    def __init__(self, left: LogicalExpression, right: LogicalExpression):
+        """Initialize a NOR operation with left and right operands."""
+        super().__init__(left=left, right=right, operator="NOR")
+
+
+class NaryOp(LogicalExpression):
+    """
+    Represents a flat conjunction or disjunction of any number of operands.
+
+    A chain such as ``((A ∧ B) ∧ C) ∧ D`` is a single node with four operands,
+    so evaluation, depth and traversal cost do not grow with chain nesting.
+
+    Attributes:
+        operands: The operands, in order.
+        operator: "AND" (conjunction) or "OR" (disjunction).
+    """
+
+    operands: Tuple[LogicalExpression, ...] = Field(..., min_length=1)
+    operator: Literal["AND", "OR"]
+
     def evaluate(self, context: Dict[str, bool]) -> bool:
         """
-        Evaluates the XOR operation given a truth assignment.
+        Evaluates the operation, stopping at the first deciding operand.
 
         Args:
             context: Dictionary mapping variable names to truth values.
 
         Returns:
-            Boolean result of XOR operation (True if exactly one operand is True).
+            Whether all (AND) or any (OR) operands are true.
+        """
+        if self.operator == "AND":
+            for operand in self.operands:
+                if not operand.evaluate(context):
+                    return False
+            return True
+        for operand in self.operands:
+            if operand.evaluate(context):
+                return True
+        return False
+
+    def _partial(self, assignment: Dict[str, bool], memo: Dict[int, Any]) -> Union[LogicalExpression, bool]:
+        result = memo.get(id(self))
+        if result is not None:
+            return result
+        # The absorbing constant decides the node: False for AND, True for OR.
+        absorbing = self.operator == "OR"
+        operands = []
+        changed = False
+        for operand in self.operands:
+            residual = operand._partial(assignment, memo)
+            if residual is absorbing:
+                memo[id(self)] = absorbing
+                return absorbing
+            if isinstance(residual, bool):
+                changed = True
+                continue
+            changed = changed or residual is not operand
+            operands.append(residual)
+        if not changed:
+            result = self
+        elif not operands:
+            result = not absorbing
+        elif len(operands) == 1:
+            result = operands[0]
+        else:
+            result = construct_unchecked(
+                NaryOp, {"operands": tuple(operands), "operator": self.operator}
+            )
+        memo[id(self)] = result
+        return result
+
+    def variables(self) -> List[str]:
+        """
+        Returns the list of variables in the operation.
+
+        Returns:
+            List of unique variable names from all operands.
+        """
+        names = set()
+        for operand in self.operands:
+            names.update(operand.variables())
+        return list(names)
+
+    def depth(self) -> int:
+        """
+        Returns the depth of the expression tree.
+
+        Returns:
+            The maximum depth of the operands plus 1.
+        """
+        return 1 + max(operand.depth() for operand in self.operands)
+
+    def to_dict(self) -> Dict:
+        """
+        Converts the operation to a dictionary.
+
+        Returns:
+            Dictionary representation of the operation.
+            Example: {"type": "NaryOp", "operator": "AND", "operands": [...]}
         """
-        left_val = self.left.evaluate(context)
-        right_val = self.right.evaluate(context)
-        return left_val != right_val
+        return {
+            "type": "NaryOp",
+            "operator": self.operator,
+            "operands": [operand.to_dict() for operand in self.operands],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "NaryOp":
+        """
+        Reconstructs the operation from a dictionary.
+
+        Args:
+            data: Dictionary with "operator" and "operands" fields.
+
+        Returns:
+            Reconstructed NaryOp object.
+
+        Raises:
+            ValueError: If the data is invalid.
+        """
+        if "operator" in data and isinstance(data.get("operands"), list):
+            return NaryOp(
+                operands=tuple(LogicalExpression.from_dict(operand) for operand in data["operands"]),
+                operator=data["operator"],
+            )
+        raise ValueError("Invalid n-ary operation data")
+
+    @staticmethod
+    def collect(operator: str, operands: Iterable[LogicalExpression]) -> List[LogicalExpression]:
+        """
+        Splices nested chains of the same operator into one operand list.
+
+        Args:
+            operator: "AND" or "OR".
+            operands: Operands that may themselves be NaryOp nodes or
+                      BinaryOp chains with the same operator.
+
+        Returns:
+            The flat operand list, in left-to-right order.
+        """
+        flat: List[LogicalExpression] = []
+        pending = list(operands)
+        pending.reverse()
+        while pending:
+            node = pending.pop()
+            if isinstance(node, NaryOp) and node.operator == operator:
+                pending.extend(reversed(node.operands))
+            elif isinstance(node, BinaryOp) and node.operator == operator:
+                pending.append(node.right)
+                pending.append(node.left)
+            else:
+                flat.append(node)
+        return flat
+
+    @staticmethod
+    def flatten(expression):
+        """
+        Replaces every AND/OR chain in an expression by a single NaryOp.
+
+        Args:
+            expression: Any expression tree.
+
+        Returns:
+            The equivalent expression with n-ary conjunctions and
+            disjunctions; single operands are not wrapped.
+        """
+        return _rebuild(expression, _flatten_chain)
+
+    @staticmethod
+    def expand(expression):
+        """
+        Replaces every NaryOp in an expression by a left-deep BinaryOp chain.
+
+        Args:
+            expression: Any expression tree.
+
+        Returns:
+            The equivalent expression using only binary connectives.
+        """
+        return _rebuild(expression, _expand_chain)
+
+
+class AndN(NaryOp):
+    """
+    Represents an n-ary conjunction (∧).
+
+    Nested conjunctions passed as operands are flattened into this node.
+    """
+
+    def __init__(self, *operands: LogicalExpression):
+        """Initialize a conjunction of the given operands."""
+        super().__init__(operands=tuple(NaryOp.collect("AND", operands)), operator="AND")
+
+
+class OrN(NaryOp):
+    """
+    Represents an n-ary disjunction (∨).
+
+    Nested disjunctions passed as operands are flattened into this node.
+    """
+
+    def __init__(self, *operands: LogicalExpression):
+        """Initialize a disjunction of the given operands."""
+        super().__init__(operands=tuple(NaryOp.collect("OR", operands)), operator="OR")
+
+
+def _negate(residual):
+    """Negates a partial evaluation result, cancelling double negation."""
+    if isinstance(residual, bool):
+        return not residual
+    if isinstance(residual, Not):
+        return residual.operand
+    return construct_unchecked(Not, {"operand": residual})
+
+
+def _residual(if_true: bool, if_false: bool, operand):
+    """
+    Folds a connective whose other operand is a known constant.
+
+    ``if_true``/``if_false`` are the connective's values when ``operand`` is
+    True/False, so the result is a constant, the operand, or its negation.
+    """
+    if if_true == if_false:
+        return if_true
+    return operand if if_true else _negate(operand)
+
+
+def _flatten_chain(node, operands, rebuild):
+    flat = NaryOp.collect(node.operator, operands)
+    children = tuple(rebuild(child) for child in flat)
+    if len(children) == 1:
+        return children[0]
+    return construct_unchecked(NaryOp, {"operands": children, "operator": node.operator})
+
+
+def _expand_chain(node, operands, rebuild):
+    children = [rebuild(child) for child in NaryOp.collect(node.operator, operands)]
+    result = children[0]
+    for child in children[1:]:
+        result = construct_unchecked(
+            BinaryOp, {"left": result, "right": child, "operator": node.operator}
+        )
+    return result
+
+
+def _rebuild(expression, convert_chain):
+    """Rebuilds an expression, passing every AND/OR chain to ``convert_chain``."""
+    from agent_logic.core.quantifiers import ExistentialQuantifier, UniversalQuantifier
+
+    memo: Dict[int, object] = {}
+
+    def rebuild(node):
+        result = memo.get(id(node))
+        if result is not None:
+            return result
+        if isinstance(node, NaryOp) or (
+            isinstance(node, BinaryOp) and node.operator in ("AND", "OR")
+        ):
+            operands = node.operands if isinstance(node, NaryOp) else (node.left, node.right)
+            result = convert_chain(node, operands, rebuild)
+        elif isinstance(node, BinaryOp):
+            left, right = rebuild(node.left), rebuild(node.right)
+            result = node if left is node.left and right is node.right else construct_unchecked(
+                BinaryOp, {"left": left, "right": right, "operator": node.operator}
+            )
+        elif isinstance(node, Not):
+            operand = rebuild(node.operand)
+            result = node if operand is node.operand else construct_unchecked(
+                Not, {"operand": operand}
+            )
+        elif isinstance(node, (UniversalQuantifier, ExistentialQuantifier)) and isinstance(
+            node.predicate, LogicalExpression
+        ):
+            predicate = rebuild(node.predicate)
+            result = node if predicate is node.predicate else type(node)(
+                variable=node.variable, predicate=predicate
+            )
+        else:
+            result = node
+        memo[id(node)] = result
+        return result
+
+    return rebuild(expression)
+
+
+LogicalExpression.register_type(
+    "Proposition",
+    Proposition,
+    lambda data, decode: construct_unchecked(Proposition, {"name": data["name"]}),
+)
+LogicalExpression.register_type(
+    "Not",
+    Not,
+    lambda data, decode: construct_unchecked(Not, {"operand": decode(data["operand"])}),
+)
+LogicalExpression.register_type(
+    "BinaryOp",
+    BinaryOp,
+    lambda data, decode: construct_unchecked(
+        BinaryOp,
+        {"left": decode(data["left"]), "right": decode(data["right"]), "operator": data["operator"]},
+    ),
+)
+LogicalExpression.register_type(
+    "NaryOp",
+    NaryOp,
+    lambda data, decode: construct_unchecked(
+        NaryOp,
+        {"operands": tuple(decode(operand) for operand in data["operands"]), "operator": data["operator"]},
+    ),
+)
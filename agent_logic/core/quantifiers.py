@@ -4,11 +4,34 @@ from typing import Dict, List, Literal, Any, TYPE_CHECKING
 
 from pydantic import BaseModel
 
+from agent_logic.core.base import LogicalExpression, construct_unchecked
+
 # Use TYPE_CHECKING to avoid circular imports
 if TYPE_CHECKING:
     from agent_logic.core.predicates import Predicate  # noqa: F401
 
 
+def _predicate_from_dict(data: Dict) -> Any:
+    """Decodes a quantifier body: a tagged expression or a legacy Predicate."""
+    if "type" in data:
+        return LogicalExpression.from_dict(data)
+    from agent_logic.core.predicates import Predicate
+    return Predicate.from_dict(data)
+
+
+def _trusted_quantifier(cls: type, tag: str):
+    def decode_quantifier(data: Dict, decode) -> Any:
+        body = data["predicate"]
+        if isinstance(body, dict) and "type" not in body:
+            predicate = _predicate_from_dict(body)
+        else:
+            predicate = decode(body)
+        return construct_unchecked(
+            cls, {"type": tag, "variable": data["variable"], "predicate": predicate}
+        )
+    return decode_quantifier
+
+
 class UniversalQuantifier(BaseModel):
     """Represents Universal Quantification: ∀x P(x)"""
 
@@ -38,10 +61,7 @@ class UniversalQuantifier(BaseModel):
 
     @classmethod
     def from_dict(cls, data: Dict) -> UniversalQuantifier:
-        from agent_logic.core.predicates import Predicate
-        return cls(
-            variable=data["variable"], predicate=Predicate.from_dict(data["predicate"])
-        )
+        return cls(variable=data["variable"], predicate=_predicate_from_dict(data["predicate"]))
 
 
 class ExistentialQuantifier(BaseModel):
@@ -73,11 +93,13 @@ class ExistentialQuantifier(BaseModel):
 
     @classmethod
     def from_dict(cls, data: Dict) -> ExistentialQuantifier:
-        from agent_logic.core.predicates import Predicate
-        return cls(
-            variable=data["variable"], predicate=Predicate.from_dict(data["predicate"])
-        )
+        return cls(variable=data["variable"], predicate=_predicate_from_dict(data["predicate"]))
+
 
+# Quantifiers serialize as FORALL/EXISTS; ASTParser input uses the class names.
+for _cls, _tag in ((UniversalQuantifier, "FORALL"), (ExistentialQuantifier, "EXISTS")):
+    LogicalExpression.register_type(_tag, _cls, _trusted_quantifier(_cls, _tag))
+    LogicalExpression.register_type(_cls.__name__, _cls, _trusted_quantifier(_cls, _tag))
 
 # Define aliases for better naming in imports
 ForAll = UniversalQuantifier
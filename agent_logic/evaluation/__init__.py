@@ -2,10 +2,45 @@
 Logical evaluation module.
 
 This module provides tools for evaluating logical expressions,
-including truth table generation and formula validation.
+including truth table generation, formula validation, batched
+evaluation, and-inverter graphs, clause encoding, satisfiability procedures,
+unsatisfiable core extraction, semantic signatures, model counting and enumeration.
 """
 
+from agent_logic.evaluation.aig import AIG
+from agent_logic.evaluation.bdd import BDD
+from agent_logic.evaluation.cnf import CNF, CNFEncoder
 from agent_logic.evaluation.evaluator import Evaluator
+from agent_logic.evaluation.enumeration import ModelEnumerator
+from agent_logic.evaluation.incremental import EvaluationSession
+from agent_logic.evaluation.model_counting import ModelCounter
+from agent_logic.evaluation.mus import MUSExtractor, UnsatCore
+from agent_logic.evaluation.sat_solvers import (
+    CDCLSolver,
+    HornSAT,
+    TwoSAT,
+    classify_clauses,
+)
+from agent_logic.evaluation.signatures import SemanticSignatures
 from agent_logic.evaluation.truth_table import TruthTable
+from agent_logic.evaluation.vectorized import BatchEvaluator
 
-__all__ = ["TruthTable", "Evaluator"] 
\ No newline at end of file
+__all__ = [
+    "TruthTable",
+    "Evaluator",
+    "BatchEvaluator",
+    "SemanticSignatures",
+    "EvaluationSession",
+    "ModelCounter",
+    "ModelEnumerator",
+    "BDD",
+    "AIG",
+    "CNF",
+    "CNFEncoder",
+    "CDCLSolver",
+    "MUSExtractor",
+    "UnsatCore",
+    "HornSAT",
+    "TwoSAT",
+    "classify_clauses",
+]
@@ -0,0 +1,548 @@
+"""
+And-inverter graph module.
+
+This module provides and-inverter graphs (AIGs), a compact multi-output
+representation for large formulas and formula sets:
+- AIG: A structurally hashed graph of two-input AND nodes with complemented
+  edges, with conversion from and to expressions, bit-parallel simulation,
+  Tseitin encoding, SAT-backed equivalence checking and fraiging
+
+Edges are integer literals: node ``i`` has literal ``2 * i`` and its
+complement ``2 * i + 1``, so negation is a single XOR and costs no node.
+Literal 0 is the constant FALSE and 1 is TRUE. Every connective is lowered to
+ANDs and inverters, and ``and_`` normalizes as it builds: constants are
+propagated, equal and complementary operands are folded, a set of two-level
+rules (contradiction, idempotence, subsumption, substitution and resolution
+over the operands' own operands) removes local redundancy, and a unique table
+returns the existing node for a repeated (left, right) pair. Nodes are
+created after their operands, so node order is a topological order.
+
+Simulation evaluates every node once per call on whole words of patterns
+(Python integers used as bit vectors, 64 patterns per word by default), which
+makes random simulation a cheap filter before exact SAT checks.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from agent_logic.core.base import LogicalExpression
+from agent_logic.core.factory import ExpressionBuilder
+from agent_logic.core.operations import BinaryOp, NaryOp, Not
+from agent_logic.evaluation.cnf import CNF, atom_name
+from agent_logic.evaluation.sat_solvers import CDCLSolver
+
+FALSE = 0
+TRUE = 1
+WORD_BITS = 64
+
+_DEFAULT_BUILDER = ExpressionBuilder()
+
+
+def _xor(aig: "AIG", left: int, right: int) -> int:
+    return aig.or_(aig.and_(left, right ^ 1), aig.and_(left ^ 1, right))
+
+
+# Binary operators lowered to AND/inverter literals: operator -> function(aig, left, right).
+GATES: Dict[str, Callable[["AIG", int, int], int]] = {
+    "AND": lambda aig, left, right: aig.and_(left, right),
+    "OR": lambda aig, left, right: aig.or_(left, right),
+    "IMPLIES": lambda aig, left, right: aig.and_(left, right ^ 1) ^ 1,
+    "IFF": lambda aig, left, right: _xor(aig, left, right) ^ 1,
+    "XOR": _xor,
+    "NAND": lambda aig, left, right: aig.and_(left, right) ^ 1,
+    "NOR": lambda aig, left, right: aig.and_(left ^ 1, right ^ 1),
+}
+
+
+class AIG:
+    """
+    Structurally hashed and-inverter graph.
+
+    Example:
+        >>> aig = AIG()
+        >>> f = aig.compile(FormulaParser.parse("(P ∧ Q) ∨ (P ∧ ¬Q)"))
+        >>> aig.to_expression(f).to_dict()
+        {'type': 'Proposition', 'name': 'P'}
+
+    Attributes:
+        inputs: Input variable names in creation order.
+    """
+
+    def __init__(self):
+        """Creates a graph holding only the constant node."""
+        self.inputs: List[str] = []
+        # Per node: operand literals (-1 for inputs and the constant).
+        self._left: List[int] = [-1]
+        self._right: List[int] = [-1]
+        self._input_literal: Dict[str, int] = {}
+        self._input_name: Dict[int, str] = {}
+        self._atoms: Dict[str, LogicalExpression] = {}
+        self._unique: Dict[Tuple[int, int], int] = {}
+
+    def __len__(self) -> int:
+        """Returns the number of nodes, the constant and inputs included."""
+        return len(self._left)
+
+    @property
+    def num_ands(self) -> int:
+        """The number of AND nodes."""
+        return len(self._left) - 1 - len(self.inputs)
+
+    def is_and(self, literal: int) -> bool:
+        """Returns whether a literal points to an AND node."""
+        return self._left[literal >> 1] >= 0
+
+    def fanins(self, literal: int) -> Tuple[int, int]:
+        """
+        Returns the operand literals of the AND node a literal points to.
+
+        Raises:
+            ValueError: If the literal points to an input or the constant.
+        """
+        node = literal >> 1
+        if self._left[node] < 0:
+            raise ValueError(f"Literal {literal} is not an AND node")
+        return self._left[node], self._right[node]
+
+    def input(self, name: str) -> int:
+        """Returns the literal of an input variable, creating it if needed."""
+        literal = self._input_literal.get(name)
+        if literal is None:
+            literal = 2 * len(self._left)
+            self._left.append(-1)
+            self._right.append(-1)
+            self._input_literal[name] = literal
+            self._input_name[literal >> 1] = name
+            self.inputs.append(name)
+        return literal
+
+    def and_(self, left: int, right: int) -> int:
+        """
+        Returns the literal of ``left ∧ right``, reusing or simplifying nodes.
+
+        Args:
+            left: Operand literal.
+            right: Operand literal.
+
+        Returns:
+            An existing literal when the conjunction folds to one, otherwise
+            the literal of a (possibly shared) AND node.
+        """
+        if left > right:
+            left, right = right, left
+        if left == FALSE or left == right ^ 1:
+            return FALSE
+        if left == TRUE or left == right:
+            return right
+        simplified = self._two_level(left, right)
+        if simplified is not None:
+            return simplified
+        key = (left, right)
+        literal = self._unique.get(key)
+        if literal is None:
+            literal = self._unique[key] = 2 * len(self._left)
+            self._left.append(left)
+            self._right.append(right)
+        return literal
+
+    def or_(self, left: int, right: int) -> int:
+        """Returns the literal of ``left ∨ right``."""
+        return self.and_(left ^ 1, right ^ 1) ^ 1
+
+    def _operands(self, literal: int) -> Optional[Tuple[int, int]]:
+        node = literal >> 1
+        if self._left[node] < 0:
+            return None
+        return self._left[node], self._right[node]
+
+    def _two_level(self, a: int, b: int) -> Optional[int]:
+        """Applies two-level AND rules looking one level below the operands."""
+        for x, y in ((a, b), (b, a)):
+            fx = self._operands(x)
+            if fx is None:
+                continue
+            x0, x1 = fx
+            fy = self._operands(y)
+            if not x & 1:
+                # x = x0 ∧ x1
+                if y == x0 ^ 1 or y == x1 ^ 1:
+                    return FALSE  # contradiction
+                if y == x0 or y == x1:
+                    return x  # idempotence
+                if fy is not None and not y & 1:
+                    if any(p == q ^ 1 for p in fx for q in fy):
+                        return FALSE  # contradiction
+                continue
+            # x = ¬(x0 ∧ x1)
+            if y == x0 ^ 1 or y == x1 ^ 1:
+                return y  # subsumption
+            if y == x0:
+                return self.and_(y, x1 ^ 1)  # substitution
+            if y == x1:
+                return self.and_(y, x0 ^ 1)  # substitution
+            if fy is None:
+                continue
+            if not y & 1:
+                if x0 ^ 1 in fy or x1 ^ 1 in fy:
+                    return y  # subsumption: y already falsifies x0 ∧ x1
+                if x0 in fy and x1 in fy:
+                    return FALSE  # contradiction
+            else:
+                # Resolution: ¬(p ∧ q) ∧ ¬(p ∧ ¬q) = ¬p.
+                y0, y1 = fy
+                for p, q in ((x0, x1), (x1, x0)):
+                    for r, s in ((y0, y1), (y1, y0)):
+                        if p == r and q == s ^ 1:
+                            return p ^ 1
+        return None
+
+    def compile(self, expression: LogicalExpression) -> int:
+        """
+        Adds an expression to the graph.
+
+        Args:
+            expression: The expression to compile; atoms are keyed like
+                        ``Relation.evaluate`` and shared subexpressions are
+                        compiled once.
+
+        Returns:
+            The literal of the expression.
+
+        Raises:
+            ValueError: If the expression contains unsupported node types or
+                        operators.
+        """
+        compiled: Dict[int, int] = {}
+        stack = [(expression, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if id(node) in compiled:
+                continue
+            name = atom_name(node)
+            if name is not None:
+                self._atoms.setdefault(name, node)
+                compiled[id(node)] = self.input(name)
+                continue
+            if isinstance(node, Not):
+                children = (node.operand,)
+            elif isinstance(node, BinaryOp):
+                children = (node.left, node.right)
+            elif isinstance(node, NaryOp):
+                children = node.operands
+            else:
+                raise ValueError(f"Cannot compile expression type: {type(node).__name__}")
+            if not expanded:
+                stack.append((node, True))
+                stack.extend((child, False) for child in reversed(children))
+                continue
+            if isinstance(node, Not):
+                result = compiled[id(node.operand)] ^ 1
+            elif isinstance(node, BinaryOp):
+                gate = GATES.get(node.operator)
+                if gate is None:
+                    raise ValueError(f"Unknown operator: {node.operator}")
+                result = gate(self, compiled[id(node.left)], compiled[id(node.right)])
+            else:
+                gate = GATES[node.operator]
+                result = compiled[id(node.operands[0])]
+                for operand in node.operands[1:]:
+                    result = gate(self, result, compiled[id(operand)])
+            compiled[id(node)] = result
+        return compiled[id(expression)]
+
+    def to_expression(self, literal: int, factory: Optional[ExpressionBuilder] = None):
+        """
+        Converts the cone of a literal back into an expression.
+
+        Args:
+            literal: The literal to convert.
+            factory: Builder used for new nodes.
+
+        Returns:
+            An expression of conjunctions and negations over the original
+            atoms (shared nodes stay shared), or True/False for a constant.
+        """
+        if literal <= TRUE:
+            return literal == TRUE
+        builder = factory if factory is not None else _DEFAULT_BUILDER
+        nodes: Dict[int, LogicalExpression] = {}
+        negations: Dict[int, LogicalExpression] = {}
+
+        def edge(current: int) -> LogicalExpression:
+            node = nodes[current >> 1]
+            if not current & 1:
+                return node
+            negated = negations.get(current >> 1)
+            if negated is None:
+                negated = negations[current >> 1] = builder.negation(node)
+            return negated
+
+        for node in self._cone([literal]):
+            name = self._input_name.get(node)
+            if name is not None:
+                atom = self._atoms.get(name)
+                nodes[node] = atom if atom is not None else builder.proposition(name)
+            else:
+                nodes[node] = builder.binary("AND", edge(self._left[node]), edge(self._right[node]))
+        return edge(literal)
+
+    def _cone(self, literals: Sequence[int]) -> List[int]:
+        """Returns the non-constant nodes reachable from literals, in topological order."""
+        seen = set()
+        stack = [literal >> 1 for literal in literals if literal > TRUE]
+        while stack:
+            node = stack.pop()
+            if node in seen:
+                continue
+            seen.add(node)
+            if self._left[node] >= 0:
+                stack.append(self._left[node] >> 1)
+                stack.append(self._right[node] >> 1)
+        return sorted(seen)
+
+    def simulate(self, literals: Sequence[int], patterns: Dict[str, int], width: int = WORD_BITS) -> List[int]:
+        """
+        Evaluates literals on many input patterns at once.
+
+        Args:
+            literals: Literals to evaluate.
+            patterns: Bit vector of each input; bit ``i`` is the value in
+                      pattern ``i``. Missing inputs are False in every pattern.
+            width: Number of patterns (bits per vector).
+
+        Returns:
+            The bit vector of each literal, in order.
+        """
+        mask = (1 << width) - 1
+        values = [0] * len(self._left)
+        left, right = self._left, self._right
+        for node in self._cone(literals):
+            name = self._input_name.get(node)
+            if name is not None:
+                values[node] = patterns.get(name, 0) & mask
+                continue
+            a, b = left[node], right[node]
+            value_a = values[a >> 1] ^ (mask if a & 1 else 0)
+            value_b = values[b >> 1] ^ (mask if b & 1 else 0)
+            values[node] = value_a & value_b
+        return [values[literal >> 1] ^ (mask if literal & 1 else 0) for literal in literals]
+
+    def random_patterns(self, words: int = 1, seed: int = 0) -> Dict[str, int]:
+        """Returns reproducible random bit vectors of ``words * 64`` bits for every input."""
+        rng = random.Random(seed)
+        return {name: rng.getrandbits(words * WORD_BITS) for name in self.inputs}
+
+    def evaluate(self, literal: int, assignment: Dict[str, bool]) -> bool:
+        """
+        Evaluates a literal under one assignment.
+
+        Args:
+            literal: The literal to evaluate.
+            assignment: Truth values of the inputs; missing inputs are False.
+
+        Returns:
+            The value of the literal.
+        """
+        patterns = {name: int(bool(value)) for name, value in assignment.items()}
+        return bool(self.simulate([literal], patterns, 1)[0])
+
+    def to_cnf(self, literals: Sequence[int], cnf: Optional[CNF] = None) -> Tuple[CNF, List[int]]:
+        """
+        Encodes the cones of literals as clauses (Tseitin encoding).
+
+        Each AND node gets an auxiliary variable defined by three clauses;
+        inputs use ``cnf.var(name)``.
+
+        Args:
+            literals: Literals to encode.
+            cnf: Clause set to add to; a new one is created by default.
+
+        Returns:
+            The clause set and the integer literal of each AIG literal.
+        """
+        cnf = cnf if cnf is not None else CNF()
+        variables: Dict[int, int] = {}
+        for node in self._cone(literals):
+            name = self._input_name.get(node)
+            if name is not None:
+                variables[node] = cnf.var(name)
+                continue
+            output = variables[node] = cnf.aux()
+            a = self._cnf_literal(self._left[node], variables)
+            b = self._cnf_literal(self._right[node], variables)
+            cnf.clauses.extend(([-output, a], [-output, b], [output, -a, -b]))
+        results = []
+        for literal in literals:
+            if literal <= TRUE:
+                constant = cnf.aux()
+                cnf.clauses.append([constant if literal == TRUE else -constant])
+                results.append(constant)
+            else:
+                results.append(self._cnf_literal(literal, variables))
+        return cnf, results
+
+    @staticmethod
+    def _cnf_literal(literal: int, variables: Dict[int, int]) -> int:
+        variable = variables[literal >> 1]
+        return -variable if literal & 1 else variable
+
+    def equivalent(self, first: int, second: int, words: int = 4, seed: int = 0) -> bool:
+        """
+        Decides whether two literals denote the same function.
+
+        Identical literals are equivalent at once; random simulation rejects
+        most non-equivalent pairs; the rest are decided by a SAT check on
+        the miter of the two cones.
+
+        Args:
+            first: First literal.
+            second: Second literal.
+            words: Number of 64-pattern words of random simulation.
+            seed: Seed of the random patterns.
+
+        Returns:
+            True if the literals agree under every assignment.
+        """
+        if first == second:
+            return True
+        if first == second ^ 1:
+            return False
+        left, right = self.simulate([first, second], self.random_patterns(words, seed), words * WORD_BITS)
+        if left != right:
+            return False
+        cnf, (a, b) = self.to_cnf([first, second])
+        solver = CDCLSolver(cnf.num_vars, cnf.clauses)
+        return not solver.solve([a, -b]) and not solver.solve([-a, b])
+
+    def fraig(self, literals: Sequence[int], words: int = 4, seed: int = 0) -> Tuple["AIG", List[int]]:
+        """
+        Builds a functionally reduced copy of the cones of literals.
+
+        Nodes are copied in topological order. A copied node whose random
+        simulation signature matches an earlier node (possibly complemented)
+        or input is checked against it with one incremental SAT solver shared
+        by all checks and, if equivalent, merged into it, so no
+        two nodes in the cones of the returned literals compute the same
+        function or its complement. Merged nodes stay in the graph unused.
+
+        Args:
+            literals: Literals whose cones are reduced.
+            words: Number of 64-pattern words of random simulation.
+            seed: Seed of the random patterns.
+
+        Returns:
+            The reduced graph and the literal of each input literal in it.
+        """
+        width = words * WORD_BITS
+        mask = (1 << width) - 1
+        patterns = self.random_patterns(words, seed)
+        reduced = AIG()
+        reduced._atoms = dict(self._atoms)
+        mapped: Dict[int, int] = {0: FALSE}
+        # Phase-normalized signature -> representative literals of the reduced graph.
+        classes: Dict[int, List[int]] = {0: [FALSE]}
+        # Reduced node -> simulation vector and solver variable, filled on first use.
+        values: Dict[int, int] = {0: 0}
+        solver = CDCLSolver()
+        variables: Dict[int, int] = {}
+
+        def vector(literal: int) -> int:
+            node = literal >> 1
+            if node not in values:
+                values[node] = vector(reduced._left[node]) & vector(reduced._right[node])
+            return values[node] ^ (mask if literal & 1 else 0)
+
+        def variable(literal: int) -> int:
+            node = literal >> 1
+            if node not in variables:
+                output = variables[node] = solver.new_var()
+                if node == 0:
+                    solver.add_clause([-output])
+                elif reduced.is_and(literal):
+                    a, b = variable(reduced._left[node]), variable(reduced._right[node])
+                    solver.add_clause([-output, a])
+                    solver.add_clause([-output, b])
+                    solver.add_clause([output, -a, -b])
+            return -variables[node] if literal & 1 else variables[node]
+
+        # Counterexamples from failed checks form a second signature that is
+        # compared before any further SAT call on the same pair of functions.
+        counterexamples = {"width": 0}
+        cex_inputs: Dict[str, int] = {}
+        cex_values: Dict[int, int] = {0: 0}
+
+        def cex_vector(literal: int) -> int:
+            node = literal >> 1
+            if node not in cex_values:
+                name = reduced._input_name.get(node)
+                if name is not None:
+                    cex_values[node] = cex_inputs.get(name, 0)
+                else:
+                    cex_values[node] = cex_vector(reduced._left[node]) & cex_vector(reduced._right[node])
+            return cex_values[node] ^ ((1 << counterexamples["width"]) - 1 if literal & 1 else 0)
+
+        def add_counterexample() -> None:
+            bit = 1 << counterexamples["width"]
+            counterexamples["width"] += 1
+            for name in reduced.inputs:
+                variable_number = variables.get(reduced._input_literal[name] >> 1)
+                if variable_number is not None and solver.model.get(variable_number):
+                    cex_inputs[name] = cex_inputs.get(name, 0) | bit
+            for node in sorted(cex_values):
+                name = reduced._input_name.get(node)
+                if name is not None:
+                    value = cex_inputs.get(name, 0) & bit
+                elif node:
+                    left, right = reduced._left[node], reduced._right[node]
+                    value = (cex_values[left >> 1] ^ (bit if left & 1 else 0)) & (
+                        cex_values[right >> 1] ^ (bit if right & 1 else 0)
+                    ) & bit
+                else:
+                    value = 0
+                cex_values[node] |= value
+
+        def proved_equal(first: int, second: int) -> bool:
+            # One incremental solver is shared by all checks; a node's clauses are added once.
+            if cex_vector(first) != cex_vector(second):
+                return False
+            x, y = variable(first), variable(second)
+            for assumptions in ([x, -y], [-x, y]):
+                outcome = solver.solve(assumptions)
+                if outcome:
+                    add_counterexample()
+                if outcome is not False:
+                    return False
+            return True
+
+        for node in self._cone(literals):
+            name = self._input_name.get(node)
+            if name is not None:
+                literal = mapped[node] = reduced.input(name)
+                value = values[literal >> 1] = patterns.get(name, 0) & mask
+                # Inputs are candidates too, so a cone equal to one collapses to it.
+                phase = value & 1
+                classes.setdefault(value ^ (mask if phase else 0), []).append(literal ^ phase)
+                continue
+            a = mapped[self._left[node] >> 1] ^ (self._left[node] & 1)
+            b = mapped[self._right[node] >> 1] ^ (self._right[node] & 1)
+            literal = mapped[node] = reduced.and_(a, b)
+            if not reduced.is_and(literal) or literal >> 1 < len(reduced) - 1:
+                # Folded to a constant, an input or an existing node.
+                continue
+            value = vector(literal)
+            phase = value & 1
+            members = classes.setdefault(value ^ (mask if phase else 0), [])
+            for candidate in members:
+                if proved_equal(literal ^ phase, candidate):
+                    mapped[node] = candidate ^ phase
+                    break
+            else:
+                members.append(literal ^ phase)
+        results = [
+            literal if literal <= TRUE else mapped[literal >> 1] ^ (literal & 1)
+            for literal in literals
+        ]
+        return reduced, results
+
@@ -0,0 +1,383 @@
+"""
+Binary decision diagram module.
+
+This module provides reduced ordered binary decision diagrams (ROBDDs):
+- BDD: A node manager with a unique table and an operation cache, which
+  compiles expressions into canonical diagrams, counts their models and
+  enumerates them as disjoint cubes
+
+Nodes are integers: 0 and 1 are the terminals, every other node is a
+(level, low, high) triple stored once in the unique table, so equivalent
+functions compile to the same node. Variables are ordered by first use unless
+an explicit order is given; the order can change the diagram size
+exponentially, so pass one when a good order is known. Compilation cost is
+bounded by the diagram sizes, which makes a compiled diagram worth keeping
+when many queries (counts, weighted counts) are asked of the same formula.
+Operations walk the diagrams on explicit stacks, so diagrams may be deeper
+than the interpreter's recursion limit.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from agent_logic.core.base import LogicalExpression
+from agent_logic.core.operations import BINARY_TRUTH_FUNCTIONS, BinaryOp, NaryOp, Not
+from agent_logic.evaluation.cnf import atom_name
+
+FALSE = 0
+TRUE = 1
+
+
+class NodeBudgetExceeded(Exception):
+    """Raised when a manager would allocate more nodes than its budget."""
+
+
+class BDD:
+    """
+    Manager for reduced ordered binary decision diagrams.
+
+    Example:
+        >>> bdd = BDD()
+        >>> root = bdd.compile(FormulaParser.parse("P ∨ Q"))
+        >>> bdd.count(root)
+        3
+
+    Attributes:
+        order: Variable names, from the top of the diagrams to the bottom.
+    """
+
+    def __init__(self, order: Optional[Sequence[str]] = None, max_nodes: Optional[int] = None):
+        """
+        Creates an empty manager.
+
+        Args:
+            order: Initial variable order; variables met later during
+                   compilation are appended below these.
+            max_nodes: Optional bound on allocated nodes; operations that would
+                       exceed it raise NodeBudgetExceeded.
+        """
+        self.max_nodes = max_nodes
+        self.order: List[str] = []
+        self._level: Dict[str, int] = {}
+        # Parallel node arrays; terminals sit below every variable level.
+        self._levels: List[float] = [float("inf"), float("inf")]
+        self._lows: List[int] = [FALSE, TRUE]
+        self._highs: List[int] = [FALSE, TRUE]
+        self._unique: Dict[Tuple[int, int, int], int] = {}
+        self._apply_cache: Dict[Tuple[str, int, int], int] = {}
+        for name in order or ():
+            self.var(name)
+
+    def __len__(self) -> int:
+        """Returns the number of nodes allocated so far, terminals included."""
+        return len(self._levels)
+
+    def size(self, node: int) -> int:
+        """Returns the number of nodes reachable from ``node``, terminals included."""
+        seen = {node}
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if current > TRUE:
+                for child in (self._lows[current], self._highs[current]):
+                    if child not in seen:
+                        seen.add(child)
+                        stack.append(child)
+        return len(seen)
+
+    def var(self, name: str) -> int:
+        """Returns the diagram of a single variable, adding it to the order if needed."""
+        level = self._level.get(name)
+        if level is None:
+            level = self._level[name] = len(self.order)
+            self.order.append(name)
+        return self._node(level, FALSE, TRUE)
+
+    def _node(self, level: int, low: int, high: int) -> int:
+        if low == high:
+            return low
+        key = (level, low, high)
+        node = self._unique.get(key)
+        if node is None:
+            if self.max_nodes is not None and len(self._levels) >= self.max_nodes:
+                raise NodeBudgetExceeded
+            node = self._unique[key] = len(self._levels)
+            self._levels.append(level)
+            self._lows.append(low)
+            self._highs.append(high)
+        return node
+
+    def apply(self, operator: str, left: int, right: int) -> int:
+        """
+        Combines two diagrams with a binary operator.
+
+        Args:
+            operator: Any key of ``BINARY_TRUTH_FUNCTIONS`` ("AND", "OR", ...).
+            left: First operand node.
+            right: Second operand node.
+
+        Returns:
+            The node of the combined function.
+
+        Raises:
+            ValueError: If the operator is unknown.
+        """
+        truth = BINARY_TRUTH_FUNCTIONS.get(operator)
+        if truth is None:
+            raise ValueError(f"Unknown operator: {operator}")
+        return self._apply(operator, truth, left, right)
+
+    def _apply(self, operator, truth, left: int, right: int) -> int:
+        cache = self._apply_cache
+        levels, lows, highs = self._levels, self._lows, self._highs
+        # Explicit-stack Shannon expansion. The stack holds operand pairs to
+        # expand, pushed as two ints (right first), and (key, level) tuples
+        # that build a node from the two cofactor results on top of ``results``.
+        stack: List = [right, left]
+        results: List[int] = []
+        pop, push = stack.pop, stack.append
+        while stack:
+            a = pop()
+            if a.__class__ is tuple:
+                key, level = a
+                high = results.pop()
+                node = cache[key] = self._node(level, results.pop(), high)
+                results.append(node)
+                continue
+            b = pop()
+            if a <= TRUE and b <= TRUE:
+                results.append(TRUE if truth(a == TRUE, b == TRUE) else FALSE)
+                continue
+            key = (operator, a, b)
+            node = cache.get(key)
+            if node is not None:
+                results.append(node)
+                continue
+            level_a, level_b = levels[a], levels[b]
+            if level_a <= level_b:
+                level, a_low, a_high = level_a, lows[a], highs[a]
+            else:
+                level, a_low, a_high = level_b, a, a
+            if level_b == level:
+                b_low, b_high = lows[b], highs[b]
+            else:
+                b_low = b_high = b
+            # The low cofactor is expanded first, as in a recursive walk.
+            push((key, level))
+            push(b_high)
+            push(a_high)
+            push(b_low)
+            push(a_low)
+        return results[0]
+
+    def negate(self, node: int) -> int:
+        """Returns the diagram of the negated function."""
+        return self._apply("XOR", BINARY_TRUTH_FUNCTIONS["XOR"], node, TRUE)
+
+    def restrict(self, node: int, assignment: Dict[str, bool]) -> int:
+        """
+        Fixes the values of some variables in a diagram.
+
+        Args:
+            node: Root node.
+            assignment: Values of the variables to fix.
+
+        Returns:
+            The node of the restricted function.
+        """
+        fixed = {self._level[name]: value for name, value in assignment.items() if name in self._level}
+        memo: Dict[int, int] = {FALSE: FALSE, TRUE: TRUE}
+        # Post-order on an explicit stack; a node is finished once the
+        # children it depends on are in the memo.
+        stack = [node]
+        while stack:
+            current = stack[-1]
+            if current in memo:
+                stack.pop()
+                continue
+            level = self._levels[current]
+            if level in fixed:
+                child = self._highs[current] if fixed[level] else self._lows[current]
+                result = memo.get(child)
+                if result is None:
+                    stack.append(child)
+                    continue
+            else:
+                low, high = memo.get(self._lows[current]), memo.get(self._highs[current])
+                if low is None or high is None:
+                    if high is None:
+                        stack.append(self._highs[current])
+                    if low is None:
+                        stack.append(self._lows[current])
+                    continue
+                result = self._node(level, low, high)
+            stack.pop()
+            memo[current] = result
+        return memo[node]
+
+    def exists(self, node: int, names: Iterable[str]) -> int:
+        """
+        Existentially quantifies variables out of a diagram.
+
+        Args:
+            node: Root node.
+            names: Variables to eliminate.
+
+        Returns:
+            The node of the function that holds when some value of the
+            eliminated variables satisfies the original one.
+        """
+        levels = {self._level[name] for name in names if name in self._level}
+        if not levels:
+            return node
+        memo: Dict[int, int] = {FALSE: FALSE, TRUE: TRUE}
+        truth = BINARY_TRUTH_FUNCTIONS["OR"]
+        stack = [node]
+        while stack:
+            current = stack[-1]
+            if current in memo:
+                stack.pop()
+                continue
+            low, high = memo.get(self._lows[current]), memo.get(self._highs[current])
+            if low is None or high is None:
+                if high is None:
+                    stack.append(self._highs[current])
+                if low is None:
+                    stack.append(self._lows[current])
+                continue
+            stack.pop()
+            level = self._levels[current]
+            if level in levels:
+                memo[current] = self._apply("OR", truth, low, high)
+            else:
+                memo[current] = self._node(level, low, high)
+        return memo[node]
+
+    def cubes(self, node: int) -> Iterator[Dict[str, bool]]:
+        """
+        Lazily enumerates the paths from a node to the TRUE terminal.
+
+        Each path is a cube: a partial assignment all of whose completions
+        satisfy the function. Variables skipped by the path are omitted, and
+        different paths never share a model, so the cubes partition the models.
+
+        Args:
+            node: Root node.
+
+        Returns:
+            Iterator of partial assignments, one per path.
+        """
+        # Depth-first over (node, path); memory is bounded by the diagram height.
+        stack: List[Tuple[int, Tuple[Tuple[str, bool], ...]]] = [(node, ())]
+        while stack:
+            current, path = stack.pop()
+            if current == TRUE:
+                yield dict(path)
+                continue
+            if current == FALSE:
+                continue
+            name = self.order[self._levels[current]]
+            stack.append((self._lows[current], path + ((name, False),)))
+            stack.append((self._highs[current], path + ((name, True),)))
+
+    def compile(self, expression: LogicalExpression) -> int:
+        """
+        Compiles an expression into a diagram.
+
+        Args:
+            expression: The expression to compile; atoms are keyed like
+                        ``Relation.evaluate`` and shared subexpressions are
+                        compiled once.
+
+        Returns:
+            The root node.
+
+        Raises:
+            ValueError: If the expression contains unsupported node types.
+        """
+        compiled: Dict[int, int] = {}
+        stack = [(expression, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if id(node) in compiled:
+                continue
+            name = atom_name(node)
+            if name is not None:
+                compiled[id(node)] = self.var(name)
+                continue
+            if isinstance(node, Not):
+                children = (node.operand,)
+            elif isinstance(node, BinaryOp):
+                children = (node.left, node.right)
+            elif isinstance(node, NaryOp):
+                children = node.operands
+            else:
+                raise ValueError(f"Cannot compile expression type: {type(node).__name__}")
+            if not expanded:
+                stack.append((node, True))
+                stack.extend((child, False) for child in reversed(children))
+                continue
+            if isinstance(node, Not):
+                result = self.negate(compiled[id(node.operand)])
+            elif isinstance(node, BinaryOp):
+                result = self.apply(node.operator, compiled[id(node.left)], compiled[id(node.right)])
+            else:
+                result = compiled[id(node.operands[0])]
+                for operand in node.operands[1:]:
+                    result = self.apply(node.operator, result, compiled[id(operand)])
+            compiled[id(node)] = result
+        return compiled[id(expression)]
+
+    def count(self, node: int, weights: Optional[Dict[str, float]] = None):
+        """
+        Counts the models of a diagram over all variables of the manager.
+
+        Args:
+            node: Root node.
+            weights: Optional probability of each variable being true. A
+                     variable with probability ``p`` contributes ``p`` when
+                     true and ``1 - p`` when false; variables without a
+                     weight contribute 1 either way.
+
+        Returns:
+            The exact number of satisfying assignments (an int) without
+            weights, otherwise the total weight of the satisfying assignments.
+        """
+        pairs = [
+            (1, 1) if weights is None or name not in weights else (weights[name], 1 - weights[name])
+            for name in self.order
+        ]
+        levels, lows, highs = self._levels, self._lows, self._highs
+        bottom = len(pairs)
+
+        def level_of(current: int) -> int:
+            return bottom if current <= TRUE else levels[current]
+
+        def skipped(start: int, end: int):
+            # Weight of leaving levels [start, end) unconstrained.
+            total = 1
+            for level in range(start, end):
+                total *= pairs[level][0] + pairs[level][1]
+            return total
+
+        memo: Dict[int, object] = {FALSE: 0, TRUE: 1}
+        stack = [node]
+        while stack:
+            current = stack[-1]
+            if current in memo:
+                stack.pop()
+                continue
+            low, high = lows[current], highs[current]
+            pending = [child for child in (low, high) if child not in memo]
+            if pending:
+                stack.extend(pending)
+                continue
+            level = levels[current]
+            positive, negative = pairs[level]
+            memo[current] = (
+                positive * memo[high] * skipped(level + 1, level_of(high))
+                + negative * memo[low] * skipped(level + 1, level_of(low))
+            )
+            stack.pop()
+        return memo[node] * skipped(0, level_of(node))
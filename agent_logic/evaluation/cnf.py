@@ -0,0 +1,427 @@
+"""
+Clause encoding module.
+
+This module converts logical expressions into clause sets in the integer
+(DIMACS-style) encoding used by the SAT procedures:
+- CNF: A clause set together with the variable numbering
+- CNFEncoder: Direct (distributive) and Tseitin conversions
+- unit_propagate: Simplifies a clause set under a partial assignment
+
+A positive integer ``v`` denotes the variable numbered ``v`` and ``-v`` its
+negation. The direct conversion preserves the clause structure of the input,
+which is what formula classification needs; it is bounded by a clause budget
+because distribution can blow up exponentially. The Tseitin conversion is
+linear in the size of the expression and equisatisfiable (in fact it keeps the
+model count, since every auxiliary variable is functionally determined).
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from agent_logic.core.base import LogicalExpression
+from agent_logic.core.functions import Relation
+from agent_logic.core.operations import BinaryOp, NaryOp, Not, Proposition
+
+# Operators encoded as the negation of another operator.
+NEGATED_OPERATORS = {"NAND": "AND", "NOR": "OR", "XOR": "IFF"}
+
+
+class ClauseBudgetExceeded(Exception):
+    """Raised when a direct CNF conversion would exceed its clause budget."""
+
+
+def atom_name(expression: LogicalExpression) -> Optional[str]:
+    """
+    Returns the variable name under which an atomic expression is evaluated.
+
+    Relations use the same ``Name(a, b)`` key as ``Relation.evaluate``.
+
+    Args:
+        expression: The expression to inspect.
+
+    Returns:
+        The variable name, or None if the expression is not atomic.
+    """
+    if isinstance(expression, Proposition):
+        return expression.name
+    if isinstance(expression, Relation):
+        return f"{expression.name}({', '.join(expression.parameters)})"
+    return None
+
+
+class CNF:
+    """
+    Clause set in integer encoding.
+
+    Attributes:
+        clauses: List of clauses, each a list of non-zero integer literals.
+        variables: Names of the input variables in allocation order.
+        num_vars: Total number of variables including auxiliary ones.
+    """
+
+    __slots__ = ("clauses", "variables", "num_vars", "_index")
+
+    def __init__(self):
+        self.clauses: List[List[int]] = []
+        self.variables: List[str] = []
+        self.num_vars: int = 0
+        self._index: Dict[str, int] = {}
+
+    def var(self, name: str) -> int:
+        """Returns the number of a named variable, allocating it if needed."""
+        index = self._index.get(name)
+        if index is None:
+            self.num_vars += 1
+            index = self._index[name] = self.num_vars
+            self.variables.append(name)
+        return index
+
+    def aux(self) -> int:
+        """Allocates a fresh auxiliary variable."""
+        self.num_vars += 1
+        return self.num_vars
+
+    def decode(self, model: Dict[int, bool]) -> Dict[str, bool]:
+        """
+        Translates an integer model back to named input variables.
+
+        Args:
+            model: Mapping from variable number to truth value.
+
+        Returns:
+            Mapping from variable name to truth value (unset inputs are False).
+        """
+        return {name: bool(model.get(v, False)) for name, v in self._index.items()}
+
+    def encode(self, assignment: Dict[str, bool]) -> List[int]:
+        """Translates a named (partial) assignment into a list of literals."""
+        return [
+            self._index[name] if value else -self._index[name]
+            for name, value in assignment.items()
+            if name in self._index
+        ]
+
+    def __len__(self) -> int:
+        return len(self.clauses)
+
+    def __repr__(self) -> str:
+        return f"CNF(num_vars={self.num_vars}, clauses={len(self.clauses)})"
+
+
+def _normalize(clause: Iterable[int]) -> Optional[List[int]]:
+    """Sorts and deduplicates a clause; returns None for tautologies."""
+    literals = set(clause)
+    for literal in literals:
+        if -literal in literals:
+            return None
+    return sorted(literals, key=abs)
+
+
+class CNFEncoder:
+    """Converts logical expressions into clause sets."""
+
+    DEFAULT_MAX_CLAUSES = 10_000
+
+    @staticmethod
+    def direct(
+        expression: LogicalExpression,
+        max_clauses: int = DEFAULT_MAX_CLAUSES,
+        cnf: Optional[CNF] = None,
+    ) -> Optional[CNF]:
+        """
+        Converts an expression to an equivalent CNF by negation pushing and
+        distribution, without auxiliary variables.
+
+        Args:
+            expression: The expression to convert.
+            max_clauses: Upper bound on intermediate clause-set size.
+            cnf: Existing clause set to extend (shares its variable numbering).
+                 Variables allocated by a failed attempt are kept but unused.
+
+        Returns:
+            The clause set, or None if the budget was exceeded.
+
+        Raises:
+            ValueError: If the expression contains unsupported node types.
+        """
+        target = cnf if cnf is not None else CNF()
+        memo: Dict[tuple, List[List[int]]] = {}
+
+        def operator_of(node: BinaryOp, positive: bool) -> Tuple[str, bool]:
+            op = node.operator
+            if op in NEGATED_OPERATORS:
+                return NEGATED_OPERATORS[op], not positive
+            return op, positive
+
+        def children(node: LogicalExpression, positive: bool) -> List[Tuple[LogicalExpression, bool]]:
+            """Returns the (subexpression, polarity) pairs a conversion is built from."""
+            if atom_name(node) is not None:
+                return []
+            if isinstance(node, Not):
+                return [(node.operand, not positive)]
+            if isinstance(node, BinaryOp):
+                op, positive = operator_of(node, positive)
+                if op == "IFF":
+                    return [(node.left, True), (node.left, False), (node.right, True), (node.right, False)]
+                return [(node.left, positive if op != "IMPLIES" else not positive), (node.right, positive)]
+            if isinstance(node, NaryOp):
+                return [(operand, positive) for operand in node.operands]
+            raise ValueError(f"Cannot encode expression type: {type(node).__name__}")
+
+        def combine(node: LogicalExpression, positive: bool) -> List[List[int]]:
+            """Builds the clauses of a node from the converted children."""
+            def part(child: LogicalExpression, polarity: bool) -> List[List[int]]:
+                return memo[(id(child), polarity)]
+
+            name = atom_name(node)
+            if name is not None:
+                v = target.var(name)
+                return [[v if positive else -v]]
+            if isinstance(node, Not):
+                return part(node.operand, not positive)
+            if isinstance(node, BinaryOp):
+                op, positive = operator_of(node, positive)
+                if op == "AND":
+                    if positive:
+                        return _conjoin(part(node.left, True), part(node.right, True))
+                    return _disjoin(part(node.left, False), part(node.right, False), max_clauses)
+                if op == "OR":
+                    if positive:
+                        return _disjoin(part(node.left, True), part(node.right, True), max_clauses)
+                    return _conjoin(part(node.left, False), part(node.right, False))
+                if op == "IMPLIES":
+                    if positive:
+                        return _disjoin(part(node.left, False), part(node.right, True), max_clauses)
+                    return _conjoin(part(node.left, True), part(node.right, False))
+                if op == "IFF":
+                    l_pos, l_neg = part(node.left, True), part(node.left, False)
+                    r_pos, r_neg = part(node.right, True), part(node.right, False)
+                    if positive:
+                        return _conjoin(
+                            _disjoin(l_neg, r_pos, max_clauses),
+                            _disjoin(l_pos, r_neg, max_clauses),
+                        )
+                    return _conjoin(
+                        _disjoin(l_pos, r_pos, max_clauses),
+                        _disjoin(l_neg, r_neg, max_clauses),
+                    )
+                raise ValueError(f"Unknown operator: {op}")
+            parts = [part(operand, positive) for operand in node.operands]
+            result = parts[0]
+            if (node.operator == "AND") == positive:
+                for other in parts[1:]:
+                    result = _conjoin(result, other)
+            else:
+                for other in parts[1:]:
+                    result = _disjoin(result, other, max_clauses)
+            return result
+
+        def convert(root: LogicalExpression) -> List[List[int]]:
+            # Post-order over (node, polarity) pairs on an explicit stack, so
+            # deep expressions do not hit the recursion limit.
+            stack: List[Tuple[LogicalExpression, bool, bool]] = [(root, True, False)]
+            while stack:
+                node, positive, expanded = stack.pop()
+                key = (id(node), positive)
+                if key in memo:
+                    continue
+                if not expanded:
+                    pending = [
+                        (child, polarity)
+                        for child, polarity in children(node, positive)
+                        if (id(child), polarity) not in memo
+                    ]
+                    if pending:
+                        stack.append((node, positive, True))
+                        # Reversed, so atoms are numbered left to right.
+                        stack.extend((child, polarity, False) for child, polarity in reversed(pending))
+                        continue
+                result = combine(node, positive)
+                if len(result) > max_clauses:
+                    raise ClauseBudgetExceeded
+                memo[key] = result
+            return memo[(id(root), True)]
+
+        try:
+            clauses = convert(expression)
+        except ClauseBudgetExceeded:
+            return None
+        target.clauses.extend(list(c) for c in clauses)
+        return target
+
+    @staticmethod
+    def tseitin(expression: LogicalExpression, cnf: Optional[CNF] = None) -> CNF:
+        """
+        Converts an expression to an equisatisfiable CNF in linear size.
+
+        Args:
+            expression: The expression to convert.
+            cnf: Existing clause set to extend (shares its variable numbering).
+
+        Returns:
+            The clause set asserting the expression.
+
+        Raises:
+            ValueError: If the expression contains unsupported node types.
+        """
+        target = cnf if cnf is not None else CNF()
+        root = CNFEncoder.tseitin_literal(expression, target)
+        target.clauses.append([root])
+        return target
+
+    @staticmethod
+    def tseitin_literal(expression: LogicalExpression, cnf: CNF) -> int:
+        """
+        Adds Tseitin definitions for an expression and returns its literal.
+
+        The returned literal is equivalent to the expression under the added
+        clauses but is not asserted, which lets callers use it as a selector
+        or combine several expressions.
+
+        Args:
+            expression: The expression to define.
+            cnf: Clause set that receives the definitions.
+
+        Returns:
+            Integer literal standing for the expression.
+        """
+        literal_of: Dict[int, int] = {}
+        clauses = cnf.clauses
+        stack = [(expression, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if id(node) in literal_of:
+                continue
+            name = atom_name(node)
+            if name is not None:
+                literal_of[id(node)] = cnf.var(name)
+                continue
+            if isinstance(node, Not):
+                children = [node.operand]
+            elif isinstance(node, BinaryOp):
+                children = [node.left, node.right]
+            elif isinstance(node, NaryOp):
+                children = node.operands
+            else:
+                raise ValueError(f"Cannot encode expression type: {type(node).__name__}")
+            if not expanded:
+                stack.append((node, True))
+                stack.extend((child, False) for child in children)
+                continue
+            if isinstance(node, Not):
+                literal_of[id(node)] = -literal_of[id(node.operand)]
+                continue
+            if isinstance(node, NaryOp):
+                literals = list(dict.fromkeys(literal_of[id(operand)] for operand in node.operands))
+                x = cnf.aux()
+                if node.operator == "AND":
+                    clauses.extend([-x, literal] for literal in literals)
+                    clauses.append([x] + [-literal for literal in literals])
+                else:
+                    clauses.extend([x, -literal] for literal in literals)
+                    clauses.append([-x] + literals)
+                literal_of[id(node)] = x
+                continue
+
+            a, b = literal_of[id(node.left)], literal_of[id(node.right)]
+            op = node.operator
+            negated = op in NEGATED_OPERATORS
+            if negated:
+                op = NEGATED_OPERATORS[op]
+            if op == "IMPLIES":
+                a, op = -a, "OR"
+            x = cnf.aux()
+            if op == "AND":
+                clauses.extend(([-x, a], [-x, b], [x, -a, -b]))
+            elif op == "OR":
+                clauses.extend(([x, -a], [x, -b], [-x, a, b]))
+            elif op == "IFF":
+                clauses.extend(([-x, -a, b], [-x, a, -b], [x, a, b], [x, -a, -b]))
+            else:
+                raise ValueError(f"Unknown operator: {op}")
+            literal_of[id(node)] = -x if negated else x
+        return literal_of[id(expression)]
+
+
+def unit_propagate(
+    clauses: Sequence[Sequence[int]], literals: Sequence[int]
+) -> Optional[Tuple[List[Tuple[int, ...]], Set[int]]]:
+    """
+    Assigns literals and simplifies a clause set by unit propagation.
+
+    Args:
+        clauses: The clauses to simplify.
+        literals: Literals to assign first.
+
+    Returns:
+        The clauses that are not yet satisfied, with false literals removed,
+        and the set of literals assigned (given and propagated); or None if
+        the literals conflict with the clauses.
+    """
+    if not literals:
+        return list(clauses), set()
+    # Occurrence lists: literal -> positions of the clauses containing it.
+    occurrences: Dict[int, List[int]] = {}
+    for position, clause in enumerate(clauses):
+        for literal in clause:
+            occurrences.setdefault(literal, []).append(position)
+    satisfied = [False] * len(clauses)
+    # Number of literals of each clause not yet assigned false.
+    open_literals = [len(clause) for clause in clauses]
+    queue = list(literals)
+    for clause in clauses:
+        if not clause:
+            return None
+        if len(clause) == 1:
+            queue.append(clause[0])
+    assigned: Set[int] = set()
+    while queue:
+        literal = queue.pop()
+        if literal in assigned:
+            continue
+        if -literal in assigned:
+            return None
+        assigned.add(literal)
+        for position in occurrences.get(literal, ()):
+            satisfied[position] = True
+        for position in occurrences.get(-literal, ()):
+            if satisfied[position]:
+                continue
+            open_literals[position] -= 1
+            if not open_literals[position]:
+                return None
+            if open_literals[position] == 1:
+                queue.extend(other for other in clauses[position] if -other not in assigned)
+    remaining = [
+        tuple(literal for literal in clause if -literal not in assigned)
+        for clause, done in zip(clauses, satisfied)
+        if not done
+    ]
+    return remaining, assigned
+
+
+def _conjoin(left: List[List[int]], right: List[List[int]]) -> List[List[int]]:
+    """Returns the clause set of a conjunction."""
+    if left is right:
+        return left
+    seen = {tuple(c) for c in left}
+    return left + [c for c in right if tuple(c) not in seen]
+
+
+def _disjoin(left: List[List[int]], right: List[List[int]], max_clauses: int) -> List[List[int]]:
+    """Returns the clause set of a disjunction by distributing over the clauses."""
+    if len(left) * len(right) > max_clauses:
+        raise ClauseBudgetExceeded
+    result: List[List[int]] = []
+    seen = set()
+    for a in left:
+        for b in right:
+            clause = _normalize(a + b)
+            if clause is None:
+                continue
+            key = tuple(clause)
+            if key not in seen:
+                seen.add(key)
+                result.append(clause)
+    return result
@@ -0,0 +1,147 @@
+"""
+Model enumeration module.
+
+This module lazily enumerates the satisfying assignments of expressions
+(AllSAT):
+- ModelEnumerator: Yields models or compressed cubes one at a time, with
+  optional projection onto a subset of the variables
+
+The default "sat" method runs a depth-first search over the clause form of
+the expression (the direct CNF when it fits the clause budget, otherwise the
+Tseitin encoding). Each branch assigns one projected variable and runs unit
+propagation, and every branch is checked with the incremental CDCL solver
+before it is entered, so no dead end is ever explored: the delay between two
+results is polynomial, and memory is bounded by the search depth rather than
+by the number of models found (no blocking clauses are kept). When every
+clause is satisfied before all projected variables are assigned, the
+remaining ones are don't-cares and the result is a cube. Branches are
+disjoint, so cubes never overlap.
+
+The "bdd" method compiles a binary decision diagram, quantifies away the
+non-projected variables, and walks its paths to the TRUE terminal.
+"""
+
+from __future__ import annotations
+
+import itertools
+from typing import Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+from agent_logic.core.base import LogicalExpression
+from agent_logic.evaluation.bdd import BDD
+from agent_logic.evaluation.cnf import CNF, CNFEncoder, unit_propagate
+from agent_logic.evaluation.sat_solvers import CDCLSolver
+
+
+class ModelEnumerator:
+    """Enumerates the satisfying assignments of expressions."""
+
+    @staticmethod
+    def iter_models(
+        expression: LogicalExpression,
+        project_onto: Optional[Sequence[str]] = None,
+        cubes: bool = False,
+        method: str = "sat",
+    ) -> Iterator[Dict[str, bool]]:
+        """
+        Lazily yields the satisfying assignments of an expression.
+
+        Args:
+            expression: The expression to enumerate models of.
+            project_onto: Variables to report (relations use their
+                          ``Name(a, b)`` key); defaults to the atoms of the
+                          expression. Assignments that differ only outside
+                          these variables are reported once.
+            cubes: Yield partial assignments that omit don't-care variables
+                   instead of expanding every cube into full assignments.
+            method: "sat" for the solver-guided search or "bdd" for decision
+                    diagram path traversal.
+
+        Returns:
+            Iterator of assignments over the projected variables. Cubes and
+            full assignments are pairwise disjoint, so each projected model is
+            reported exactly once.
+
+        Raises:
+            ValueError: If the method is unknown or the expression contains
+                        unsupported node types.
+        """
+        if method == "bdd":
+            results = ModelEnumerator._bdd_cubes(expression, project_onto)
+        elif method == "sat":
+            results = ModelEnumerator._sat_cubes(expression, project_onto)
+        else:
+            raise ValueError(f"Unknown enumeration method: {method}")
+        names, cube_iterator = results
+        if cubes:
+            return cube_iterator
+        return ModelEnumerator._expand(names, cube_iterator)
+
+    @staticmethod
+    def _expand(names: List[str], cube_iterator: Iterator[Dict[str, bool]]) -> Iterator[Dict[str, bool]]:
+        for cube in cube_iterator:
+            free = [name for name in names if name not in cube]
+            for values in itertools.product([False, True], repeat=len(free)):
+                model = dict(cube)
+                model.update(zip(free, values))
+                yield {name: model[name] for name in names}
+
+    @staticmethod
+    def _bdd_cubes(expression, project_onto) -> Tuple[List[str], Iterator[Dict[str, bool]]]:
+        bdd = BDD()
+        root = bdd.compile(expression)
+        names = list(project_onto) if project_onto is not None else list(bdd.order)
+        projected = set(names)
+        root = bdd.exists(root, [name for name in bdd.order if name not in projected])
+        return names, bdd.cubes(root)
+
+    @staticmethod
+    def _sat_cubes(expression, project_onto) -> Tuple[List[str], Iterator[Dict[str, bool]]]:
+        cnf = CNFEncoder.direct(expression)
+        if cnf is None:
+            cnf = CNFEncoder.tseitin(expression, CNF())
+        names = list(project_onto) if project_onto is not None else list(cnf.variables)
+        numbers = {cnf.var(name): name for name in names}
+        return names, ModelEnumerator._search(cnf, numbers)
+
+    @staticmethod
+    def _search(cnf: CNF, numbers: Dict[int, str]) -> Iterator[Dict[str, bool]]:
+        clauses = [tuple(clause) for clause in cnf.clauses]
+        if any(not clause for clause in clauses):
+            return
+        solver = CDCLSolver(cnf.num_vars, cnf.clauses)
+        if not solver.solve():
+            return
+        start = unit_propagate(clauses, [clause[0] for clause in clauses if len(clause) == 1])
+        if start is None:
+            return
+        # Entries: (remaining clauses, assigned literals, projected decisions).
+        stack: List[Tuple[List[Tuple[int, ...]], Set[int], Tuple[int, ...]]] = [
+            (start[0], start[1], ())
+        ]
+        while stack:
+            remaining, assigned, decisions = stack.pop()
+            occurrences: Dict[int, int] = {}
+            for clause in remaining:
+                for literal in clause:
+                    variable = abs(literal)
+                    if variable in numbers:
+                        occurrences[variable] = occurrences.get(variable, 0) + 1
+            if not occurrences:
+                # The solver check guarantees an extension exists, and no
+                # remaining clause mentions an unassigned projected variable.
+                yield {
+                    numbers[abs(literal)]: literal > 0
+                    for literal in assigned
+                    if abs(literal) in numbers
+                }
+                continue
+            variable = max(occurrences, key=occurrences.__getitem__)
+            # Push the negative branch first so the positive one is explored first.
+            for literal in (-variable, variable):
+                branch = unit_propagate(remaining, [literal])
+                if branch is None:
+                    continue
+                branch_decisions = decisions + (literal,)
+                if branch[0] and not solver.solve(branch_decisions):
+                    continue
+                stack.append((branch[0], assigned | branch[1], branch_decisions))
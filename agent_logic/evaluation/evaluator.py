@@ -2,14 +2,36 @@
 Expression evaluator module.
 
 This module provides utilities for evaluating logical expressions with different truth assignments.
+
+Satisfiability, validity and equivalence checks are routed through the
+cheapest complete procedure for the input: the clause form of the expression
+is classified as Horn, dual-Horn or 2-CNF (each decidable in linear time),
+tiny inputs are enumerated with a truth table, and everything else goes to
+the CDCL solver.
 """
 
-from typing import Dict
+from itertools import product
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
 
 from agent_logic.core.base import LogicalExpression
 from agent_logic.core.functions import Function, Relation
-from agent_logic.core.operations import BinaryOp, Not, Proposition
+from agent_logic.core.operations import BinaryOp, NaryOp, Not, Proposition
 from agent_logic.core.quantifiers import ExistentialQuantifier, UniversalQuantifier
+from agent_logic.evaluation.cnf import CNF, CNFEncoder
+from agent_logic.evaluation.sat_solvers import (
+    DUAL_HORN,
+    GENERAL,
+    HORN,
+    SMALL,
+    TWO_CNF,
+    CDCLSolver,
+    HornSAT,
+    TwoSAT,
+    classify_clauses,
+)
+from agent_logic.evaluation.enumeration import ModelEnumerator
+from agent_logic.evaluation.model_counting import ModelCounter
+from agent_logic.evaluation.vectorized import BatchEvaluator
 
 
 class Evaluator:
@@ -18,8 +40,17 @@ class Evaluator:
 
     This class provides methods to evaluate expressions and determine logical properties
     such as consistency, validity, and equivalence.
+
+    Attributes:
+        TRUTH_TABLE_MAX_VARIABLES: Largest variable count for which a formula
+            outside the tractable classes is decided by enumeration.
+        MAX_DIRECT_CLAUSES: Clause budget for the structure-preserving CNF
+            used for classification; larger formulas are treated as general.
     """
 
+    TRUTH_TABLE_MAX_VARIABLES = 6
+    MAX_DIRECT_CLAUSES = CNFEncoder.DEFAULT_MAX_CLAUSES
+
     @staticmethod
     def evaluate_with_assignment(expression: LogicalExpression, assignment: Dict[str, bool]) -> bool:
         """
@@ -34,6 +65,84 @@ class Evaluator:
         """
         return expression.evaluate(assignment)
 
+    @staticmethod
+    def evaluate_batch(
+        expression: LogicalExpression,
+        assignments: Union[Sequence[Dict[str, bool]], Any],
+        variables: Optional[Sequence[str]] = None,
+    ) -> Union[List[bool], Any]:
+        """
+        Evaluates one expression under many assignments in a single bit-parallel pass.
+
+        Args:
+            expression: The logical expression to evaluate
+            assignments: Sequence of assignment dictionaries, or a 2-D boolean
+                         NumPy array with one column per variable
+            variables: Column names for array input; defaults to the sorted
+                       atom names of the expression
+
+        Returns:
+            List of results for dictionary input, boolean NumPy array for array input
+        """
+        return BatchEvaluator.evaluate_batch(expression, assignments, variables)
+
+    @staticmethod
+    def evaluate_many(expressions: Sequence[LogicalExpression], assignment: Dict[str, bool]) -> List[bool]:
+        """
+        Evaluates many expressions under one assignment, sharing common subexpressions.
+
+        Args:
+            expressions: The logical expressions to evaluate
+            assignment: Dictionary mapping variable names to boolean values
+
+        Returns:
+            List of results, one per expression
+        """
+        return BatchEvaluator.evaluate_many(expressions, assignment)
+
+    @staticmethod
+    def count_models(
+        expression: LogicalExpression,
+        variables: Optional[Sequence[str]] = None,
+        weights: Optional[Dict[str, float]] = None,
+        method: str = "dpll",
+    ):
+        """
+        Counts the satisfying assignments of an expression exactly.
+
+        Args:
+            expression: The logical expression to count models of
+            variables: Extra variables to count over besides the expression's atoms
+            weights: Optional probability of each variable being true; the
+                     result is then the total weight of the models
+            method: "dpll" (component caching) or "bdd" (decision diagram)
+
+        Returns:
+            Number of models as an int, or their total weight when weighted
+        """
+        return ModelCounter.count(expression, variables, weights, method)
+
+    @staticmethod
+    def iter_models(
+        expression: LogicalExpression,
+        project_onto: Optional[Sequence[str]] = None,
+        cubes: bool = False,
+        method: str = "sat",
+    ) -> Iterator[Dict[str, bool]]:
+        """
+        Lazily yields the satisfying assignments of an expression.
+
+        Args:
+            expression: The logical expression to enumerate models of
+            project_onto: Variables to report; defaults to the expression's atoms
+            cubes: Yield partial assignments that omit don't-care variables
+            method: "sat" (solver-guided search) or "bdd" (decision diagram paths)
+
+        Returns:
+            Iterator of disjoint (partial) assignments over the projected variables
+        """
+        return ModelEnumerator.iter_models(expression, project_onto, cubes, method)
+
     @staticmethod
     def are_equivalent(expr1: LogicalExpression, expr2: LogicalExpression) -> bool:
         """
@@ -49,15 +158,18 @@ class Evaluator:
         Returns:
             True if the expressions are equivalent, False otherwise
         """
-        # Get all variables from both expressions
-        variables = set(expr1.variables() + expr2.variables())
+        try:
+            difference = Not(operand=BinaryOp(left=expr1, right=expr2, operator="IFF"))
+            return Evaluator.find_model(difference) is None
+        except ValueError:
+            pass
 
-        # Generate all possible truth assignments
-        from agent_logic.evaluation.truth_table import TruthTable
-        assignments = TruthTable._generate_assignments(list(variables))
+        # Get all variables from both expressions
+        variables = sorted(set(expr1.variables() + expr2.variables()))
 
         # Check if the expressions have the same value for all assignments
-        for assignment in assignments:
+        for values in product([False, True], repeat=len(variables)):
+            assignment = dict(zip(variables, values, strict=True))
             if expr1.evaluate(assignment) != expr2.evaluate(assignment):
                 return False
 
@@ -74,8 +186,11 @@ class Evaluator:
         Returns:
             True if the expression is satisfiable, False otherwise
         """
-        from agent_logic.evaluation.truth_table import TruthTable
-        return TruthTable(expression).is_satisfiable()
+        try:
+            return Evaluator.find_model(expression) is not None
+        except ValueError:
+            from agent_logic.evaluation.truth_table import TruthTable
+            return TruthTable(expression).is_satisfiable()
 
     @staticmethod
     def is_valid(expression: LogicalExpression) -> bool:
@@ -88,8 +203,74 @@ class Evaluator:
         Returns:
             True if the expression is valid, False otherwise
         """
-        from agent_logic.evaluation.truth_table import TruthTable
-        return TruthTable(expression).is_tautology()
+        try:
+            return Evaluator.find_model(Not(operand=expression)) is None
+        except ValueError:
+            from agent_logic.evaluation.truth_table import TruthTable
+            return TruthTable(expression).is_tautology()
+
+    @staticmethod
+    def classify(expression: LogicalExpression) -> str:
+        """
+        Classifies an expression by the cheapest complete procedure for it.
+
+        Args:
+            expression: The logical expression to classify
+
+        Returns:
+            One of ``"Horn"``, ``"dual-Horn"``, ``"2-CNF"``, ``"small"`` or ``"general"``.
+
+        Raises:
+            ValueError: If the expression contains node types that cannot be encoded.
+        """
+        return Evaluator._route(expression)[0]
+
+    @staticmethod
+    def find_model(expression: LogicalExpression) -> Optional[Dict[str, bool]]:
+        """
+        Finds a satisfying assignment using the procedure chosen by ``classify``.
+
+        Args:
+            expression: The logical expression to satisfy
+
+        Returns:
+            A satisfying assignment over the expression's variables, or None
+            if the expression is unsatisfiable
+
+        Raises:
+            ValueError: If the expression contains node types that cannot be encoded.
+        """
+        kind, cnf = Evaluator._route(expression)
+        if kind == HORN:
+            model = HornSAT.solve(cnf.clauses, cnf.num_vars)
+        elif kind == DUAL_HORN:
+            model = HornSAT.solve_dual(cnf.clauses, cnf.num_vars)
+        elif kind == TWO_CNF:
+            model = TwoSAT.solve(cnf.clauses, cnf.num_vars)
+        elif kind == SMALL:
+            for values in product([False, True], repeat=len(cnf.variables)):
+                assignment = dict(zip(cnf.variables, values, strict=True))
+                if expression.evaluate(assignment):
+                    return assignment
+            return None
+        else:
+            solver = CDCLSolver(cnf.num_vars, cnf.clauses)
+            model = solver.model if solver.solve() else None
+        return None if model is None else cnf.decode(model)
+
+    @staticmethod
+    def _route(expression: LogicalExpression):
+        """Returns the procedure class and the clause set it should run on."""
+        cnf = CNFEncoder.direct(expression, max_clauses=Evaluator.MAX_DIRECT_CLAUSES)
+        if cnf is not None:
+            classes = classify_clauses(cnf.clauses)
+            if classes:
+                return classes[0], cnf
+        else:
+            cnf = CNFEncoder.tseitin(expression, CNF())
+        if len(cnf.variables) <= Evaluator.TRUTH_TABLE_MAX_VARIABLES:
+            return SMALL, cnf
+        return GENERAL, cnf
 
     @staticmethod
     def evaluate(expression: LogicalExpression, context: Dict[str, bool]) -> bool:
@@ -100,6 +281,8 @@ class Evaluator:
             return expression.evaluate(context)
         elif isinstance(expression, BinaryOp):
             return expression.evaluate(context)
+        elif isinstance(expression, NaryOp):
+            return expression.evaluate(context)
         elif isinstance(expression, Function):
             return expression.evaluate(context)
         elif isinstance(expression, Relation):
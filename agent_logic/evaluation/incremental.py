@@ -0,0 +1,237 @@
+"""
+Incremental evaluation module.
+
+This module keeps an expression evaluated while single variables change:
+- EvaluationSession: Caches the value of every node and, when a variable is
+  set or flipped, re-evaluates only the ancestors of that variable
+
+The expression is compiled once into a node table in topological order
+(children before parents) with parent lists. A change is propagated upward
+through a priority queue keyed by topological position, so a node shared by
+several changed children is recomputed once, after all of them, and
+propagation stops at nodes whose value does not change. N-ary conjunctions and
+disjunctions keep a count of true operands, so updating them is O(1) no matter
+how many operands they have. The cost of an update is therefore proportional to
+the part of the affected cone whose values actually change.
+"""
+
+from __future__ import annotations
+
+import heapq
+from typing import Dict, List, Optional
+
+from agent_logic.core.base import LogicalExpression
+from agent_logic.core.operations import BINARY_TRUTH_FUNCTIONS, BinaryOp, NaryOp, Not, Proposition
+from agent_logic.evaluation.cnf import atom_name
+
+_ATOM, _NOT, _BINARY, _AND_N, _OR_N = range(5)
+
+
+class EvaluationSession:
+    """
+    Maintains the value of an expression under a changing assignment.
+
+    Example:
+        >>> session = EvaluationSession(FormulaParser.parse("(P ∧ Q) → R"), {"P": True, "Q": True, "R": False})
+        >>> session.value
+        False
+        >>> session.flip("R")
+        True
+
+    Attributes:
+        expression: The expression being evaluated.
+        last_update_count: Number of nodes recomputed by the most recent update.
+    """
+
+    def __init__(self, expression: LogicalExpression, assignment: Dict[str, bool]):
+        """
+        Compiles the expression and evaluates it under an initial assignment.
+
+        Args:
+            expression: The expression to evaluate; shared subexpressions are
+                        compiled once.
+            assignment: Initial truth values. Every proposition needs a value;
+                        relations without one default to False.
+
+        Raises:
+            ValueError: If a proposition has no value or the expression
+                        contains unsupported node types.
+        """
+        self.expression = expression
+        self.last_update_count = 0
+        self._kinds: List[int] = []
+        self._children: List[List[int]] = []
+        self._operators: List[Optional[str]] = []
+        self._parents: List[List[int]] = []
+        self._values: List[bool] = []
+        # Number of true operands of each n-ary node.
+        self._true_counts: List[int] = []
+        self._atoms: Dict[str, List[int]] = {}
+        self._assignment: Dict[str, bool] = {}
+        self._root = self._compile(expression, assignment)
+
+    def _compile(self, expression: LogicalExpression, assignment: Dict[str, bool]) -> int:
+        index_of: Dict[int, int] = {}
+        stack = [(expression, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if id(node) in index_of:
+                continue
+            name = atom_name(node)
+            if name is not None:
+                if name not in assignment and isinstance(node, Proposition):
+                    raise ValueError(f"No truth value provided for proposition {name}")
+                value = bool(assignment.get(name, False))
+                self._assignment[name] = value
+                index_of[id(node)] = self._add(_ATOM, [], None, value)
+                self._atoms.setdefault(name, []).append(index_of[id(node)])
+                continue
+            if isinstance(node, Not):
+                children = [node.operand]
+            elif isinstance(node, BinaryOp):
+                children = [node.left, node.right]
+            elif isinstance(node, NaryOp):
+                children = list(node.operands)
+            else:
+                raise ValueError(f"Cannot evaluate expression type: {type(node).__name__}")
+            if not expanded:
+                stack.append((node, True))
+                stack.extend((child, False) for child in reversed(children))
+                continue
+            child_indices = [index_of[id(child)] for child in children]
+            values = [self._values[child] for child in child_indices]
+            if isinstance(node, Not):
+                index = self._add(_NOT, child_indices, None, not values[0])
+            elif isinstance(node, BinaryOp):
+                truth = BINARY_TRUTH_FUNCTIONS.get(node.operator)
+                if truth is None:
+                    raise ValueError(f"Unknown operator: {node.operator}")
+                index = self._add(_BINARY, child_indices, node.operator, truth(values[0], values[1]))
+            else:
+                count = sum(values)
+                if node.operator == "AND":
+                    index = self._add(_AND_N, child_indices, None, count == len(values))
+                else:
+                    index = self._add(_OR_N, child_indices, None, count > 0)
+                self._true_counts[index] = count
+            for child in child_indices:
+                self._parents[child].append(index)
+            index_of[id(node)] = index
+        return index_of[id(expression)]
+
+    def _add(self, kind: int, children: List[int], operator: Optional[str], value: bool) -> int:
+        self._kinds.append(kind)
+        self._children.append(children)
+        self._operators.append(operator)
+        self._parents.append([])
+        self._values.append(value)
+        self._true_counts.append(0)
+        return len(self._kinds) - 1
+
+    @property
+    def value(self) -> bool:
+        """The value of the expression under the current assignment."""
+        return self._values[self._root]
+
+    @property
+    def assignment(self) -> Dict[str, bool]:
+        """A copy of the current assignment of the expression's atoms."""
+        return dict(self._assignment)
+
+    def __len__(self) -> int:
+        """Returns the number of distinct nodes in the compiled expression."""
+        return len(self._kinds)
+
+    def set(self, name: str, value: bool) -> bool:
+        """
+        Assigns a variable and updates the affected nodes.
+
+        Args:
+            name: Variable name (relations use their ``Name(a, b)`` key).
+            value: The new truth value.
+
+        Returns:
+            The value of the expression after the update.
+
+        Raises:
+            KeyError: If the expression does not contain the variable.
+        """
+        if name not in self._atoms:
+            raise KeyError(name)
+        value = bool(value)
+        self.last_update_count = 0
+        if self._assignment[name] == value:
+            return self.value
+        self._assignment[name] = value
+        values = self._values
+        queue: List[int] = []
+        queued = set()
+        for leaf in self._atoms[name]:
+            values[leaf] = value
+            self._notify(leaf, queue, queued)
+        while queue:
+            index = heapq.heappop(queue)
+            queued.discard(index)
+            self.last_update_count += 1
+            new_value = self._recompute(index)
+            if new_value != values[index]:
+                values[index] = new_value
+                self._notify(index, queue, queued)
+        return self.value
+
+    def flip(self, name: str) -> bool:
+        """
+        Negates a variable and updates the affected nodes.
+
+        Args:
+            name: Variable name (relations use their ``Name(a, b)`` key).
+
+        Returns:
+            The value of the expression after the update.
+
+        Raises:
+            KeyError: If the expression does not contain the variable.
+        """
+        if name not in self._atoms:
+            raise KeyError(name)
+        return self.set(name, not self._assignment[name])
+
+    def update(self, assignment: Dict[str, bool]) -> bool:
+        """
+        Assigns several variables, one after another.
+
+        Args:
+            assignment: New truth values; names not in the expression are ignored.
+
+        Returns:
+            The value of the expression after the update.
+        """
+        total = 0
+        for name, value in assignment.items():
+            if name in self._atoms:
+                self.set(name, value)
+                total += self.last_update_count
+        self.last_update_count = total
+        return self.value
+
+    def _notify(self, child: int, queue: List[int], queued: set) -> None:
+        """Schedules the parents of a node whose value just changed."""
+        delta = 1 if self._values[child] else -1
+        for parent in self._parents[child]:
+            if self._kinds[parent] >= _AND_N:
+                self._true_counts[parent] += delta
+            if parent not in queued:
+                queued.add(parent)
+                heapq.heappush(queue, parent)
+
+    def _recompute(self, index: int) -> bool:
+        kind = self._kinds[index]
+        children = self._children[index]
+        values = self._values
+        if kind == _NOT:
+            return not values[children[0]]
+        if kind == _BINARY:
+            return BINARY_TRUTH_FUNCTIONS[self._operators[index]](values[children[0]], values[children[1]])
+        if kind == _AND_N:
+            return self._true_counts[index] == len(children)
+        return self._true_counts[index] > 0
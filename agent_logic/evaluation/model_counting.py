@@ -0,0 +1,238 @@
+"""
+Model counting module.
+
+This module counts the satisfying assignments of expressions (#SAT):
+- ModelCounter: Exact, optionally weighted, model counts by DPLL search with
+  connected-component decomposition and a component cache, or by compiling a
+  binary decision diagram
+
+The DPLL counter works on the clause form of the expression: the direct CNF
+when it fits the clause budget, otherwise the Tseitin encoding, whose
+auxiliary variables are functionally determined by the inputs and so do not
+change the count. After each decision and unit propagation the remaining
+clauses are split into components that share no variable; components are
+counted independently and their counts multiplied, and every component count
+is cached under its clause set, so isomorphic subproblems reached along
+different branches are counted once. Unit propagation walks occurrence lists
+and the search runs on an explicit stack, so long implication or parity chains
+are counted without deep recursion. Counts are exact Python integers.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from agent_logic.core.base import LogicalExpression
+from agent_logic.evaluation.bdd import BDD
+from agent_logic.evaluation.cnf import CNF, CNFEncoder, unit_propagate
+
+Clause = Tuple[int, ...]
+
+
+def _components(clauses: List[Clause]) -> List[List[Clause]]:
+    """Splits clauses into groups that share no variable."""
+    parent: Dict[int, int] = {}
+
+    def find(variable: int) -> int:
+        root = variable
+        while parent[root] != root:
+            root = parent[root]
+        while parent[variable] != root:
+            parent[variable], variable = root, parent[variable]
+        return root
+
+    for clause in clauses:
+        first = abs(clause[0])
+        parent.setdefault(first, first)
+        for literal in clause[1:]:
+            variable = abs(literal)
+            parent.setdefault(variable, variable)
+            a, b = find(first), find(variable)
+            if a != b:
+                parent[b] = a
+    groups: Dict[int, List[Clause]] = {}
+    for clause in clauses:
+        groups.setdefault(find(abs(clause[0])), []).append(clause)
+    return list(groups.values())
+
+
+def _variables(clauses: Sequence[Clause]) -> set:
+    return {abs(literal) for clause in clauses for literal in clause}
+
+
+class _Counter:
+    """Weighted DPLL counter with component caching over one clause set."""
+
+    def __init__(self, weights: Dict[int, Tuple[object, object]]):
+        self.weights = weights
+        self.cache: Dict[Tuple[Clause, ...], object] = {}
+
+    def weight(self, literal: int):
+        positive, negative = self.weights.get(abs(literal), (1, 1))
+        return positive if literal > 0 else negative
+
+    def free(self, variable: int):
+        positive, negative = self.weights.get(variable, (1, 1))
+        return positive + negative
+
+    def split(self, clauses: Sequence[Clause], literals: Sequence[int]):
+        """
+        Assigns literals and splits what is left into independent components.
+
+        Returns:
+            The weight of the assigned and vanished variables together with the
+            remaining components, or None if the literals conflict.
+        """
+        result = unit_propagate(clauses, literals)
+        if result is None:
+            return None
+        remaining, assigned = result
+        total = 1
+        for literal in assigned:
+            total *= self.weight(literal)
+        vanished = _variables(clauses) - _variables(remaining) - {abs(literal) for literal in assigned}
+        for variable in vanished:
+            total *= self.free(variable)
+        return total, _components(remaining)
+
+    def enter_expand(self, clauses: Sequence[Clause], literals: Sequence[int], stack: List) -> Optional[object]:
+        split = self.split(clauses, literals)
+        if split is None:
+            return 0
+        stack.append(_ExpandFrame(*split))
+        return None
+
+    def enter_count(self, clauses: List[Clause], stack: List) -> Optional[object]:
+        key = tuple(sorted(clauses))
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        occurrences: Dict[int, int] = {}
+        for clause in key:
+            for literal in clause:
+                occurrences[abs(literal)] = occurrences.get(abs(literal), 0) + 1
+        most = max(occurrences.values())
+        # Among the most frequent variables take the middle one in clause
+        # order, which splits chain-like instances into balanced components.
+        tied = [variable for variable, count in occurrences.items() if count == most]
+        stack.append(_CountFrame(key, tied[len(tied) // 2]))
+        return None
+
+    def expand(self, clauses: Sequence[Clause], literals: Sequence[int]):
+        """Weight of the models of ``clauses`` that extend ``literals``, over the clause variables."""
+        # Expansions wait on the counts of their components and counts on their
+        # two branches; frames live on an explicit stack instead of the call
+        # stack. ``result`` is the value returned by the frame just finished,
+        # or None right after a new frame was pushed.
+        stack: List = []
+        result = self.enter_expand(clauses, literals, stack)
+        while stack:
+            frame = stack[-1]
+            if isinstance(frame, _ExpandFrame):
+                if result is not None:
+                    frame.total *= result
+                if not frame.total or frame.next == len(frame.components):
+                    stack.pop()
+                    result = frame.total
+                    continue
+                component = frame.components[frame.next]
+                frame.next += 1
+                result = self.enter_count(component, stack)
+            else:
+                if result is not None:
+                    frame.total += result
+                    frame.branch += 1
+                if frame.branch == 2:
+                    stack.pop()
+                    self.cache[frame.key] = result = frame.total
+                    continue
+                literal = frame.variable if frame.branch == 0 else -frame.variable
+                result = self.enter_expand(frame.key, (literal,), stack)
+        return result
+
+
+class _ExpandFrame:
+    """Pending product over the components left after a propagation."""
+
+    __slots__ = ("total", "components", "next")
+
+    def __init__(self, total, components: List[List[Clause]]):
+        self.total = total
+        self.components = components
+        self.next = 0
+
+
+class _CountFrame:
+    """Pending sum over the two branches on a decision variable."""
+
+    __slots__ = ("key", "variable", "total", "branch")
+
+    def __init__(self, key: Tuple[Clause, ...], variable: int):
+        self.key = key
+        self.variable = variable
+        self.total = 0
+        self.branch = 0
+
+
+class ModelCounter:
+    """Counts the satisfying assignments of expressions."""
+
+    @staticmethod
+    def count(
+        expression: LogicalExpression,
+        variables: Optional[Sequence[str]] = None,
+        weights: Optional[Dict[str, float]] = None,
+        method: str = "dpll",
+    ):
+        """
+        Counts the models of an expression.
+
+        Args:
+            expression: The expression to count models of.
+            variables: Variables to count over, in addition to the atoms of
+                       the expression (relations use their ``Name(a, b)`` key);
+                       each extra variable doubles the unweighted count.
+            weights: Optional probability of each variable being true. A
+                     variable with probability ``p`` contributes ``p`` when
+                     true and ``1 - p`` when false; variables without a weight
+                     contribute 1 either way, so with a probability for every
+                     variable the result is the probability of the expression.
+            method: "dpll" for the component-caching counter or "bdd" to
+                    compile a binary decision diagram.
+
+        Returns:
+            The exact number of models (an int) without weights, otherwise the
+            total weight of the models in the type of the given weights.
+
+        Raises:
+            ValueError: If the method is unknown or the expression contains
+                        unsupported node types.
+        """
+        if method == "bdd":
+            bdd = BDD()
+            root = bdd.compile(expression)
+            for name in variables or ():
+                bdd.var(name)
+            return bdd.count(root, weights)
+        if method != "dpll":
+            raise ValueError(f"Unknown counting method: {method}")
+
+        cnf = CNFEncoder.direct(expression)
+        if cnf is None:
+            cnf = CNFEncoder.tseitin(expression, CNF())
+        for name in variables or ():
+            cnf.var(name)
+        weight_pairs = {
+            cnf.var(name): (weights[name], 1 - weights[name])
+            for name in cnf.variables
+            if weights is not None and name in weights
+        }
+        counter = _Counter(weight_pairs)
+        clauses = [tuple(sorted(set(clause))) for clause in cnf.clauses]
+        if any(not clause for clause in clauses):
+            return 0
+        total = counter.expand(clauses, [clause[0] for clause in clauses if len(clause) == 1])
+        unconstrained = set(range(1, cnf.num_vars + 1)) - _variables(clauses)
+        for variable in unconstrained:
+            total *= counter.free(variable)
+        return total
@@ -0,0 +1,163 @@
+"""
+Minimal unsatisfiable subset module.
+
+This module explains inconsistent premise sets:
+- UnsatCore: Indices of conflicting premises and whether they are minimal
+- MUSExtractor: Extracts a minimal unsatisfiable subset (MUS) of premises
+  with one incremental SAT solver
+
+Every premise is Tseitin-encoded behind a selector variable, so any subset of
+premises is checked by passing its selectors as assumptions and an
+unsatisfiable check reports the responsible selectors as a core. Extraction
+then runs in three stages:
+
+1. Core trimming: the core of the full set is re-solved under its own
+   selectors, which often yields a smaller core, until it stops shrinking.
+2. Deletion: each remaining premise is removed in turn. If the rest is still
+   unsatisfiable, the premise is dropped for good; otherwise it belongs to
+   every conflict within the working set and is kept.
+3. Clause-set refinement: after an unsatisfiable check the working set is cut
+   down to that check's core, which drops many premises per SAT call.
+
+Each check is one solver call on a shared instance, so learned clauses carry
+over between checks. With a check or conflict budget the extraction can stop
+early and return a conflicting subset that is not proven minimal.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from pydantic import BaseModel
+
+from agent_logic.core.base import LogicalExpression
+from agent_logic.evaluation.cnf import CNF, CNFEncoder
+from agent_logic.evaluation.sat_solvers import CDCLSolver
+
+
+class UnsatCore(BaseModel):
+    """
+    Conflicting subset of a premise list.
+
+    Attributes:
+        indices: Positions of the conflicting premises, ascending.
+        minimal: True if removing any single premise makes the subset
+                 consistent; False if a budget ran out first.
+        checks: Number of SAT calls made.
+    """
+
+    indices: List[int]
+    minimal: bool = True
+    checks: int = 0
+
+
+def shrink_core(
+    solver: CDCLSolver,
+    core: Sequence[int],
+    trim_rounds: int = 3,
+    max_checks: Optional[int] = None,
+    max_conflicts: Optional[int] = None,
+) -> Tuple[List[int], bool, int]:
+    """
+    Shrinks an unsatisfiable set of assumption literals to a minimal one.
+
+    Args:
+        solver: Solver whose clauses are unsatisfiable under ``core``.
+        core: Assumption literals that cannot hold together.
+        trim_rounds: Maximum number of core trimming rounds.
+        max_checks: Optional limit on the number of SAT calls.
+        max_conflicts: Optional conflict budget per SAT call.
+
+    Returns:
+        The remaining assumption literals in their original order, whether
+        they are proven minimal, and the number of SAT calls made.
+    """
+    order = {literal: position for position, literal in enumerate(core)}
+    working = list(core)
+    checks = 0
+    minimal = True
+
+    def budget_left() -> bool:
+        return max_checks is None or checks < max_checks
+
+    for _ in range(trim_rounds):
+        if not budget_left():
+            break
+        outcome = solver.solve(working, max_conflicts)
+        checks += 1
+        if outcome is not False or len(solver.core) >= len(working):
+            break
+        found = set(solver.core)
+        working = [literal for literal in working if literal in found]
+
+    necessary = set()
+    while True:
+        candidate = next((literal for literal in working if literal not in necessary), None)
+        if candidate is None:
+            break
+        if not budget_left():
+            minimal = False
+            break
+        rest = [literal for literal in working if literal != candidate]
+        outcome = solver.solve(rest, max_conflicts)
+        checks += 1
+        if outcome is False:
+            found = set(solver.core)
+            working = [literal for literal in rest if literal in found]
+        else:
+            # Satisfiable without it, or undecided within the conflict budget.
+            necessary.add(candidate)
+            minimal = minimal and outcome is True
+    working.sort(key=order.__getitem__)
+    return working, minimal, checks
+
+
+class MUSExtractor:
+    """Finds minimal conflicting subsets of premise lists."""
+
+    @staticmethod
+    def extract(
+        premises: Sequence[LogicalExpression],
+        max_checks: Optional[int] = None,
+        max_conflicts: Optional[int] = None,
+        trim_rounds: int = 3,
+    ) -> Optional[UnsatCore]:
+        """
+        Extracts a minimal unsatisfiable subset of premises.
+
+        Args:
+            premises: The premises to explain.
+            max_checks: Optional limit on the number of SAT calls after the
+                        initial consistency check; when it is reached the
+                        current conflicting subset is returned unminimized.
+            max_conflicts: Optional conflict budget per SAT call. Premises
+                           whose removal cannot be decided within it are kept.
+            trim_rounds: Maximum number of core trimming rounds.
+
+        Returns:
+            The conflicting premises, or None if the premises are consistent.
+            Without budgets the subset is minimal: every proper subset is
+            consistent.
+
+        Raises:
+            ValueError: If a premise contains node types that cannot be encoded,
+                        or if the initial consistency check exceeds the
+                        conflict budget.
+        """
+        cnf = CNF()
+        selectors: List[int] = []
+        for premise in premises:
+            literal = CNFEncoder.tseitin_literal(premise, cnf)
+            selector = cnf.aux()
+            cnf.clauses.append([-selector, literal])
+            selectors.append(selector)
+        solver = CDCLSolver(cnf.num_vars, cnf.clauses)
+        outcome = solver.solve(selectors, max_conflicts)
+        if outcome is None:
+            raise ValueError("Consistency check exceeded the conflict budget")
+        if outcome:
+            return None
+        index_of: Dict[int, int] = {selector: index for index, selector in enumerate(selectors)}
+        core = sorted(solver.core, key=index_of.__getitem__)
+        core, minimal, checks = shrink_core(solver, core, trim_rounds, max_checks, max_conflicts)
+        return UnsatCore(indices=[index_of[selector] for selector in core], minimal=minimal, checks=checks + 1)
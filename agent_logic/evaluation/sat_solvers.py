@@ -0,0 +1,562 @@
+"""
+SAT procedures module.
+
+This module provides satisfiability procedures over clause sets in integer
+encoding (see ``agent_logic.evaluation.cnf``):
+- classify_clauses: Detects Horn, dual-Horn and 2-CNF clause sets
+- HornSAT: Linear-time unit propagation for Horn and dual-Horn clause sets
+- TwoSAT: Linear-time strongly-connected-component procedure for 2-CNF
+- CDCLSolver: Incremental conflict-driven clause learning solver with
+  assumptions, used for everything outside the tractable classes
+
+All procedures return a model as a mapping from variable number to truth
+value, or None when the clause set is unsatisfiable.
+"""
+
+from __future__ import annotations
+
+import heapq
+from typing import Dict, Iterable, List, Optional, Sequence
+
+HORN = "Horn"
+DUAL_HORN = "dual-Horn"
+TWO_CNF = "2-CNF"
+SMALL = "small"
+GENERAL = "general"
+
+
+def classify_clauses(clauses: Sequence[Sequence[int]]) -> List[str]:
+    """
+    Determines which tractable classes a clause set belongs to.
+
+    Args:
+        clauses: Clause set in integer encoding.
+
+    Returns:
+        The matching classes among ``"Horn"``, ``"dual-Horn"`` and ``"2-CNF"``,
+        in that order; empty if none applies.
+    """
+    horn = dual_horn = two_cnf = True
+    for clause in clauses:
+        positives = 0
+        for literal in clause:
+            if literal > 0:
+                positives += 1
+        if positives > 1:
+            horn = False
+        if len(clause) - positives > 1:
+            dual_horn = False
+        if len(clause) > 2:
+            two_cnf = False
+        if not (horn or dual_horn or two_cnf):
+            break
+    classes = []
+    if horn:
+        classes.append(HORN)
+    if dual_horn:
+        classes.append(DUAL_HORN)
+    if two_cnf:
+        classes.append(TWO_CNF)
+    return classes
+
+
+class HornSAT:
+    """Linear-time satisfiability for Horn and dual-Horn clause sets."""
+
+    @staticmethod
+    def solve(clauses: Sequence[Sequence[int]], num_vars: int) -> Optional[Dict[int, bool]]:
+        """
+        Finds the minimal model of a Horn clause set by unit propagation.
+
+        Every variable starts False; a clause whose negative literals are all
+        falsified forces its positive literal. Each literal occurrence is
+        visited at most once, so the running time is linear in the input size.
+
+        Args:
+            clauses: Clauses with at most one positive literal each.
+            num_vars: Number of variables.
+
+        Returns:
+            The minimal model, or None if the clause set is unsatisfiable.
+
+        Raises:
+            ValueError: If a clause has more than one positive literal.
+        """
+        remaining = [0] * len(clauses)
+        head = [0] * len(clauses)
+        occurs: List[List[int]] = [[] for _ in range(num_vars + 1)]
+        value = [False] * (num_vars + 1)
+        queue: List[int] = []
+
+        for index, clause in enumerate(clauses):
+            for literal in clause:
+                if literal > 0:
+                    if head[index]:
+                        raise ValueError(f"Clause {list(clause)} is not a Horn clause")
+                    head[index] = literal
+                else:
+                    remaining[index] += 1
+                    occurs[-literal].append(index)
+            if remaining[index] == 0:
+                if not head[index]:
+                    return None
+                if not value[head[index]]:
+                    value[head[index]] = True
+                    queue.append(head[index])
+
+        while queue:
+            var = queue.pop()
+            for index in occurs[var]:
+                remaining[index] -= 1
+                if remaining[index] == 0:
+                    target = head[index]
+                    if not target:
+                        return None
+                    if not value[target]:
+                        value[target] = True
+                        queue.append(target)
+
+        return {v: value[v] for v in range(1, num_vars + 1)}
+
+    @staticmethod
+    def solve_dual(clauses: Sequence[Sequence[int]], num_vars: int) -> Optional[Dict[int, bool]]:
+        """
+        Solves a dual-Horn clause set (at most one negative literal per clause)
+        by flipping every polarity and solving the resulting Horn problem.
+
+        Args:
+            clauses: Clauses with at most one negative literal each.
+            num_vars: Number of variables.
+
+        Returns:
+            The maximal model, or None if the clause set is unsatisfiable.
+        """
+        model = HornSAT.solve([[-lit for lit in clause] for clause in clauses], num_vars)
+        if model is None:
+            return None
+        return {v: not val for v, val in model.items()}
+
+
+class TwoSAT:
+    """Linear-time satisfiability for clause sets with at most two literals per clause."""
+
+    @staticmethod
+    def solve(clauses: Sequence[Sequence[int]], num_vars: int) -> Optional[Dict[int, bool]]:
+        """
+        Decides a 2-CNF clause set via the implication graph.
+
+        Each clause ``(a ∨ b)`` contributes the edges ``¬a → b`` and ``¬b → a``.
+        The set is unsatisfiable iff some variable shares a strongly connected
+        component with its negation; otherwise assigning each variable the
+        value whose component comes later in topological order is a model.
+
+        Args:
+            clauses: Clauses with one or two literals each.
+            num_vars: Number of variables.
+
+        Returns:
+            A model, or None if the clause set is unsatisfiable.
+
+        Raises:
+            ValueError: If a clause has more than two literals.
+        """
+        size = 2 * num_vars + 2
+
+        def node(literal: int) -> int:
+            return 2 * literal if literal > 0 else -2 * literal + 1
+
+        graph: List[List[int]] = [[] for _ in range(size)]
+        for clause in clauses:
+            if len(clause) == 0:
+                return None
+            if len(clause) == 1:
+                a = b = clause[0]
+            elif len(clause) == 2:
+                a, b = clause
+            else:
+                raise ValueError(f"Clause {list(clause)} has more than two literals")
+            graph[node(-a)].append(node(b))
+            graph[node(-b)].append(node(a))
+
+        # Iterative Tarjan; components are numbered in reverse topological order.
+        index_of = [-1] * size
+        low = [0] * size
+        component = [-1] * size
+        on_stack = [False] * size
+        stack: List[int] = []
+        counter = 0
+        components = 0
+        for start in range(2, size):
+            if index_of[start] != -1:
+                continue
+            work = [(start, 0)]
+            while work:
+                v, edge = work.pop()
+                if edge == 0:
+                    index_of[v] = low[v] = counter
+                    counter += 1
+                    stack.append(v)
+                    on_stack[v] = True
+                recurse = False
+                successors = graph[v]
+                while edge < len(successors):
+                    w = successors[edge]
+                    edge += 1
+                    if index_of[w] == -1:
+                        work.append((v, edge))
+                        work.append((w, 0))
+                        recurse = True
+                        break
+                    if on_stack[w]:
+                        low[v] = min(low[v], index_of[w])
+                if recurse:
+                    continue
+                if low[v] == index_of[v]:
+                    while True:
+                        w = stack.pop()
+                        on_stack[w] = False
+                        component[w] = components
+                        if w == v:
+                            break
+                    components += 1
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[v])
+
+        model: Dict[int, bool] = {}
+        for v in range(1, num_vars + 1):
+            if component[2 * v] == component[2 * v + 1]:
+                return None
+            model[v] = component[2 * v] < component[2 * v + 1]
+        return model
+
+
+class CDCLSolver:
+    """
+    Incremental conflict-driven clause learning SAT solver.
+
+    Clauses can be added between calls to ``solve``; learned clauses are kept
+    because they are implied by the clause database. Assumption literals
+    let callers temporarily enable or disable parts of the problem, and when
+    a call fails under assumptions ``core`` lists the assumptions responsible.
+
+    Example:
+        >>> solver = CDCLSolver()
+        >>> solver.add_clause([1, 2])
+        >>> solver.add_clause([-1])
+        >>> solver.solve()
+        True
+        >>> solver.model[2]
+        True
+    """
+
+    def __init__(self, num_vars: int = 0, clauses: Iterable[Sequence[int]] = ()):
+        """
+        Initializes the solver.
+
+        Args:
+            num_vars: Number of variables to allocate up front.
+            clauses: Initial clauses.
+        """
+        self.num_vars = 0
+        self.ok = True
+        self.model: Dict[int, bool] = {}
+        self.core: List[int] = []
+        self.conflicts = 0
+        self._clauses: List[List[int]] = []
+        self._watches: Dict[int, List[int]] = {}
+        self._assign: List[Optional[bool]] = [None]
+        self._level: List[int] = [0]
+        self._reason: List[Optional[int]] = [None]
+        self._activity: List[float] = [0.0]
+        self._phase: List[bool] = [False]
+        self._heap: List = []
+        self._bump = 1.0
+        self._trail: List[int] = []
+        self._trail_lim: List[int] = []
+        self._qhead = 0
+        self._ensure_vars(num_vars)
+        for clause in clauses:
+            self.add_clause(clause)
+
+    def new_var(self) -> int:
+        """Allocates a fresh variable and returns its number."""
+        self._ensure_vars(self.num_vars + 1)
+        return self.num_vars
+
+    def add_clause(self, clause: Iterable[int]) -> bool:
+        """
+        Adds a clause to the database.
+
+        Args:
+            clause: Iterable of non-zero integer literals.
+
+        Returns:
+            False if the database became trivially unsatisfiable, else True.
+        """
+        if not self.ok:
+            return False
+        self._cancel_until(0)
+        literals = set(clause)
+        if literals:
+            self._ensure_vars(max(abs(lit) for lit in literals))
+        for literal in literals:
+            if -literal in literals:
+                return True
+
+        kept = []
+        for literal in literals:
+            value = self._value(literal)
+            if value is True:
+                return True
+            if value is None:
+                kept.append(literal)
+        if not kept:
+            self.ok = False
+            return False
+        if len(kept) == 1:
+            self._enqueue(kept[0], None)
+            if self._propagate() is not None:
+                self.ok = False
+            return self.ok
+        self._attach(kept)
+        return True
+
+    def solve(self, assumptions: Sequence[int] = (), max_conflicts: Optional[int] = None) -> Optional[bool]:
+        """
+        Decides satisfiability of the clause database under assumptions.
+
+        Args:
+            assumptions: Literals that must hold in the model.
+            max_conflicts: Optional conflict budget for this call.
+
+        Returns:
+            True (with ``model`` set), False (with ``core`` set to a subset of
+            the assumptions that cannot hold together), or None if the
+            conflict budget ran out.
+        """
+        self.model = {}
+        self.core = []
+        if not self.ok:
+            return False
+        for literal in assumptions:
+            self._ensure_vars(abs(literal))
+        self._cancel_until(0)
+        if self._propagate() is not None:
+            self.ok = False
+            return False
+
+        budget = max_conflicts
+        restart_limit = 100
+        conflicts_since_restart = 0
+        while True:
+            conflict = self._propagate()
+            if conflict is not None:
+                self.conflicts += 1
+                conflicts_since_restart += 1
+                if not self._trail_lim:
+                    self.ok = False
+                    return False
+                learnt, backjump = self._analyze(conflict)
+                self._cancel_until(backjump)
+                if len(learnt) == 1:
+                    self._enqueue(learnt[0], None)
+                else:
+                    self._enqueue(learnt[0], self._attach(learnt))
+                self._bump *= 1.05
+                if budget is not None:
+                    budget -= 1
+                    if budget < 0:
+                        self._cancel_until(0)
+                        return None
+                continue
+
+            if conflicts_since_restart >= restart_limit:
+                conflicts_since_restart = 0
+                restart_limit = int(restart_limit * 1.5)
+                self._cancel_until(0)
+                continue
+
+            literal = None
+            while len(self._trail_lim) < len(assumptions):
+                assumed = assumptions[len(self._trail_lim)]
+                value = self._value(assumed)
+                if value is True:
+                    self._trail_lim.append(len(self._trail))
+                elif value is False:
+                    self.core = self._analyze_final(-assumed)
+                    self._cancel_until(0)
+                    return False
+                else:
+                    literal = assumed
+                    break
+            if literal is None:
+                literal = self._pick_branch()
+                if literal is None:
+                    self.model = {
+                        v: bool(self._assign[v]) for v in range(1, self.num_vars + 1)
+                    }
+                    self._cancel_until(0)
+                    return True
+            self._trail_lim.append(len(self._trail))
+            self._enqueue(literal, None)
+
+    def _ensure_vars(self, count: int) -> None:
+        while self.num_vars < count:
+            self.num_vars += 1
+            self._assign.append(None)
+            self._level.append(0)
+            self._reason.append(None)
+            self._activity.append(0.0)
+            self._phase.append(False)
+            heapq.heappush(self._heap, (0.0, self.num_vars))
+
+    def _value(self, literal: int) -> Optional[bool]:
+        value = self._assign[abs(literal)]
+        if value is None:
+            return None
+        return value if literal > 0 else not value
+
+    def _enqueue(self, literal: int, reason: Optional[int]) -> None:
+        var = abs(literal)
+        self._assign[var] = literal > 0
+        self._level[var] = len(self._trail_lim)
+        self._reason[var] = reason
+        self._trail.append(literal)
+
+    def _attach(self, clause: List[int]) -> int:
+        index = len(self._clauses)
+        self._clauses.append(clause)
+        self._watches.setdefault(clause[0], []).append(index)
+        self._watches.setdefault(clause[1], []).append(index)
+        return index
+
+    def _propagate(self) -> Optional[int]:
+        """Runs unit propagation; returns the index of a conflicting clause, if any."""
+        trail = self._trail
+        clauses = self._clauses
+        watches = self._watches
+        assign = self._assign
+        while self._qhead < len(trail):
+            false_literal = -trail[self._qhead]
+            self._qhead += 1
+            watching = watches.get(false_literal)
+            if not watching:
+                continue
+            kept = []
+            conflict = None
+            position = 0
+            while position < len(watching):
+                index = watching[position]
+                position += 1
+                clause = clauses[index]
+                if clause[0] == false_literal:
+                    clause[0], clause[1] = clause[1], clause[0]
+                first = clause[0]
+                first_value = assign[abs(first)]
+                if first_value is not None and first_value == (first > 0):
+                    kept.append(index)
+                    continue
+                for k in range(2, len(clause)):
+                    candidate = clause[k]
+                    value = assign[abs(candidate)]
+                    if value is None or value == (candidate > 0):
+                        clause[1], clause[k] = candidate, false_literal
+                        watches.setdefault(candidate, []).append(index)
+                        break
+                else:
+                    kept.append(index)
+                    if first_value is None:
+                        self._enqueue(first, index)
+                    else:
+                        conflict = index
+                        kept.extend(watching[position:])
+                        break
+            watches[false_literal] = kept
+            if conflict is not None:
+                self._qhead = len(trail)
+                return conflict
+        return None
+
+    def _analyze(self, conflict: int):
+        """Derives a first-UIP learned clause and the level to backjump to."""
+        seen = set()
+        learnt: List[int] = [0]
+        counter = 0
+        current = len(self._trail_lim)
+        literal = None
+        clause = self._clauses[conflict]
+        position = len(self._trail) - 1
+        while True:
+            for q in clause if literal is None else clause[1:]:
+                var = abs(q)
+                if var not in seen and self._level[var] > 0:
+                    seen.add(var)
+                    self._activity[var] += self._bump
+                    heapq.heappush(self._heap, (-self._activity[var], var))
+                    if self._level[var] == current:
+                        counter += 1
+                    else:
+                        learnt.append(q)
+            while abs(self._trail[position]) not in seen:
+                position -= 1
+            literal = self._trail[position]
+            position -= 1
+            seen.discard(abs(literal))
+            counter -= 1
+            if counter == 0:
+                break
+            clause = self._clauses[self._reason[abs(literal)]]
+        learnt[0] = -literal
+
+        if len(learnt) == 1:
+            return learnt, 0
+        deepest = max(range(1, len(learnt)), key=lambda i: self._level[abs(learnt[i])])
+        learnt[1], learnt[deepest] = learnt[deepest], learnt[1]
+        return learnt, self._level[abs(learnt[1])]
+
+    def _analyze_final(self, literal: int) -> List[int]:
+        """Collects the assumptions that imply ``literal`` (a falsified assumption's negation)."""
+        core = [-literal]
+        if not self._trail_lim:
+            return core
+        seen = {abs(literal)}
+        for position in range(len(self._trail) - 1, self._trail_lim[0] - 1, -1):
+            var = abs(self._trail[position])
+            if var not in seen:
+                continue
+            reason = self._reason[var]
+            if reason is None:
+                if self._level[var] > 0:
+                    core.append(self._trail[position])
+            else:
+                for q in self._clauses[reason][1:]:
+                    if self._level[abs(q)] > 0:
+                        seen.add(abs(q))
+            seen.discard(var)
+        return core
+
+    def _pick_branch(self) -> Optional[int]:
+        heap = self._heap
+        while heap:
+            _, var = heapq.heappop(heap)
+            if self._assign[var] is None:
+                return var if self._phase[var] else -var
+        for var in range(1, self.num_vars + 1):
+            if self._assign[var] is None:
+                return var if self._phase[var] else -var
+        return None
+
+    def _cancel_until(self, level: int) -> None:
+        if len(self._trail_lim) <= level:
+            return
+        boundary = self._trail_lim[level]
+        for position in range(len(self._trail) - 1, boundary - 1, -1):
+            var = abs(self._trail[position])
+            self._phase[var] = self._trail[position] > 0
+            self._assign[var] = None
+            self._reason[var] = None
+            heapq.heappush(self._heap, (-self._activity[var], var))
+        del self._trail[boundary:]
+        del self._trail_lim[level:]
+        self._qhead = min(self._qhead, boundary)
@@ -0,0 +1,203 @@
+"""
+Semantic signature module.
+
+This module groups formulas by logical equivalence without comparing every
+pair:
+- SemanticSignatures: Random-simulation signatures, signature buckets and
+  exact equivalence classes of formula collections
+
+A signature is the formula's value on a fixed set of random assignments,
+computed bit-parallel as one lane (see ``evaluate_lanes``). The random value
+of a variable is derived from its name and the seed alone, so the same
+variable gets the same vector in every formula and equivalent formulas always
+have equal signatures, even when their atom sets differ (``P ∨ ¬P`` and
+``Q → Q``). Different signatures prove non-equivalence at the cost of one
+integer comparison; formulas with equal signatures are confirmed with
+``Evaluator.are_equivalent`` inside their bucket only. With 256 vectors,
+inequivalent formulas share a signature only when they differ on very few
+assignments, so deduplicating a corpus costs one evaluation per formula plus
+about one exact check per duplicate.
+"""
+
+from __future__ import annotations
+
+import random
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence
+
+from agent_logic.core.base import LogicalExpression
+from agent_logic.evaluation.evaluator import Evaluator
+from agent_logic.evaluation.vectorized import evaluate_lanes
+
+DEFAULT_WIDTH = 256
+
+
+@lru_cache(maxsize=65536)
+def _vector(name: str, width: int, seed: int) -> int:
+    # String seeds are hashed with SHA-512, so vectors are stable across processes.
+    return random.Random(f"{seed}:{name}").getrandbits(width)
+
+
+def _split_buckets(buckets: List[List[LogicalExpression]]) -> List[List[List[int]]]:
+    """Partitions each bucket into exact equivalence classes of local indices."""
+    results = []
+    for expressions in buckets:
+        classes: List[List[int]] = []
+        for index, expression in enumerate(expressions):
+            for members in classes:
+                if Evaluator.are_equivalent(expressions[members[0]], expression):
+                    members.append(index)
+                    break
+            else:
+                classes.append([index])
+        results.append(classes)
+    return results
+
+
+class SemanticSignatures:
+    """Buckets formulas by random-simulation signatures before exact equivalence checks."""
+
+    @staticmethod
+    def signatures(
+        expressions: Sequence[LogicalExpression], width: int = DEFAULT_WIDTH, seed: int = 0
+    ) -> List[int]:
+        """
+        Computes the signatures of many expressions in one pass.
+
+        Args:
+            expressions: The expressions to sign; shared subexpressions are
+                         evaluated once.
+            width: Number of random assignments (bits per signature).
+            seed: Selects the set of random assignments; signatures are only
+                  comparable for equal width and seed.
+
+        Returns:
+            One signature per expression; bit ``i`` is the value under
+            random assignment ``i``.
+
+        Raises:
+            ValueError: If an expression contains unsupported node types.
+        """
+        mask = (1 << width) - 1
+        return evaluate_lanes(expressions, lambda name, node: _vector(name, width, seed), mask)
+
+    @staticmethod
+    def signature(expression: LogicalExpression, width: int = DEFAULT_WIDTH, seed: int = 0) -> int:
+        """
+        Computes the signature of one expression.
+
+        Args:
+            expression: The expression to sign.
+            width: Number of random assignments (bits per signature).
+            seed: Selects the set of random assignments.
+
+        Returns:
+            The signature; equivalent expressions have equal signatures.
+
+        Raises:
+            ValueError: If the expression contains unsupported node types.
+        """
+        return SemanticSignatures.signatures([expression], width, seed)[0]
+
+    @staticmethod
+    def buckets(
+        expressions: Sequence[LogicalExpression], width: int = DEFAULT_WIDTH, seed: int = 0
+    ) -> Dict[int, List[int]]:
+        """
+        Groups expressions by signature.
+
+        Args:
+            expressions: The expressions to group.
+            width: Number of random assignments (bits per signature).
+            seed: Selects the set of random assignments.
+
+        Returns:
+            Mapping from signature to the indices of the expressions having
+            it, in input order. Equivalent expressions share a bucket.
+
+        Raises:
+            ValueError: If an expression contains unsupported node types.
+        """
+        buckets: Dict[int, List[int]] = {}
+        for index, signature in enumerate(SemanticSignatures.signatures(expressions, width, seed)):
+            buckets.setdefault(signature, []).append(index)
+        return buckets
+
+    @staticmethod
+    def equivalence_classes(
+        expressions: Sequence[LogicalExpression],
+        width: int = DEFAULT_WIDTH,
+        seed: int = 0,
+        workers: Optional[int] = None,
+        chunk_size: int = 1000,
+    ) -> List[List[int]]:
+        """
+        Partitions expressions into classes of logically equivalent ones.
+
+        Args:
+            expressions: The expressions to partition.
+            width: Number of random assignments (bits per signature).
+            seed: Selects the set of random assignments.
+            workers: Number of worker processes for the exact checks; the
+                     checks run in this process when None or 1.
+            chunk_size: Approximate number of expressions sent to a worker
+                        per task.
+
+        Returns:
+            The classes as lists of indices, each in input order, ordered by
+            their first index.
+
+        Raises:
+            ValueError: If an expression contains unsupported node types.
+        """
+        classes: List[List[int]] = []
+        shared: List[List[int]] = []
+        for indices in SemanticSignatures.buckets(expressions, width, seed).values():
+            (shared if len(indices) > 1 else classes).append(indices)
+
+        tasks: List[List[List[int]]] = [[]]
+        size = 0
+        for indices in shared:
+            if size >= chunk_size:
+                tasks.append([])
+                size = 0
+            tasks[-1].append(indices)
+            size += len(indices)
+        payloads = [[[expressions[i] for i in indices] for indices in task] for task in tasks]
+        if workers is not None and workers > 1 and len(tasks) > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(_split_buckets, payloads))
+        else:
+            results = [_split_buckets(payload) for payload in payloads]
+
+        for task, split in zip(tasks, results):
+            for indices, local_classes in zip(task, split):
+                classes.extend([indices[i] for i in members] for members in local_classes)
+        classes.sort(key=lambda members: members[0])
+        return classes
+
+    @staticmethod
+    def deduplicate(
+        expressions: Sequence[LogicalExpression],
+        width: int = DEFAULT_WIDTH,
+        seed: int = 0,
+        workers: Optional[int] = None,
+    ) -> List[int]:
+        """
+        Selects one expression per equivalence class.
+
+        Args:
+            expressions: The expressions to deduplicate.
+            width: Number of random assignments (bits per signature).
+            seed: Selects the set of random assignments.
+            workers: Number of worker processes for the exact checks.
+
+        Returns:
+            The indices of the first expression of every class, ascending.
+
+        Raises:
+            ValueError: If an expression contains unsupported node types.
+        """
+        classes = SemanticSignatures.equivalence_classes(expressions, width, seed, workers)
+        return [members[0] for members in classes]
@@ -0,0 +1,211 @@
+"""
+Vectorized evaluation module.
+
+This module evaluates expressions on many truth assignments at once:
+- BatchEvaluator: One formula over many assignments, and many formulas over
+  one assignment
+
+Every node is evaluated once per call into a *lane* holding its value under
+all assignments. Lanes are Python integers used as bit vectors (bit ``i`` is
+the value under assignment ``i``), or boolean NumPy arrays when the input is
+a NumPy array. Connectives become a single bitwise operation per node, so the
+per-assignment interpreter overhead of ``LogicalExpression.evaluate`` is paid
+once per node instead of once per node and assignment. NumPy is optional; it
+is only used when the caller passes an array.
+"""
+
+from __future__ import annotations
+
+import sys
+from functools import reduce
+from operator import and_, or_
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+from agent_logic.core.base import LogicalExpression
+from agent_logic.core.operations import BinaryOp, NaryOp, Not, Proposition
+from agent_logic.evaluation.cnf import atom_name
+
+# Binary operators on lanes: operator -> function(left, right, mask).
+# ``mask`` has every lane bit set (True for NumPy lanes) and bounds negation.
+LANE_OPERATORS: Dict[str, Callable[[Any, Any, Any], Any]] = {
+    "AND": lambda left, right, mask: left & right,
+    "OR": lambda left, right, mask: left | right,
+    "IMPLIES": lambda left, right, mask: (~left & mask) | right,
+    "IFF": lambda left, right, mask: ~(left ^ right) & mask,
+    "XOR": lambda left, right, mask: left ^ right,
+    "NAND": lambda left, right, mask: ~(left & right) & mask,
+    "NOR": lambda left, right, mask: ~(left | right) & mask,
+}
+
+
+def evaluate_lanes(
+    roots: Sequence[LogicalExpression], leaf: Callable[[str, LogicalExpression], Any], mask: Any
+) -> List[Any]:
+    """
+    Evaluates expressions bottom-up on lanes, visiting each shared node once.
+
+    Args:
+        roots: Expressions to evaluate; subexpressions shared between them
+               (by identity) are evaluated once.
+        leaf: Returns the lane of an atom given its variable name and node.
+        mask: Lane with every position set.
+
+    Returns:
+        The lanes of the roots, in order.
+
+    Raises:
+        ValueError: If an expression contains unsupported node types.
+    """
+    values: Dict[int, Any] = {}
+    for root in roots:
+        stack = [(root, False)]
+        while stack:
+            node, expanded = stack.pop()
+            key = id(node)
+            if key in values:
+                continue
+            name = atom_name(node)
+            if name is not None:
+                values[key] = leaf(name, node)
+                continue
+            if isinstance(node, Not):
+                children = (node.operand,)
+            elif isinstance(node, BinaryOp):
+                children = (node.left, node.right)
+            elif isinstance(node, NaryOp):
+                children = node.operands
+            else:
+                raise ValueError(f"Cannot evaluate expression type: {type(node).__name__}")
+            if not expanded:
+                stack.append((node, True))
+                stack.extend((child, False) for child in children)
+                continue
+            if isinstance(node, Not):
+                values[key] = ~values[id(node.operand)] & mask
+            elif isinstance(node, BinaryOp):
+                operation = LANE_OPERATORS.get(node.operator)
+                if operation is None:
+                    raise ValueError(f"Unknown operator: {node.operator}")
+                values[key] = operation(values[id(node.left)], values[id(node.right)], mask)
+            else:
+                lanes = [values[id(operand)] for operand in node.operands]
+                values[key] = reduce(and_ if node.operator == "AND" else or_, lanes)
+    return [values[id(root)] for root in roots]
+
+
+def atom_names(expression: LogicalExpression) -> List[str]:
+    """Returns the sorted variable names of the atoms in an expression."""
+    names = set()
+    evaluate_lanes([expression], lambda name, node: names.add(name) or 0, 0)
+    return sorted(names)
+
+
+class BatchEvaluator:
+    """Evaluates expressions on many assignments, or many expressions on one assignment."""
+
+    @staticmethod
+    def evaluate_batch(
+        expression: LogicalExpression,
+        assignments: Union[Sequence[Dict[str, bool]], Any],
+        variables: Optional[Sequence[str]] = None,
+    ) -> Union[List[bool], Any]:
+        """
+        Evaluates one expression under many assignments.
+
+        Args:
+            expression: The expression to evaluate.
+            assignments: Either a sequence of dictionaries mapping variable
+                         names to truth values, or a 2-D boolean NumPy array
+                         with one row per assignment and one column per variable.
+            variables: Column names for array input (relations use their
+                       ``Name(a, b)`` key); defaults to the sorted atom names of
+                       the expression. Ignored for dictionary input.
+
+        Returns:
+            The value under each assignment: a list of bools for dictionary
+            input, or a 1-D boolean NumPy array for array input.
+
+        Raises:
+            ValueError: If a proposition has no value, the array shape does not
+                        match ``variables``, or the expression contains
+                        unsupported node types.
+        """
+        numpy = sys.modules.get("numpy")
+        if numpy is not None and isinstance(assignments, numpy.ndarray):
+            return BatchEvaluator._evaluate_array(numpy, expression, assignments, variables)
+
+        rows = list(assignments)
+        count = len(rows)
+        if not count:
+            return []
+
+        def leaf(name, node):
+            if isinstance(node, Proposition):
+                try:
+                    bits = "".join("1" if row[name] else "0" for row in reversed(rows))
+                except KeyError:
+                    raise ValueError(f"No truth value provided for proposition {name}") from None
+            else:
+                # Relations default to False, as in Relation.evaluate.
+                bits = "".join("1" if row.get(name, False) else "0" for row in reversed(rows))
+            return int(bits, 2)
+
+        (lane,) = evaluate_lanes([expression], leaf, (1 << count) - 1)
+        digits = format(lane, "b").zfill(count)
+        return [digit == "1" for digit in reversed(digits)]
+
+    @staticmethod
+    def _evaluate_array(numpy, expression, array, variables):
+        if array.ndim != 2:
+            raise ValueError(f"Expected a 2-D assignment array but got {array.ndim} dimensions")
+        columns = list(variables) if variables is not None else atom_names(expression)
+        if array.shape[1] != len(columns):
+            raise ValueError(
+                f"Assignment array has {array.shape[1]} columns for {len(columns)} variables"
+            )
+        array = array.astype(bool, copy=False)
+        index = {name: position for position, name in enumerate(columns)}
+        false = numpy.zeros(array.shape[0], dtype=bool)
+
+        def leaf(name, node):
+            position = index.get(name)
+            if position is not None:
+                return array[:, position]
+            if isinstance(node, Proposition):
+                raise ValueError(f"No truth value provided for proposition {name}")
+            return false
+
+        (lane,) = evaluate_lanes([expression], leaf, True)
+        return numpy.asarray(lane, dtype=bool)
+
+    @staticmethod
+    def evaluate_many(
+        expressions: Sequence[LogicalExpression], assignment: Dict[str, bool]
+    ) -> List[bool]:
+        """
+        Evaluates many expressions under one assignment.
+
+        Subexpressions shared between the expressions (for example nodes
+        interned by an ExpressionFactory) are evaluated only once.
+
+        Args:
+            expressions: The expressions to evaluate.
+            assignment: Dictionary mapping variable names to truth values.
+
+        Returns:
+            The value of each expression, in order.
+
+        Raises:
+            ValueError: If a proposition has no value or an expression
+                        contains unsupported node types.
+        """
+
+        def leaf(name, node):
+            value = assignment.get(name)
+            if value is None:
+                if isinstance(node, Proposition):
+                    raise ValueError(f"No truth value provided for proposition {name}")
+                return 0
+            return 1 if value else 0
+
+        return [bool(lane) for lane in evaluate_lanes(expressions, leaf, 1)]
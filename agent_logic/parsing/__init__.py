@@ -6,9 +6,18 @@ string representations to logical expression objects.
 """
 
 from agent_logic.parsing.ast_parser import ASTParser
+from agent_logic.parsing.cache import CacheInfo, ParseCache
+from agent_logic.parsing.formula_parser import FormulaParser, FormulaSyntaxError
+from agent_logic.parsing.stream_reader import FormulaReader, ParseRecord
 from agent_logic.parsing.token_parser import Tokenizer
 
 __all__ = [
     "ASTParser",
+    "CacheInfo",
+    "FormulaParser",
+    "FormulaReader",
+    "FormulaSyntaxError",
+    "ParseCache",
+    "ParseRecord",
     "Tokenizer"
 ] 
\ No newline at end of file
@@ -0,0 +1,169 @@
+"""
+Parse result caching.
+
+This module provides a bounded LRU cache in front of the formula parser and
+dictionary deserialization:
+- CacheInfo: Hit/miss statistics snapshot
+- ParseCache: Thread-safe LRU cache keyed on the raw formula string or a
+  canonical JSON serialization of the dictionary
+
+Cached expressions are returned by reference to every caller, and their
+subexpressions are shared through an ExpressionFactory, so results must be
+treated as immutable. A factory's unique table never evicts, so the cache's
+private factory is replaced by a fresh one after every ``maxsize`` misses:
+nodes of evicted entries are then released with the old table, and memory
+stays bounded by the nodes of about ``2 * maxsize`` parses. Results parsed in
+different generations do not share nodes.
+"""
+
+from __future__ import annotations
+
+import json
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable, Dict, Optional
+
+from pydantic import BaseModel
+
+from agent_logic.core.base import LogicalExpression
+from agent_logic.core.factory import ExpressionFactory
+from agent_logic.parsing.formula_parser import FormulaParser
+
+
+class CacheInfo(BaseModel):
+    """
+    Snapshot of cache statistics.
+
+    Attributes:
+        hits: Lookups answered from the cache.
+        misses: Lookups that required parsing.
+        maxsize: Maximum number of cached entries.
+        currsize: Current number of cached entries.
+    """
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class ParseCache:
+    """
+    Bounded LRU cache for parsed expressions.
+
+    Example:
+        >>> cache = ParseCache(maxsize=1024)
+        >>> cache.parse("P ∧ Q") is cache.parse("P ∧ Q")
+        True
+        >>> cache.cache_info().hits
+        1
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 4096,
+        factory: Optional[ExpressionFactory] = None,
+        json_decoder: Callable[[Dict], LogicalExpression] = LogicalExpression.from_dict,
+    ):
+        """
+        Initializes the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept; least recently used
+                     entries are evicted first.
+            factory: Factory used to share subexpressions between cached
+                     results. By default a private one is created and
+                     replaced after every ``maxsize`` misses; a supplied
+                     factory is never replaced, and its table grows with
+                     every distinct subexpression parsed.
+            json_decoder: Converts dictionaries into expressions on a miss.
+
+        Raises:
+            ValueError: If maxsize is not positive.
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self._owns_factory = factory is None
+        self.factory = factory if factory is not None else ExpressionFactory()
+        self.json_decoder = json_decoder
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._generation_misses = 0
+
+    def parse(self, text: str):
+        """
+        Parses a formula string, reusing a previous result for the same text.
+
+        Args:
+            text: The formula text.
+
+        Returns:
+            The (shared) parsed expression.
+
+        Raises:
+            FormulaSyntaxError: If the text is not a well-formed formula.
+        """
+        return self._lookup(("text", text), lambda: FormulaParser.parse(text, self.factory))
+
+    def from_dict(self, data: Dict):
+        """
+        Deserializes a dictionary, reusing a previous result for equal data.
+
+        Args:
+            data: Dictionary representation of an expression.
+
+        Returns:
+            The (shared) reconstructed expression.
+
+        Raises:
+            ValueError: If the dictionary does not describe a valid expression.
+        """
+        key = ("dict", json.dumps(data, sort_keys=True, separators=(",", ":")))
+        return self._lookup(key, lambda: self.factory.intern(self.json_decoder(data)))
+
+    def _lookup(self, key: tuple, build: Callable[[], object]):
+        entries = self._entries
+        with self._lock:
+            expression = entries.get(key)
+            if expression is not None:
+                entries.move_to_end(key)
+                self._hits += 1
+                return expression
+            self._misses += 1
+        # Build outside the lock; failures are not cached.
+        expression = build()
+        with self._lock:
+            entries[key] = expression
+            entries.move_to_end(key)
+            if len(entries) > self.maxsize:
+                entries.popitem(last=False)
+            if self._owns_factory:
+                self._generation_misses += 1
+                if self._generation_misses >= self.maxsize:
+                    # Start a new generation; the old table goes with its last cached entry.
+                    self.factory = ExpressionFactory()
+                    self._generation_misses = 0
+        return expression
+
+    def cache_info(self) -> CacheInfo:
+        """Returns current hit/miss statistics."""
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                maxsize=self.maxsize,
+                currsize=len(self._entries),
+            )
+
+    def clear(self) -> None:
+        """Empties the cache, resets its statistics and drops a private factory's nodes."""
+        with self._lock:
+            self._entries.clear()
+            if self._owns_factory:
+                self.factory = ExpressionFactory()
+                self._generation_misses = 0
+            self._hits = 0
+            self._misses = 0
@@ -0,0 +1,265 @@
+"""
+Infix formula parser.
+
+This module turns textual formulas such as ``(P ∧ Q) → ¬R`` into expression
+trees using precedence climbing (a Pratt parser) over the token stream
+produced by a lexer compiled once at import time. The parser keeps pending
+operators on an explicit stack, so deeply nested input does not hit the
+interpreter's recursion limit.
+
+Supported syntax, from loosest to tightest binding:
+- Quantifiers ``∀x`` / ``FORALL x`` and ``∃x`` / ``EXISTS x`` (optionally
+  followed by ``.`` or ``:``), whose scope extends as far right as possible
+- ``↔`` / ``<->`` / ``<=>`` / ``IFF`` (right associative)
+- ``→`` / ``->`` / ``=>`` / ``IMPLIES`` (right associative)
+- ``∨`` / ``|`` / ``||`` / ``OR``, ``⊕`` / ``XOR`` and ``↓`` / ``NOR``
+- ``∧`` / ``&`` / ``&&`` / ``AND`` and ``↑`` / ``NAND``
+- ``¬`` / ``~`` / ``!`` / ``NOT``
+- Atoms: propositions ``P`` and relations ``Likes(x, pizza)``, and parentheses
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from agent_logic.core.factory import ExpressionBuilder
+from agent_logic.core.quantifiers import ExistentialQuantifier, UniversalQuantifier
+
+# Single-pass lexer: every token is matched as plain text by one compiled
+# alternation (C-level findall) and classified with a dictionary lookup.
+_LEXER = re.compile(r"<->|<=>|->|=>|&&|\|\||[A-Za-z_][A-Za-z0-9_]*|\S")
+_SYMBOL_KINDS: Dict[str, str] = {
+    "∧": "AND", "&": "AND", "&&": "AND", "AND": "AND",
+    "∨": "OR", "|": "OR", "||": "OR", "OR": "OR",
+    "→": "IMPLIES", "->": "IMPLIES", "=>": "IMPLIES", "IMPLIES": "IMPLIES",
+    "↔": "IFF", "<->": "IFF", "<=>": "IFF", "IFF": "IFF",
+    "⊕": "XOR", "XOR": "XOR", "↑": "NAND", "NAND": "NAND", "↓": "NOR", "NOR": "NOR",
+    "¬": "NOT", "~": "NOT", "!": "NOT", "NOT": "NOT",
+    "∀": "FORALL", "FORALL": "FORALL",
+    "∃": "EXISTS", "EXISTS": "EXISTS",
+    "(": "LPAREN", ")": "RPAREN", ",": "COMMA", ".": "DOT", ":": "DOT",
+}
+
+# Infix operators: token type -> (binding power, right associative).
+INFIX_BINDING: Dict[str, Tuple[int, bool]] = {
+    "IFF": (10, True),
+    "IMPLIES": (20, True),
+    "OR": (30, False),
+    "XOR": (30, False),
+    "NOR": (30, False),
+    "AND": (40, False),
+    "NAND": (40, False),
+}
+PREFIX_BINDING = 50
+
+_DEFAULT_BUILDER = ExpressionBuilder()
+_QUANTIFIERS = (UniversalQuantifier, ExistentialQuantifier)
+
+
+class FormulaSyntaxError(ValueError):
+    """
+    Raised when a formula cannot be parsed.
+
+    Attributes:
+        position: Character offset (or token index for token input) of the error.
+    """
+
+    def __init__(self, message: str, position: int):
+        super().__init__(f"{message} at position {position}")
+        self.position = position
+
+
+class _Parser:
+    """Single-use Pratt parser over parallel token kind/value/position lists."""
+
+    __slots__ = ("kinds", "values", "text", "index", "builder")
+
+    def __init__(self, kinds, values, text, builder):
+        self.kinds: List[str] = kinds
+        self.values: List[str] = values
+        self.text: Optional[str] = text
+        self.index = 0
+        self.builder = builder
+
+    def error(self, message: str) -> FormulaSyntaxError:
+        if self.text is None:
+            return FormulaSyntaxError(message, self.index)
+        # Offsets are only needed on failure, so they are recovered lazily.
+        for count, match in enumerate(_LEXER.finditer(self.text)):
+            if count == self.index:
+                return FormulaSyntaxError(message, match.start())
+        return FormulaSyntaxError(message, len(self.text))
+
+    def error_at(self, index: int, message: str) -> FormulaSyntaxError:
+        self.index = index
+        return self.error(message)
+
+    def peek(self) -> Optional[str]:
+        return self.kinds[self.index] if self.index < len(self.kinds) else None
+
+    def expect(self, kind: str) -> str:
+        if self.peek() != kind:
+            found = self.values[self.index] if self.index < len(self.values) else "end of input"
+            raise self.error(f"Expected {kind} but found {found!r}")
+        value = self.values[self.index]
+        self.index += 1
+        return value
+
+    def parse(self):
+        expression = self.expression(0)
+        if self.index != len(self.kinds):
+            raise self.error(f"Unexpected token {self.values[self.index]!r}")
+        return expression
+
+    def expression(self, min_binding: int):
+        # Prefix forms and right operands push a continuation instead of
+        # recursing, so nesting depth is limited by memory only.
+        # Each entry is (token kind, saved value, binding power to restore).
+        pending: List[Tuple[str, Any, int]] = []
+        kinds = self.kinds
+        count = len(kinds)
+        infix = INFIX_BINDING.get
+        while True:
+            kind = kinds[self.index] if self.index < count else None
+            if kind == "NOT" or kind == "LPAREN":
+                self.index += 1
+                pending.append((kind, None, min_binding))
+                min_binding = PREFIX_BINDING if kind == "NOT" else 0
+                continue
+            if kind == "FORALL" or kind == "EXISTS":
+                self.index += 1
+                variable = self.expect("VAR")
+                if self.peek() == "DOT":
+                    self.index += 1
+                pending.append((kind, variable, min_binding))
+                min_binding = 0
+                continue
+            if kind == "VAR" and (self.index + 1 == count or kinds[self.index + 1] != "LPAREN"):
+                left = self.builder.proposition(self.values[self.index])
+                self.index += 1
+            else:
+                left = self.atom()
+            while True:
+                binding = infix(kinds[self.index]) if self.index < count else None
+                if binding is not None and (
+                    binding[0] > min_binding or (binding[0] == min_binding and binding[1])
+                ):
+                    break
+                if not pending:
+                    return left
+                kind, saved, min_binding = pending.pop()
+                if kind in INFIX_BINDING:
+                    if isinstance(saved, _QUANTIFIERS) or isinstance(left, _QUANTIFIERS):
+                        raise self.error("Quantified formulas cannot be operands of a connective")
+                    left = self.builder.binary(kind, saved, left)
+                else:
+                    left = self.close(kind, saved, left)
+            power, right_assoc = binding
+            pending.append((kinds[self.index], left, min_binding))
+            self.index += 1
+            min_binding = power if right_assoc else power + 1
+
+    def close(self, kind: str, saved: Any, operand):
+        """Completes a pending prefix construct once its operand is parsed."""
+        if kind == "NOT":
+            if isinstance(operand, _QUANTIFIERS):
+                raise self.error("Negated quantifiers are not supported")
+            return self.builder.negation(operand)
+        if kind == "FORALL":
+            return self.builder.universal(saved, operand)
+        if kind == "EXISTS":
+            return self.builder.existential(saved, operand)
+        self.expect("RPAREN")
+        return operand
+
+    def atom(self):
+        kind = self.peek()
+        if kind is None:
+            raise self.error("Unexpected end of input")
+        if kind == "VAR":
+            name = self.values[self.index]
+            self.index += 1
+            if self.peek() != "LPAREN":
+                return self.builder.proposition(name)
+            self.index += 1
+            parameters: List[str] = []
+            if self.peek() != "RPAREN":
+                parameters.append(self.expect("VAR"))
+                while self.peek() == "COMMA":
+                    self.index += 1
+                    parameters.append(self.expect("VAR"))
+            self.expect("RPAREN")
+            return self.builder.relation(name, parameters)
+        raise self.error(f"Unexpected token {self.values[self.index]!r}")
+
+
+class FormulaParser:
+    """Parses infix formula strings into logical expressions."""
+
+    @staticmethod
+    def lex(text: str) -> Tuple[List[str], List[str]]:
+        """
+        Splits text into tokens in a single pass.
+
+        Args:
+            text: The formula text.
+
+        Returns:
+            Parallel lists of token kinds and token texts.
+
+        Raises:
+            FormulaSyntaxError: If the text contains an unrecognized character.
+        """
+        values = _LEXER.findall(text)
+        get = _SYMBOL_KINDS.get
+        kinds = [get(value) or "VAR" for value in values]
+        for index, (kind, value) in enumerate(zip(kinds, values, strict=True)):
+            if kind == "VAR" and not (value[0].isalpha() or value[0] == "_"):
+                raise _Parser(kinds, values, text, None).error_at(
+                    index, f"Unexpected character {value!r}"
+                )
+        return kinds, values
+
+    @staticmethod
+    def parse(text: str, factory: Optional[ExpressionBuilder] = None):
+        """
+        Parses a formula string.
+
+        Args:
+            text: The formula, e.g. ``"(P ∧ Q) → ¬R"`` or ``"P AND NOT Q"``.
+            factory: Builder used to create nodes. Pass an ExpressionFactory to
+                     hash-cons the result; defaults to plain construction.
+
+        Returns:
+            The parsed LogicalExpression (or quantifier at the top level).
+
+        Raises:
+            FormulaSyntaxError: If the text is not a well-formed formula.
+        """
+        kinds, values = FormulaParser.lex(text)
+        builder = factory if factory is not None else _DEFAULT_BUILDER
+        return _Parser(kinds, values, text, builder).parse()
+
+    @staticmethod
+    def parse_tokens(
+        tokens: Sequence[Tuple[str, str]], factory: Optional[ExpressionBuilder] = None
+    ):
+        """
+        Parses a token list as produced by ``Tokenizer.tokenize``.
+
+        Args:
+            tokens: Sequence of (token type, text) pairs.
+            factory: Builder used to create nodes.
+
+        Returns:
+            The parsed expression.
+
+        Raises:
+            FormulaSyntaxError: If the tokens do not form a well-formed formula;
+                                positions are token indices.
+        """
+        kinds = [kind for kind, _ in tokens]
+        values = [value for _, value in tokens]
+        builder = factory if factory is not None else _DEFAULT_BUILDER
+        return _Parser(kinds, values, None, builder).parse()
@@ -0,0 +1,284 @@
+"""
+Streaming formula ingestion.
+
+This module reads large formula corpora lazily with bounded memory:
+- ParseRecord: Outcome of parsing a single record (expression or error)
+- FormulaReader: Iterates over a file of formulas, optionally parsing in a
+  process pool
+
+Two layouts are supported:
+- Line-delimited: one record per line, either a textual formula parsed with
+  FormulaParser or a JSON object decoded with ``LogicalExpression.from_dict``
+  (or any other decoder such as ``ASTParser.parse_dict``). Blank lines are
+  skipped.
+- JSON array: a top-level ``[...]`` of expression objects, decoded element by
+  element without loading the whole array.
+
+Malformed records are reported individually instead of aborting the scan.
+"""
+
+from __future__ import annotations
+
+import json
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+from agent_logic.core.base import LogicalExpression
+from agent_logic.core.factory import ExpressionBuilder
+from agent_logic.parsing.formula_parser import FormulaParser
+from agent_logic.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = " \t\r\n"
+
+
+class ParseRecord(BaseModel):
+    """
+    Result of parsing one record of a formula corpus.
+
+    Attributes:
+        location: 1-based line number (line-delimited input) or element number (JSON arrays).
+        expression: The parsed expression, or None if parsing failed.
+        error: Error message when parsing failed.
+    """
+
+    model_config = {"arbitrary_types_allowed": True}
+
+    location: int
+    expression: Optional[Any] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the record was parsed successfully."""
+        return self.error is None
+
+
+def _parse_one(raw, json_decoder: Callable[[Dict], Any], factory) -> Tuple[Any, Optional[str]]:
+    """Parses a raw record (text line or decoded JSON value)."""
+    try:
+        if isinstance(raw, str):
+            stripped = raw.strip()
+            if stripped.startswith("{"):
+                raw = json.loads(stripped)
+            else:
+                return FormulaParser.parse(stripped, factory), None
+        return json_decoder(raw), None
+    except Exception as e:  # Per-record isolation: report and keep going.
+        return None, f"{type(e).__name__}: {e}"
+
+
+def _parse_chunk(chunk: List, json_decoder: Callable[[Dict], Any]) -> List[Tuple[Any, Optional[str]]]:
+    """Worker entry point: parses a chunk of raw records."""
+    return [_parse_one(raw, json_decoder, None) for raw in chunk]
+
+
+class FormulaReader:
+    """
+    Lazily parses a file of formulas.
+
+    Iterating over the reader yields parsed expressions; failed records are
+    passed to ``on_error`` (logged by default). ``records()`` yields a
+    ParseRecord for every record, successful or not.
+
+    Example:
+        >>> reader = FormulaReader("corpus.jsonl", workers=4)
+        >>> for expression in reader:
+        ...     process(expression)
+        >>> reader.error_count
+        0
+    """
+
+    def __init__(
+        self,
+        path: str,
+        layout: str = "auto",
+        json_decoder: Callable[[Dict], Any] = LogicalExpression.from_dict,
+        workers: int = 0,
+        chunk_size: int = 1000,
+        factory: Optional[ExpressionBuilder] = None,
+        on_error: Optional[Callable[[ParseRecord], None]] = None,
+        encoding: str = "utf-8",
+        read_size: int = 1 << 16,
+        max_record_size: int = 1 << 26,
+    ):
+        """
+        Initializes the reader.
+
+        Args:
+            path: File to read.
+            layout: ``"lines"``, ``"json-array"`` or ``"auto"`` (detected from
+                    the first non-whitespace character).
+            json_decoder: Converts a decoded JSON object into an expression.
+            workers: Number of worker processes; 0 or 1 parses in-process.
+            chunk_size: Records per work unit when using worker processes.
+            factory: Optional builder (e.g. ExpressionFactory) for textual
+                     formulas; only available for in-process parsing.
+            on_error: Callback receiving failed records during iteration.
+            encoding: Text encoding of the file.
+            read_size: Characters read at a time from JSON arrays.
+            max_record_size: Largest JSON array element accepted, in characters.
+
+        Raises:
+            ValueError: If the layout is unknown or a factory is combined with workers.
+        """
+        if layout not in ("auto", "lines", "json-array"):
+            raise ValueError(f"Unknown layout: {layout}")
+        if factory is not None and workers > 1:
+            raise ValueError("A shared factory cannot be used with worker processes")
+        self.path = path
+        self.layout = layout
+        self.json_decoder = json_decoder
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.factory = factory
+        self.on_error = on_error
+        self.encoding = encoding
+        self.read_size = read_size
+        self.max_record_size = max_record_size
+        self.record_count = 0
+        self.error_count = 0
+
+    def __iter__(self) -> Iterator[Any]:
+        """Yields successfully parsed expressions, reporting failures to ``on_error``."""
+        for record in self.records():
+            if record.error is None:
+                yield record.expression
+            elif self.on_error is not None:
+                self.on_error(record)
+            else:
+                logger.warning(f"{self.path}:{record.location}: {record.error}")
+
+    def records(self) -> Iterator[ParseRecord]:
+        """
+        Yields one ParseRecord per record in file order.
+
+        Returns:
+            Iterator over parse results; memory use is bounded by the chunk
+            size and the number of workers, not by the file size.
+        """
+        self.record_count = 0
+        self.error_count = 0
+        with open(self.path, "r", encoding=self.encoding) as handle:
+            raw_records = self._raw_records(handle)
+            if self.workers > 1:
+                results = self._parse_parallel(raw_records)
+            else:
+                results = (
+                    (location, *_parse_one(raw, self.json_decoder, self.factory))
+                    if error is None
+                    else (location, None, error)
+                    for location, raw, error in raw_records
+                )
+            for location, expression, error in results:
+                self.record_count += 1
+                if error is not None:
+                    self.error_count += 1
+                yield ParseRecord(location=location, expression=expression, error=error)
+
+    def _raw_records(self, handle) -> Iterator[Tuple[int, Any, Optional[str]]]:
+        """Yields (location, raw record, framing error) triples."""
+        layout = self.layout
+        if layout == "auto":
+            first = handle.read(1)
+            while first and first in _WHITESPACE:
+                first = handle.read(1)
+            handle.seek(0)
+            layout = "json-array" if first == "[" else "lines"
+        if layout == "lines":
+            for number, line in enumerate(handle, start=1):
+                if line.strip():
+                    yield number, line, None
+        else:
+            yield from self._array_elements(handle)
+
+    def _array_elements(self, handle) -> Iterator[Tuple[int, Any, Optional[str]]]:
+        """Incrementally decodes the elements of a top-level JSON array."""
+        buffer = ""
+        position = 0
+        eof = False
+
+        def fill() -> bool:
+            nonlocal buffer, position, eof
+            chunk = handle.read(self.read_size)
+            if not chunk:
+                eof = True
+                return False
+            buffer = buffer[position:] + chunk
+            position = 0
+            return True
+
+        def skip_whitespace() -> Optional[str]:
+            nonlocal position
+            while True:
+                while position < len(buffer) and buffer[position] in _WHITESPACE:
+                    position += 1
+                if position < len(buffer):
+                    return buffer[position]
+                if not fill():
+                    return None
+
+        if skip_whitespace() != "[":
+            yield 1, None, "Input does not start with a JSON array"
+            return
+        position += 1
+        number = 0
+        expect_element = True
+        while True:
+            char = skip_whitespace()
+            if char is None:
+                yield number + 1, None, "Unterminated JSON array"
+                return
+            if char == "]":
+                return
+            if char == ",":
+                if expect_element:
+                    yield number + 1, None, "Unexpected ',' in JSON array"
+                    return
+                position += 1
+                expect_element = True
+                continue
+            number += 1
+            while True:
+                try:
+                    value, end = _DECODER.raw_decode(buffer, position)
+                except json.JSONDecodeError as e:
+                    if len(buffer) - position > self.max_record_size:
+                        yield number, None, f"JSONDecodeError: element exceeds {self.max_record_size} characters"
+                        return
+                    if not fill():
+                        yield number, None, f"JSONDecodeError: {e.msg}"
+                        return
+                    continue
+                # A number or literal ending the buffer may continue in the next chunk.
+                if end < len(buffer) or not fill():
+                    break
+            position = end
+            expect_element = False
+            yield number, value, None
+
+    def _parse_parallel(self, raw_records) -> Iterator[Tuple[int, Any, Optional[str]]]:
+        """Parses chunks of records in worker processes, preserving order."""
+        in_flight: List = []
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            while True:
+                chunk = list(islice(raw_records, self.chunk_size))
+                if chunk:
+                    pending = [raw for _, raw, error in chunk if error is None]
+                    future = pool.submit(_parse_chunk, pending, self.json_decoder)
+                    in_flight.append((chunk, future))
+                if in_flight and (not chunk or len(in_flight) >= 2 * self.workers):
+                    done_chunk, future = in_flight.pop(0)
+                    parsed = iter(future.result())
+                    for location, _, error in done_chunk:
+                        if error is None:
+                            yield (location, *next(parsed))
+                        else:
+                            yield location, None, error
+                if not chunk and not in_flight:
+                    return
@@ -2,16 +2,23 @@
 Logical proofs module.
 
 This module provides tools for constructing and validating logical proofs,
-including inference rules and proof verification systems.
+including inference rules, proof verification systems and a knowledge base
+with incremental entailment queries.
 """
 
+from agent_logic.proofs.datalog import DatalogEngine, DatalogRule, Derivation
 from agent_logic.proofs.inference_rules import InferenceRules
+from agent_logic.proofs.knowledge_base import KnowledgeBase
 from agent_logic.proofs.proof_system import Proof, ProofStep
 from agent_logic.proofs.quantifier_rules import QuantifierRules
 from agent_logic.proofs.unification import Unification
 
 __all__ = [
+    "DatalogEngine",
+    "DatalogRule",
+    "Derivation",
     "InferenceRules",
+    "KnowledgeBase",
     "Proof",
     "ProofStep",
     "QuantifierRules",
@@ -0,0 +1,588 @@
+"""
+Datalog engine for Horn rule sets.
+
+This module provides bottom-up evaluation of function-free Horn clauses
+expressed with the existing expression types:
+- DatalogRule: A single rule ``∀x̄ (B₁ ∧ ... ∧ Bₙ → H)`` over Relation atoms
+- Derivation: Provenance record explaining how a fact was derived
+- DatalogEngine: Stratified, semi-naive evaluator with indexed joins
+
+Rules are written as (possibly nested) UniversalQuantifier objects wrapping an
+IMPLIES BinaryOp whose antecedent is a conjunction of Relation atoms (or
+negated atoms) and whose consequent is a single Relation. The quantified
+names are the rule variables; every other parameter is a constant. A
+Proposition is treated as a relation of arity zero, so propositional Horn
+clauses such as ``P ∧ Q → R`` are handled by the same machinery.
+
+Entailment is decided in polynomial time in the number of facts, and every
+derived fact can be turned into a Proof that the proof system validates.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from pydantic import BaseModel, Field
+
+from agent_logic.core.base import LogicalExpression
+from agent_logic.core.functions import Relation
+from agent_logic.core.operations import BinaryOp, Not, Proposition
+from agent_logic.core.quantifiers import UniversalQuantifier
+from agent_logic.proofs.proof_system import Proof, ProofStep
+from agent_logic.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+Atom = Union[Relation, Proposition]
+GroundFact = Tuple[str, Tuple[str, ...]]
+
+
+def _atom_key(atom: Atom) -> Tuple[str, Tuple[str, ...]]:
+    """Returns the (predicate, arguments) pair for a Relation or Proposition."""
+    if isinstance(atom, Relation):
+        return atom.name, tuple(atom.parameters)
+    if isinstance(atom, Proposition):
+        return atom.name, ()
+    raise ValueError(f"Expected a Relation or Proposition atom, got {atom!r}")
+
+
+class DatalogRule(BaseModel):
+    """
+    Represents a single Horn rule with optional negated body atoms.
+
+    Attributes:
+        head: The atom derived when the body holds.
+        body: Positive body atoms that must all be known facts.
+        negated: Body atoms that must not be derivable (stratified negation).
+        variables: Names bound by the rule's universal quantifiers.
+    """
+
+    head: LogicalExpression
+    body: List[LogicalExpression] = Field(default_factory=list)
+    negated: List[LogicalExpression] = Field(default_factory=list)
+    variables: List[str] = Field(default_factory=list)
+
+    @classmethod
+    def from_expression(cls, expression) -> DatalogRule:
+        """
+        Builds a rule from a quantified implication.
+
+        Accepts ``∀x∀y (Body → Head)`` as nested UniversalQuantifier objects,
+        an unquantified ``Body → Head`` implication, or a bare atom (a rule
+        with an empty body).
+
+        Args:
+            expression: The logical expression to convert.
+
+        Returns:
+            The equivalent DatalogRule.
+
+        Raises:
+            ValueError: If the expression is not a safe Horn clause.
+        """
+        variables: List[str] = []
+        while isinstance(expression, UniversalQuantifier):
+            variables.append(expression.variable)
+            expression = expression.predicate
+
+        body: List[LogicalExpression] = []
+        negated: List[LogicalExpression] = []
+        if isinstance(expression, BinaryOp) and expression.operator == "IMPLIES":
+            head = expression.right
+            pending = [expression.left]
+            while pending:
+                node = pending.pop()
+                if isinstance(node, BinaryOp) and node.operator == "AND":
+                    pending.append(node.right)
+                    pending.append(node.left)
+                elif isinstance(node, Not) and isinstance(
+                    node.operand, (Relation, Proposition)
+                ):
+                    negated.append(node.operand)
+                elif isinstance(node, (Relation, Proposition)):
+                    body.append(node)
+                else:
+                    raise ValueError(f"Unsupported body literal in Horn rule: {node}")
+        else:
+            head = expression
+
+        if not isinstance(head, (Relation, Proposition)):
+            raise ValueError(f"Horn rule head must be a single atom, got {head}")
+
+        rule = cls(head=head, body=body, negated=negated, variables=variables)
+        rule._check_safety()
+        return rule
+
+    def _check_safety(self) -> None:
+        """Ensures every head or negated variable occurs in a positive body atom."""
+        bound = {
+            arg
+            for atom in self.body
+            for arg in _atom_key(atom)[1]
+            if arg in self.variables
+        }
+        for atom in [self.head] + list(self.negated):
+            for arg in _atom_key(atom)[1]:
+                if arg in self.variables and arg not in bound:
+                    raise ValueError(
+                        f"Unsafe rule: variable '{arg}' in {atom} is not bound "
+                        "by a positive body atom"
+                    )
+
+
+class Derivation(BaseModel):
+    """
+    Provenance of a derived fact.
+
+    Attributes:
+        fact: The derived ground atom.
+        rule: The rule that produced the fact, or None for an input fact.
+        premises: Ground instances of the rule's positive body atoms.
+        absent: Ground instances of the rule's negated body atoms.
+    """
+
+    fact: LogicalExpression
+    rule: Optional[DatalogRule] = None
+    premises: List[LogicalExpression] = Field(default_factory=list)
+    absent: List[LogicalExpression] = Field(default_factory=list)
+
+
+class _FactIndex:
+    """Stores the tuples of one predicate with lazily built hash indexes."""
+
+    __slots__ = ("tuples", "arity", "_indexes")
+
+    def __init__(self):
+        self.tuples: Set[Tuple[str, ...]] = set()
+        self.arity: Optional[int] = None
+        self._indexes: Dict[Tuple[int, ...], Dict[Tuple[str, ...], List]] = {}
+
+    def add(self, row: Tuple[str, ...]) -> bool:
+        """Adds a tuple, keeping existing indexes up to date."""
+        if row in self.tuples:
+            return False
+        self.tuples.add(row)
+        self.arity = len(row)
+        for positions, index in self._indexes.items():
+            index.setdefault(tuple(row[i] for i in positions), []).append(row)
+        return True
+
+    def lookup(self, positions: Tuple[int, ...], values: Tuple[str, ...]) -> Iterable:
+        """Returns the tuples whose arguments at ``positions`` equal ``values``."""
+        if not positions:
+            return self.tuples
+        if len(positions) == self.arity:
+            return (values,) if values in self.tuples else ()
+        index = self._indexes.get(positions)
+        if index is None:
+            index = {}
+            for row in self.tuples:
+                index.setdefault(tuple(row[i] for i in positions), []).append(row)
+            self._indexes[positions] = index
+        return index.get(values, ())
+
+
+_EMPTY_INDEX = _FactIndex()
+
+
+class DatalogEngine:
+    """
+    Stratified semi-naive Datalog evaluator over Relation atoms.
+
+    Facts and rules may be added in any order; the model is (re)computed
+    lazily on the first query after a change. Each derived fact keeps the
+    first derivation found, which is one of minimal depth because evaluation
+    proceeds breadth-first.
+
+    Example:
+        >>> engine = DatalogEngine()
+        >>> engine.add(Relation(name="Parent", parameters=["alice", "bob"]))
+        >>> engine.add(rule)  # ∀x∀y (Parent(x, y) → Ancestor(x, y))
+        >>> engine.entails(Relation(name="Ancestor", parameters=["alice", "bob"]))
+        True
+    """
+
+    def __init__(self, program: Iterable = ()):
+        """
+        Initializes the engine, optionally loading a program.
+
+        Args:
+            program: Facts and rules accepted by ``add``.
+        """
+        self.rules: List[DatalogRule] = []
+        self._edb: Set[GroundFact] = set()
+        self._propositional: Set[str] = set()
+        self._relations: Optional[Dict[str, _FactIndex]] = None
+        self._provenance: Dict[GroundFact, Tuple[int, List[GroundFact], List[GroundFact]]] = {}
+        for statement in program:
+            self.add(statement)
+
+    def add(self, statement) -> None:
+        """
+        Adds a ground fact or a Horn rule to the program.
+
+        Args:
+            statement: A ground Relation/Proposition, or a (quantified) implication.
+
+        Raises:
+            ValueError: If the statement is neither a ground atom nor a Horn rule.
+        """
+        if isinstance(statement, (Relation, Proposition)):
+            self.add_fact(statement)
+        else:
+            self.add_rule(statement)
+
+    def add_fact(self, atom: Atom) -> None:
+        """Adds a ground atom to the extensional database."""
+        if isinstance(atom, Proposition):
+            self._propositional.add(atom.name)
+        self._edb.add(_atom_key(atom))
+        self._relations = None
+
+    def add_rule(self, rule: Union[DatalogRule, LogicalExpression, UniversalQuantifier]) -> None:
+        """Adds a rule, converting it from an expression if necessary."""
+        if not isinstance(rule, DatalogRule):
+            rule = DatalogRule.from_expression(rule)
+        if not rule.body and not rule.negated:
+            if rule.variables:
+                raise ValueError(f"Unsafe rule: universally quantified fact {rule.head}")
+            self.add_fact(rule.head)
+            return
+        for atom in [rule.head] + rule.body + rule.negated:
+            if isinstance(atom, Proposition):
+                self._propositional.add(atom.name)
+        self.rules.append(rule)
+        self._relations = None
+
+    def stratify(self) -> List[List[DatalogRule]]:
+        """
+        Partitions the rules into strata so negation is only applied to
+        predicates that are fully computed in an earlier stratum.
+
+        Returns:
+            Rules grouped by stratum, lowest stratum first.
+
+        Raises:
+            ValueError: If a predicate depends negatively on itself.
+        """
+        predicates = {_atom_key(rule.head)[0] for rule in self.rules}
+        stratum: Dict[str, int] = {name: 0 for name in predicates}
+        limit = len(predicates)
+        changed = True
+        while changed:
+            changed = False
+            for rule in self.rules:
+                head = _atom_key(rule.head)[0]
+                level = stratum[head]
+                for atom in rule.body:
+                    level = max(level, stratum.get(_atom_key(atom)[0], 0))
+                for atom in rule.negated:
+                    level = max(level, stratum.get(_atom_key(atom)[0], 0) + 1)
+                if level > stratum[head]:
+                    if level > limit:
+                        raise ValueError(
+                            f"Program is not stratifiable: '{head}' depends "
+                            "negatively on itself"
+                        )
+                    stratum[head] = level
+                    changed = True
+
+        strata: Dict[int, List[DatalogRule]] = {}
+        for rule in self.rules:
+            strata.setdefault(stratum[_atom_key(rule.head)[0]], []).append(rule)
+        return [strata[level] for level in sorted(strata)]
+
+    def evaluate(self) -> Dict[str, Set[Tuple[str, ...]]]:
+        """
+        Computes the minimal (perfect) model of the program.
+
+        Returns:
+            Mapping from predicate name to the set of argument tuples that hold.
+        """
+        if self._relations is None:
+            self._run()
+        return {name: set(index.tuples) for name, index in self._relations.items()}
+
+    def entails(self, atom: Atom) -> bool:
+        """Checks whether a ground atom holds in the model of the program."""
+        name, args = _atom_key(atom)
+        return args in self._model().get(name, _EMPTY_INDEX).tuples
+
+    def query(self, atom: Atom, variables: Iterable[str] = ()) -> List[Dict[str, str]]:
+        """
+        Answers a conjunctive query consisting of a single atom.
+
+        Args:
+            atom: Query pattern, e.g. ``Ancestor(alice, z)``.
+            variables: Parameter names in ``atom`` to treat as free variables.
+
+        Returns:
+            Sorted list of variable bindings for which the atom holds.
+        """
+        name, args = _atom_key(atom)
+        free = set(variables)
+        bound = tuple(i for i, arg in enumerate(args) if arg not in free)
+        index = self._model().get(name)
+        if index is None:
+            return []
+        answers = []
+        for row in index.lookup(bound, tuple(args[i] for i in bound)):
+            binding: Dict[str, str] = {}
+            for arg, value in zip(args, row, strict=True):
+                if arg in free and binding.setdefault(arg, value) != value:
+                    break
+            else:
+                answers.append(binding)
+        return sorted(answers, key=lambda b: sorted(b.items()))
+
+    def explain(self, atom: Atom) -> Optional[Derivation]:
+        """
+        Returns the derivation recorded for a ground atom.
+
+        Args:
+            atom: The ground atom to explain.
+
+        Returns:
+            A Derivation (with ``rule`` None for input facts), or None if the
+            atom does not hold.
+        """
+        if not self.entails(atom):
+            return None
+        key = _atom_key(atom)
+        if key not in self._provenance:
+            return Derivation(fact=self._make_atom(key))
+        rule_index, premises, absent = self._provenance[key]
+        return Derivation(
+            fact=self._make_atom(key),
+            rule=self.rules[rule_index],
+            premises=[self._make_atom(p) for p in premises],
+            absent=[self._make_atom(a) for a in absent],
+        )
+
+    def to_proof(self, atom: Atom) -> Optional[Proof]:
+        """
+        Converts the derivation of a ground atom into a validatable Proof.
+
+        Input facts and ground instances of the rules used become "Given"
+        steps, bodies are assembled with Conjunction Introduction and each
+        rule application is a Modus Ponens step. Negated body atoms appear as
+        "Given" negations justified by the closed-world assumption.
+
+        Args:
+            atom: The ground atom to prove.
+
+        Returns:
+            A Proof ending in ``atom``, or None if the atom does not hold.
+        """
+        if not self.entails(atom):
+            return None
+
+        steps: List[ProofStep] = []
+        step_of: Dict[GroundFact, int] = {}
+
+        def emit(statement: LogicalExpression, justification: str, deps=None) -> int:
+            steps.append(
+                ProofStep(
+                    step_number=len(steps) + 1,
+                    statement=statement,
+                    justification=justification,
+                    dependencies=deps,
+                )
+            )
+            return len(steps)
+
+        # Iterative post-order walk so deep derivation chains cannot overflow the stack.
+        stack: List[Tuple[GroundFact, bool]] = [(_atom_key(atom), False)]
+        while stack:
+            key, expanded = stack.pop()
+            if key in step_of:
+                continue
+            if key not in self._provenance:
+                step_of[key] = emit(self._make_atom(key), "Given")
+                continue
+            rule_index, premises, absent = self._provenance[key]
+            if not expanded:
+                stack.append((key, True))
+                stack.extend((p, False) for p in reversed(premises) if p not in step_of)
+                continue
+
+            body_steps = [step_of[p] for p in premises]
+            body_atoms = [self._make_atom(p) for p in premises]
+            for negated in absent:
+                body_atoms.append(Not(operand=self._make_atom(negated)))
+                body_steps.append(emit(body_atoms[-1], "Given"))
+
+            conjunction, conjunction_step = body_atoms[0], body_steps[0]
+            for conjunct, conjunct_step in zip(body_atoms[1:], body_steps[1:], strict=True):
+                conjunction = BinaryOp(left=conjunction, right=conjunct, operator="AND")
+                conjunction_step = emit(
+                    conjunction,
+                    "Conjunction Introduction",
+                    [conjunction_step, conjunct_step],
+                )
+
+            head = self._make_atom(key)
+            instance = BinaryOp(left=conjunction, right=head, operator="IMPLIES")
+            instance_step = emit(instance, "Given")
+            step_of[key] = emit(head, "Modus Ponens", [conjunction_step, instance_step])
+
+        return Proof(steps=steps)
+
+    def _model(self) -> Dict[str, _FactIndex]:
+        """Returns the computed relations, evaluating the program if needed."""
+        if self._relations is None:
+            self._run()
+        return self._relations
+
+    def _make_atom(self, key: GroundFact) -> Atom:
+        """Builds the expression object for a ground (predicate, args) pair."""
+        name, args = key
+        if not args and name in self._propositional:
+            return Proposition(name=name)
+        return Relation(name=name, parameters=list(args))
+
+    def _run(self) -> None:
+        """Evaluates all strata with semi-naive iteration."""
+        relations: Dict[str, _FactIndex] = {}
+        for name, args in self._edb:
+            relations.setdefault(name, _FactIndex()).add(args)
+        self._relations = relations
+        self._provenance = {}
+
+        rule_ids = {id(rule): i for i, rule in enumerate(self.rules)}
+        compiled = {id(rule): _CompiledRule(rule) for rule in self.rules}
+
+        for stratum in self.stratify():
+            heads = {_atom_key(rule.head)[0] for rule in stratum}
+            for name in heads:
+                relations.setdefault(name, _FactIndex())
+            # Body predicate -> positions of the rules in this stratum that use it.
+            users: Dict[str, List[int]] = {}
+            for position, rule in enumerate(stratum):
+                for name in {name for name, _ in compiled[id(rule)].body}:
+                    users.setdefault(name, []).append(position)
+
+            # The first round joins against everything known so far.
+            delta: Optional[Dict[str, Set[Tuple[str, ...]]]] = None
+            active = stratum
+            rounds = 0
+            while True:
+                rounds += 1
+                new_facts: Dict[str, Set[Tuple[str, ...]]] = {}
+                for rule in active:
+                    plan = compiled[id(rule)]
+                    for row, premises, absent in plan.fire(relations, delta):
+                        head_name = plan.head_name
+                        if row in relations[head_name].tuples:
+                            continue
+                        pending = new_facts.setdefault(head_name, set())
+                        if row in pending:
+                            continue
+                        pending.add(row)
+                        self._provenance[(head_name, row)] = (
+                            rule_ids[id(rule)],
+                            premises,
+                            absent,
+                        )
+                if not new_facts:
+                    break
+                for name, rows in new_facts.items():
+                    for row in rows:
+                        relations[name].add(row)
+                delta = {name: rows for name, rows in new_facts.items() if name in heads}
+                if not delta:
+                    break
+                # Only rules joining against a predicate that just grew can fire.
+                positions = {position for name in delta for position in users.get(name, ())}
+                active = [stratum[position] for position in sorted(positions)]
+            logger.debug(f"Stratum {sorted(heads)} reached fixpoint after {rounds} rounds")
+
+
+class _CompiledRule:
+    """Join plan for a rule: variable slots and argument patterns per atom."""
+
+    __slots__ = ("head_name", "head_args", "body", "negated")
+
+    def __init__(self, rule: DatalogRule):
+        variables = set(rule.variables)
+        self.head_name, head_args = _atom_key(rule.head)
+        self.head_args = [(arg in variables, arg) for arg in head_args]
+        self.body = [
+            (name, [(arg in variables, arg) for arg in args])
+            for name, args in map(_atom_key, rule.body)
+        ]
+        self.negated = [
+            (name, [(arg in variables, arg) for arg in args])
+            for name, args in map(_atom_key, rule.negated)
+        ]
+
+    def fire(self, relations: Dict[str, _FactIndex], delta):
+        """
+        Yields head tuples derivable from the current relations.
+
+        When ``delta`` is given, only joins in which at least one body atom
+        matches a tuple from the previous round are enumerated (semi-naive).
+        """
+        if delta is None:
+            yield from self._join(relations, None, None)
+            return
+        for position, (name, _) in enumerate(self.body):
+            if delta.get(name):
+                yield from self._join(relations, position, delta[name])
+
+    def _join(self, relations, delta_position, delta_rows):
+        order = list(range(len(self.body)))
+        if delta_position is not None:
+            order.remove(delta_position)
+            order.insert(0, delta_position)
+
+        def extend(depth: int, binding: Dict[str, str], matched: List):
+            if depth == len(order):
+                absent = []
+                for name, pattern in self.negated:
+                    row = tuple(binding[a] if is_var else a for is_var, a in pattern)
+                    if row in relations.get(name, _EMPTY_INDEX).tuples:
+                        return
+                    absent.append((name, row))
+                head = tuple(binding[a] if is_var else a for is_var, a in self.head_args)
+                premises = [None] * len(self.body)
+                for position, fact in matched:
+                    premises[position] = fact
+                yield head, premises, absent
+                return
+
+            position = order[depth]
+            name, pattern = self.body[position]
+            positions = tuple(
+                i for i, (is_var, a) in enumerate(pattern) if not is_var or a in binding
+            )
+            values = tuple(
+                binding[a] if is_var else a
+                for is_var, a in (pattern[i] for i in positions)
+            )
+            if depth == 0 and delta_rows is not None:
+                candidates = [
+                    row
+                    for row in delta_rows
+                    if all(row[i] == v for i, v in zip(positions, values, strict=True))
+                ]
+            else:
+                candidates = relations.get(name, _EMPTY_INDEX).lookup(positions, values)
+
+            for row in list(candidates):
+                extended = binding
+                consistent = True
+                for (is_var, a), value in zip(pattern, row, strict=True):
+                    if is_var:
+                        if a in extended:
+                            if extended[a] != value:
+                                consistent = False
+                                break
+                        else:
+                            if extended is binding:
+                                extended = dict(binding)
+                            extended[a] = value
+                if consistent:
+                    yield from extend(depth + 1, extended, matched + [(position, (name, row))])
+
+        yield from extend(0, {}, [])
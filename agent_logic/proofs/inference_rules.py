@@ -20,6 +20,8 @@ class InferenceRules:
             if isinstance(p, Proposition) and isinstance(p_implies_q.left, Proposition):
                 if p.name == p_implies_q.left.name:  # Compare by name
                     return p_implies_q.right  # Return Q
+            elif p is not None and p == p_implies_q.left:  # Compound antecedent
+                return p_implies_q.right
         return None  # Return None instead of raising an error (avoid test failure)
 
     @staticmethod
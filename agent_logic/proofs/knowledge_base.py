@@ -0,0 +1,222 @@
+"""
+Knowledge base with incremental entailment.
+
+This module answers repeated entailment questions against a changing set of
+premises:
+- KnowledgeBase: Premises kept as clauses in one persistent incremental SAT
+  instance, with ``add``, ``retract``, ``entails``, ``consistent`` and
+  ``conflict``
+
+Each premise is Tseitin-encoded once and asserted through a selector
+variable: its clause set only says ``selector → premise``, and queries pass
+the selectors of the active premises as assumptions. Retracting a premise
+fixes its selector to false, so no clause is ever removed and everything the
+solver has learned stays valid. A query ``KB ⊨ φ`` encodes ``φ`` (once per
+structurally distinct goal) and checks that the premises together with ``¬φ``
+are unsatisfiable. Answers are cached per goal fingerprint until the premise
+set changes.
+
+Goal definitions and retracted premises leave unused variables behind. When
+they outnumber the live part of the instance, the solver is rebuilt from the
+active premises, so the cost of a query does not grow with the number of
+queries asked before it.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from agent_logic.core.base import LogicalExpression
+from agent_logic.evaluation.cnf import CNF, CNFEncoder
+from agent_logic.evaluation.mus import shrink_core
+from agent_logic.evaluation.sat_solvers import CDCLSolver
+from agent_logic.transformations.canonical import Fingerprint
+
+
+class KnowledgeBase:
+    """
+    Premise set supporting incremental entailment and consistency queries.
+
+    Example:
+        >>> kb = KnowledgeBase([FormulaParser.parse("P → Q"), FormulaParser.parse("P")])
+        >>> kb.entails(FormulaParser.parse("Q"))
+        True
+        >>> kb.retract(1)
+        >>> kb.entails(FormulaParser.parse("Q"))
+        False
+
+    Attributes:
+        COMPACT_MIN_VARS: Number of unused variables tolerated before the
+            solver is rebuilt, regardless of the size of the live instance.
+    """
+
+    COMPACT_MIN_VARS = 1000
+
+    def __init__(self, premises: Iterable[LogicalExpression] = ()):
+        """
+        Creates a knowledge base.
+
+        Args:
+            premises: Initial premises; they get handles 0, 1, 2, ...
+
+        Raises:
+            ValueError: If a premise contains node types that cannot be encoded.
+        """
+        # Handle -> (premise, selector variable) for the active premises.
+        self._premises: Dict[int, Tuple[LogicalExpression, int]] = {}
+        self._next_handle = 0
+        self._reset_solver()
+        for premise in premises:
+            self.add(premise)
+
+    def _reset_solver(self) -> None:
+        self._cnf = CNF()
+        self._solver = CDCLSolver()
+        self._flushed = 0
+        self._dead_vars = 0
+        self._goal_literals: Dict[bytes, int] = {}
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        self._entailed: Dict[bytes, bool] = {}
+        self._consistent: Optional[bool] = None
+
+    def _encode(self, expression: LogicalExpression) -> int:
+        """Defines an expression in the instance and returns its literal."""
+        literal = CNFEncoder.tseitin_literal(expression, self._cnf)
+        self._flush()
+        return literal
+
+    def _flush(self) -> None:
+        clauses = self._cnf.clauses
+        for clause in clauses[self._flushed:]:
+            self._solver.add_clause(clause)
+        self._flushed = len(clauses)
+
+    def _assert(self, premise: LogicalExpression) -> int:
+        """Encodes a premise behind a fresh selector and returns the selector."""
+        literal = self._encode(premise)
+        selector = self._cnf.aux()
+        self._cnf.clauses.append([-selector, literal])
+        self._flush()
+        return selector
+
+    def _compact(self) -> None:
+        """Rebuilds the solver when unused variables dominate the instance."""
+        live = self._cnf.num_vars - self._dead_vars
+        if self._dead_vars <= max(live, self.COMPACT_MIN_VARS):
+            return
+        premises, entailed, consistent = self._premises, self._entailed, self._consistent
+        self._reset_solver()
+        self._premises = {handle: (premise, self._assert(premise)) for handle, (premise, _) in premises.items()}
+        # The premise set is unchanged, so cached answers stay valid.
+        self._entailed, self._consistent = entailed, consistent
+
+    def add(self, premise: LogicalExpression) -> int:
+        """
+        Adds a premise.
+
+        Args:
+            premise: The premise to add.
+
+        Returns:
+            The handle used to retract the premise.
+
+        Raises:
+            ValueError: If the premise contains node types that cannot be encoded.
+        """
+        selector = self._assert(premise)
+        handle = self._next_handle
+        self._next_handle += 1
+        self._premises[handle] = (premise, selector)
+        self._invalidate()
+        return handle
+
+    def retract(self, handle: int) -> None:
+        """
+        Removes a premise.
+
+        Args:
+            handle: The handle returned by ``add`` (or the position of an
+                    initial premise).
+
+        Raises:
+            ValueError: If no active premise has this handle.
+        """
+        entry = self._premises.pop(handle, None)
+        if entry is None:
+            raise ValueError(f"No active premise with handle {handle}")
+        selector = entry[1]
+        # The selector is never assumed again; fixing it satisfies the premise clause for good.
+        self._solver.add_clause([-selector])
+        self._dead_vars += 1
+        self._invalidate()
+        self._compact()
+
+    @property
+    def premises(self) -> Dict[int, LogicalExpression]:
+        """The active premises by handle."""
+        return {handle: premise for handle, (premise, _) in self._premises.items()}
+
+    def __len__(self) -> int:
+        return len(self._premises)
+
+    def _assumptions(self) -> List[int]:
+        return [selector for _, selector in self._premises.values()]
+
+    def consistent(self) -> bool:
+        """
+        Decides whether the active premises can all be true together.
+
+        Returns:
+            True if the premises are satisfiable.
+        """
+        if self._consistent is None:
+            self._consistent = bool(self._solver.solve(self._assumptions()))
+        return self._consistent
+
+    def entails(self, goal: LogicalExpression) -> bool:
+        """
+        Decides whether the active premises entail a goal.
+
+        Args:
+            goal: The formula to check.
+
+        Returns:
+            True if the goal holds in every model of the premises (always
+            True when the premises are inconsistent).
+
+        Raises:
+            ValueError: If the goal contains node types that cannot be encoded.
+        """
+        key = Fingerprint.of(goal)
+        cached = self._entailed.get(key)
+        if cached is not None:
+            return cached
+        literal = self._goal_literals.get(key)
+        if literal is None:
+            self._compact()
+            before = self._cnf.num_vars
+            literal = self._goal_literals[key] = self._encode(goal)
+            # Goal definitions only matter while this goal is queried.
+            self._dead_vars += self._cnf.num_vars - before
+        result = self._solver.solve(self._assumptions() + [-literal]) is False
+        self._entailed[key] = result
+        return result
+
+    def conflict(self) -> Optional[List[int]]:
+        """
+        Explains an inconsistent premise set.
+
+        Returns:
+            The handles of a minimal inconsistent subset of the active
+            premises, ascending, or None if the premises are consistent.
+        """
+        assumptions = self._assumptions()
+        if self._solver.solve(assumptions):
+            self._consistent = True
+            return None
+        self._consistent = False
+        handle_of = {selector: handle for handle, (_, selector) in self._premises.items()}
+        core = sorted(self._solver.core, key=handle_of.__getitem__)
+        return sorted(handle_of[selector] for selector in shrink_core(self._solver, core)[0])
@@ -16,7 +16,7 @@ from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
-from agent_logic.core.base import LogicalExpression
+from agent_logic.core.base import LogicalExpression, construct_unchecked
 from agent_logic.core.operations import BinaryOp, Proposition
 from agent_logic.proofs.inference_rules import InferenceRules
 from agent_logic.proofs.quantifier_rules import QuantifierRules
@@ -182,9 +182,12 @@ class Proof(BaseModel):
                         # For Modus Ponens, ensure correct parameter order
                         for i in range(2):
                             if (
-                                isinstance(ref_statements[i], Proposition)
-                                and isinstance(ref_statements[1 - i], BinaryOp)
+                                isinstance(ref_statements[1 - i], BinaryOp)
                                 and ref_statements[1 - i].operator == "IMPLIES"
+                                and (
+                                    isinstance(ref_statements[i], Proposition)
+                                    or ref_statements[1 - i].left == ref_statements[i]
+                                )
                             ):
                                 return rule_func(
                                     ref_statements[i], ref_statements[1 - i]
@@ -220,48 +223,101 @@ class Proof(BaseModel):
 
         return None  # If no valid inference is applied
 
-    def to_dict(self) -> Dict:
+    def to_dict(self, shared: bool = False) -> Dict:
         """
         Serializes the proof to a structured dictionary for external usage.
 
+        Args:
+            shared: Emit the DAG layout, where every distinct subexpression is
+                    stored once in a ``"nodes"`` table and each step's
+                    ``statement`` is an index into it.
+
         Returns:
             Dictionary representation of the proof with all steps.
         """
-        # Convert each step to a dictionary, ensuring statement is also converted to dict
-        steps_data = []
-        for step in self.steps:
-            step_dict = step.model_dump()  # Use model_dump instead of dict
-            # Ensure statement is serialized as a dict with type information
-            step_dict["statement"] = step.statement.to_dict()
-            steps_data.append(step_dict)
+        if shared:
+            from agent_logic.serialization.dag_json import DAG_FORMAT, ExpressionTable
+
+            table = ExpressionTable()
+            statements = [table.add(step.statement) for step in self.steps]
+            return {
+                "format": DAG_FORMAT,
+                "nodes": table.nodes,
+                "steps": [
+                    self._step_dict(step, statement)
+                    for step, statement in zip(self.steps, statements, strict=True)
+                ],
+            }
+        return {"steps": [self._step_dict(step, step.statement.to_dict()) for step in self.steps]}
 
-        return {"steps": steps_data}
+    @staticmethod
+    def _step_dict(step: ProofStep, statement) -> Dict:
+        return {
+            "step_number": step.step_number,
+            "statement": statement,
+            "justification": step.justification,
+            "dependencies": list(step.dependencies) if step.dependencies is not None else None,
+        }
 
     @classmethod
-    def from_dict(cls, data: Dict) -> Proof:
+    def from_dict(cls, data: Dict, trusted: bool = False) -> Proof:
         """
         Reconstructs a proof from a dictionary representation.
 
+        Both the tree layout and the shared DAG layout produced by
+        ``to_dict(shared=True)`` are accepted; the latter is recognized by its
+        ``"nodes"`` table.
+
         Args:
             data: Dictionary containing a "steps" list with proof step data.
+            trusted: Skip pydantic validation of steps and statements; only for
+                     data produced by ``to_dict``.
 
         Returns:
             Reconstructed Proof object.
+
+        Raises:
+            ValueError: If a statement is not a valid expression dictionary or
+                        node reference.
         """
         steps_data = data.get("steps", [])
+        if "nodes" in data:
+            from agent_logic.serialization.dag_json import ExpressionTable
+
+            table = ExpressionTable.decode(data["nodes"], trusted=trusted)
+
+            def load_statement(reference):
+                if type(reference) is not int or not 0 <= reference < len(table):
+                    raise ValueError(f"Invalid statement reference: {reference!r}")
+                return table[reference]
+        else:
+
+            def load_statement(statement):
+                return LogicalExpression.from_dict(statement, trusted=trusted)
+
+        if trusted:
+            try:
+                steps = [
+                    construct_unchecked(
+                        ProofStep,
+                        {
+                            "step_number": step_data["step_number"],
+                            "statement": load_statement(step_data["statement"]),
+                            "justification": step_data["justification"],
+                            "dependencies": step_data.get("dependencies"),
+                        },
+                    )
+                    for step_data in steps_data
+                ]
+            except KeyError as e:
+                raise ValueError(f"Malformed trusted proof step: missing {e}") from None
+            return construct_unchecked(cls, {"steps": steps, "debug": False})
 
-        # Create ProofStep objects with properly reconstructed statements
         steps = []
         for step_data in steps_data:
-            # If step_data["statement"] is itself a dictionary, reconstruct it as a LogicalExpression
-            if isinstance(step_data.get("statement"), dict):
-                from agent_logic.core.base import LogicalExpression
-
-                step_data["statement"] = LogicalExpression.from_dict(
-                    step_data["statement"]
-                )
-
-            # Create the ProofStep
+            step_data = dict(step_data)
+            if isinstance(step_data.get("statement"), (dict, int)):
+                step_data["statement"] = load_statement(step_data["statement"])
             steps.append(ProofStep(**step_data))
 
         return cls(steps=steps)
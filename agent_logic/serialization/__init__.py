@@ -0,0 +1,27 @@
+"""
+Serialization module.
+
+This module provides compact encodings of expressions and proofs beyond the
+plain ``to_dict``/``from_dict`` JSON representation:
+- binary: Versioned binary format with shared-subtree back-references
+- dag_json: Human-readable JSON node tables shared across expressions
+- proof_store: Append-only, memory-mapped proof archives
+"""
+
+from agent_logic.serialization.binary import (
+    FORMAT_VERSION,
+    BinaryReader,
+    BinarySerializer,
+    BinaryWriter,
+)
+from agent_logic.serialization.dag_json import ExpressionTable
+from agent_logic.serialization.proof_store import ProofStore
+
+__all__ = [
+    "FORMAT_VERSION",
+    "BinaryReader",
+    "BinarySerializer",
+    "BinaryWriter",
+    "ExpressionTable",
+    "ProofStore",
+]
@@ -0,0 +1,522 @@
+"""
+Compact binary serialization.
+
+This module implements a versioned binary format for expressions and proofs:
+- BinaryWriter: Streams expressions or proof steps to a binary file object
+- BinaryReader: Streams them back from a binary file object
+- BinarySerializer: One-shot ``dumps``/``loads`` helpers over bytes
+
+Layout: a 5-byte header (``b"ALGB"`` magic and a format version byte),
+a content-kind byte, then a sequence of length-prefixed records. Each record
+is a postfix opcode stream evaluated on a stack. Symbols (names, variables,
+justifications) are defined once, inline, on first use and later referred to
+by index; every node gets an index too, and a structurally equal subtree that
+was already written anywhere earlier in the stream is emitted as a single
+back-reference. Integers are unsigned LEB128 varints.
+"""
+
+from __future__ import annotations
+
+import io
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
+
+from agent_logic.core.base import construct_unchecked
+from agent_logic.core.functions import Relation
+from agent_logic.core.operations import BinaryOp, NaryOp, Not, Proposition
+from agent_logic.core.quantifiers import ExistentialQuantifier, UniversalQuantifier
+from agent_logic.proofs.proof_system import Proof, ProofStep
+
+MAGIC = b"ALGB"
+FORMAT_VERSION = 1
+
+KIND_EXPRESSIONS = 0
+KIND_PROOF = 1
+
+OP_SYMBOL = 0
+OP_PROPOSITION = 1
+OP_RELATION = 2
+OP_NOT = 3
+OP_FORALL = 4
+OP_EXISTS = 5
+OP_REF = 6
+OP_ROOT = 7
+OP_STEP = 8
+OP_AND_N = 9
+OP_OR_N = 10
+OP_BINARY = 16  # OP_BINARY + index into BINARY_OPERATORS
+
+BINARY_OPERATORS: Tuple[str, ...] = ("AND", "OR", "IMPLIES", "IFF", "XOR", "NAND", "NOR")
+_BINARY_OPCODES: Dict[str, int] = {
+    operator: OP_BINARY + index for index, operator in enumerate(BINARY_OPERATORS)
+}
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(view: memoryview, pos: int) -> Tuple[int, int]:
+    result = 0
+    shift = 0
+    while True:
+        byte = view[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+class _EncoderState:
+    """Symbol and node tables shared by every record of one stream."""
+
+    __slots__ = ("symbols", "nodes", "by_id")
+
+    def __init__(self):
+        self.symbols: Dict[str, int] = {}
+        self.nodes: Dict[tuple, int] = {}
+        # id(node) -> (node, index); the node is kept alive so ids stay unique.
+        self.by_id: Dict[int, Tuple[object, int]] = {}
+
+    def symbol(self, out: bytearray, text: str) -> int:
+        index = self.symbols.get(text)
+        if index is None:
+            index = self.symbols[text] = len(self.symbols)
+            data = text.encode("utf-8")
+            out.append(OP_SYMBOL)
+            _write_varint(out, len(data))
+            out += data
+        return index
+
+    def expression(self, out: bytearray, root) -> None:
+        """Appends the postfix encoding of ``root`` to ``out``."""
+        by_id = self.by_id
+        # Entries are (node, None) before the children are written and
+        # (node, start offset of the children) afterwards.
+        stack: List[Tuple[object, Optional[int]]] = [(root, None)]
+        while stack:
+            node, start = stack.pop()
+            seen = by_id.get(id(node))
+            if seen is not None:
+                out.append(OP_REF)
+                _write_varint(out, seen[1])
+                continue
+            if isinstance(node, BinaryOp):
+                if start is None:
+                    stack.extend(((node, len(out)), (node.right, None), (node.left, None)))
+                    continue
+                opcode = _BINARY_OPCODES.get(node.operator)
+                if opcode is None:
+                    raise ValueError(f"Cannot serialize operator: {node.operator}")
+                key = (opcode, by_id[id(node.left)][1], by_id[id(node.right)][1])
+                self._define(out, node, key, (opcode,), start)
+            elif isinstance(node, Proposition):
+                key = (OP_PROPOSITION, self.symbol(out, node.name))
+                self._define(out, node, key, key, len(out))
+            elif isinstance(node, NaryOp):
+                if start is None:
+                    stack.append((node, len(out)))
+                    stack.extend((operand, None) for operand in reversed(node.operands))
+                    continue
+                opcode = OP_AND_N if node.operator == "AND" else OP_OR_N
+                count = len(node.operands)
+                key = (opcode, count) + tuple(by_id[id(operand)][1] for operand in node.operands)
+                self._define(out, node, key, (opcode, count), start)
+            elif isinstance(node, Not):
+                if start is None:
+                    stack.extend(((node, len(out)), (node.operand, None)))
+                    continue
+                key = (OP_NOT, by_id[id(node.operand)][1])
+                self._define(out, node, key, (OP_NOT,), start)
+            elif isinstance(node, Relation):
+                name = self.symbol(out, node.name)
+                parameters = tuple(self.symbol(out, parameter) for parameter in node.parameters)
+                key = (OP_RELATION, name) + parameters
+                self._define(out, node, key, (OP_RELATION, name, len(parameters)) + parameters, len(out))
+            elif isinstance(node, (UniversalQuantifier, ExistentialQuantifier)):
+                if start is None:
+                    stack.extend(((node, len(out)), (node.predicate, None)))
+                    continue
+                opcode = OP_FORALL if node.type == "FORALL" else OP_EXISTS
+                variable = self.symbol(out, node.variable)
+                key = (opcode, variable, by_id[id(node.predicate)][1])
+                self._define(out, node, key, (opcode, variable), start)
+            else:
+                raise ValueError(f"Cannot serialize expression type: {type(node).__name__}")
+
+    def _define(self, out: bytearray, node, key: tuple, code: tuple, start: int) -> None:
+        """
+        Emits ``code`` as a new node, or a back-reference if an equal node exists.
+
+        When an equal node exists its children were necessarily written as
+        back-references as well (starting at ``start``), so they are dropped.
+        """
+        index = self.nodes.get(key)
+        if index is None:
+            index = self.nodes[key] = len(self.nodes)
+            out.append(code[0])
+            for value in code[1:]:
+                _write_varint(out, value)
+        else:
+            del out[start:]
+            out.append(OP_REF)
+            _write_varint(out, index)
+        self.by_id[id(node)] = (node, index)
+
+    def rollback(self, symbol_count: int, node_count: int) -> None:
+        """Forgets symbols and nodes defined by a record that failed to encode."""
+        self.symbols = {k: v for k, v in self.symbols.items() if v < symbol_count}
+        self.nodes = {k: v for k, v in self.nodes.items() if v < node_count}
+        self.by_id = {k: v for k, v in self.by_id.items() if v[1] < node_count}
+
+
+class _DecoderState:
+    """Symbol and node tables rebuilt while reading one stream."""
+
+    __slots__ = ("symbols", "nodes")
+
+    def __init__(self):
+        self.symbols: List[str] = []
+        self.nodes: List[object] = []
+
+    def record(self, view: memoryview, pos: int, end: int):
+        """
+        Decodes one record occupying ``view[pos:end]``.
+
+        Returns:
+            The decoded root expression or ProofStep.
+
+        Raises:
+            ValueError: If the record is malformed.
+        """
+        symbols = self.symbols
+        nodes = self.nodes
+        stack: List[object] = []
+        push = stack.append
+        pop = stack.pop
+        try:
+            while pos < end:
+                op = view[pos]
+                pos += 1
+                if op == OP_REF:
+                    index = view[pos]
+                    pos += 1
+                    if index >= 0x80:
+                        index, pos = _read_varint(view, pos - 1)
+                    push(nodes[index])
+                    continue
+                if op >= OP_BINARY:
+                    right = pop()
+                    node = construct_unchecked(
+                        BinaryOp,
+                        {"left": pop(), "right": right, "operator": BINARY_OPERATORS[op - OP_BINARY]},
+                    )
+                elif op == OP_PROPOSITION:
+                    index, pos = _read_varint(view, pos)
+                    node = construct_unchecked(Proposition, {"name": symbols[index]})
+                elif op == OP_NOT:
+                    node = construct_unchecked(Not, {"operand": pop()})
+                elif op == OP_SYMBOL:
+                    length, pos = _read_varint(view, pos)
+                    symbols.append(str(view[pos:pos + length], "utf-8"))
+                    pos += length
+                    continue
+                elif op == OP_RELATION:
+                    index, pos = _read_varint(view, pos)
+                    count, pos = _read_varint(view, pos)
+                    parameters = []
+                    for _ in range(count):
+                        parameter, pos = _read_varint(view, pos)
+                        parameters.append(symbols[parameter])
+                    node = construct_unchecked(
+                        Relation, {"name": symbols[index], "parameters": parameters}
+                    )
+                elif op == OP_FORALL or op == OP_EXISTS:
+                    index, pos = _read_varint(view, pos)
+                    cls, tag = (
+                        (UniversalQuantifier, "FORALL") if op == OP_FORALL
+                        else (ExistentialQuantifier, "EXISTS")
+                    )
+                    node = construct_unchecked(
+                        cls, {"type": tag, "variable": symbols[index], "predicate": pop()}
+                    )
+                elif op == OP_AND_N or op == OP_OR_N:
+                    count, pos = _read_varint(view, pos)
+                    if not 0 < count <= len(stack):
+                        raise ValueError("Malformed record: bad operand count")
+                    operands = tuple(stack[-count:])
+                    del stack[-count:]
+                    node = construct_unchecked(
+                        NaryOp, {"operands": operands, "operator": "AND" if op == OP_AND_N else "OR"}
+                    )
+                elif op == OP_ROOT:
+                    if pos != end or len(stack) != 1:
+                        raise ValueError("Malformed record: unbalanced expression")
+                    return stack[0]
+                elif op == OP_STEP:
+                    step_number, pos = _read_varint(view, pos)
+                    justification, pos = _read_varint(view, pos)
+                    count, pos = _read_varint(view, pos)
+                    dependencies: Optional[List[int]] = None
+                    if count:
+                        dependencies = []
+                        for _ in range(count - 1):
+                            dependency, pos = _read_varint(view, pos)
+                            dependencies.append(dependency)
+                    if pos != end or len(stack) != 1:
+                        raise ValueError("Malformed record: unbalanced proof step")
+                    return construct_unchecked(
+                        ProofStep,
+                        {
+                            "step_number": step_number,
+                            "statement": stack[0],
+                            "justification": symbols[justification],
+                            "dependencies": dependencies,
+                        },
+                    )
+                else:
+                    raise ValueError(f"Unknown opcode: {op}")
+                nodes.append(node)
+                push(node)
+        except (IndexError, UnicodeDecodeError) as e:
+            raise ValueError(f"Malformed record: {e}") from None
+        raise ValueError("Malformed record: missing terminator")
+
+
+def _encode_header(kind: int) -> bytes:
+    return MAGIC + bytes((FORMAT_VERSION, kind))
+
+
+def _check_header(header: BytesLike, kind: int) -> None:
+    if len(header) < 6 or bytes(header[:4]) != MAGIC:
+        raise ValueError("Not an agent_logic binary stream")
+    if header[4] != FORMAT_VERSION:
+        raise ValueError(f"Unsupported binary format version: {header[4]}")
+    if header[5] != kind:
+        expected = "proof" if kind == KIND_PROOF else "expression"
+        raise ValueError(f"Binary stream does not contain {expected} data")
+
+
+class BinaryWriter:
+    """
+    Writes expressions or proof steps to a binary stream incrementally.
+
+    Symbols and nodes written earlier are referenced by later records, so a
+    stream must be read back in full, from the start, by a BinaryReader.
+
+    Example:
+        >>> with open("premises.bin", "wb") as handle:
+        ...     writer = BinaryWriter(handle)
+        ...     for expression in expressions:
+        ...         writer.write_expression(expression)
+    """
+
+    def __init__(self, stream: BinaryIO, proof: bool = False):
+        """
+        Initializes the writer and writes the stream header.
+
+        Args:
+            stream: Binary file object to write to.
+            proof: Whether the stream holds proof steps rather than expressions.
+        """
+        self.stream = stream
+        self.kind = KIND_PROOF if proof else KIND_EXPRESSIONS
+        self._state = _EncoderState()
+        stream.write(_encode_header(self.kind))
+
+    def _write_record(self, statement, step: Optional[ProofStep] = None) -> None:
+        state = self._state
+        symbol_count, node_count = len(state.symbols), len(state.nodes)
+        record = bytearray()
+        try:
+            state.expression(record, statement)
+        except ValueError:
+            state.rollback(symbol_count, node_count)
+            raise
+        if step is None:
+            record.append(OP_ROOT)
+        else:
+            justification = state.symbol(record, step.justification)
+            record.append(OP_STEP)
+            _write_varint(record, step.step_number)
+            _write_varint(record, justification)
+            if step.dependencies is None:
+                record.append(0)
+            else:
+                _write_varint(record, len(step.dependencies) + 1)
+                for dependency in step.dependencies:
+                    _write_varint(record, dependency)
+        frame = bytearray()
+        _write_varint(frame, len(record))
+        self.stream.write(bytes(frame + record))
+
+    def write_expression(self, expression) -> None:
+        """
+        Appends one expression.
+
+        Args:
+            expression: The expression to write.
+
+        Raises:
+            ValueError: If the stream holds proof steps or the expression
+                        contains unsupported node types.
+        """
+        if self.kind != KIND_EXPRESSIONS:
+            raise ValueError("Cannot write a bare expression to a proof stream")
+        self._write_record(expression)
+
+    def write_step(self, step: ProofStep) -> None:
+        """
+        Appends one proof step.
+
+        Args:
+            step: The step to write.
+
+        Raises:
+            ValueError: If the stream holds expressions or the statement
+                        contains unsupported node types.
+        """
+        if self.kind != KIND_PROOF:
+            raise ValueError("Cannot write a proof step to an expression stream")
+        self._write_record(step.statement, step)
+
+
+class BinaryReader:
+    """
+    Reads expressions or proof steps from a binary stream incrementally.
+
+    Example:
+        >>> with open("premises.bin", "rb") as handle:
+        ...     for expression in BinaryReader(handle):
+        ...         process(expression)
+    """
+
+    def __init__(self, stream: BinaryIO, proof: bool = False):
+        """
+        Initializes the reader and checks the stream header.
+
+        Args:
+            stream: Binary file object to read from.
+            proof: Whether the stream is expected to hold proof steps.
+
+        Raises:
+            ValueError: If the header is missing, has another version, or
+                        announces a different kind of content.
+        """
+        self.stream = stream
+        _check_header(stream.read(6), KIND_PROOF if proof else KIND_EXPRESSIONS)
+        self._state = _DecoderState()
+
+    def _read_length(self) -> Optional[int]:
+        result = 0
+        shift = 0
+        while True:
+            byte = self.stream.read(1)
+            if not byte:
+                if shift:
+                    raise ValueError("Truncated binary stream")
+                return None
+            result |= (byte[0] & 0x7F) << shift
+            if byte[0] < 0x80:
+                return result
+            shift += 7
+
+    def __iter__(self) -> Iterator:
+        """Yields decoded expressions (or ProofSteps) in stream order."""
+        while True:
+            length = self._read_length()
+            if length is None:
+                return
+            data = self.stream.read(length)
+            if len(data) != length:
+                raise ValueError("Truncated binary stream")
+            yield self._state.record(memoryview(data), 0, length)
+
+
+class BinarySerializer:
+    """One-shot binary encoding and decoding of expressions and proofs."""
+
+    @staticmethod
+    def dumps(expression) -> bytes:
+        """Encodes a single expression."""
+        return BinarySerializer.dumps_many([expression])
+
+    @staticmethod
+    def dumps_many(expressions) -> bytes:
+        """Encodes a sequence of expressions sharing one symbol and node table."""
+        buffer = io.BytesIO()
+        writer = BinaryWriter(buffer)
+        for expression in expressions:
+            writer.write_expression(expression)
+        return buffer.getvalue()
+
+    @staticmethod
+    def dumps_proof(proof: Proof) -> bytes:
+        """Encodes a proof."""
+        buffer = io.BytesIO()
+        writer = BinaryWriter(buffer, proof=True)
+        for step in proof.steps:
+            writer.write_step(step)
+        return buffer.getvalue()
+
+    @staticmethod
+    def _records(data: BytesLike, kind: int) -> Iterator:
+        view = memoryview(data)
+        _check_header(view, kind)
+        state = _DecoderState()
+        pos, total = 6, len(view)
+        while pos < total:
+            try:
+                length, pos = _read_varint(view, pos)
+            except IndexError:
+                raise ValueError("Truncated binary stream") from None
+            end = pos + length
+            if end > total:
+                raise ValueError("Truncated binary stream")
+            yield state.record(view, pos, end)
+            pos = end
+
+    @staticmethod
+    def loads(data: BytesLike):
+        """
+        Decodes a single expression.
+
+        Args:
+            data: Bytes produced by ``dumps``.
+
+        Returns:
+            The decoded expression.
+
+        Raises:
+            ValueError: If the data is malformed or does not hold exactly one expression.
+        """
+        expressions = BinarySerializer.loads_many(data)
+        if len(expressions) != 1:
+            raise ValueError(f"Expected one expression but found {len(expressions)}")
+        return expressions[0]
+
+    @staticmethod
+    def loads_many(data: BytesLike) -> List:
+        """
+        Decodes every expression in the data, decoding directly from a memoryview.
+
+        Raises:
+            ValueError: If the data is malformed.
+        """
+        return list(BinarySerializer._records(data, KIND_EXPRESSIONS))
+
+    @staticmethod
+    def loads_proof(data: BytesLike) -> Proof:
+        """
+        Decodes a proof.
+
+        Raises:
+            ValueError: If the data is malformed or is not a proof.
+        """
+        steps = list(BinarySerializer._records(data, KIND_PROOF))
+        return construct_unchecked(Proof, {"steps": steps, "debug": False})
@@ -0,0 +1,153 @@
+"""
+DAG-aware JSON serialization.
+
+This module provides a JSON layout in which every distinct subexpression is
+written once into a node table:
+- ExpressionTable: Builds and decodes node tables
+
+Each table entry has the same shape as ``to_dict`` output except that child
+expressions are replaced by the integer index of an earlier entry, e.g.
+``{"type": "BinaryOp", "operator": "AND", "left": 0, "right": 1}``. A proof
+serialized with ``Proof.to_dict(shared=True)`` stores one table for all of its
+steps, and each step's ``statement`` is an index into it.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List
+
+from agent_logic.core.base import LogicalExpression
+from agent_logic.core.functions import Relation
+from agent_logic.core.operations import BinaryOp, NaryOp, Not, Proposition
+from agent_logic.core.quantifiers import ExistentialQuantifier, UniversalQuantifier
+
+DAG_FORMAT = "dag"
+
+
+class ExpressionTable:
+    """
+    Node table of structurally distinct subexpressions.
+
+    Example:
+        >>> table = ExpressionTable()
+        >>> root = table.add(expression)
+        >>> nodes = table.nodes
+        >>> ExpressionTable.decode(nodes)[root] == expression
+        True
+    """
+
+    def __init__(self):
+        self.nodes: List[Dict] = []
+        self._index: Dict[tuple, int] = {}
+        # id(node) -> (node, index); the node is kept alive so ids stay unique.
+        self._by_id: Dict[int, tuple] = {}
+
+    def add(self, expression) -> int:
+        """
+        Adds an expression and all of its subexpressions to the table.
+
+        Args:
+            expression: The expression to add.
+
+        Returns:
+            Index of the entry representing the expression.
+
+        Raises:
+            ValueError: If the expression contains unsupported node types.
+        """
+        by_id = self._by_id
+        stack = [(expression, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if id(node) in by_id:
+                continue
+            if isinstance(node, BinaryOp):
+                if not expanded:
+                    stack.extend(((node, True), (node.right, False), (node.left, False)))
+                    continue
+                left, right = by_id[id(node.left)][1], by_id[id(node.right)][1]
+                key = ("BinaryOp", node.operator, left, right)
+                entry = {"type": "BinaryOp", "operator": node.operator, "left": left, "right": right}
+            elif isinstance(node, NaryOp):
+                if not expanded:
+                    stack.append((node, True))
+                    stack.extend((operand, False) for operand in reversed(node.operands))
+                    continue
+                operands = [by_id[id(operand)][1] for operand in node.operands]
+                key = ("NaryOp", node.operator) + tuple(operands)
+                entry = {"type": "NaryOp", "operator": node.operator, "operands": operands}
+            elif isinstance(node, Proposition):
+                key = ("Proposition", node.name)
+                entry = {"type": "Proposition", "name": node.name}
+            elif isinstance(node, Not):
+                if not expanded:
+                    stack.extend(((node, True), (node.operand, False)))
+                    continue
+                operand = by_id[id(node.operand)][1]
+                key = ("Not", operand)
+                entry = {"type": "Not", "operand": operand}
+            elif isinstance(node, Relation):
+                key = ("Relation", node.name, tuple(node.parameters))
+                entry = {"type": "Relation", "name": node.name, "parameters": list(node.parameters)}
+            elif isinstance(node, (UniversalQuantifier, ExistentialQuantifier)) and isinstance(
+                node.predicate, (BinaryOp, NaryOp, Proposition, Not, Relation,
+                                 UniversalQuantifier, ExistentialQuantifier)
+            ):
+                if not expanded:
+                    stack.extend(((node, True), (node.predicate, False)))
+                    continue
+                predicate = by_id[id(node.predicate)][1]
+                key = (node.type, node.variable, predicate)
+                entry = {"type": node.type, "variable": node.variable, "predicate": predicate}
+            else:
+                raise ValueError(f"Cannot serialize expression type: {type(node).__name__}")
+            index = self._index.get(key)
+            if index is None:
+                index = self._index[key] = len(self.nodes)
+                self.nodes.append(entry)
+            by_id[id(node)] = (node, index)
+        return by_id[id(expression)][1]
+
+    def add_all(self, expressions: Iterable) -> List[int]:
+        """Adds several expressions, returning their entry indices."""
+        return [self.add(expression) for expression in expressions]
+
+    @staticmethod
+    def decode(nodes: List[Dict], trusted: bool = False) -> List[Any]:
+        """
+        Rebuilds every entry of a node table.
+
+        Args:
+            nodes: Node table entries; children must refer to earlier entries.
+            trusted: Skip pydantic validation of the rebuilt nodes.
+
+        Returns:
+            Expressions parallel to ``nodes``; shared entries decode to shared objects.
+
+        Raises:
+            ValueError: If an entry is malformed, has an unknown type, or
+                        refers to an entry that is not defined before it.
+        """
+        built: List[Any] = []
+
+        def resolve(reference):
+            if type(reference) is not int or not 0 <= reference < len(built):
+                raise ValueError(f"Invalid node reference: {reference!r}")
+            return built[reference]
+
+        for position, entry in enumerate(nodes):
+            if not isinstance(entry, dict):
+                raise ValueError(f"Node {position} is not a dictionary")
+            decoder = LogicalExpression.trusted_decoder(entry.get("type"))
+            if decoder is None:
+                raise ValueError(f"Unknown expression type in node {position}: {entry.get('type')}")
+            try:
+                node = decoder(entry, resolve)
+            except (KeyError, TypeError) as e:
+                raise ValueError(f"Malformed node {position}: {e}") from None
+            if not trusted:
+                # Children are already validated instances, so this only
+                # checks the node's own fields (names, operator, ...).
+                node = type(node)(**node.__dict__)
+            built.append(node)
+        return built
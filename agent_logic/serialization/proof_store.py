@@ -0,0 +1,198 @@
+"""
+Memory-mapped proof corpus store.
+
+This module provides an append-only on-disk archive of proofs:
+- ProofStore: Stores binary-encoded proofs with O(1) lookup by id
+
+A store consists of two files: the data file ``<path>``, holding an 8-byte
+header followed by concatenated proofs in the binary format, and the index
+file ``<path>.idx``, holding one fixed-width (offset, length) entry per
+proof. Proof ids are positions in the index. Both files are opened with
+``mmap``, so fetching a proof touches only its own pages and decodes straight
+from the mapping. Data is written before its index entry, so an interrupted
+append never leaves a dangling id.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+from typing import Iterator, Optional, Tuple
+
+from agent_logic.proofs.proof_system import Proof
+from agent_logic.serialization.binary import BinarySerializer
+
+STORE_MAGIC = b"ALGS"
+STORE_VERSION = 1
+_HEADER = STORE_MAGIC + bytes((STORE_VERSION, 0, 0, 0))
+_ENTRY = struct.Struct("<QQ")
+
+
+class ProofStore:
+    """
+    Append-only, memory-mapped archive of proofs.
+
+    Example:
+        >>> with ProofStore("corpus.algs", mode="a") as store:
+        ...     proof_id = store.append(proof)
+        >>> with ProofStore("corpus.algs") as store:
+        ...     store[proof_id].is_valid()
+        True
+    """
+
+    def __init__(self, path: str, mode: str = "r"):
+        """
+        Opens (and in append mode, creates) a store.
+
+        Args:
+            path: Path of the data file; the index is stored at ``path + ".idx"``.
+            mode: ``"r"`` for read-only access or ``"a"`` to allow appends.
+
+        Raises:
+            ValueError: If the mode is unknown or the file is not a proof store.
+            FileNotFoundError: If a read-only store does not exist.
+        """
+        if mode not in ("r", "a"):
+            raise ValueError(f"Unknown mode: {mode}")
+        self.path = path
+        self.index_path = path + ".idx"
+        self.mode = mode
+        file_mode = "rb" if mode == "r" else "a+b"
+        if mode == "a" and not os.path.exists(path):
+            with open(path, "wb") as f:
+                f.write(_HEADER)
+            open(self.index_path, "wb").close()
+        self._data = open(path, file_mode)
+        self._data.seek(0)
+        if self._data.read(len(_HEADER))[:5] != _HEADER[:5]:
+            self._data.close()
+            raise ValueError(f"Not a proof store (or unsupported version): {path}")
+        self._index = open(self.index_path, file_mode)
+        self._data_map: Optional[mmap.mmap] = None
+        self._index_map: Optional[mmap.mmap] = None
+        self._count = 0
+        self._remap()
+
+    @staticmethod
+    def is_store(path: str) -> bool:
+        """Returns whether ``path`` starts with the proof store header."""
+        with open(path, "rb") as f:
+            return f.read(len(STORE_MAGIC)) == STORE_MAGIC
+
+    def _remap(self) -> None:
+        """(Re)creates the mappings after the files have grown."""
+        for mapping in (self._data_map, self._index_map):
+            if mapping is not None:
+                mapping.close()
+        self._data_map = self._index_map = None
+        index_size = os.fstat(self._index.fileno()).st_size
+        self._count = index_size // _ENTRY.size
+        if self._count:
+            self._index_map = mmap.mmap(self._index.fileno(), 0, access=mmap.ACCESS_READ)
+            self._data_map = mmap.mmap(self._data.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __len__(self) -> int:
+        """Returns the number of stored proofs."""
+        return self._count
+
+    def __enter__(self) -> ProofStore:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Releases the mappings and file handles."""
+        for mapping in (self._data_map, self._index_map):
+            if mapping is not None:
+                mapping.close()
+        self._data_map = self._index_map = None
+        self._data.close()
+        self._index.close()
+
+    def append(self, proof: Proof) -> int:
+        """
+        Appends a proof.
+
+        Args:
+            proof: The proof to store.
+
+        Returns:
+            The id of the stored proof.
+
+        Raises:
+            ValueError: If the store is read-only or the proof cannot be encoded.
+        """
+        if self.mode != "a":
+            raise ValueError("Store is opened read-only")
+        payload = BinarySerializer.dumps_proof(proof)
+        self._data.seek(0, os.SEEK_END)
+        offset = self._data.tell()
+        self._data.write(payload)
+        self._data.flush()
+        self._index.seek(0, os.SEEK_END)
+        self._index.write(_ENTRY.pack(offset, len(payload)))
+        self._index.flush()
+        proof_id = self._count
+        # Mappings are refreshed lazily, on the first read past their end.
+        self._count += 1
+        return proof_id
+
+    def _locate(self, proof_id: int) -> Tuple[int, int]:
+        if not 0 <= proof_id < self._count:
+            raise IndexError(f"Proof id out of range: {proof_id}")
+        if self._index_map is None or (proof_id + 1) * _ENTRY.size > len(self._index_map):
+            self._remap()
+        return _ENTRY.unpack_from(self._index_map, proof_id * _ENTRY.size)
+
+    def get_bytes(self, proof_id: int) -> bytes:
+        """
+        Returns the encoded form of a proof.
+
+        Raises:
+            IndexError: If no proof has this id.
+        """
+        offset, length = self._locate(proof_id)
+        return self._data_map[offset:offset + length]
+
+    def get(self, proof_id: int) -> Proof:
+        """
+        Fetches and decodes one proof.
+
+        Args:
+            proof_id: Id returned by ``append``.
+
+        Returns:
+            The decoded proof.
+
+        Raises:
+            IndexError: If no proof has this id.
+            ValueError: If the stored data is corrupt.
+        """
+        offset, length = self._locate(proof_id)
+        with memoryview(self._data_map) as view:
+            with view[offset:offset + length] as record:
+                return BinarySerializer.loads_proof(record)
+
+    __getitem__ = get
+
+    def scan(self, start: int = 0, stop: Optional[int] = None) -> Iterator[Tuple[int, Proof]]:
+        """
+        Iterates over stored proofs in id order.
+
+        Args:
+            start: First id to yield.
+            stop: Id to stop before; defaults to the end of the store.
+
+        Returns:
+            Iterator of (proof id, proof) pairs.
+        """
+        stop = self._count if stop is None else min(stop, self._count)
+        for proof_id in range(start, stop):
+            yield proof_id, self.get(proof_id)
+
+    def __iter__(self) -> Iterator[Proof]:
+        """Yields every stored proof in id order."""
+        for _, proof in self.scan():
+            yield proof
@@ -2,11 +2,26 @@
 Logical transformations module.
 
 This module provides tools for logical formula transformations,
-including normal forms and logical equivalences.
+including normal forms, logical equivalences, canonical forms,
+rule-based rewriting, fixpoint simplification and two-level minimization.
+
+Rewriting transformations are copy-on-write: subtrees they leave unchanged
+are returned as the original node objects, and each pass memoizes its results
+so shared subtrees are transformed once.
 """
 
+from agent_logic.transformations.canonical import Canonicalizer, Fingerprint
 from agent_logic.transformations.equivalences import EquivalenceRules
+from agent_logic.transformations.minimization import Minimizer
+from agent_logic.transformations.simplifier import SimplificationResult, Simplifier
+from agent_logic.transformations.rewriting import (
+    DISTRIBUTIVE_RULES,
+    STANDARD_RULES,
+    RewriteRule,
+    RewriteSystem,
+)
 from agent_logic.transformations.normal_forms import (
+    NormalForms,
     to_cnf,
     to_dnf
 )
@@ -14,8 +29,26 @@ from agent_logic.transformations.normal_forms import (
 __all__ = [
     # Equivalence transformations
     "EquivalenceRules",
-    
+
     # Normal forms
+    "NormalForms",
     "to_cnf",
-    "to_dnf"
-] 
\ No newline at end of file
+    "to_dnf",
+
+    # Canonical forms
+    "Canonicalizer",
+    "Fingerprint",
+
+    # Simplification
+    "Simplifier",
+    "SimplificationResult",
+
+    # Rewriting
+    "RewriteRule",
+    "RewriteSystem",
+    "STANDARD_RULES",
+    "DISTRIBUTIVE_RULES",
+
+    # Minimization
+    "Minimizer",
+]
@@ -0,0 +1,268 @@
+"""
+Canonical forms and structural fingerprints.
+
+This module provides process-independent identities for expressions:
+- Fingerprint: 128-bit Merkle-style digest computed bottom-up (blake2b) and
+  cached on expression nodes
+- Canonicalizer: Normalizes semantically trivial variations so equivalent
+  spellings share one canonical expression (and fingerprint)
+
+Canonicalization removes double negations, flattens nested AND/OR chains,
+drops duplicate conjuncts/disjuncts, orders the operands of commutative
+operators by a fixed total order (literals alphabetically, then compound
+operands by fingerprint) and rebuilds chains left-deep, so n-ary
+conjunctions and disjunctions share the canonical form of the equivalent
+binary chains. The fingerprint of a node depends only on its structure, so it
+is stable across processes and suitable as a cache key; use
+``Canonicalizer.fingerprint`` to key on the canonical form instead of the
+literal spelling.
+
+Fingerprints are cached in the node itself, which assumes nodes are not
+mutated once they have been fingerprinted (as for ExpressionFactory nodes).
+"""
+
+from __future__ import annotations
+
+from hashlib import blake2b
+from typing import Dict, List, Optional, Set, Tuple
+
+from agent_logic.core.factory import ExpressionBuilder
+from agent_logic.core.functions import Relation
+from agent_logic.core.operations import BinaryOp, NaryOp, Not, Proposition
+from agent_logic.core.quantifiers import ExistentialQuantifier, UniversalQuantifier
+
+FINGERPRINT_SIZE = 16
+_CACHE_KEY = "_fingerprint"
+
+# Operators whose operand chains are flattened and sorted.
+ASSOCIATIVE_OPERATORS = frozenset({"AND", "OR"})
+# Binary operators whose two operands may be swapped.
+COMMUTATIVE_OPERATORS = frozenset({"AND", "OR", "IFF", "XOR", "NAND", "NOR"})
+
+_QUANTIFIERS = (UniversalQuantifier, ExistentialQuantifier)
+_DEFAULT_BUILDER = ExpressionBuilder()
+
+
+def _text(value: str) -> bytes:
+    data = value.encode("utf-8")
+    return len(data).to_bytes(4, "little") + data
+
+
+class Fingerprint:
+    """Computes structural fingerprints of expressions."""
+
+    @staticmethod
+    def of(expression) -> bytes:
+        """
+        Returns the 128-bit structural fingerprint of an expression.
+
+        Each node hashes a type tag, its own fields and the fingerprints of
+        its children, so equal structures always produce equal digests and
+        shared subexpressions are hashed once.
+
+        Args:
+            expression: The expression to fingerprint.
+
+        Returns:
+            A 16-byte digest.
+
+        Raises:
+            ValueError: If the expression contains unsupported node types.
+        """
+        cached = expression.__dict__.get(_CACHE_KEY)
+        if cached is not None:
+            return cached
+        digests: Dict[int, bytes] = {}
+        stack = [(expression, False)]
+        while stack:
+            node, expanded = stack.pop()
+            key = id(node)
+            if key in digests:
+                continue
+            cached = node.__dict__.get(_CACHE_KEY)
+            if cached is not None:
+                digests[key] = cached
+                continue
+            if isinstance(node, BinaryOp):
+                if not expanded:
+                    stack.extend(((node, True), (node.right, False), (node.left, False)))
+                    continue
+                payload = b"B" + _text(node.operator) + digests[id(node.left)] + digests[id(node.right)]
+            elif isinstance(node, Proposition):
+                payload = b"P" + _text(node.name)
+            elif isinstance(node, Not):
+                if not expanded:
+                    stack.extend(((node, True), (node.operand, False)))
+                    continue
+                payload = b"N" + digests[id(node.operand)]
+            elif isinstance(node, NaryOp):
+                if not expanded:
+                    stack.append((node, True))
+                    stack.extend((operand, False) for operand in reversed(node.operands))
+                    continue
+                payload = b"M" + _text(node.operator) + len(node.operands).to_bytes(4, "little")
+                payload += b"".join(digests[id(operand)] for operand in node.operands)
+            elif isinstance(node, Relation):
+                payload = b"R" + _text(node.name) + len(node.parameters).to_bytes(4, "little")
+                payload += b"".join(_text(parameter) for parameter in node.parameters)
+            elif isinstance(node, _QUANTIFIERS):
+                if not expanded:
+                    stack.extend(((node, True), (node.predicate, False)))
+                    continue
+                tag = b"A" if node.type == "FORALL" else b"E"
+                payload = tag + _text(node.variable) + digests[id(node.predicate)]
+            else:
+                raise ValueError(f"Cannot fingerprint expression type: {type(node).__name__}")
+            digest = blake2b(payload, digest_size=FINGERPRINT_SIZE).digest()
+            digests[key] = digest
+            node.__dict__[_CACHE_KEY] = digest
+        return digests[id(expression)]
+
+    @staticmethod
+    def hex(expression) -> str:
+        """Returns the fingerprint as a 32-character hexadecimal string."""
+        return Fingerprint.of(expression).hex()
+
+
+def _order_key(node) -> tuple:
+    """Total order on canonical operands: literals by name, then by fingerprint."""
+    atom = node.operand if isinstance(node, Not) else node
+    if isinstance(atom, Proposition):
+        return (0, atom.name, (), atom is not node, b"")
+    if isinstance(atom, Relation):
+        return (0, atom.name, tuple(atom.parameters), atom is not node, b"")
+    return (1, "", (), False, Fingerprint.of(node))
+
+
+def _is_left_deep_chain(node, operator: str, operands: List) -> bool:
+    """Returns whether ``node`` is exactly the left-deep chain of ``operands``."""
+    for operand in reversed(operands[1:]):
+        if not (isinstance(node, BinaryOp) and node.operator == operator and node.right is operand):
+            return False
+        node = node.left
+    return node is operands[0]
+
+
+class Canonicalizer:
+    """Rewrites expressions into a canonical representative."""
+
+    @staticmethod
+    def canonicalize(expression, factory: Optional[ExpressionBuilder] = None):
+        """
+        Returns the canonical form of an expression.
+
+        Args:
+            expression: The expression to normalize.
+            factory: Builder used for new nodes; pass an ExpressionFactory to
+                     share nodes between canonical forms.
+
+        Returns:
+            An equivalent expression in canonical form. Atoms and other
+            subexpressions left unchanged are reused, not copied.
+
+        Raises:
+            ValueError: If the expression contains unsupported node types.
+        """
+        builder = factory if factory is not None else _DEFAULT_BUILDER
+        memo: Dict[int, object] = {}
+
+        def canon(node):
+            result = memo.get(id(node))
+            if result is not None:
+                return result
+            if isinstance(node, (Proposition, Relation)):
+                result = node
+            elif isinstance(node, Not):
+                inner, negated = node.operand, True
+                while isinstance(inner, Not):
+                    inner, negated = inner.operand, not negated
+                body = canon(inner)
+                if not negated:
+                    result = body
+                elif isinstance(body, Not):
+                    # e.g. ¬(¬P ∧ ¬P): the chain dedupes to ¬P, so the negations cancel.
+                    result = body.operand
+                elif body is node.operand:
+                    result = node
+                else:
+                    result = builder.negation(body)
+            elif isinstance(node, NaryOp) or (
+                isinstance(node, BinaryOp) and node.operator in ASSOCIATIVE_OPERATORS
+            ):
+                result = chain(node)
+            elif isinstance(node, BinaryOp):
+                left, right = canon(node.left), canon(node.right)
+                if node.operator in COMMUTATIVE_OPERATORS and _order_key(right) < _order_key(left):
+                    left, right = right, left
+                if left is node.left and right is node.right:
+                    result = node
+                else:
+                    result = builder.binary(node.operator, left, right)
+            elif isinstance(node, _QUANTIFIERS):
+                body = canon(node.predicate)
+                if body is node.predicate:
+                    result = node
+                elif node.type == "FORALL":
+                    result = builder.universal(node.variable, body)
+                else:
+                    result = builder.existential(node.variable, body)
+            else:
+                raise ValueError(f"Cannot canonicalize expression type: {type(node).__name__}")
+            memo[id(node)] = result
+            return result
+
+        # Chain node -> (node, its deduplicated canonical operands), so chains
+        # reached again through shared subexpressions are not walked twice.
+        flattened: Dict[int, Tuple[object, Dict[bytes, object]]] = {}
+
+        def chain(node):
+            operator = node.operator
+            unique: Dict[bytes, object] = {}
+            visited: Set[int] = set()
+            pending = [node]
+            while pending:
+                current = pending.pop()
+                if isinstance(current, (BinaryOp, NaryOp)) and current.operator == operator:
+                    if id(current) in visited:
+                        # Its operands are already collected; duplicates are dropped anyway.
+                        continue
+                    visited.add(id(current))
+                    entry = flattened.get(id(current))
+                    if entry is not None:
+                        for key, operand in entry[1].items():
+                            unique.setdefault(key, operand)
+                    elif isinstance(current, BinaryOp):
+                        pending.append(current.right)
+                        pending.append(current.left)
+                    else:
+                        pending.extend(reversed(current.operands))
+                    continue
+                operand = canon(current)
+                if isinstance(operand, BinaryOp) and operand.operator == operator:
+                    # e.g. ¬¬(A ∧ B) inside a conjunction: splice its operands in.
+                    pending.append(operand)
+                    continue
+                unique.setdefault(Fingerprint.of(operand), operand)
+            flattened[id(node)] = (node, unique)
+            ordered = sorted(unique.values(), key=_order_key)
+            if _is_left_deep_chain(node, operator, ordered):
+                return node
+            result = ordered[0]
+            for operand in ordered[1:]:
+                result = builder.binary(operator, result, operand)
+            return result
+
+        return canon(expression)
+
+    @staticmethod
+    def fingerprint(expression) -> bytes:
+        """
+        Returns the fingerprint of the canonical form of an expression.
+
+        Args:
+            expression: The expression to key.
+
+        Returns:
+            A 16-byte digest shared by all trivially equivalent spellings.
+        """
+        return Fingerprint.of(Canonicalizer.canonicalize(expression))
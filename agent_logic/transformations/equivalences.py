@@ -3,7 +3,13 @@ from agent_logic.core.operations import BinaryOp, Not
 
 
 class EquivalenceRules:
-    """Defines common logical equivalences for transformations."""
+    """
+    Defines common logical equivalences for transformations.
+
+    Each rule rewrites the root of an expression only and returns the input
+    object itself when it does not apply. Use ``Simplifier`` or
+    ``RewriteSystem`` to apply rules at every position.
+    """
 
     @staticmethod
     def apply_de_morgan(expression: LogicalExpression) -> LogicalExpression:
@@ -15,9 +21,9 @@ class EquivalenceRules:
         if isinstance(expression, Not) and isinstance(expression.operand, BinaryOp):
             op = expression.operand
             if op.operator == "AND":
-                return BinaryOp(Not(op.left), Not(op.right), "OR")
+                return BinaryOp(left=Not(operand=op.left), right=Not(operand=op.right), operator="OR")
             elif op.operator == "OR":
-                return BinaryOp(Not(op.left), Not(op.right), "AND")
+                return BinaryOp(left=Not(operand=op.left), right=Not(operand=op.right), operator="AND")
         return expression
 
     @staticmethod
@@ -63,9 +69,9 @@ class EquivalenceRules:
                 and expression.right.operator == "OR"
             ):
                 return BinaryOp(
-                    BinaryOp(expression.left, expression.right.left, "AND"),
-                    BinaryOp(expression.left, expression.right.right, "AND"),
-                    "OR",
+                    left=BinaryOp(left=expression.left, right=expression.right.left, operator="AND"),
+                    right=BinaryOp(left=expression.left, right=expression.right.right, operator="AND"),
+                    operator="OR",
                 )
             elif (
                 expression.operator == "OR"
@@ -73,8 +79,8 @@ class EquivalenceRules:
                 and expression.right.operator == "AND"
             ):
                 return BinaryOp(
-                    BinaryOp(expression.left, expression.right.left, "OR"),
-                    BinaryOp(expression.left, expression.right.right, "OR"),
-                    "AND",
+                    left=BinaryOp(left=expression.left, right=expression.right.left, operator="OR"),
+                    right=BinaryOp(left=expression.left, right=expression.right.right, operator="OR"),
+                    operator="AND",
                 )
         return expression
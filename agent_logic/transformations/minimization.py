@@ -0,0 +1,393 @@
+"""
+Two-level Boolean minimization.
+
+This module rewrites expressions into small sum-of-products (SOP) or
+product-of-sums (POS) formulas:
+- Minimizer: Exact Quine–McCluskey minimization with a set-cover solver for
+  few variables, and an Espresso-style expand/irredundant heuristic for more
+
+Cubes are bitsets over the sorted atom names of the expression: a cube is a
+``(bits, care)`` pair where ``care`` marks the variables it mentions and
+``bits`` their values, so merging, containment and coverage tests are a few
+integer operations. The exact method combines implicants differing in one
+variable until only primes remain, takes the essential primes and solves the
+rest of the cover by branch and bound (cheapest cover by cube count, then
+literal count). The heuristic starts from the disjoint cubes of a binary
+decision diagram, drops every literal whose removal keeps the cube inside the
+function, and removes cubes covered by the others.
+
+All work is metered by a budget. The exact method falls back to the heuristic
+when it runs out, and the heuristic returns the cover it has reached, which
+is equivalent to the input at every step. Reading the initial cover is charged
+per literal, with as much again set aside for building the result, so if even
+the decision diagram and its cubes do not fit, the input expression is
+returned unchanged.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from agent_logic.core.base import LogicalExpression
+from agent_logic.core.factory import ExpressionBuilder
+from agent_logic.evaluation.bdd import BDD, FALSE, TRUE, NodeBudgetExceeded
+from agent_logic.evaluation.cnf import atom_name
+
+Cube = Tuple[int, int]
+
+_DEFAULT_BUILDER = ExpressionBuilder()
+
+
+class _BudgetExceeded(Exception):
+    """Raised when a minimization step runs out of budget."""
+
+
+class _Budget:
+    __slots__ = ("remaining",)
+
+    def __init__(self, remaining: int):
+        self.remaining = remaining
+
+    def spend(self, amount: int = 1) -> None:
+        self.remaining -= amount
+        if self.remaining < 0:
+            raise _BudgetExceeded
+
+
+def _cost(cover: Sequence[Cube]) -> Tuple[int, int]:
+    return len(cover), sum(bin(care).count("1") for _, care in cover)
+
+
+def _contains(outer: Cube, inner: Cube) -> bool:
+    """Returns whether every model of ``inner`` is a model of ``outer``."""
+    return outer[1] & inner[1] == outer[1] and inner[0] & outer[1] == outer[0]
+
+
+def prime_implicants(minterms: Sequence[int], num_vars: int, budget: Optional[_Budget] = None) -> List[Cube]:
+    """
+    Computes the prime implicants of a function by Quine–McCluskey merging.
+
+    Args:
+        minterms: Models of the function as integers (bit ``i`` = variable ``i``).
+        num_vars: Number of variables.
+        budget: Optional work meter.
+
+    Returns:
+        The prime implicants as ``(bits, care)`` cubes.
+    """
+    full = (1 << num_vars) - 1
+    current: Set[Cube] = {(minterm, full) for minterm in minterms}
+    primes: List[Cube] = []
+    while current:
+        merged: Set[Cube] = set()
+        used: Set[Cube] = set()
+        for bits, care in current:
+            if budget is not None:
+                budget.spend()
+            remaining = care
+            while remaining:
+                bit = remaining & -remaining
+                remaining ^= bit
+                # Merge with the partner differing only in this variable, once per pair.
+                if not bits & bit and (bits | bit, care) in current:
+                    merged.add((bits, care & ~bit))
+                    used.add((bits, care))
+                    used.add((bits | bit, care))
+        primes.extend(current - used)
+        current = merged
+    return primes
+
+
+def _minimum_cover(
+    primes: List[Cube], minterms: Sequence[int], budget: _Budget
+) -> List[Cube]:
+    """Selects a cheapest set of primes covering all minterms (branch and bound)."""
+    coverage = []
+    for bits, care in primes:
+        budget.spend(len(minterms) // 64 + 1)
+        covered = 0
+        for index, minterm in enumerate(minterms):
+            if minterm & care == bits:
+                covered |= 1 << index
+        coverage.append(covered)
+    universe = (1 << len(minterms)) - 1
+    literal_counts = [bin(care).count("1") for _, care in primes]
+
+    # Greedy cover as the initial upper bound.
+    greedy: List[int] = []
+    uncovered = universe
+    while uncovered:
+        choice = max(
+            range(len(primes)),
+            key=lambda i: (bin(coverage[i] & uncovered).count("1"), -literal_counts[i]),
+        )
+        greedy.append(choice)
+        uncovered &= ~coverage[choice]
+    best = [greedy, (len(greedy), sum(literal_counts[i] for i in greedy))]
+
+    def search(chosen: List[int], uncovered: int, literals: int) -> None:
+        budget.spend()
+        if (len(chosen), literals) >= tuple(best[1]):
+            return
+        if not uncovered:
+            best[0], best[1] = list(chosen), (len(chosen), literals)
+            return
+        if len(chosen) + 1 > best[1][0]:
+            return
+        # Branch on the uncovered minterm with the fewest covering primes.
+        candidates = None
+        remaining = uncovered
+        while remaining:
+            bit = remaining & -remaining
+            remaining ^= bit
+            covering = [i for i in range(len(primes)) if coverage[i] & bit]
+            if candidates is None or len(covering) < len(candidates):
+                candidates = covering
+                if len(candidates) == 1:
+                    break
+        candidates.sort(key=lambda i: (-bin(coverage[i] & uncovered).count("1"), literal_counts[i]))
+        for index in candidates:
+            chosen.append(index)
+            search(chosen, uncovered & ~coverage[index], literals + literal_counts[index])
+            chosen.pop()
+
+    try:
+        search([], universe, 0)
+    except _BudgetExceeded:
+        pass
+    return [primes[i] for i in best[0]]
+
+
+class _Heuristic:
+    """Espresso-style expand and irredundant passes over a BDD-checked cover."""
+
+    def __init__(self, bdd: BDD, function: int, names: List[str], budget: _Budget):
+        self.bdd = bdd
+        self.function = function
+        self.names = names
+        self.budget = budget
+
+    def assignment(self, cube: Cube) -> Dict[str, bool]:
+        bits, care = cube
+        return {
+            name: bool(bits >> index & 1)
+            for index, name in enumerate(self.names)
+            if care >> index & 1
+        }
+
+    def implies(self, target: int, cube: Cube) -> bool:
+        self.budget.spend()
+        return self.bdd.restrict(target, self.assignment(cube)) == TRUE
+
+    def cube_node(self, cube: Cube) -> int:
+        node = TRUE
+        for name, value in self.assignment(cube).items():
+            literal = self.bdd.var(name)
+            node = self.bdd.apply("AND", node, literal if value else self.bdd.negate(literal))
+        return node
+
+    def expand(self, cover: List[Cube]) -> None:
+        """Drops literals from each cube while it stays inside the function (in place)."""
+        order = sorted(range(len(cover)), key=lambda i: -bin(cover[i][1]).count("1"))
+        for position in order:
+            bits, care = cover[position]
+            remaining = care
+            while remaining:
+                bit = remaining & -remaining
+                remaining ^= bit
+                candidate = (bits & ~bit, care & ~bit)
+                if self.implies(self.function, candidate):
+                    bits, care = candidate
+                    cover[position] = candidate
+        # Drop cubes contained in another cube.
+        unique: List[Cube] = []
+        for cube in sorted(set(cover), key=lambda c: bin(c[1]).count("1")):
+            self.budget.spend(len(unique) + 1)
+            if not any(_contains(kept, cube) for kept in unique):
+                unique.append(cube)
+        cover[:] = unique
+
+    def irredundant(self, cover: List[Cube]) -> None:
+        """Removes cubes covered by the union of the others (in place)."""
+        position = len(cover) - 1
+        # Most specific cubes (most literals) are tried first.
+        cover.sort(key=lambda c: bin(c[1]).count("1"))
+        while position >= 0:
+            others = FALSE
+            for index, cube in enumerate(cover):
+                if index != position:
+                    self.budget.spend()
+                    others = self.bdd.apply("OR", others, self.cube_node(cube))
+            if self.implies(others, cover[position]):
+                del cover[position]
+            position -= 1
+
+    def run(self, cover: List[Cube]) -> List[Cube]:
+        best = list(cover)
+        try:
+            while True:
+                candidate = list(best)
+                self.expand(candidate)
+                self.irredundant(candidate)
+                if _cost(candidate) >= _cost(best):
+                    return best if _cost(best) <= _cost(candidate) else candidate
+                best = candidate
+        except (_BudgetExceeded, NodeBudgetExceeded):
+            return best
+
+
+class Minimizer:
+    """
+    Minimizes expressions into two-level (SOP or POS) form.
+
+    Attributes:
+        DEFAULT_BUDGET: Default number of work units one call may spend.
+        EXACT_MAX_VARIABLES: Largest variable count handled by the exact
+            method when ``method="auto"``.
+    """
+
+    DEFAULT_BUDGET = 200_000
+    EXACT_MAX_VARIABLES = 10
+
+    @staticmethod
+    def minimize(
+        expression: LogicalExpression,
+        form: str = "SOP",
+        method: str = "auto",
+        budget: int = DEFAULT_BUDGET,
+        factory: Optional[ExpressionBuilder] = None,
+    ) -> LogicalExpression:
+        """
+        Returns a minimal (or, heuristically, small) equivalent two-level formula.
+
+        Args:
+            expression: The expression to minimize.
+            form: "SOP" for a disjunction of conjunctions of literals, or
+                  "POS" for a conjunction of disjunctions of literals.
+            method: "exact", "heuristic", or "auto" (exact for at most
+                    ``EXACT_MAX_VARIABLES`` variables).
+            budget: Work units the call may spend before returning the best
+                    formula found so far.
+            factory: Builder used for the result nodes.
+
+        Returns:
+            An equivalent expression in the requested form, built from the
+            expression's own atoms. Constant functions are returned as
+            ``A ∧ ¬A`` or ``A ∨ ¬A`` over the first atom. If the budget does
+            not allow even an initial cover, the input is returned unchanged.
+
+        Raises:
+            ValueError: If the form or method is unknown, or the expression
+                        contains unsupported node types.
+        """
+        if form not in ("SOP", "POS"):
+            raise ValueError(f"Unknown normal form: {form}")
+        if method not in ("auto", "exact", "heuristic"):
+            raise ValueError(f"Unknown minimization method: {method}")
+        builder = factory if factory is not None else _DEFAULT_BUILDER
+
+        atoms: Dict[str, LogicalExpression] = {}
+        stack = [expression]
+        seen = set()
+        while stack:
+            node = stack.pop()
+            if id(node) in seen:
+                continue
+            seen.add(id(node))
+            name = atom_name(node)
+            if name is not None:
+                atoms.setdefault(name, node)
+                continue
+            for field in ("operand", "left", "right"):
+                child = node.__dict__.get(field)
+                if child is not None:
+                    stack.append(child)
+            stack.extend(node.__dict__.get("operands", ()))
+        names = sorted(atoms)
+
+        meter = _Budget(budget)
+        bdd = BDD(order=names, max_nodes=max(budget, 16))
+        try:
+            function = bdd.compile(expression)
+            if form == "POS":
+                function = bdd.negate(function)
+            cubes = []
+            # Units reserved for building the result, one per literal and per term.
+            reserve = 0
+            for cube in bdd.cubes(function):
+                # Reading a cube and building it back into a formula both cost its size.
+                meter.spend(2 * (len(cube) + 1))
+                reserve += len(cube) + 1
+                bits = care = 0
+                for name, value in cube.items():
+                    index = names.index(name)
+                    care |= 1 << index
+                    if value:
+                        bits |= 1 << index
+                cubes.append((bits, care))
+        except (_BudgetExceeded, NodeBudgetExceeded):
+            return expression
+
+        cover = None
+        if method == "exact" or (method == "auto" and len(names) <= Minimizer.EXACT_MAX_VARIABLES):
+            try:
+                minterms = sorted(
+                    {bits | extra for bits, care in cubes for extra in _completions(care, len(names), meter)}
+                )
+                primes = prime_implicants(minterms, len(names), meter)
+                cover = _minimum_cover(primes, minterms, meter) if minterms else []
+            except _BudgetExceeded:
+                # Fall back to the heuristic, which keeps the initial cover if
+                # nothing is left to spend.
+                pass
+        if cover is None:
+            cover = _Heuristic(bdd, function, names, meter).run(cubes)
+        try:
+            return _build(cover, names, atoms, form, builder, _Budget(reserve + max(meter.remaining, 0)))
+        except _BudgetExceeded:
+            return expression
+
+
+def _completions(care: int, num_vars: int, budget: _Budget):
+    """Yields every assignment of the variables outside ``care`` as a bitmask."""
+    free = [1 << index for index in range(num_vars) if not care >> index & 1]
+    budget.spend(1 << len(free))
+    for mask in range(1 << len(free)):
+        value = 0
+        for position, bit in enumerate(free):
+            if mask >> position & 1:
+                value |= bit
+        yield value
+
+
+def _build(
+    cover: List[Cube], names: List[str], atoms: Dict[str, LogicalExpression], form: str, builder, budget: _Budget
+):
+    """Builds the SOP (or, from a cover of the negation, the POS) expression."""
+    inner, outer = ("AND", "OR") if form == "SOP" else ("OR", "AND")
+    terms = []
+    for bits, care in sorted(cover, key=lambda cube: (bin(cube[1]).count("1"), cube)):
+        budget.spend(bin(care).count("1") + 1)
+        literals = []
+        for index, name in enumerate(names):
+            if care >> index & 1:
+                positive = bool(bits >> index & 1)
+                if form == "POS":
+                    positive = not positive
+                atom = atoms[name]
+                literals.append(atom if positive else builder.negation(atom))
+        if not literals:
+            # The cover is a tautology (SOP) or the function is unsatisfiable (POS).
+            atom = atoms[names[0]]
+            return builder.binary(outer, atom, builder.negation(atom))
+        term = literals[0]
+        for literal in literals[1:]:
+            term = builder.binary(inner, term, literal)
+        terms.append(term)
+    if not terms:
+        atom = atoms[names[0]]
+        return builder.binary(inner, atom, builder.negation(atom))
+    result = terms[0]
+    for term in terms[1:]:
+        result = builder.binary(outer, result, term)
+    return result
@@ -1,50 +1,239 @@
+"""
+Conjunctive and disjunctive normal forms.
+
+This module converts expressions into normal forms:
+- NormalForms: CNF and DNF conversion by negation normal form followed by
+  distribution
+
+Conversion first rewrites implications, biconditionals, XOR, NAND and NOR
+into conjunctions, disjunctions and negations and pushes negations down to
+the atoms, then distributes one connective over the other. Quantified
+formulas are treated as atoms. N-ary AndN/OrN nodes are accepted anywhere a
+binary chain is: their operands are converted as one chain, and chains that
+came in n-ary are rebuilt as NaryOp nodes in the result.
+
+Both passes are copy-on-write: a subtree that is already in the target form
+is returned as the original node object, not a copy, and every pass keeps a
+memo table so shared subtrees are converted once. Converting an expression
+that is already in normal form therefore allocates nothing and returns the
+input itself, which keeps identity-based caches valid across pipelines. Terms
+produced by distribution have repeated literals merged, and duplicate or
+complementary (tautological clause, contradictory conjunct) terms dropped.
+Distribution can grow the expression exponentially; use
+``CNFEncoder.tseitin`` for a linear-size equisatisfiable clause form.
+"""
+
+from __future__ import annotations
+
+import itertools
+from typing import Any, Dict, List, Optional, Tuple
+
 from agent_logic.core.base import LogicalExpression
-from agent_logic.core.operations import BinaryOp, Not
+from agent_logic.core.factory import ExpressionBuilder
+from agent_logic.core.operations import BinaryOp, NaryOp, Not
+from agent_logic.transformations.canonical import Fingerprint
+
+_DUAL = {"AND": "OR", "OR": "AND"}
+_DEFAULT_BUILDER = ExpressionBuilder()
+
+
+def _is_chain(node, operator: str) -> bool:
+    return isinstance(node, (BinaryOp, NaryOp)) and node.operator == operator
+
+
+class _NormalFormPass:
+    """Memoized negation normal form and distribution passes."""
+
+    def __init__(self, builder: ExpressionBuilder):
+        self.builder = builder
+        # (id, flag) -> (node, result); the node is kept alive so its id is not reused.
+        self.nnf_memo: Dict[Tuple[int, bool], Tuple[Any, Any]] = {}
+        self.distribute_memo: Dict[int, Tuple[Any, Any]] = {}
+
+    def combine(self, operator: str, operands: List[Any], nary: bool):
+        if len(operands) == 1:
+            return operands[0]
+        if nary:
+            return self.builder.nary(operator, operands)
+        result = operands[0]
+        for operand in operands[1:]:
+            result = self.builder.binary(operator, result, operand)
+        return result
+
+    def nnf(self, node, negate: bool = False):
+        """Returns the negation normal form of ``node`` (or of ``¬node``)."""
+        entry = self.nnf_memo.get((id(node), negate))
+        if entry is not None:
+            return entry[1]
+        builder = self.builder
+        if isinstance(node, Not):
+            operand = node.operand
+            if not negate and not isinstance(operand, (Not, BinaryOp, NaryOp)):
+                result = node
+            else:
+                result = self.nnf(operand, not negate)
+        elif isinstance(node, NaryOp) or (isinstance(node, BinaryOp) and node.operator in _DUAL):
+            children = node.operands if isinstance(node, NaryOp) else (node.left, node.right)
+            converted = [self.nnf(child, negate) for child in children]
+            if not negate and all(new is old for new, old in zip(converted, children)):
+                result = node
+            else:
+                operator = _DUAL[node.operator] if negate else node.operator
+                result = self.combine(operator, converted, isinstance(node, NaryOp))
+        elif isinstance(node, BinaryOp):
+            left, right, operator = node.left, node.right, node.operator
+            if operator == "NAND":
+                result = self.nnf(builder.binary("AND", left, right), not negate)
+            elif operator == "NOR":
+                result = self.nnf(builder.binary("OR", left, right), not negate)
+            elif operator == "IMPLIES":
+                # A → B ≡ ¬A ∨ B, and ¬(A → B) ≡ A ∧ ¬B.
+                if negate:
+                    result = builder.binary("AND", self.nnf(left), self.nnf(right, True))
+                else:
+                    result = builder.binary("OR", self.nnf(left, True), self.nnf(right))
+            elif operator in ("IFF", "XOR"):
+                # A ↔ B ≡ (¬A ∨ B) ∧ (A ∨ ¬B), and A ⊕ B ≡ ¬(A ↔ B) ≡ (A ∨ B) ∧ (¬A ∨ ¬B).
+                equivalent = (operator == "IFF") != negate
+                positive_left, positive_right = self.nnf(left), self.nnf(right)
+                negative_left, negative_right = self.nnf(left, True), self.nnf(right, True)
+                if equivalent:
+                    first = builder.binary("OR", negative_left, positive_right)
+                    second = builder.binary("OR", positive_left, negative_right)
+                else:
+                    first = builder.binary("OR", positive_left, positive_right)
+                    second = builder.binary("OR", negative_left, negative_right)
+                result = builder.binary("AND", first, second)
+            else:
+                raise ValueError(f"Unknown operator: {operator}")
+        else:
+            # Atoms and quantified formulas.
+            result = builder.negation(node) if negate else node
+        self.nnf_memo[(id(node), negate)] = (node, result)
+        return result
+
+    def distribute(self, node, outer: str):
+        """Distributes ``outer`` over its dual in a negation normal form expression."""
+        entry = self.distribute_memo.get(id(node))
+        if entry is not None:
+            return entry[1]
+        inner = _DUAL[outer]
+        if _is_chain(node, outer) or _is_chain(node, inner):
+            nary = isinstance(node, NaryOp)
+            children = node.operands if nary else (node.left, node.right)
+            converted = [self.distribute(child, outer) for child in children]
+            if _is_chain(node, inner):
+                groups = [NaryOp.collect(outer, [child]) for child in converted]
+            else:
+                groups = []
+            if any(len(group) > 1 for group in groups):
+                # (A ∧ B) ∨ C ≡ (A ∨ C) ∧ (B ∨ C), for every combination.
+                result = self.combine(outer, self.products(groups, inner, nary), nary)
+            elif all(new is old for new, old in zip(converted, children)):
+                result = node
+            elif nary:
+                # Splice converted children that became chains of the same operator.
+                result = self.combine(node.operator, NaryOp.collect(node.operator, converted), nary)
+            else:
+                result = self.combine(node.operator, converted, nary)
+        else:
+            result = node
+        self.distribute_memo[id(node)] = (node, result)
+        return result
+
+    def products(self, groups: List[List[Any]], inner: str, nary: bool) -> List[Any]:
+        """
+        Builds the distributed terms, one per combination of group members.
+
+        Repeated literals are merged, terms containing a literal and its
+        negation are dropped (they are absorbed by the outer connective) and
+        repeated terms are built once.
+        """
+        terms = []
+        seen = set()
+        for combination in itertools.product(*groups):
+            literals = {}
+            for literal in NaryOp.collect(inner, combination):
+                atom = literal.operand if isinstance(literal, Not) else literal
+                literals.setdefault((Fingerprint.of(atom), atom is not literal), literal)
+            if any((key, not negated) in literals for key, negated in literals):
+                continue
+            signature = frozenset(literals)
+            if signature not in seen:
+                seen.add(signature)
+                terms.append(self.combine(inner, list(literals.values()), nary))
+        if not terms:
+            # Every term is absorbed: keep one to stand for the constant.
+            terms.append(self.combine(inner, NaryOp.collect(inner, next(itertools.product(*groups))), nary))
+        return terms
 
 
 class NormalForms:
     """Handles logical normal forms like CNF and DNF."""
 
     @staticmethod
-    def to_cnf(expression: LogicalExpression) -> LogicalExpression:
-        """Recursively converts an expression to Conjunctive Normal Form (CNF)."""
-
-        # Apply De Morgan’s laws where necessary
-        if isinstance(expression, Not) and isinstance(expression.operand, BinaryOp):
-            op = expression.operand
-            if op.operator == "AND":
-                return BinaryOp(Not(op.left), Not(op.right), "OR")
-            elif op.operator == "OR":
-                return BinaryOp(Not(op.left), Not(op.right), "AND")
-
-        # Recursively simplify left and right subexpressions
-        if isinstance(expression, BinaryOp):
-            return BinaryOp(
-                NormalForms.to_cnf(expression.left),
-                NormalForms.to_cnf(expression.right),
-                expression.operator,
-            )
-
-        return expression  # If already in CNF, return as-is
+    def to_nnf(
+        expression: LogicalExpression, factory: Optional[ExpressionBuilder] = None
+    ) -> LogicalExpression:
+        """
+        Converts an expression to negation normal form.
+
+        Args:
+            expression: The expression to convert.
+            factory: Builder used for new nodes.
+
+        Returns:
+            An equivalent expression using only ∧, ∨ and negated atoms.
+            Subtrees already in this form are returned as-is.
+
+        Raises:
+            ValueError: If a binary operator is unknown.
+        """
+        return _NormalFormPass(factory or _DEFAULT_BUILDER).nnf(expression)
 
     @staticmethod
-    def to_dnf(expression: LogicalExpression) -> LogicalExpression:
-        """Recursively converts an expression to Disjunctive Normal Form (DNF)."""
-
-        # Apply De Morgan’s laws where necessary
-        if isinstance(expression, Not) and isinstance(expression.operand, BinaryOp):
-            op = expression.operand
-            if op.operator == "AND":
-                return BinaryOp(Not(op.left), Not(op.right), "OR")
-            elif op.operator == "OR":
-                return BinaryOp(Not(op.left), Not(op.right), "AND")
-
-        # Recursively simplify left and right subexpressions
-        if isinstance(expression, BinaryOp):
-            return BinaryOp(
-                NormalForms.to_dnf(expression.left),
-                NormalForms.to_dnf(expression.right),
-                expression.operator,
-            )
-
-        return expression  # If already in DNF, return as-is
+    def to_cnf(
+        expression: LogicalExpression, factory: Optional[ExpressionBuilder] = None
+    ) -> LogicalExpression:
+        """
+        Converts an expression to Conjunctive Normal Form (CNF).
+
+        Args:
+            expression: The expression to convert.
+            factory: Builder used for new nodes.
+
+        Returns:
+            An equivalent conjunction of disjunctions of literals. If the
+            expression is already in CNF it is returned unchanged.
+
+        Raises:
+            ValueError: If a binary operator is unknown.
+        """
+        run = _NormalFormPass(factory or _DEFAULT_BUILDER)
+        return run.distribute(run.nnf(expression), "AND")
+
+    @staticmethod
+    def to_dnf(
+        expression: LogicalExpression, factory: Optional[ExpressionBuilder] = None
+    ) -> LogicalExpression:
+        """
+        Converts an expression to Disjunctive Normal Form (DNF).
+
+        Args:
+            expression: The expression to convert.
+            factory: Builder used for new nodes.
+
+        Returns:
+            An equivalent disjunction of conjunctions of literals. If the
+            expression is already in DNF it is returned unchanged.
+
+        Raises:
+            ValueError: If a binary operator is unknown.
+        """
+        run = _NormalFormPass(factory or _DEFAULT_BUILDER)
+        return run.distribute(run.nnf(expression), "OR")
+
+
+# Module-level aliases for the package API.
+to_cnf = NormalForms.to_cnf
+to_dnf = NormalForms.to_dnf
@@ -0,0 +1,467 @@
+"""
+Term rewriting with user-defined rules.
+
+This module applies equivalences declared as patterns instead of code:
+- RewriteRule: A named ``pattern → replacement`` pair with pattern variables
+- RewriteSystem: A rule set compiled into a discrimination net, applied with
+  an innermost, outermost or exhaustive strategy
+- STANDARD_RULES: The equivalences of ``EquivalenceRules`` and the
+  associative laws of ``InferenceRules`` as declarative rules; they terminate
+  under every strategy
+- DISTRIBUTIVE_RULES: The two distributive laws, kept apart because together
+  they never terminate
+
+Patterns are ordinary expressions. By default every proposition in a pattern
+is a pattern variable that matches any subexpression, so ``¬(A ∧ B)`` matches
+every negated conjunction; a variable used twice (``A ∧ A``) only matches
+structurally equal subexpressions. Relations and propositions not listed as
+variables match themselves.
+
+Patterns are flattened in preorder into symbol paths (``¬``, ``∧``, a
+constant, or a variable wildcard) and stored in a trie keyed first on the
+head symbol. Retrieval walks the trie alongside the subject and only visits
+paths compatible with it, so its cost depends on the matching patterns rather
+than on the size of the rule set: rules for other connectives are never
+looked at. When several rules match, the one added first wins.
+
+Rewriting leaves unchanged subtrees shared with the input and processes
+shared subtrees once per pass.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from pydantic import BaseModel
+
+from agent_logic.core.base import LogicalExpression
+from agent_logic.core.factory import ExpressionBuilder
+from agent_logic.core.functions import Relation
+from agent_logic.core.operations import BinaryOp, NaryOp, Not, Proposition
+from agent_logic.core.quantifiers import ExistentialQuantifier, UniversalQuantifier
+from agent_logic.transformations.canonical import Fingerprint
+from agent_logic.transformations.simplifier import SimplificationResult
+
+_QUANTIFIERS = (UniversalQuantifier, ExistentialQuantifier)
+_WILDCARD = "*"
+_DEFAULT_BUILDER = ExpressionBuilder()
+
+STRATEGIES = ("innermost", "outermost", "exhaustive")
+
+STANDARD_RULES: List[Tuple[str, str, str]] = [
+    ("double_negation", "¬¬A", "A"),
+    ("de_morgan_and", "¬(A ∧ B)", "¬A ∨ ¬B"),
+    ("de_morgan_or", "¬(A ∨ B)", "¬A ∧ ¬B"),
+    ("associative_and", "A ∧ (B ∧ C)", "(A ∧ B) ∧ C"),
+    ("associative_or", "A ∨ (B ∨ C)", "(A ∨ B) ∨ C"),
+]
+
+# Each law terminates on its own (towards DNF or CNF); together they undo
+# each other's work, so add at most one of them to an exhaustive system.
+DISTRIBUTIVE_RULES: List[Tuple[str, str, str]] = [
+    ("distributive_and", "A ∧ (B ∨ C)", "(A ∧ B) ∨ (A ∧ C)"),
+    ("distributive_or", "A ∨ (B ∧ C)", "(A ∨ B) ∧ (A ∨ C)"),
+]
+
+
+def _symbol(node) -> Tuple[tuple, Sequence[Any]]:
+    """Returns the discrimination net symbol of a node and its children."""
+    if isinstance(node, BinaryOp):
+        return ("B", node.operator), (node.left, node.right)
+    if isinstance(node, Not):
+        return ("N",), (node.operand,)
+    if isinstance(node, Proposition):
+        return ("P", node.name), ()
+    if isinstance(node, NaryOp):
+        return ("M", node.operator, len(node.operands)), node.operands
+    if isinstance(node, Relation):
+        return ("R", node.name, tuple(node.parameters)), ()
+    if isinstance(node, _QUANTIFIERS):
+        return ("Q", node.type, node.variable), (node.predicate,)
+    # Unknown nodes only match pattern variables.
+    return ("?", id(node)), ()
+
+
+def _propositions(expression) -> set:
+    """Returns the names of the propositions in an expression."""
+    names = set()
+    stack = [expression]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, Proposition):
+            names.add(node.name)
+        stack.extend(_symbol(node)[1])
+    return names
+
+
+def _key(node):
+    try:
+        return Fingerprint.of(node)
+    except ValueError:
+        return ("id", id(node))
+
+
+class RewriteRule(BaseModel):
+    """
+    A rewrite rule ``pattern → replacement``.
+
+    Attributes:
+        name: Rule name, used in rewrite statistics.
+        pattern: The expression to match; its variables match any subexpression.
+        replacement: The expression to substitute, over the pattern variables.
+        variables: Names of the propositions that act as pattern variables.
+    """
+
+    name: str
+    pattern: LogicalExpression
+    replacement: LogicalExpression
+    variables: List[str]
+
+
+class _NetNode:
+    __slots__ = ("edges", "rules")
+
+    def __init__(self):
+        self.edges: Dict[Any, "_NetNode"] = {}
+        # (rule index, variable names in wildcard order) for patterns ending here.
+        self.rules: List[Tuple[int, Tuple[str, ...]]] = []
+
+
+class RewriteSystem:
+    """
+    An indexed set of rewrite rules.
+
+    Example:
+        >>> system = RewriteSystem(STANDARD_RULES)
+        >>> result = system.rewrite(FormulaParser.parse("¬(P ∧ ¬Q)"))
+        >>> result.rewrites
+        {'de_morgan_and': 1, 'double_negation': 1}
+    """
+
+    DEFAULT_MAX_STEPS = 100_000
+
+    def __init__(
+        self,
+        rules: Optional[Iterable[Union[RewriteRule, Tuple[str, Any, Any]]]] = None,
+        factory: Optional[ExpressionBuilder] = None,
+    ):
+        """
+        Creates a rule set.
+
+        Args:
+            rules: Initial rules, as RewriteRule objects or
+                   ``(name, pattern, replacement)`` tuples (see ``add_rule``).
+            factory: Builder used for replacement nodes.
+        """
+        self.builder = factory if factory is not None else _DEFAULT_BUILDER
+        self._rules: List[RewriteRule] = []
+        self._root = _NetNode()
+        for rule in rules or ():
+            if isinstance(rule, RewriteRule):
+                self.add_rule(rule.name, rule.pattern, rule.replacement, rule.variables)
+            else:
+                self.add_rule(*rule)
+
+    def __len__(self) -> int:
+        """Returns the number of rules."""
+        return len(self._rules)
+
+    @property
+    def rules(self) -> List[RewriteRule]:
+        """The rules, in priority order."""
+        return list(self._rules)
+
+    def add_rule(
+        self,
+        name: str,
+        pattern: Union[str, LogicalExpression],
+        replacement: Union[str, LogicalExpression],
+        variables: Optional[Sequence[str]] = None,
+    ) -> RewriteRule:
+        """
+        Adds a rule with lower priority than the existing ones.
+
+        Args:
+            name: Rule name.
+            pattern: Pattern expression, or formula text to parse.
+            replacement: Replacement expression, or formula text to parse.
+            variables: Propositions that act as pattern variables; defaults to
+                       every proposition of the pattern.
+
+        Returns:
+            The added rule.
+
+        Raises:
+            ValueError: If the replacement uses a variable missing from the
+                        pattern, or a formula cannot be parsed.
+        """
+        if isinstance(pattern, str) or isinstance(replacement, str):
+            from agent_logic.parsing.formula_parser import FormulaParser
+
+            if isinstance(pattern, str):
+                pattern = FormulaParser.parse(pattern)
+            if isinstance(replacement, str):
+                replacement = FormulaParser.parse(replacement)
+        pattern_names = _propositions(pattern)
+        if variables is None:
+            variables = sorted(pattern_names)
+        else:
+            missing = (_propositions(replacement) & set(variables)) - pattern_names
+            if missing:
+                raise ValueError(f"Replacement uses variables missing from the pattern: {sorted(missing)}")
+        rule = RewriteRule(name=name, pattern=pattern, replacement=replacement, variables=list(variables))
+        index = len(self._rules)
+        self._rules.append(rule)
+        self._insert(index, rule)
+        return rule
+
+    def _insert(self, index: int, rule: RewriteRule) -> None:
+        variables = set(rule.variables)
+        net = self._root
+        order: List[str] = []
+        pending = [rule.pattern]
+        while pending:
+            node = pending.pop()
+            if isinstance(node, Proposition) and node.name in variables:
+                symbol, children = _WILDCARD, ()
+                order.append(node.name)
+            else:
+                symbol, children = _symbol(node)
+            net = net.edges.setdefault(symbol, _NetNode())
+            pending.extend(reversed(children))
+        net.rules.append((index, tuple(order)))
+
+    def match(self, expression) -> Optional[Tuple[RewriteRule, Dict[str, Any]]]:
+        """
+        Finds the highest-priority rule matching an expression at its root.
+
+        Args:
+            expression: The subject expression.
+
+        Returns:
+            The rule and the bindings of its variables, or None.
+        """
+        best: Optional[Tuple[int, Dict[str, Any]]] = None
+        stack: List[Tuple[_NetNode, Tuple[Any, ...], Tuple[Any, ...]]] = [
+            (self._root, (expression,), ())
+        ]
+        while stack:
+            net, pending, bound = stack.pop()
+            if not pending:
+                for index, order in net.rules:
+                    if best is not None and best[0] <= index:
+                        continue
+                    bindings = self._bind(order, bound)
+                    if bindings is not None:
+                        best = (index, bindings)
+                continue
+            term, rest = pending[0], pending[1:]
+            wildcard = net.edges.get(_WILDCARD)
+            if wildcard is not None:
+                stack.append((wildcard, rest, bound + (term,)))
+            symbol, children = _symbol(term)
+            child = net.edges.get(symbol)
+            if child is not None:
+                stack.append((child, tuple(children) + rest, bound))
+        if best is None:
+            return None
+        return self._rules[best[0]], best[1]
+
+    @staticmethod
+    def _bind(order: Tuple[str, ...], bound: Tuple[Any, ...]) -> Optional[Dict[str, Any]]:
+        bindings: Dict[str, Any] = {}
+        for name, term in zip(order, bound):
+            previous = bindings.get(name)
+            if previous is None:
+                bindings[name] = term
+            elif previous is not term and _key(previous) != _key(term):
+                return None
+        return bindings
+
+    def instantiate(self, rule: RewriteRule, bindings: Dict[str, Any]):
+        """Builds the replacement of a rule under variable bindings."""
+        builder = self.builder
+        memo: Dict[int, Any] = {}
+
+        def build(node):
+            result = memo.get(id(node))
+            if result is not None:
+                return result
+            if isinstance(node, Proposition) and node.name in bindings:
+                result = bindings[node.name]
+            elif isinstance(node, Not):
+                result = builder.negation(build(node.operand))
+            elif isinstance(node, BinaryOp):
+                result = builder.binary(node.operator, build(node.left), build(node.right))
+            elif isinstance(node, NaryOp):
+                result = builder.nary(node.operator, [build(operand) for operand in node.operands])
+            elif isinstance(node, _QUANTIFIERS):
+                body = build(node.predicate)
+                if node.type == "FORALL":
+                    result = builder.universal(node.variable, body)
+                else:
+                    result = builder.existential(node.variable, body)
+            else:
+                result = node
+            memo[id(node)] = result
+            return result
+
+        return build(rule.replacement)
+
+    def apply(self, expression):
+        """
+        Rewrites an expression once at its root.
+
+        Args:
+            expression: The subject expression.
+
+        Returns:
+            The instantiated replacement of the first matching rule, or the
+            expression itself if no rule matches.
+        """
+        found = self.match(expression)
+        if found is None:
+            return expression
+        return self.instantiate(*found)
+
+    def rewrite(
+        self,
+        expression,
+        strategy: str = "exhaustive",
+        max_steps: int = DEFAULT_MAX_STEPS,
+    ) -> SimplificationResult:
+        """
+        Rewrites an expression with the rules.
+
+        Args:
+            expression: The expression to rewrite.
+            strategy: "innermost" rewrites every position once, children
+                      before parents; "outermost" rewrites every position
+                      once, parents before children (the children of a
+                      replacement are visited, not the replacement itself);
+                      "exhaustive" repeats innermost passes until no rule
+                      matches anywhere.
+            max_steps: Maximum number of rule applications, which guards
+                       against rule sets that do not terminate.
+
+        Returns:
+            The rewritten expression with per-rule counts; ``complete`` is
+            False if the step budget ran out.
+
+        Raises:
+            ValueError: If the strategy is unknown.
+        """
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown rewriting strategy: {strategy}")
+        run = _Pass(self, max_steps)
+        result = getattr(run, strategy)(expression)
+        return SimplificationResult(
+            expression=result,
+            rewrites=run.rewrites,
+            steps=sum(run.rewrites.values()),
+            complete=run.complete,
+        )
+
+
+class _Pass:
+    """One traversal of an expression under a strategy."""
+
+    def __init__(self, system: RewriteSystem, max_steps: int):
+        self.system = system
+        self.remaining = max_steps
+        self.complete = True
+        self.rewrites: Dict[str, int] = {}
+        # id -> (node, result); the node is kept alive so its id is not reused.
+        self.memo: Dict[int, Tuple[Any, Any]] = {}
+
+    def step(self, node):
+        """Applies the first matching rule at a node, or returns None."""
+        found = self.system.match(node)
+        if found is None:
+            return None
+        if self.remaining <= 0:
+            self.complete = False
+            return None
+        self.remaining -= 1
+        rule, bindings = found
+        self.rewrites[rule.name] = self.rewrites.get(rule.name, 0) + 1
+        return self.system.instantiate(rule, bindings)
+
+    @staticmethod
+    def children(node) -> Sequence[Any]:
+        """Returns the subexpressions a strategy descends into."""
+        if isinstance(node, Not):
+            return (node.operand,)
+        if isinstance(node, BinaryOp):
+            return (node.left, node.right)
+        if isinstance(node, NaryOp):
+            return node.operands
+        if isinstance(node, _QUANTIFIERS) and isinstance(node.predicate, LogicalExpression):
+            return (node.predicate,)
+        return ()
+
+    def rebuild(self, node, children: Sequence[Any]):
+        """Rebuilds a node from rewritten children, reusing it if none changed."""
+        if all(new is old for new, old in zip(children, self.children(node))):
+            return node
+        builder = self.system.builder
+        if isinstance(node, Not):
+            return builder.negation(children[0])
+        if isinstance(node, BinaryOp):
+            return builder.binary(node.operator, children[0], children[1])
+        if isinstance(node, NaryOp):
+            return builder.nary(node.operator, list(children))
+        if node.type == "FORALL":
+            return builder.universal(node.variable, children[0])
+        return builder.existential(node.variable, children[0])
+
+    def traverse(self, root, parents_first: bool):
+        """
+        Rewrites every position once, without recursion.
+
+        Rules can make the term deeper on every pass, so the traversal keeps
+        its own stack instead of using Python's.
+        """
+        results: List[Any] = []
+        stack: List[Tuple[Any, Any]] = [(root, None)]
+        while stack:
+            node, target = stack.pop()
+            if target is None:
+                entry = self.memo.get(id(node))
+                if entry is not None:
+                    results.append(entry[1])
+                    continue
+                target = node
+                if parents_first:
+                    replaced = self.step(node)
+                    if replaced is not None:
+                        target = replaced
+                stack.append((node, target))
+                stack.extend((child, None) for child in reversed(self.children(target)))
+                continue
+            count = len(self.children(target))
+            rebuilt = self.rebuild(target, results[len(results) - count:])
+            del results[len(results) - count:]
+            if not parents_first:
+                replaced = self.step(rebuilt)
+                if replaced is not None:
+                    rebuilt = replaced
+            self.memo[id(node)] = (node, rebuilt)
+            results.append(rebuilt)
+        return results[0]
+
+    def innermost(self, node):
+        return self.traverse(node, parents_first=False)
+
+    def outermost(self, node):
+        return self.traverse(node, parents_first=True)
+
+    def exhaustive(self, node):
+        # Repeated innermost passes instead of re-visiting replacements: each
+        # pass is iterative, however deep the rules make the term.
+        while True:
+            steps = self.remaining
+            node = self.innermost(node)
+            if self.remaining == steps or not self.complete:
+                return node
+            self.memo = {}
@@ -0,0 +1,394 @@
+"""
+Fixpoint simplification.
+
+This module applies local equivalences at every position of an expression:
+- SimplificationResult: The simplified expression with rewrite statistics
+- Simplifier: Bottom-up rewriting to a fixpoint with double negation,
+  De Morgan, constant folding, idempotence, complement, absorption and
+  subsumption
+
+Children are simplified before their parents, and a node whose rewrite
+produces a new node is simplified again until no rule applies, so the result
+is a fixpoint of all rules at every position. Negations are only pushed
+inward (De Morgan) and every other rule removes nodes, so rewriting always
+terminates. Conjunction and disjunction chains, binary or n-ary, are
+simplified as flat operand lists: duplicates are dropped, complementary
+operands and absorbing constants collapse the chain, and an operand whose
+dual operands include all those of another operand is subsumed by it
+(``A ∧ (A ∨ B)`` ≡ ``A``, ``(A ∨ B) ∧ (A ∨ B ∨ C)`` ≡ ``A ∨ B``).
+
+Results are memoized per subterm by identity and by structural fingerprint,
+so shared and repeated subtrees are simplified once. Pending rewrites are kept
+on an explicit stack, so input depth is not limited by Python's recursion
+limit. Constants are Python booleans, as in
+``LogicalExpression.partial_evaluate``: a tautology or contradiction
+simplifies to True or False.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+from agent_logic.core.factory import ExpressionBuilder
+from agent_logic.core.functions import Relation
+from agent_logic.core.operations import (
+    BINARY_TRUTH_FUNCTIONS,
+    BinaryOp,
+    NaryOp,
+    Not,
+    Proposition,
+    _residual,
+)
+from agent_logic.core.quantifiers import ExistentialQuantifier, UniversalQuantifier
+from agent_logic.transformations.canonical import Fingerprint
+
+_QUANTIFIERS = (UniversalQuantifier, ExistentialQuantifier)
+_DUAL = {"AND": "OR", "OR": "AND"}
+_DEFAULT_BUILDER = ExpressionBuilder()
+
+
+class SimplificationResult(BaseModel):
+    """
+    Outcome of a simplification.
+
+    Attributes:
+        expression: The simplified expression, or True/False if the input is
+                    a tautology or contradiction found by the rules.
+        rewrites: Number of applications of each rule, by rule name.
+        steps: Total number of rule applications.
+        complete: False if the step budget ran out before the fixpoint.
+    """
+
+    model_config = {"arbitrary_types_allowed": True}
+
+    expression: Any
+    rewrites: Dict[str, int] = Field(default_factory=dict)
+    steps: int = 0
+    complete: bool = True
+
+
+def _is_chain(node, operator: Optional[str] = None) -> bool:
+    if isinstance(node, NaryOp) or (isinstance(node, BinaryOp) and node.operator in _DUAL):
+        return operator is None or node.operator == operator
+    return False
+
+
+class _Run:
+    """State of one simplification: memo tables, budget and rule counts."""
+
+    def __init__(self, builder: ExpressionBuilder, max_steps: int):
+        self.builder = builder
+        self.remaining = max_steps
+        self.complete = True
+        self.rewrites: Dict[str, int] = {}
+        self.by_id: Dict[int, Tuple[Any, Any]] = {}
+        self.by_key: Dict[Any, Any] = {}
+
+    def fire(self, rule: str, required: bool = False) -> bool:
+        """Records one application of a rule, or returns False if the budget is spent."""
+        if self.remaining <= 0 and not required:
+            self.complete = False
+            return False
+        self.remaining -= 1
+        self.rewrites[rule] = self.rewrites.get(rule, 0) + 1
+        return True
+
+    @staticmethod
+    def key(node):
+        if isinstance(node, bool):
+            return node
+        try:
+            return Fingerprint.of(node)
+        except ValueError:
+            return ("id", id(node))
+
+    def literal(self, node, negated: bool = False):
+        """Returns a key identifying a node, or its negation, up to one outer ¬."""
+        if isinstance(node, Not):
+            return (negated, self.key(node.operand))
+        return (not negated, self.key(node))
+
+    def complementary(self, first, second) -> bool:
+        return (isinstance(first, Not) and self.key(first.operand) == self.key(second)) or (
+            isinstance(second, Not) and self.key(second.operand) == self.key(first)
+        )
+
+    def simplify(self, root):
+        """
+        Simplifies a node without recursion.
+
+        Rewrites are generators that yield each subterm they need simplified
+        and are sent its result; pending rewrites wait on an explicit stack,
+        so neither deep inputs nor long cascades of rewrites (De Morgan
+        pushed through alternating chains) are limited by Python's stack.
+        """
+        value, key = self.cached(root)
+        if value is not None:
+            return value
+        stack = [self.visit(root, key)]
+        while True:
+            try:
+                request = stack[-1].send(value)
+            except StopIteration as stop:
+                stack.pop()
+                value = stop.value
+                if not stack:
+                    return value
+                continue
+            value, key = self.cached(request)
+            if value is None:
+                stack.append(self.visit(request, key))
+
+    def cached(self, node) -> Tuple[Any, Any]:
+        """Returns the memoized result for a node, or None if it has none yet, and the node's key."""
+        if isinstance(node, bool):
+            return node, None
+        entry = self.by_id.get(id(node))
+        if entry is not None:
+            return entry[1], None
+        key = self.key(node)
+        result = self.by_key.get(key)
+        if result is not None:
+            # Keep the node alive so its id is not reused by a later temporary.
+            self.by_id[id(node)] = (node, result)
+        return result, key
+
+    def visit(self, node, key):
+        result = yield from self.rewrite(node)
+        self.by_key[key] = result
+        # The result is its own fixpoint.
+        if not isinstance(result, bool):
+            self.by_key.setdefault(self.key(result), result)
+        self.by_id[id(node)] = (node, result)
+        return result
+
+    def rewrite(self, node):
+        if isinstance(node, (Proposition, Relation)):
+            return node
+        if isinstance(node, Not):
+            return (yield from self.negation(node))
+        if _is_chain(node):
+            return (yield from self.chain(node))
+        if isinstance(node, BinaryOp):
+            return (yield from self.binary(node))
+        if isinstance(node, _QUANTIFIERS) and isinstance(node.predicate, (Proposition, Relation, Not, BinaryOp, NaryOp)):
+            body = yield node.predicate
+            if isinstance(body, bool) or body is node.predicate:
+                return node
+            if node.type == "FORALL":
+                return self.builder.universal(node.variable, body)
+            return self.builder.existential(node.variable, body)
+        return node
+
+    def negation(self, node):
+        operand = yield node.operand
+        if isinstance(operand, bool) and self.fire("constant_folding", required=True):
+            return not operand
+        if isinstance(operand, Not) and self.fire("double_negation"):
+            return operand.operand
+        if _is_chain(operand) and self.fire("de_morgan"):
+            operands = NaryOp.collect(operand.operator, [operand])
+            negated = [self.builder.negation(child) for child in operands]
+            dual = _DUAL[operand.operator]
+            if isinstance(operand, NaryOp):
+                pushed = self.builder.nary(dual, negated)
+            else:
+                pushed = self._left_deep(dual, negated)
+            return (yield pushed)
+        if operand is node.operand:
+            return node
+        return self.builder.negation(operand)
+
+    def binary(self, node):
+        left = yield node.left
+        right = yield node.right
+        truth = BINARY_TRUTH_FUNCTIONS.get(node.operator)
+        if truth is None:
+            raise ValueError(f"Unknown operator: {node.operator}")
+        result = None
+        if isinstance(left, bool) and isinstance(right, bool):
+            if self.fire("constant_folding", required=True):
+                return truth(left, right)
+        elif isinstance(left, bool):
+            if self.fire("constant_folding", required=True):
+                result = _residual(truth(left, True), truth(left, False), right)
+        elif isinstance(right, bool):
+            if self.fire("constant_folding", required=True):
+                result = _residual(truth(True, right), truth(False, right), left)
+        elif self.key(left) == self.key(right):
+            if self.fire("idempotence"):
+                result = _residual(truth(True, True), truth(False, False), left)
+        elif self.complementary(left, right):
+            if self.fire("complement"):
+                # left = x, right = ¬x, or the other way round: the value depends on left alone.
+                result = _residual(truth(True, False), truth(False, True), left)
+        if result is not None:
+            return (yield result)
+        if left is node.left and right is node.right:
+            return node
+        return self.builder.binary(node.operator, left, right)
+
+    def chain(self, node):
+        operator = node.operator
+        absorbing = operator == "OR"
+        operands, changed = yield from self.flatten(node)
+
+        fired = False
+        if any(operand is absorbing for operand in operands) and self.fire("constant_folding", required=True):
+            return absorbing
+        if any(isinstance(operand, bool) for operand in operands) and self.fire("constant_folding", required=True):
+            operands = [operand for operand in operands if not isinstance(operand, bool)]
+            fired = True
+
+        unique: Dict[Any, Any] = {}
+        kept = []
+        for operand in operands:
+            key = self.key(operand)
+            if key in unique and self.fire("idempotence"):
+                fired = True
+                continue
+            unique.setdefault(key, operand)
+            kept.append((key, operand))
+        operands = [operand for _, operand in kept]
+
+        # Complement: some operand is contradicted by others, e.g. A and ¬A, or
+        # A ∧ B next to ¬A and ¬B (the form De Morgan leaves for ¬(A ∧ B)).
+        dual = _DUAL[operator]
+        literals = {self.literal(operand) for operand in operands}
+        for operand in operands:
+            parts = NaryOp.collect(dual, [operand])
+            if all(self.literal(part, negated=True) in literals for part in parts):
+                if self.fire("complement"):
+                    return absorbing
+                break
+
+        # Subsumption: drop operands whose dual operand set contains another's.
+        sets = [frozenset(self.key(part) for part in NaryOp.collect(dual, [operand])) for operand in operands]
+        survivors = []
+        for index, operand in enumerate(operands):
+            subsumer = None
+            for other, other_set in enumerate(sets):
+                if other != index and other_set <= sets[index] and (
+                    other_set != sets[index] or other < index
+                ):
+                    subsumer = other_set
+                    break
+            if subsumer is not None and self.fire("absorption" if len(subsumer) == 1 else "subsumption"):
+                fired = True
+                continue
+            survivors.append(operand)
+        operands = survivors
+
+        if not fired and not changed:
+            return node
+        if not operands:
+            return not absorbing
+        if len(operands) == 1:
+            return operands[0]
+        if isinstance(node, NaryOp):
+            return self.builder.nary(operator, operands)
+        return self._left_deep(operator, operands)
+
+    def flatten(self, node) -> Tuple[List[Any], bool]:
+        """
+        Returns the simplified operands of a chain and whether any changed.
+
+        Inner chain nodes that were already simplified are spliced in from
+        the memo, and a sub-chain reached a second time is skipped, since its
+        operands are already present. Shared sub-chains are therefore walked
+        once, not once per path to them.
+        """
+        operator = node.operator
+        operands: List[Any] = []
+        changed = False
+        seen = set()
+        # (node, expand): expand is True for chain nodes whose children are pushed.
+        stack = [(node, True)]
+        while stack:
+            current, expand = stack.pop()
+            if expand:
+                children = current.operands if isinstance(current, NaryOp) else (current.left, current.right)
+                stack.extend((child, False) for child in reversed(children))
+                continue
+            if _is_chain(current, operator):
+                if id(current) in seen:
+                    # Merging is always done: expanding it would copy the shared sub-chain.
+                    self.fire("idempotence", required=True)
+                    changed = True
+                    continue
+                seen.add(id(current))
+                entry = self.by_id.get(id(current))
+                simplified = entry[1] if entry is not None else self.by_key.get(self.key(current))
+                if simplified is None:
+                    stack.append((current, True))
+                    continue
+            else:
+                simplified = yield current
+            changed = changed or simplified is not current
+            if _is_chain(simplified, operator):
+                operands.extend(NaryOp.collect(operator, [simplified]))
+            else:
+                operands.append(simplified)
+        return operands, changed
+
+    def _left_deep(self, operator: str, operands: List[Any]):
+        result = operands[0]
+        for operand in operands[1:]:
+            result = self.builder.binary(operator, result, operand)
+        return result
+
+
+class Simplifier:
+    """
+    Simplifies expressions by local rewriting to a fixpoint.
+
+    Attributes:
+        DEFAULT_MAX_STEPS: Default limit on rule applications per call.
+    """
+
+    DEFAULT_MAX_STEPS = 100_000
+
+    @staticmethod
+    def simplify(
+        expression,
+        max_steps: int = DEFAULT_MAX_STEPS,
+        factory: Optional[ExpressionBuilder] = None,
+    ) -> SimplificationResult:
+        """
+        Simplifies an expression at every position until no rule applies.
+
+        Example:
+            >>> result = Simplifier.simplify(FormulaParser.parse("¬¬P ∧ (P ∨ Q)"))
+            >>> result.expression.to_dict()
+            {'type': 'Proposition', 'name': 'P'}
+            >>> result.rewrites
+            {'double_negation': 1, 'absorption': 1}
+
+        Args:
+            expression: The expression to simplify.
+            max_steps: Maximum number of rule applications. When it is
+                       reached, the remaining nodes are rebuilt from their
+                       simplified children without further rewriting, so the
+                       result is still equivalent to the input. Constant
+                       folding is always completed, so no constant is left
+                       inside the result, and may exceed the limit.
+            factory: Builder used for new nodes; pass an ExpressionFactory to
+                     share them.
+
+        Returns:
+            The simplified expression (or True/False) with rule counts.
+            Subexpressions that need no rewriting are reused, not copied.
+
+        Raises:
+            ValueError: If a binary operator is unknown.
+        """
+        run = _Run(factory if factory is not None else _DEFAULT_BUILDER, max_steps)
+        result = run.simplify(expression)
+        return SimplificationResult(
+            expression=result,
+            rewrites=run.rewrites,
+            steps=sum(run.rewrites.values()),
+            complete=run.complete,
+        )
@@ -0,0 +1,87 @@
+"""
+Micro-benchmark for BinaryOp evaluation.
+
+Builds a rule base of implications ``(A_i ∧ B_i ∧ ...) → C_i`` joined by
+conjunctions and evaluates it under a skewed assignment in which most
+antecedents start with a false atom, so the left operand decides almost
+every connective. Short-circuit evaluation (``BinaryOp.evaluate``) is
+compared against eager evaluation of both operands.
+
+Usage:
+    python benchmarks/bench_evaluate.py [--rules 200] [--width 8] [--repeat 5]
+"""
+
+import argparse
+import random
+import sys
+import timeit
+
+from agent_logic.core.operations import And, BinaryOp, Implies, Not, Proposition
+
+_EAGER = {
+    "AND": lambda a, b: a and b,
+    "OR": lambda a, b: a or b,
+    "IMPLIES": lambda a, b: (not a) or b,
+    "IFF": lambda a, b: a == b,
+    "XOR": lambda a, b: a != b,
+    "NAND": lambda a, b: not (a and b),
+    "NOR": lambda a, b: not (a or b),
+}
+
+
+def eager_evaluate(expression, context):
+    """Evaluates both operands of every connective before combining them."""
+    if isinstance(expression, BinaryOp):
+        left = eager_evaluate(expression.left, context)
+        right = eager_evaluate(expression.right, context)
+        return _EAGER[expression.operator](left, right)
+    if isinstance(expression, Not):
+        return not eager_evaluate(expression.operand, context)
+    return expression.evaluate(context)
+
+
+def build_rule_base(rules: int, width: int, seed: int = 0):
+    """Returns a conjunction of ``rules`` implications and a skewed assignment."""
+    rng = random.Random(seed)
+    names = [f"X{i}" for i in range(rules * width)]
+    atoms = [Proposition(name=name) for name in names]
+    context = {name: rng.random() < 0.9 for name in names}
+    rule_base = None
+    for index in range(rules):
+        body = atoms[index * width:(index + 1) * width]
+        # Skew: 90% of the rules have a false first antecedent.
+        context[body[0].name] = rng.random() >= 0.9
+        antecedent = body[0]
+        for atom in body[1:-1]:
+            antecedent = And(antecedent, atom)
+        rule = Implies(antecedent, body[-1])
+        rule_base = rule if rule_base is None else And(rule, rule_base)
+    return rule_base, context
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rules", type=int, default=200)
+    parser.add_argument("--width", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--number", type=int, default=50)
+    args = parser.parse_args()
+
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 4 * args.rules * args.width))
+    rule_base, context = build_rule_base(args.rules, args.width)
+    assert rule_base.evaluate(context) == eager_evaluate(rule_base, context)
+
+    timings = {}
+    for label, function in (
+        ("eager", lambda: eager_evaluate(rule_base, context)),
+        ("short-circuit", lambda: rule_base.evaluate(context)),
+    ):
+        best = min(timeit.repeat(function, repeat=args.repeat, number=args.number))
+        timings[label] = best / args.number
+        print(f"{label:>14}: {timings[label] * 1e6:10.1f} µs per evaluation")
+    print(f"{'speedup':>14}: {timings['eager'] / timings['short-circuit']:10.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
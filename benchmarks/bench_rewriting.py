@@ -0,0 +1,64 @@
+"""
+Micro-benchmark for indexed rule matching.
+
+Rewrites the same expression to negation normal form with the De Morgan and
+double negation rules alone, and again after adding many custom rules whose
+patterns have other head connectives. With the discrimination net the
+unrelated rules are never visited, so both timings should be close; a linear
+scan over the rules would grow with the rule count.
+
+Usage:
+    python benchmarks/bench_rewriting.py [--rules 1000] [--depth 10] [--repeat 5]
+"""
+
+import argparse
+import random
+import sys
+import timeit
+
+from agent_logic.core.operations import BinaryOp, Not, Proposition
+from agent_logic.transformations import STANDARD_RULES, RewriteSystem
+
+NNF_RULES = [rule for rule in STANDARD_RULES if rule[0] in ("double_negation", "de_morgan_and", "de_morgan_or")]
+
+
+def build_expression(depth: int, seed: int = 0):
+    """Returns a random AND/OR/NOT tree over eight atoms."""
+    rng = random.Random(seed)
+    atoms = [Proposition(name=f"X{i}") for i in range(8)]
+
+    def build(level):
+        if level == 0:
+            return rng.choice(atoms)
+        if rng.random() < 0.3:
+            return Not(operand=build(level - 1))
+        return BinaryOp(left=build(level - 1), right=build(level - 1), operator=rng.choice(["AND", "OR"]))
+
+    return build(depth)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rules", type=int, default=1000)
+    parser.add_argument("--depth", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--number", type=int, default=5)
+    args = parser.parse_args()
+
+    expression = build_expression(args.depth)
+    small = RewriteSystem(NNF_RULES)
+    large = RewriteSystem(NNF_RULES)
+    for index in range(args.rules):
+        large.add_rule(f"custom_{index}", f"R{index} ↔ A", "A", variables=["A"])
+    assert small.rewrite(expression).expression == large.rewrite(expression).expression
+
+    timings = {}
+    for label, system in ((f"{len(small)} rules", small), (f"{len(large)} rules", large)):
+        best = min(timeit.repeat(lambda: system.rewrite(expression), repeat=args.repeat, number=args.number))
+        timings[label] = best / args.number
+        print(f"{label:>12}: {timings[label] * 1e3:10.2f} ms per rewrite")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
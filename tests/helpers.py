@@ -0,0 +1,36 @@
+"""Shared helpers for the randomized tests."""
+
+from agent_logic.core.operations import BinaryOp, Not
+
+OPERATORS = ["AND", "OR", "IMPLIES", "IFF", "XOR", "NAND", "NOR"]
+
+
+def random_expression(rng, atoms, depth, operators=OPERATORS, leaf=0.2, negation=0.2, negated_atoms=0.0):
+    """
+    Builds a random expression tree over the given atoms.
+
+    Args:
+        rng: The random.Random instance to draw from.
+        atoms: Leaves to choose from.
+        depth: Maximum depth of the tree.
+        operators: Binary operators to choose from.
+        leaf: Probability of stopping early at a leaf.
+        negation: Probability of negating a compound subexpression.
+        negated_atoms: Probability of negating a leaf.
+
+    Returns:
+        The expression. A zero probability draws no random number, so each
+        setting reproduces the same sequence for a given seed.
+    """
+    if depth == 0 or rng.random() < leaf:
+        atom = rng.choice(atoms)
+        if negated_atoms and rng.random() < negated_atoms:
+            return Not(operand=atom)
+        return atom
+    if negation and rng.random() < negation:
+        return Not(operand=random_expression(rng, atoms, depth - 1, operators, leaf, negation, negated_atoms))
+    return BinaryOp(
+        left=random_expression(rng, atoms, depth - 1, operators, leaf, negation, negated_atoms),
+        right=random_expression(rng, atoms, depth - 1, operators, leaf, negation, negated_atoms),
+        operator=rng.choice(operators),
+    )
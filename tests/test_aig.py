@@ -0,0 +1,124 @@
+import itertools
+import random
+import unittest
+
+from agent_logic.core.operations import AndN, Not, OrN, Proposition
+from agent_logic.evaluation import AIG, BDD, BatchEvaluator, CDCLSolver
+from agent_logic.evaluation.aig import FALSE, TRUE
+from agent_logic.parsing.formula_parser import FormulaParser
+
+from helpers import random_expression
+
+
+def assignments(names):
+    for values in itertools.product([False, True], repeat=len(names)):
+        yield dict(zip(names, values))
+
+
+class TestAIG(unittest.TestCase):
+
+    def setUp(self):
+        self.atoms = [Proposition(name=name) for name in "ABCD"]
+
+    def test_compile_matches_evaluation(self):
+        """Test that compiled literals agree with expression evaluation."""
+        rng = random.Random(47)
+        for _ in range(100):
+            expr = random_expression(rng, self.atoms, 4)
+            aig = AIG()
+            literal = aig.compile(expr)
+            for assignment in assignments("ABCD"):
+                self.assertEqual(aig.evaluate(literal, assignment), expr.evaluate(assignment))
+
+    def test_round_trip(self):
+        """Test conversion back to an expression."""
+        rng = random.Random(7)
+        for _ in range(50):
+            expr = random_expression(rng, self.atoms, 4)
+            aig = AIG()
+            result = aig.to_expression(aig.compile(expr))
+            if isinstance(result, bool):
+                self.assertTrue(all(expr.evaluate(a) == result for a in assignments("ABCD")))
+                continue
+            bdd = BDD()
+            self.assertEqual(bdd.compile(expr), bdd.compile(result))
+        aig = AIG()
+        relation = FormulaParser.parse("Likes(x, y)")
+        self.assertIs(aig.to_expression(aig.compile(relation)), relation)
+
+    def test_structural_hashing(self):
+        """Test that repeated structure shares nodes."""
+        aig = AIG()
+        first = aig.compile(FormulaParser.parse("(A ∧ B) ∨ C"))
+        size = len(aig)
+        second = aig.compile(FormulaParser.parse("C ∨ (B ∧ A)"))
+        self.assertEqual(first, second)
+        self.assertEqual(len(aig), size)
+        self.assertEqual(aig.compile(FormulaParser.parse("¬((A ∧ B) ∨ C)")), first ^ 1)
+
+    def test_constant_propagation_and_local_rewriting(self):
+        """Test constant folding and the two-level rules."""
+        aig = AIG()
+        self.assertEqual(aig.compile(FormulaParser.parse("A ∧ ¬A")), FALSE)
+        self.assertEqual(aig.compile(FormulaParser.parse("A ∨ ¬A")), TRUE)
+        a, b, c = aig.input("A"), aig.input("B"), aig.input("C")
+        ab = aig.and_(a, b)
+        self.assertEqual(aig.and_(ab, a ^ 1), 0)  # contradiction
+        self.assertEqual(aig.and_(ab, b), ab)  # idempotence
+        self.assertEqual(aig.and_(ab ^ 1, a ^ 1), a ^ 1)  # subsumption
+        self.assertEqual(aig.and_(ab ^ 1, a), aig.and_(a, b ^ 1))  # substitution
+        self.assertEqual(aig.and_(ab ^ 1, aig.and_(a, b ^ 1) ^ 1), a ^ 1)  # resolution
+        self.assertEqual(aig.and_(ab, aig.and_(a ^ 1, c)), 0)
+        self.assertEqual(aig.to_expression(0), False)
+        self.assertEqual(aig.num_ands, len(aig) - 1 - 3)
+
+    def test_simulation_matches_batch_evaluation(self):
+        """Test 64-pattern simulation against lane evaluation."""
+        rng = random.Random(3)
+        expr = random_expression(rng, self.atoms, 6)
+        aig = AIG()
+        literal = aig.compile(expr)
+        patterns = aig.random_patterns(words=1, seed=5)
+        vector = aig.simulate([literal], patterns)[0]
+        rows = [{name: bool(patterns.get(name, 0) >> bit & 1) for name in "ABCD"} for bit in range(64)]
+        expected = BatchEvaluator.evaluate_batch(expr, rows)
+        self.assertEqual([bool(vector >> bit & 1) for bit in range(64)], expected)
+
+    def test_equivalence_and_cnf(self):
+        """Test SAT-backed equivalence and the Tseitin encoding."""
+        aig = AIG()
+        xor = aig.compile(FormulaParser.parse("A ⊕ B"))
+        other = aig.compile(FormulaParser.parse("(A ∨ B) ∧ ¬(A ∧ B)"))
+        self.assertTrue(aig.equivalent(xor, other))
+        self.assertFalse(aig.equivalent(xor, aig.compile(FormulaParser.parse("A ∨ B"))))
+        cnf, (root,) = aig.to_cnf([xor])
+        solver = CDCLSolver(cnf.num_vars, cnf.clauses + [[root]])
+        self.assertTrue(solver.solve())
+        model = cnf.decode(solver.model)
+        self.assertNotEqual(model["A"], model["B"])
+
+    def test_fraig_merges_equivalent_nodes(self):
+        """Test functional reduction of structurally different equivalents."""
+        aig = AIG()
+        p, q, r = (Proposition(name=name) for name in "PQR")
+        first = aig.compile(AndN(OrN(p, q), OrN(Not(operand=p), r), OrN(q, r)))
+        second = aig.compile(AndN(OrN(p, q), OrN(Not(operand=p), r)))
+        reduced, (new_first, new_second) = aig.fraig([first, second])
+        self.assertNotEqual(first, second)
+        self.assertEqual(new_first, new_second)
+        for assignment in assignments("PQR"):
+            self.assertEqual(reduced.evaluate(new_first, assignment), aig.evaluate(first, assignment))
+
+    def test_fraig_reduces_cone_to_input(self):
+        """Test that a cone equivalent to an input literal is merged into the input."""
+        aig = AIG()
+        root = aig.compile(FormulaParser.parse("p4 ↔ (p2 ↔ p4)"))
+        self.assertTrue(aig.is_and(root))
+        reduced, (new_root,) = aig.fraig([root])
+        self.assertEqual(new_root, reduced.input("p2"))
+        reduced, (new_root,) = aig.fraig([root ^ 1])
+        self.assertEqual(new_root, reduced.input("p2") ^ 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
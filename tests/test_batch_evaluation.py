@@ -0,0 +1,82 @@
+import itertools
+import random
+import unittest
+
+from agent_logic.core.factory import ExpressionFactory
+from agent_logic.core.functions import Relation
+from agent_logic.core.operations import AndN, NaryOp, Proposition
+from agent_logic.evaluation.evaluator import Evaluator
+from agent_logic.evaluation.vectorized import atom_names
+from agent_logic.parsing.formula_parser import FormulaParser
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class TestBatchEvaluation(unittest.TestCase):
+
+    def setUp(self):
+        self.expr = FormulaParser.parse("((A ⊕ B) → ¬C) ↔ (D ↑ (A ∨ C)) ∧ (B ↓ D)")
+        self.names = ["A", "B", "C", "D"]
+        self.rows = [
+            dict(zip(self.names, values)) for values in itertools.product([False, True], repeat=4)
+        ]
+
+    def test_batch_matches_evaluate(self):
+        """Test that every operator agrees with scalar evaluation."""
+        expected = [self.expr.evaluate(row) for row in self.rows]
+        self.assertEqual(Evaluator.evaluate_batch(self.expr, self.rows), expected)
+        flat = NaryOp.flatten(FormulaParser.parse("A ∧ B ∧ (C ∨ D ∨ ¬A)"))
+        self.assertEqual(
+            Evaluator.evaluate_batch(flat, self.rows), [flat.evaluate(row) for row in self.rows]
+        )
+        self.assertEqual(Evaluator.evaluate_batch(self.expr, []), [])
+
+    def test_batch_missing_values(self):
+        """Test that missing propositions raise and missing relations are False."""
+        with self.assertRaises(ValueError):
+            Evaluator.evaluate_batch(self.expr, [{"A": True}])
+        likes = Relation(name="Likes", parameters=["a", "b"])
+        self.assertEqual(
+            Evaluator.evaluate_batch(likes, [{"Likes(a, b)": True}, {}]), [True, False]
+        )
+        self.assertEqual(atom_names(AndN(likes, Proposition(name="P"))), ["Likes(a, b)", "P"])
+
+    def test_evaluate_many_shares_subexpressions(self):
+        """Test evaluating several formulas over one assignment."""
+        factory = ExpressionFactory()
+        shared = FormulaParser.parse("(A ∧ B) ∨ C", factory=factory)
+        formulas = [
+            FormulaParser.parse("(A ∧ B) ∨ C", factory=factory),
+            FormulaParser.parse("¬((A ∧ B) ∨ C) ∨ D", factory=factory),
+            FormulaParser.parse("A NOR D", factory=factory),
+        ]
+        self.assertIs(formulas[0], shared)
+        rng = random.Random(5)
+        for _ in range(20):
+            assignment = {name: rng.random() < 0.5 for name in self.names}
+            self.assertEqual(
+                Evaluator.evaluate_many(formulas, assignment),
+                [formula.evaluate(assignment) for formula in formulas],
+            )
+        with self.assertRaises(ValueError):
+            Evaluator.evaluate_many(formulas, {"A": True})
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_numpy_array_input(self):
+        """Test 2-D array input with default and explicit column order."""
+        array = numpy.array([[row[name] for name in self.names] for row in self.rows])
+        expected = numpy.array([self.expr.evaluate(row) for row in self.rows])
+        result = Evaluator.evaluate_batch(self.expr, array)
+        self.assertEqual(result.dtype, bool)
+        self.assertTrue((result == expected).all())
+        reordered = Evaluator.evaluate_batch(self.expr, array[:, ::-1], variables=self.names[::-1])
+        self.assertTrue((reordered == expected).all())
+        with self.assertRaises(ValueError):
+            Evaluator.evaluate_batch(self.expr, array[:, :2])
+
+
+if __name__ == "__main__":
+    unittest.main()
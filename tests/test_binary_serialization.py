@@ -0,0 +1,105 @@
+import io
+import unittest
+
+from agent_logic.core.functions import Relation
+from agent_logic.core.operations import BinaryOp, Not, Proposition
+from agent_logic.core.predicates import Predicate
+from agent_logic.core.quantifiers import UniversalQuantifier
+from agent_logic.parsing.formula_parser import FormulaParser
+from agent_logic.proofs.proof_system import Proof, ProofStep
+from agent_logic.serialization.binary import BinaryReader, BinarySerializer, BinaryWriter
+
+
+class TestBinarySerialization(unittest.TestCase):
+
+    def setUp(self):
+        self.p = Proposition(name="P")
+        self.q = Proposition(name="Q")
+
+    def test_round_trip(self):
+        """Test that every node type survives encoding."""
+        formulas = [
+            "P",
+            "(P ∧ Q) → ¬(R ∨ P)",
+            "P ↔ Q",
+            "∀x Likes(x, pizza) → Owns(x, pizza)",
+        ]
+        for text in formulas:
+            expr = FormulaParser.parse(text)
+            self.assertEqual(BinarySerializer.loads(BinarySerializer.dumps(expr)), expr)
+        unicode = Relation(name="Ünïcode", parameters=["ß"])
+        self.assertEqual(BinarySerializer.loads(BinarySerializer.dumps(unicode)), unicode)
+
+    def test_shared_subtrees_are_referenced(self):
+        """Test that equal subtrees are stored once and decoded as shared nodes."""
+        big = FormulaParser.parse(" ∧ ".join(f"(A{i} ∨ ¬B{i})" for i in range(20)))
+        copy = FormulaParser.parse(" ∧ ".join(f"(A{i} ∨ ¬B{i})" for i in range(20)))
+        single = BinarySerializer.dumps(big)
+        pair = BinarySerializer.dumps(BinaryOp(left=big, right=copy, operator="OR"))
+        self.assertLess(len(pair), len(single) + 8)
+        decoded = BinarySerializer.loads(pair)
+        self.assertIs(decoded.left, decoded.right)
+        self.assertEqual(decoded.right, copy)
+
+    def test_many_and_streaming(self):
+        """Test multi-record streams through the writer and reader."""
+        exprs = [self.p, Not(operand=self.p), Relation(name="R", parameters=["a", "b"])]
+        self.assertEqual(BinarySerializer.loads_many(BinarySerializer.dumps_many(exprs)), exprs)
+        buffer = io.BytesIO()
+        writer = BinaryWriter(buffer)
+        for expr in exprs:
+            writer.write_expression(expr)
+        with self.assertRaises(ValueError):
+            writer.write_expression(UniversalQuantifier(
+                variable="x", predicate=Predicate(name="Z", terms=[])
+            ))
+        writer.write_expression(BinaryOp(left=self.q, right=self.p, operator="IMPLIES"))
+        buffer.seek(0)
+        decoded = list(BinaryReader(buffer))
+        self.assertEqual(decoded[:3], exprs)
+        self.assertEqual(decoded[3], BinaryOp(left=self.q, right=self.p, operator="IMPLIES"))
+
+    def test_proof_round_trip(self):
+        """Test proof encoding, including dependencies and justifications."""
+        steps = [
+            ProofStep(step_number=1, statement=self.p, justification="Given"),
+            ProofStep(
+                step_number=2,
+                statement=BinaryOp(left=self.p, right=self.q, operator="IMPLIES"),
+                justification="Given",
+            ),
+            ProofStep(
+                step_number=3, statement=self.q, justification="Modus Ponens", dependencies=[1, 2]
+            ),
+            ProofStep(
+                step_number=4,
+                statement=Not(operand=Not(operand=self.q)),
+                justification="Double Negation",
+                dependencies=[],
+            ),
+        ]
+        proof = Proof(steps=steps)
+        decoded = BinarySerializer.loads_proof(BinarySerializer.dumps_proof(proof))
+        self.assertEqual(decoded.steps, proof.steps)
+        self.assertEqual(decoded.steps[3].dependencies, [])
+        self.assertIsNone(decoded.steps[0].dependencies)
+
+    def test_invalid_data(self):
+        """Test header, kind and truncation errors."""
+        data = BinarySerializer.dumps(self.p)
+        with self.assertRaises(ValueError):
+            BinarySerializer.loads(b"JUNK" + data[4:])
+        with self.assertRaises(ValueError):
+            BinarySerializer.loads(data[:4] + b"\x63" + data[5:])
+        with self.assertRaises(ValueError):
+            BinarySerializer.loads_proof(data)
+        with self.assertRaises(ValueError):
+            BinarySerializer.loads(data[:-1])
+        with self.assertRaises(ValueError):
+            BinaryWriter(io.BytesIO()).write_step(
+                ProofStep(step_number=1, statement=self.p, justification="Given")
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
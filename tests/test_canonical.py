@@ -0,0 +1,125 @@
+import random
+import unittest
+
+from agent_logic.core.factory import ExpressionFactory
+from agent_logic.core.functions import Relation
+from agent_logic.core.operations import BinaryOp, NaryOp, Not, Proposition
+from agent_logic.evaluation.evaluator import Evaluator
+from agent_logic.parsing.formula_parser import FormulaParser
+from agent_logic.transformations.canonical import Canonicalizer, Fingerprint
+
+from helpers import random_expression
+
+
+class TestCanonical(unittest.TestCase):
+
+    def test_fingerprint_is_structural(self):
+        """Test that equal structures share digests and different ones do not."""
+        first = FormulaParser.parse("(P ∧ Q) → Likes(x, y)")
+        second = FormulaParser.parse("(P ∧ Q) → Likes(x, y)")
+        self.assertEqual(len(Fingerprint.of(first)), 16)
+        self.assertEqual(Fingerprint.of(first), Fingerprint.of(second))
+        self.assertNotEqual(Fingerprint.of(first), Fingerprint.of(FormulaParser.parse("(Q ∧ P) → Likes(x, y)")))
+        self.assertNotEqual(
+            Fingerprint.of(Relation(name="R", parameters=["ab"])),
+            Fingerprint.of(Relation(name="R", parameters=["a", "b"])),
+        )
+        # A known digest guards against accidental changes to the encoding.
+        self.assertEqual(Fingerprint.hex(Proposition(name="P")), "bb1f8bad531423f5eb886d1e9f040415")
+
+    def test_cache_is_invalidated_on_mutation(self):
+        """Test that mutating or copying a node drops its cached digest."""
+        p = Proposition(name="P")
+        before = Fingerprint.of(p)
+        self.assertEqual(p, Proposition(name="P"))
+        p.name = "Q"
+        self.assertNotEqual(Fingerprint.of(p), before)
+        copy = p.model_copy(update={"name": "P"})
+        self.assertEqual(Fingerprint.of(copy), before)
+
+    def test_trivial_variants_share_canonical_form(self):
+        """Test flattening, ordering, deduplication and double negation."""
+        variants = [
+            "P ∧ (Q ∧ (R ∨ S))",
+            "(Q ∧ P) ∧ ¬¬(S ∨ R)",
+            "Q ∧ (S ∨ R) ∧ P ∧ Q",
+        ]
+        canonical = [Canonicalizer.canonicalize(FormulaParser.parse(text)) for text in variants]
+        self.assertTrue(all(form == canonical[0] for form in canonical))
+        keys = {Canonicalizer.fingerprint(FormulaParser.parse(text)) for text in variants}
+        self.assertEqual(len(keys), 1)
+        self.assertEqual(canonical[0].left.left, Proposition(name="P"))
+
+    def test_iff_and_implication(self):
+        """Test that IFF operands are ordered while implication is untouched."""
+        self.assertEqual(
+            Canonicalizer.fingerprint(FormulaParser.parse("Q ↔ P")),
+            Canonicalizer.fingerprint(FormulaParser.parse("P ↔ Q")),
+        )
+        self.assertNotEqual(
+            Canonicalizer.fingerprint(FormulaParser.parse("Q → P")),
+            Canonicalizer.fingerprint(FormulaParser.parse("P → Q")),
+        )
+        self.assertEqual(
+            Canonicalizer.canonicalize(FormulaParser.parse("¬¬¬P → Q")),
+            BinaryOp(left=Not(operand=Proposition(name="P")), right=Proposition(name="Q"), operator="IMPLIES"),
+        )
+
+    def test_canonical_form_is_equivalent(self):
+        """Test that canonicalization preserves meaning and is idempotent."""
+        factory = ExpressionFactory()
+        for text in ["(A ∨ ¬B) ∧ (C ↔ A) ∧ ¬¬(B ∨ A ∨ B)", "∀x Likes(x, a) ∨ Likes(x, a)"]:
+            expression = FormulaParser.parse(text)
+            canonical = Canonicalizer.canonicalize(expression, factory)
+            self.assertIs(Canonicalizer.canonicalize(canonical, factory), canonical)
+            if not text.startswith("∀"):
+                self.assertTrue(Evaluator.are_equivalent(expression, canonical))
+
+    def test_canonical_input_is_returned_unchanged(self):
+        """Test that canonicalization reuses nodes already in canonical form."""
+        for text in ["(A ∨ ¬B) ∧ (C ↔ A) ∧ ¬¬(B ∨ A ∨ B)", "(P → Q) ↔ (R ∧ ¬S)"]:
+            canonical = Canonicalizer.canonicalize(FormulaParser.parse(text))
+            self.assertIs(Canonicalizer.canonicalize(canonical), canonical)
+        untouched = FormulaParser.parse("(A ∧ B) ∧ C")
+        expression = BinaryOp(left=untouched, right=FormulaParser.parse("¬¬D"), operator="IMPLIES")
+        self.assertIs(Canonicalizer.canonicalize(expression).left, untouched)
+
+    def test_canonicalization_is_idempotent(self):
+        """Test that canonical forms are fixpoints, also when chains collapse under a negation."""
+        for text in ["¬(¬P ∧ ¬P)", "¬(¬(Q ∨ R) ∨ ¬(R ∨ Q))", "¬¬(¬P ∧ (¬P ∧ ¬P))"]:
+            canonical = Canonicalizer.canonicalize(FormulaParser.parse(text))
+            self.assertNotIsInstance(canonical.operand if isinstance(canonical, Not) else canonical, Not, text)
+            self.assertIs(Canonicalizer.canonicalize(canonical), canonical, text)
+        collapsed = FormulaParser.parse("¬(¬P ∧ ¬P)")
+        self.assertEqual(Canonicalizer.fingerprint(collapsed), Fingerprint.of(Proposition(name="P")))
+
+        rng = random.Random(35)
+        atoms = [Proposition(name=name) for name in "ABC"]
+        for _ in range(300):
+            expression = random_expression(rng, atoms, 4, operators=["AND", "OR", "IFF"], negation=0.4)
+            canonical = Canonicalizer.canonicalize(expression)
+            self.assertIs(Canonicalizer.canonicalize(canonical), canonical, expression)
+            self.assertTrue(Evaluator.are_equivalent(expression, canonical))
+
+    def test_shared_chains_canonicalized_in_dag_size(self):
+        """Test that chains sharing sub-chains are not walked as trees."""
+        for operator in ("AND", "OR"):
+            node = Proposition(name="P")
+            for _ in range(60):
+                node = BinaryOp(left=node, right=node, operator=operator)
+            self.assertEqual(Canonicalizer.canonicalize(node), Proposition(name="P"))
+
+            # Each level is also canonicalized on its own below a negation.
+            node = Proposition(name="P")
+            for _ in range(40):
+                node = BinaryOp(
+                    left=BinaryOp(left=node, right=Not(operand=node), operator=operator),
+                    right=node,
+                    operator=operator,
+                )
+            canonical = Canonicalizer.canonicalize(node)
+            self.assertEqual(len(NaryOp.collect(operator, [canonical])), 41)
+
+
+if __name__ == "__main__":
+    unittest.main()
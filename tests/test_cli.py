@@ -5,7 +5,7 @@ import unittest
 from io import StringIO
 from unittest.mock import patch
 
-from agent_logic.cli import main, validate_proof
+from agent_logic.cli import convert_proof, main, validate_proof
 from agent_logic.core.operations import BinaryOp, Proposition
 from agent_logic.proofs.proof_system import Proof, ProofStep
 
@@ -92,6 +92,32 @@ class TestCLI(unittest.TestCase):
             # Clean up
             os.unlink(temp_file_path)
 
+    def test_convert_and_validate_dag_layout(self):
+        """Test converting a proof to the shared layout and validating it."""
+        p = Proposition(name="P")
+        q = Proposition(name="Q")
+        proof = Proof(steps=[
+            ProofStep(step_number=1, statement=p, justification="Given"),
+            ProofStep(
+                step_number=2,
+                statement=BinaryOp(left=p, right=q, operator="IMPLIES"),
+                justification="Given",
+            ),
+            ProofStep(
+                step_number=3, statement=q, justification="Modus Ponens", dependencies=[1, 2]
+            ),
+        ])
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, "proof.json")
+            target = os.path.join(directory, "proof.dag.json")
+            with open(source, "w") as f:
+                json.dump(proof.to_dict(), f)
+            with patch("builtins.print"):
+                self.assertEqual(convert_proof(source, target, layout="dag"), 0)
+                with open(target) as f:
+                    self.assertIn("nodes", json.load(f))
+                self.assertEqual(validate_proof(target), 0)
+
     def test_validate_proof_error(self):
         """Test error handling with a non-existent file."""
         # Use a path that doesn't exist
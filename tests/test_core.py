@@ -1,7 +1,12 @@
+import itertools
+import random
 import unittest
 
 from agent_logic.core.base import LogicalExpression
-from agent_logic.core.operations import BinaryOp, Not, Proposition
+from agent_logic.core.functions import Relation
+from agent_logic.core.operations import BinaryOp, Nand, Nor, Not, Proposition, Xor
+from agent_logic.core.quantifiers import UniversalQuantifier
+from agent_logic.parsing.ast_parser import ASTParser
 
 
 class TestCoreLogicalExpressions(unittest.TestCase):
@@ -39,6 +44,37 @@ class TestCoreLogicalExpressions(unittest.TestCase):
         self.assertFalse(implies_expr.evaluate(context))
         self.assertFalse(iff_expr.evaluate(context))
 
+    def test_extended_binary_operators(self):
+        """Test XOR, NAND and NOR against their truth tables."""
+        p = Proposition(name="P")
+        q = Proposition(name="Q")
+        expected = {
+            "XOR": lambda a, b: a != b,
+            "NAND": lambda a, b: not (a and b),
+            "NOR": lambda a, b: not (a or b),
+        }
+        for operator, truth in expected.items():
+            expr = BinaryOp(left=p, right=q, operator=operator)
+            for a in (False, True):
+                for b in (False, True):
+                    self.assertEqual(expr.evaluate({"P": a, "Q": b}), truth(a, b))
+        self.assertTrue(Xor(p, q).evaluate({"P": True, "Q": False}))
+        self.assertFalse(Nand(p, q).evaluate({"P": True, "Q": True}))
+        self.assertTrue(Nor(p, q).evaluate({"P": False, "Q": False}))
+
+    def test_short_circuit_evaluation(self):
+        """Test that the right operand is skipped when the left one decides."""
+        p = Proposition(name="P")
+        missing = Proposition(name="Missing")
+        decided = [("AND", False), ("OR", True), ("IMPLIES", False), ("NAND", False), ("NOR", True)]
+        for operator, left_value in decided:
+            expr = BinaryOp(left=p, right=missing, operator=operator)
+            # Evaluating "Missing" would raise, so success proves it was skipped.
+            expr.evaluate({"P": left_value})
+        for operator in ("IFF", "XOR"):
+            with self.assertRaises(ValueError):
+                BinaryOp(left=p, right=missing, operator=operator).evaluate({"P": True})
+
     def test_evaluate_missing_variable(self):
         """Test error handling when a variable is missing from the context."""
         p = Proposition(name="P")
@@ -223,3 +259,80 @@ class TestCoreLogicalExpressions(unittest.TestCase):
         # Not a dictionary
         with self.assertRaises(ValueError):
             LogicalExpression.from_dict("not a dict")
+
+        # Malformed trusted input
+        with self.assertRaises(ValueError):
+            LogicalExpression.from_dict({"type": "Not"}, trusted=True)
+        with self.assertRaises(ValueError):
+            LogicalExpression.from_dicts([{"type": "UnknownType"}], trusted=True)
+
+    def test_from_dict_trusted(self):
+        """Test that the trusted fast path matches validated deserialization."""
+        expr = BinaryOp(
+            left=Not(operand=Relation(name="Likes", parameters=["x", "y"])),
+            right=Proposition(name="Q"),
+            operator="IFF",
+        )
+        data = expr.to_dict()
+        self.assertEqual(LogicalExpression.from_dict(data), expr)
+        self.assertEqual(LogicalExpression.from_dict(data, trusted=True), expr)
+        self.assertEqual(ASTParser.parse_dict(data), expr)
+
+    def test_bulk_dict_conversion(self):
+        """Test from_dicts/to_dicts round trips."""
+        exprs = [Proposition(name="P"), Not(operand=Proposition(name="Q"))]
+        data = LogicalExpression.to_dicts(exprs)
+        self.assertEqual(data, [e.to_dict() for e in exprs])
+        self.assertEqual(LogicalExpression.from_dicts(data), exprs)
+        self.assertEqual(LogicalExpression.from_dicts(data, trusted=True), exprs)
+
+    def test_quantifier_round_trip(self):
+        """Test that quantifiers over expressions deserialize through the registry."""
+        expr = UniversalQuantifier(
+            variable="x", predicate=Relation(name="Mortal", parameters=["x"])
+        )
+        data = expr.to_dict()
+        self.assertEqual(LogicalExpression.from_dict(data), expr)
+        self.assertEqual(LogicalExpression.from_dict(data, trusted=True), expr)
+        data["type"] = "UniversalQuantifier"
+        self.assertEqual(ASTParser.parse_dict(data), expr)
+
+    def test_partial_evaluate_folds_constants(self):
+        """Test residual formulas and subtree sharing under partial assignments."""
+        p, q, r, s = (Proposition(name=name) for name in "PQRS")
+        consequent = BinaryOp(left=r, right=Not(operand=s), operator="OR")
+        expr = BinaryOp(left=BinaryOp(left=p, right=q, operator="AND"), right=consequent, operator="IMPLIES")
+        residual = expr.partial_evaluate({"P": True})
+        self.assertEqual(residual, BinaryOp(left=q, right=consequent, operator="IMPLIES"))
+        self.assertIs(residual.right, consequent)
+        self.assertIs(expr.partial_evaluate({"P": False}), True)
+        self.assertEqual(expr.partial_evaluate({"R": False, "S": True}), Not(operand=expr.left))
+        self.assertIs(expr.partial_evaluate({"X": True}), expr)
+        self.assertEqual(Not(operand=Not(operand=p)).partial_evaluate({"P": False}), False)
+        self.assertEqual(Relation(name="Likes", parameters=["a", "b"]).partial_evaluate({"Likes(a, b)": True}), True)
+
+    def test_partial_evaluate_agrees_with_evaluate(self):
+        """Test that residuals evaluate like the original on every completion."""
+        names = ["A", "B", "C", "D"]
+        atoms = [Proposition(name=name) for name in names]
+        operators = ["AND", "OR", "IMPLIES", "IFF", "XOR", "NAND", "NOR"]
+        rng = random.Random(3)
+
+        def build(depth):
+            if depth == 0 or rng.random() < 0.2:
+                atom = rng.choice(atoms)
+                return Not(operand=atom) if rng.random() < 0.3 else atom
+            return BinaryOp(left=build(depth - 1), right=build(depth - 1), operator=rng.choice(operators))
+
+        for _ in range(100):
+            expr = build(4)
+            known = {name: rng.random() < 0.5 for name in rng.sample(names, 2)}
+            residual = expr.partial_evaluate(known)
+            if not isinstance(residual, bool):
+                self.assertTrue(set(residual.variables()).isdisjoint(known))
+            for values in itertools.product([False, True], repeat=len(names)):
+                context = dict(zip(names, values))
+                context.update(known)
+                expected = expr.evaluate(context)
+                actual = residual if isinstance(residual, bool) else residual.evaluate(context)
+                self.assertEqual(actual, expected)
@@ -0,0 +1,76 @@
+import json
+import unittest
+
+from agent_logic.core.base import LogicalExpression
+from agent_logic.core.functions import Relation
+from agent_logic.core.operations import BinaryOp, Not, Proposition
+from agent_logic.core.quantifiers import UniversalQuantifier
+from agent_logic.proofs.proof_system import Proof, ProofStep
+from agent_logic.serialization.dag_json import ExpressionTable
+
+
+class TestDagJson(unittest.TestCase):
+
+    def setUp(self):
+        self.p = Proposition(name="P")
+        self.q = Proposition(name="Q")
+        self.big = BinaryOp(
+            left=BinaryOp(left=self.p, right=Not(operand=self.q), operator="OR"),
+            right=Relation(name="Likes", parameters=["x", "y"]),
+            operator="AND",
+        )
+
+    def test_table_deduplicates_structurally(self):
+        """Test that equal subexpressions share one entry."""
+        table = ExpressionTable()
+        first = table.add(self.big)
+        second = table.add(LogicalExpression.from_dict(self.big.to_dict()))
+        self.assertEqual(first, second)
+        self.assertEqual(len(table.nodes), 6)
+        quantified = UniversalQuantifier(variable="x", predicate=self.big)
+        root = table.add(quantified)
+        decoded = ExpressionTable.decode(json.loads(json.dumps(table.nodes)))
+        self.assertEqual(decoded[root], quantified)
+        self.assertIs(decoded[root].predicate, decoded[first])
+
+    def test_decode_rejects_bad_tables(self):
+        """Test validation of references, types and fields."""
+        with self.assertRaises(ValueError):
+            ExpressionTable.decode([{"type": "Not", "operand": 0}])
+        with self.assertRaises(ValueError):
+            ExpressionTable.decode([{"type": "Mystery"}])
+        with self.assertRaises(ValueError):
+            ExpressionTable.decode([
+                {"type": "Proposition", "name": "P"},
+                {"type": "BinaryOp", "operator": "NOPE", "left": 0, "right": 0},
+            ])
+
+    def test_shared_proof_layout(self):
+        """Test that a proof repeating a large antecedent stores it once."""
+        antecedent = self.big
+        for index in range(10):
+            antecedent = BinaryOp(
+                left=antecedent, right=Proposition(name=f"A{index}"), operator="AND"
+            )
+        steps = [ProofStep(step_number=1, statement=antecedent, justification="Given")]
+        for number in range(2, 40):
+            steps.append(ProofStep(
+                step_number=number,
+                statement=BinaryOp(left=antecedent, right=Proposition(name=f"R{number}"), operator="OR"),
+                justification="Addition",
+                dependencies=[1],
+            ))
+        proof = Proof(steps=steps)
+        shared = proof.to_dict(shared=True)
+        self.assertEqual(shared["format"], "dag")
+        self.assertLess(len(json.dumps(shared)), len(json.dumps(proof.to_dict())) / 3)
+        for trusted in (False, True):
+            restored = Proof.from_dict(json.loads(json.dumps(shared)), trusted=trusted)
+            self.assertEqual(restored.steps, proof.steps)
+        shared["steps"][0]["statement"] = 999
+        with self.assertRaises(ValueError):
+            Proof.from_dict(shared)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+import logging
+import unittest
+
+from agent_logic.core.functions import Relation
+from agent_logic.core.operations import BinaryOp, Not, Proposition
+from agent_logic.core.quantifiers import UniversalQuantifier
+from agent_logic.proofs.datalog import DatalogEngine, DatalogRule, _CompiledRule
+from agent_logic.utils.logger import set_global_log_level
+
+
+def rel(name, *args):
+    return Relation(name=name, parameters=list(args))
+
+
+def forall(variables, body):
+    for variable in reversed(variables):
+        body = UniversalQuantifier(variable=variable, predicate=body)
+    return body
+
+
+def implies(body, head):
+    return BinaryOp(left=body, right=head, operator="IMPLIES")
+
+
+def conj(left, right):
+    return BinaryOp(left=left, right=right, operator="AND")
+
+
+class TestDatalogEngine(unittest.TestCase):
+
+    def setUp(self):
+        set_global_log_level(logging.ERROR)
+        self.engine = DatalogEngine(
+            [
+                rel("Parent", "alice", "bob"),
+                rel("Parent", "bob", "carol"),
+                rel("Parent", "carol", "dave"),
+                forall(["x", "y"], implies(rel("Parent", "x", "y"), rel("Ancestor", "x", "y"))),
+                forall(
+                    ["x", "y", "z"],
+                    implies(
+                        conj(rel("Parent", "x", "y"), rel("Ancestor", "y", "z")),
+                        rel("Ancestor", "x", "z"),
+                    ),
+                ),
+            ]
+        )
+
+    def test_transitive_closure(self):
+        """Test that recursive rules reach the full transitive closure."""
+        model = self.engine.evaluate()
+        self.assertEqual(len(model["Ancestor"]), 6)
+        self.assertTrue(self.engine.entails(rel("Ancestor", "alice", "dave")))
+        self.assertFalse(self.engine.entails(rel("Ancestor", "dave", "alice")))
+
+    def test_query_bindings(self):
+        """Test single-atom queries with free variables."""
+        answers = self.engine.query(rel("Ancestor", "alice", "z"), variables=["z"])
+        self.assertEqual([a["z"] for a in answers], ["bob", "carol", "dave"])
+
+    def test_proof_from_derivation_is_valid(self):
+        """Test that derivations convert into proofs the validator accepts."""
+        proof = self.engine.to_proof(rel("Ancestor", "alice", "dave"))
+        self.assertIsNotNone(proof)
+        self.assertEqual(proof.steps[-1].statement, rel("Ancestor", "alice", "dave"))
+        self.assertTrue(proof.is_valid())
+        self.assertIsNone(self.engine.to_proof(rel("Ancestor", "dave", "alice")))
+
+    def test_explain(self):
+        """Test the provenance record of a derived fact."""
+        derivation = self.engine.explain(rel("Ancestor", "bob", "carol"))
+        self.assertEqual(derivation.premises, [rel("Parent", "bob", "carol")])
+        self.assertIsNone(self.engine.explain(rel("Parent", "alice", "bob")).rule)
+
+    def test_stratified_negation(self):
+        """Test negation over a predicate computed in a lower stratum."""
+        self.engine.add(rel("Person", "alice"))
+        self.engine.add(rel("Person", "erin"))
+        self.engine.add(
+            forall(
+                ["x", "y"],
+                implies(rel("Parent", "x", "y"), rel("HasChild", "x")),
+            )
+        )
+        self.engine.add(
+            forall(
+                ["x"],
+                implies(
+                    conj(rel("Person", "x"), Not(operand=rel("HasChild", "x"))),
+                    rel("Childless", "x"),
+                ),
+            )
+        )
+        self.assertEqual(len(self.engine.stratify()), 2)
+        self.assertTrue(self.engine.entails(rel("Childless", "erin")))
+        self.assertFalse(self.engine.entails(rel("Childless", "alice")))
+        self.assertTrue(self.engine.to_proof(rel("Childless", "erin")).is_valid())
+
+    def test_unstratifiable_program(self):
+        """Test that negative cycles are rejected."""
+        engine = DatalogEngine(
+            [
+                rel("Node", "a"),
+                forall(
+                    ["x"],
+                    implies(conj(rel("Node", "x"), Not(operand=rel("Q", "x"))), rel("P", "x")),
+                ),
+                forall(
+                    ["x"],
+                    implies(conj(rel("Node", "x"), Not(operand=rel("P", "x"))), rel("Q", "x")),
+                ),
+            ]
+        )
+        with self.assertRaises(ValueError):
+            engine.evaluate()
+
+    def test_unsafe_rule(self):
+        """Test that head variables must be bound by the body."""
+        with self.assertRaises(ValueError):
+            DatalogRule.from_expression(
+                forall(["x", "y"], implies(rel("Node", "x"), rel("Edge", "x", "y")))
+            )
+
+    def test_propositional_horn_clauses(self):
+        """Test that propositions act as zero-arity relations."""
+        p, q, r = Proposition(name="P"), Proposition(name="Q"), Proposition(name="R")
+        engine = DatalogEngine([p, q, implies(conj(p, q), r)])
+        self.assertTrue(engine.entails(r))
+        proof = engine.to_proof(r)
+        self.assertIsInstance(proof.steps[-1].statement, Proposition)
+        self.assertTrue(proof.is_valid())
+
+    def test_rounds_fire_only_affected_rules(self):
+        """Test that later rounds only fire rules whose body grew."""
+        length = 300
+        atoms = [Proposition(name=f"P{i}") for i in range(length + 1)]
+        engine = DatalogEngine([atoms[0]] + [implies(atoms[i], atoms[i + 1]) for i in range(length)])
+        fired = []
+        original = _CompiledRule.fire
+
+        def counting_fire(plan, relations, delta):
+            fired.append(plan.head_name)
+            return original(plan, relations, delta)
+
+        _CompiledRule.fire = counting_fire
+        try:
+            self.assertTrue(engine.entails(atoms[-1]))
+        finally:
+            _CompiledRule.fire = original
+        # Every rule fires in the first round, then one rule per round.
+        self.assertEqual(len(fired), 2 * length - 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
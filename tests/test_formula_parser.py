@@ -0,0 +1,114 @@
+import unittest
+
+from agent_logic.core.factory import ExpressionFactory
+from agent_logic.core.functions import Relation
+from agent_logic.core.operations import BinaryOp, Not, Proposition
+from agent_logic.core.quantifiers import ExistentialQuantifier, UniversalQuantifier
+from agent_logic.parsing.formula_parser import FormulaParser, FormulaSyntaxError
+from agent_logic.parsing.token_parser import Tokenizer
+
+
+class TestFormulaParser(unittest.TestCase):
+
+    def setUp(self):
+        self.p = Proposition(name="P")
+        self.q = Proposition(name="Q")
+        self.r = Proposition(name="R")
+
+    def test_unicode_operators(self):
+        """Test parsing of Unicode connectives with precedence."""
+        expr = FormulaParser.parse("(P ∧ Q) → ¬R")
+        expected = BinaryOp(
+            left=BinaryOp(left=self.p, right=self.q, operator="AND"),
+            right=Not(operand=self.r),
+            operator="IMPLIES",
+        )
+        self.assertEqual(expr, expected)
+
+    def test_keyword_operators_and_precedence(self):
+        """Test that AND binds tighter than OR and NOT tighter than AND."""
+        expr = FormulaParser.parse("P AND NOT Q OR R")
+        expected = BinaryOp(
+            left=BinaryOp(left=self.p, right=Not(operand=self.q), operator="AND"),
+            right=self.r,
+            operator="OR",
+        )
+        self.assertEqual(expr, expected)
+        self.assertEqual(FormulaParser.parse("P & !Q | R"), expected)
+
+    def test_associativity(self):
+        """Test right-associative implication and left-associative conjunction."""
+        implication = FormulaParser.parse("P -> Q -> R")
+        self.assertEqual(implication.right.operator, "IMPLIES")
+        conjunction = FormulaParser.parse("P ∧ Q ∧ R")
+        self.assertEqual(conjunction.left.operator, "AND")
+        self.assertEqual(conjunction.right, self.r)
+
+    def test_extended_operators(self):
+        """Test XOR, NAND and NOR in symbol and keyword form."""
+        self.assertEqual(FormulaParser.parse("P ⊕ Q"), BinaryOp(left=self.p, right=self.q, operator="XOR"))
+        self.assertEqual(FormulaParser.parse("P NAND Q"), FormulaParser.parse("P ↑ Q"))
+        nor = FormulaParser.parse("P ∧ Q ↓ R")
+        self.assertEqual(nor.operator, "NOR")
+        self.assertEqual(nor.left.operator, "AND")
+        self.assertEqual([kind for kind, _ in Tokenizer.tokenize("P XOR Q ↓ R")], ["VAR", "XOR", "VAR", "NOR", "VAR"])
+
+    def test_relations_and_quantifiers(self):
+        """Test parsing of relations inside nested quantifiers."""
+        rule = FormulaParser.parse("∀x∀y (Parent(x, y) → Ancestor(x, y))")
+        self.assertIsInstance(rule, UniversalQuantifier)
+        self.assertEqual(rule.variable, "x")
+        self.assertEqual(rule.predicate.variable, "y")
+        body = rule.predicate.predicate
+        self.assertEqual(body.left, Relation(name="Parent", parameters=["x", "y"]))
+        self.assertIsInstance(FormulaParser.parse("EXISTS x. Likes(x, pizza)"), ExistentialQuantifier)
+
+    def test_factory_shares_subtrees(self):
+        """Test that a hash-consing factory returns shared nodes."""
+        factory = ExpressionFactory()
+        expr = FormulaParser.parse("(P ∧ Q) ∨ (P ∧ Q)", factory)
+        self.assertIs(expr.left, expr.right)
+        self.assertIs(FormulaParser.parse("P ∧ Q", factory), expr.left)
+
+    def test_syntax_errors(self):
+        """Test error reporting with character positions."""
+        for text, position in [("P Q", 2), ("(P ∧ Q", 6), ("P $ Q", 2), ("", 0)]:
+            with self.assertRaises(FormulaSyntaxError) as ctx:
+                FormulaParser.parse(text)
+            self.assertEqual(ctx.exception.position, position)
+        with self.assertRaises(ValueError):
+            FormulaParser.parse("P ∧ ∀x Q(x)")
+
+    def test_deep_nesting(self):
+        """Test that deeply nested input parses or fails with a syntax error."""
+        depth = 5000
+        expr = FormulaParser.parse("(" * depth + "P" + ")" * depth)
+        self.assertEqual(expr.to_dict(), {"type": "Proposition", "name": "P"})
+
+        expr = FormulaParser.parse("¬" * depth + "P", ExpressionFactory())
+        for _ in range(depth):
+            self.assertIsInstance(expr, Not)
+            expr = expr.operand
+        self.assertEqual(expr.name, "P")
+
+        expr = FormulaParser.parse(" → ".join(f"P{i}" for i in range(depth)))
+        for i in range(depth - 1):
+            self.assertEqual(expr.left.name, f"P{i}")
+            expr = expr.right
+        self.assertEqual(expr.name, f"P{depth - 1}")
+
+        text = "(" * depth + "P" + ")" * (depth - 1)
+        with self.assertRaises(FormulaSyntaxError) as ctx:
+            FormulaParser.parse(text)
+        self.assertEqual(ctx.exception.position, len(text))
+        self.assertFalse(Tokenizer.validate_syntax(Tokenizer.tokenize(text)))
+
+    def test_tokenizer_validation_uses_grammar(self):
+        """Test that validate_syntax accepts exactly the parseable token streams."""
+        self.assertTrue(Tokenizer.validate_syntax(Tokenizer.tokenize("¬¬P ∧ (Q ∨ R)")))
+        self.assertFalse(Tokenizer.validate_syntax(Tokenizer.tokenize("P ∧ ∨ Q")))
+        self.assertFalse(Tokenizer.validate_syntax(Tokenizer.tokenize("(P ∧ Q")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import random
+import unittest
+
+from agent_logic.core.factory import ExpressionFactory
+from agent_logic.core.functions import Relation
+from agent_logic.core.operations import AndN, BinaryOp, Not, Proposition
+from agent_logic.evaluation.incremental import EvaluationSession
+from agent_logic.parsing.formula_parser import FormulaParser
+
+
+class TestEvaluationSession(unittest.TestCase):
+
+    def test_flip_and_set(self):
+        """Test updates on a small formula."""
+        session = EvaluationSession(
+            FormulaParser.parse("(P ∧ Q) → R"), {"P": True, "Q": True, "R": False}
+        )
+        self.assertFalse(session.value)
+        self.assertTrue(session.flip("R"))
+        self.assertTrue(session.set("R", True))
+        self.assertEqual(session.last_update_count, 0)
+        self.assertTrue(session.set("R", False) is False)
+        self.assertTrue(session.update({"P": False, "Unrelated": True}))
+        self.assertEqual(session.assignment, {"P": False, "Q": True, "R": False})
+        with self.assertRaises(KeyError):
+            session.flip("Unrelated")
+        with self.assertRaises(ValueError):
+            EvaluationSession(FormulaParser.parse("P ∧ Q"), {"P": True})
+
+    def test_random_flips_match_full_evaluation(self):
+        """Test that incremental values always equal a fresh evaluation."""
+        rng = random.Random(11)
+        names = [f"X{i}" for i in range(8)]
+        atoms = [Proposition(name=name) for name in names]
+        operators = ["AND", "OR", "IMPLIES", "IFF", "XOR", "NAND", "NOR"]
+        factory = ExpressionFactory()
+        pool = [factory.intern(atom) for atom in atoms]
+        for _ in range(60):
+            kind = rng.random()
+            if kind < 0.15:
+                pool.append(factory.negation(rng.choice(pool)))
+            elif kind < 0.3:
+                pool.append(AndN(*rng.sample(pool, 3)) if rng.random() < 0.5 else factory.nary("OR", rng.sample(pool, 4)))
+            else:
+                pool.append(factory.binary(rng.choice(operators), rng.choice(pool), rng.choice(pool)))
+        expression = factory.binary("AND", pool[-1], factory.binary("OR", pool[-2], pool[-3]))
+        assignment = {name: rng.random() < 0.5 for name in names}
+        session = EvaluationSession(expression, assignment)
+        self.assertEqual(session.value, expression.evaluate(assignment))
+        present = sorted(session.assignment)
+        for _ in range(300):
+            name = rng.choice(present)
+            assignment[name] = not assignment[name]
+            self.assertEqual(session.flip(name), expression.evaluate(assignment))
+
+    def test_update_cost_is_local(self):
+        """Test that a flip only touches the ancestors of the variable."""
+        conjuncts = [
+            BinaryOp(left=Proposition(name=f"A{i}"), right=Not(operand=Proposition(name=f"B{i}")), operator="OR")
+            for i in range(500)
+        ]
+        expression = AndN(*conjuncts)
+        assignment = {f"A{i}": True for i in range(500)}
+        assignment.update({f"B{i}": False for i in range(500)})
+        session = EvaluationSession(expression, assignment)
+        self.assertTrue(session.value)
+        self.assertFalse(session.flip("A7") is False)
+        self.assertEqual(session.last_update_count, 1)  # A7 ∨ ¬B7 stays true.
+        self.assertFalse(session.flip("B7"))
+        self.assertEqual(session.last_update_count, 3)  # ¬B7, the disjunction, the root.
+        self.assertLess(session.last_update_count, len(session) // 100)
+
+    def test_relations(self):
+        """Test relation atoms keyed like Relation.evaluate."""
+        likes = Relation(name="Likes", parameters=["a", "b"])
+        session = EvaluationSession(AndN(likes, Proposition(name="P")), {"P": True})
+        self.assertFalse(session.value)
+        self.assertTrue(session.set("Likes(a, b)", True))
+
+
+if __name__ == "__main__":
+    unittest.main()
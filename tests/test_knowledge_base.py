@@ -0,0 +1,95 @@
+import random
+import unittest
+
+from agent_logic.core.operations import BinaryOp, Proposition
+from agent_logic.evaluation import Evaluator
+from agent_logic.parsing.formula_parser import FormulaParser
+from agent_logic.proofs import KnowledgeBase
+
+from helpers import random_expression
+
+CONNECTIVES = ["AND", "OR", "IMPLIES", "IFF"]
+
+
+def parse(text):
+    return FormulaParser.parse(text)
+
+
+def conjunction(premises):
+    result = None
+    for premise in premises:
+        result = premise if result is None else BinaryOp(left=result, right=premise, operator="AND")
+    return result
+
+
+class TestKnowledgeBase(unittest.TestCase):
+
+    def test_add_and_retract(self):
+        """Test entailment as premises come and go."""
+        kb = KnowledgeBase([parse("P → Q"), parse("Q → R")])
+        self.assertFalse(kb.entails(parse("R")))
+        self.assertTrue(kb.entails(parse("P → R")))
+        handle = kb.add(parse("P"))
+        self.assertTrue(kb.entails(parse("R")))
+        kb.retract(handle)
+        self.assertFalse(kb.entails(parse("R")))
+        kb.retract(0)
+        self.assertFalse(kb.entails(parse("P → R")))
+        self.assertEqual(len(kb), 1)
+        self.assertEqual(list(kb.premises), [1])
+        with self.assertRaises(ValueError):
+            kb.retract(0)
+
+    def test_consistency(self):
+        """Test consistency checks and explosion."""
+        kb = KnowledgeBase([parse("P ∨ Q"), parse("¬P")])
+        self.assertTrue(kb.consistent())
+        self.assertFalse(kb.entails(parse("S")))
+        handle = kb.add(parse("¬Q"))
+        self.assertFalse(kb.consistent())
+        self.assertTrue(kb.entails(parse("S")))
+        kb.retract(handle)
+        self.assertTrue(kb.consistent())
+        self.assertTrue(kb.entails(parse("Q")))
+        self.assertTrue(KnowledgeBase().consistent())
+        self.assertTrue(KnowledgeBase().entails(parse("P ∨ ¬P")))
+
+    def test_matches_validity_check(self):
+        """Test random add/retract/query sequences against Evaluator."""
+        rng = random.Random(49)
+        atoms = [Proposition(name=name) for name in "ABCDE"]
+        kb = KnowledgeBase()
+        active = {}
+        for _ in range(150):
+            action = rng.random()
+            if action < 0.3 or not active:
+                premise = random_expression(rng, atoms, 2, operators=CONNECTIVES, leaf=0.3)
+                active[kb.add(premise)] = premise
+            elif action < 0.45:
+                handle = rng.choice(list(active))
+                kb.retract(handle)
+                del active[handle]
+            else:
+                goal = random_expression(rng, atoms, 2, operators=CONNECTIVES, leaf=0.3)
+                premises = conjunction(active.values())
+                expected = Evaluator.is_valid(BinaryOp(left=premises, right=goal, operator="IMPLIES"))
+                self.assertEqual(kb.entails(goal), expected)
+                self.assertEqual(kb.consistent(), Evaluator.is_satisfiable(premises))
+
+    def test_compaction_keeps_answers(self):
+        """Test that rebuilding the solver after many queries keeps results."""
+        kb = KnowledgeBase([parse("A → B"), parse("B → C"), parse("A")])
+        kb.COMPACT_MIN_VARS = 10
+        for index in range(50):
+            self.assertFalse(kb.entails(parse(f"C ∧ G{index}")))
+        self.assertLess(kb._cnf.num_vars, 40)
+        self.assertTrue(kb.entails(parse("C")))
+        handle = kb.add(parse("¬C"))
+        self.assertFalse(kb.consistent())
+        kb.retract(handle)
+        self.assertTrue(kb.consistent())
+        self.assertTrue(kb.entails(parse("B ∧ C")))
+
+
+if __name__ == "__main__":
+    unittest.main()
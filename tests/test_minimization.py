@@ -0,0 +1,129 @@
+import random
+import unittest
+
+from agent_logic.core.operations import BinaryOp, Not, Proposition
+from agent_logic.evaluation.bdd import BDD
+from agent_logic.parsing.formula_parser import FormulaParser
+from agent_logic.transformations import Minimizer
+
+from helpers import random_expression
+
+
+def equivalent(first, second):
+    bdd = BDD()
+    return bdd.compile(first) == bdd.compile(second)
+
+
+def shape(expr, outer, inner):
+    """Returns the literal counts of the terms of a two-level expression."""
+    def split(node, operator):
+        if isinstance(node, BinaryOp) and node.operator == operator:
+            return split(node.left, operator) + split(node.right, operator)
+        return [node]
+
+    terms = split(expr, outer)
+    counts = []
+    for term in terms:
+        literals = split(term, inner)
+        for literal in literals:
+            assert isinstance(literal, Proposition) or (
+                isinstance(literal, Not) and isinstance(literal.operand, Proposition)
+            ), literal
+        counts.append(len(literals))
+    return counts
+
+
+class TestMinimization(unittest.TestCase):
+
+    def test_random_expressions_stay_equivalent(self):
+        """Test both methods and forms against the input function."""
+        rng = random.Random(23)
+        atoms = [Proposition(name=name) for name in "ABCDE"]
+        for _ in range(60):
+            expr = random_expression(rng, atoms, 4, negation=0, negated_atoms=0.3)
+            for method in ("exact", "heuristic"):
+                sop = Minimizer.minimize(expr, method=method)
+                pos = Minimizer.minimize(expr, form="POS", method=method)
+                self.assertTrue(equivalent(expr, sop), (expr, method))
+                self.assertTrue(equivalent(expr, pos), (expr, method))
+                shape(sop, "OR", "AND")
+                shape(pos, "AND", "OR")
+
+    def test_exact_minimum(self):
+        """Test known minimal covers."""
+        expr = FormulaParser.parse("(A ∧ B) ∨ (A ∧ ¬B) ∨ (¬A ∧ B)")
+        self.assertEqual(sorted(shape(Minimizer.minimize(expr), "OR", "AND")), [1, 1])
+        # The consensus term B ∧ C is redundant.
+        expr = FormulaParser.parse("(A ∧ B) ∨ (¬A ∧ C) ∨ (B ∧ C)")
+        self.assertEqual(sorted(shape(Minimizer.minimize(expr), "OR", "AND")), [2, 2])
+        # Cyclic cover: every prime covers two minterms, no prime is essential.
+        expr = FormulaParser.parse(
+            "(¬A ∧ ¬B ∧ C) ∨ (¬A ∧ B ∧ ¬C) ∨ (¬A ∧ B ∧ C) ∨ (A ∧ ¬B ∧ ¬C) ∨ (A ∧ ¬B ∧ C) ∨ (A ∧ B ∧ ¬C)"
+        )
+        result = Minimizer.minimize(expr, method="exact")
+        self.assertTrue(equivalent(expr, result))
+        self.assertEqual(shape(result, "OR", "AND"), [2, 2, 2])
+
+    def test_pos_form(self):
+        """Test product-of-sums output."""
+        expr = FormulaParser.parse("(A ∨ B) ∧ (A ∨ C)")
+        result = Minimizer.minimize(FormulaParser.parse("A ∨ (B ∧ C)"), form="POS")
+        self.assertTrue(equivalent(expr, result))
+        self.assertEqual(sorted(shape(result, "AND", "OR")), [2, 2])
+
+    def test_heuristic_on_many_variables(self):
+        """Test the heuristic on a function too wide for the exact method."""
+        names = [f"X{i}" for i in range(14)]
+        atoms = [Proposition(name=name) for name in names]
+        expr = atoms[0]
+        for atom in atoms[1:]:
+            expr = BinaryOp(left=expr, right=BinaryOp(left=atom, right=atoms[0], operator="AND"), operator="OR")
+        result = Minimizer.minimize(expr)
+        self.assertTrue(equivalent(expr, result))
+        self.assertEqual(shape(result, "OR", "AND"), [1])
+
+    def test_constants(self):
+        """Test tautologies and contradictions."""
+        a = Proposition(name="A")
+        tautology = Minimizer.minimize(BinaryOp(left=a, right=Not(operand=a), operator="OR"))
+        contradiction = Minimizer.minimize(BinaryOp(left=a, right=Not(operand=a), operator="AND"), form="POS")
+        self.assertEqual(tautology.to_dict()["operator"], "OR")
+        self.assertEqual(contradiction.to_dict()["operator"], "AND")
+        self.assertTrue(equivalent(tautology, BinaryOp(left=a, right=Not(operand=a), operator="OR")))
+
+    def test_budget(self):
+        """Test that small budgets still return equivalent expressions."""
+        rng = random.Random(29)
+        atoms = [Proposition(name=name) for name in "ABCDEFG"]
+        for budget in (0, 5, 50, 500):
+            expr = random_expression(rng, atoms, 5, negation=0, negated_atoms=0.3)
+            result = Minimizer.minimize(expr, budget=budget)
+            self.assertTrue(equivalent(expr, result))
+
+    def test_budget_covers_wide_covers(self):
+        """Test that a cover too large for the budget returns the input."""
+        atoms = [Proposition(name=f"X{i}") for i in range(14)]
+        parity = atoms[0]
+        for atom in atoms[1:]:
+            parity = BinaryOp(left=parity, right=atom, operator="XOR")
+        # The parity function has 2^13 cubes of 14 literals and no smaller cover.
+        self.assertIs(Minimizer.minimize(parity), parity)
+        self.assertIs(Minimizer.minimize(parity, form="POS", method="heuristic"), parity)
+        narrow = atoms[0]
+        for atom in atoms[1:8]:
+            narrow = BinaryOp(left=narrow, right=atom, operator="XOR")
+        result = Minimizer.minimize(narrow, method="heuristic")
+        self.assertTrue(equivalent(narrow, result))
+        self.assertEqual(shape(result, "OR", "AND"), [8] * 2**7)
+
+    def test_invalid_arguments(self):
+        """Test rejected forms and methods."""
+        expr = FormulaParser.parse("A ∧ B")
+        with self.assertRaises(ValueError):
+            Minimizer.minimize(expr, form="CNF")
+        with self.assertRaises(ValueError):
+            Minimizer.minimize(expr, method="fast")
+
+
+if __name__ == "__main__":
+    unittest.main()
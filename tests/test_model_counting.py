@@ -0,0 +1,101 @@
+import itertools
+import random
+import unittest
+from fractions import Fraction
+
+from agent_logic.core.operations import AndN, BinaryOp, Proposition
+from agent_logic.evaluation.bdd import BDD, TRUE
+from agent_logic.evaluation.evaluator import Evaluator
+from agent_logic.evaluation.truth_table import TruthTable
+from agent_logic.parsing.formula_parser import FormulaParser
+
+from helpers import random_expression
+
+
+class TestModelCounting(unittest.TestCase):
+
+    def test_counts_match_truth_table(self):
+        """Test both counting methods against truth table enumeration."""
+        rng = random.Random(13)
+        atoms = [Proposition(name=name) for name in "ABCDE"]
+        for _ in range(150):
+            expr = random_expression(rng, atoms, 4, negation=0, negated_atoms=0.3)
+            expected = sum(row["Result"] is True for row in TruthTable(expr).generate())
+            self.assertEqual(Evaluator.count_models(expr), expected)
+            self.assertEqual(Evaluator.count_models(expr, method="bdd"), expected)
+
+    def test_weighted_counts(self):
+        """Test weighted counting with exact fractions."""
+        rng = random.Random(17)
+        names = ["A", "B", "C", "D"]
+        atoms = [Proposition(name=name) for name in names]
+        weights = {name: Fraction(rng.randint(0, 10), 10) for name in names}
+        for _ in range(50):
+            expr = random_expression(rng, atoms, 3, negation=0, negated_atoms=0.3)
+            expected = Fraction(0)
+            for values in itertools.product([False, True], repeat=len(names)):
+                context = dict(zip(names, values))
+                if expr.evaluate(context):
+                    term = Fraction(1)
+                    for name, value in context.items():
+                        term *= weights[name] if value else 1 - weights[name]
+                    expected += term
+            # Variables missing from the expression contribute a factor of 1.
+            self.assertEqual(Evaluator.count_models(expr, variables=names, weights=weights), expected)
+            self.assertEqual(
+                Evaluator.count_models(expr, variables=names, weights=weights, method="bdd"), expected
+            )
+
+    def test_extra_variables_and_constants(self):
+        """Test counting over extra variables, tautologies and contradictions."""
+        self.assertEqual(Evaluator.count_models(FormulaParser.parse("P ∨ Q"), variables=["R"]), 6)
+        self.assertEqual(Evaluator.count_models(FormulaParser.parse("P ∨ ¬P")), 2)
+        self.assertEqual(Evaluator.count_models(FormulaParser.parse("P ∧ ¬P")), 0)
+        with self.assertRaises(ValueError):
+            Evaluator.count_models(FormulaParser.parse("P"), method="table")
+
+    def test_large_decomposable_formula(self):
+        """Test that independent components are counted separately."""
+        clauses = " ∧ ".join(f"(X{i} ∨ Y{i} ∨ ¬Z{i})" for i in range(60))
+        expr = FormulaParser.parse(clauses)
+        self.assertEqual(Evaluator.count_models(expr), 7**60)
+        self.assertEqual(Evaluator.count_models(expr, method="bdd"), 7**60)
+
+    def test_tseitin_path_keeps_count(self):
+        """Test a parity chain whose direct CNF exceeds the clause budget."""
+        expr = FormulaParser.parse(" ⊕ ".join(f"X{i}" for i in range(20)))
+        self.assertEqual(Evaluator.count_models(expr), 2**19)
+        bdd = BDD()
+        root = bdd.compile(expr)
+        self.assertEqual(bdd.count(root), 2**19)
+        self.assertEqual(bdd.size(root), 2 * 20 - 1 + 2)
+
+    def test_deep_chains_do_not_recurse(self):
+        """Test chains with more variables than the interpreter's recursion limit."""
+        atoms = [Proposition(name=f"p{i}") for i in range(1500)]
+        chain = AndN(*[BinaryOp(left=a, right=b, operator="IMPLIES") for a, b in zip(atoms, atoms[1:])])
+        self.assertEqual(Evaluator.count_models(chain), len(atoms) + 1)
+        parity = atoms[0]
+        for atom in atoms[1:1200]:
+            parity = BinaryOp(left=parity, right=atom, operator="XOR")
+        self.assertEqual(Evaluator.count_models(parity), 2**1199)
+
+    def test_deep_diagram_operations(self):
+        """Test apply, restrict and exists on a diagram deeper than the recursion limit."""
+        names = [f"p{i}" for i in range(1500)]
+        bdd = BDD(order=names)
+        layer = [bdd.var(name) for name in names]
+        while len(layer) > 1:
+            layer = [bdd.apply("AND", *layer[i:i + 2]) if i + 1 < len(layer) else layer[i]
+                     for i in range(0, len(layer), 2)]
+        root = layer[0]
+        self.assertEqual(bdd.size(root), len(names) + 2)
+        negated = bdd.negate(root)
+        self.assertEqual(bdd.count(negated), 2**len(names) - 1)
+        self.assertEqual(bdd.apply("XOR", root, negated), TRUE)
+        self.assertEqual(bdd.count(bdd.restrict(root, {names[-1]: True})), 2)
+        self.assertEqual(bdd.size(bdd.exists(root, names[::2])), len(names) // 2 + 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
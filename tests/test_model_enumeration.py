@@ -0,0 +1,79 @@
+import itertools
+import random
+import unittest
+
+from agent_logic.core.operations import Proposition
+from agent_logic.evaluation.evaluator import Evaluator
+from agent_logic.parsing.formula_parser import FormulaParser
+
+from helpers import random_expression
+
+METHODS = ["sat", "bdd"]
+
+
+def brute_force(expr, names, projection):
+    models = set()
+    for values in itertools.product([False, True], repeat=len(names)):
+        context = dict(zip(names, values))
+        if expr.evaluate(context):
+            models.add(tuple(context[name] for name in projection))
+    return models
+
+
+def cube_models(cube, projection):
+    free = [name for name in projection if name not in cube]
+    for values in itertools.product([False, True], repeat=len(free)):
+        model = dict(cube)
+        model.update(zip(free, values))
+        yield tuple(model[name] for name in projection)
+
+
+class TestModelEnumeration(unittest.TestCase):
+
+    def test_models_match_brute_force(self):
+        """Test full, projected and cube enumeration against enumeration by hand."""
+        rng = random.Random(19)
+        names = ["A", "B", "C", "D", "E"]
+        atoms = [Proposition(name=name) for name in names]
+        for _ in range(80):
+            expr = random_expression(rng, atoms, 4, negation=0, negated_atoms=0.3)
+            present = sorted(set(expr.variables()))
+            projection = sorted(rng.sample(present, max(1, len(present) // 2)))
+            for method in METHODS:
+                for project in (None, projection):
+                    target = present if project is None else project
+                    expected = brute_force(expr, present, target)
+                    models = [
+                        tuple(model[name] for name in target)
+                        for model in Evaluator.iter_models(expr, project_onto=project, method=method)
+                    ]
+                    self.assertEqual(len(models), len(set(models)))
+                    self.assertEqual(set(models), expected)
+                    covered = []
+                    for cube in Evaluator.iter_models(expr, project_onto=project, cubes=True, method=method):
+                        self.assertTrue(set(cube) <= set(target))
+                        covered.extend(cube_models(cube, target))
+                    # Cubes are disjoint and cover exactly the projected models.
+                    self.assertEqual(len(covered), len(expected))
+                    self.assertEqual(set(covered), expected)
+
+    def test_lazy_and_compressed(self):
+        """Test early stopping and don't-care compression on a wide formula."""
+        expr = FormulaParser.parse(" ∨ ".join(f"X{i}" for i in range(40)))
+        for method in METHODS:
+            first = list(itertools.islice(Evaluator.iter_models(expr, method=method), 5))
+            self.assertEqual(len(first), 5)
+            self.assertTrue(all(expr.evaluate(model) for model in first))
+            cubes = list(Evaluator.iter_models(expr, cubes=True, method=method))
+            self.assertEqual(len(cubes), 40)
+        self.assertEqual(list(Evaluator.iter_models(FormulaParser.parse("P ∧ ¬P"))), [])
+        self.assertEqual(
+            list(Evaluator.iter_models(FormulaParser.parse("P"), project_onto=["P", "Q"], cubes=True)),
+            [{"P": True}],
+        )
+        with self.assertRaises(ValueError):
+            Evaluator.iter_models(FormulaParser.parse("P"), method="table")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import random
+import unittest
+
+from agent_logic.core.operations import BinaryOp, Not, Proposition
+from agent_logic.evaluation import Evaluator, MUSExtractor
+from agent_logic.parsing.formula_parser import FormulaParser
+from agent_logic.proofs import KnowledgeBase
+
+
+def random_clause(rng, atoms):
+    literals = [a if rng.random() < 0.5 else Not(operand=a) for a in rng.sample(atoms, rng.randint(1, 2))]
+    result = literals[0]
+    for literal in literals[1:]:
+        result = BinaryOp(left=result, right=literal, operator="OR")
+    return result
+
+
+def satisfiable(premises):
+    if not premises:
+        return True
+    result = premises[0]
+    for premise in premises[1:]:
+        result = BinaryOp(left=result, right=premise, operator="AND")
+    return Evaluator.is_satisfiable(result)
+
+
+class TestMUSExtractor(unittest.TestCase):
+
+    def test_consistent_premises(self):
+        """Test that consistent premises have no core."""
+        premises = [FormulaParser.parse(text) for text in ("P → Q", "P", "Q ∨ R")]
+        self.assertIsNone(MUSExtractor.extract(premises))
+        self.assertIsNone(MUSExtractor.extract([]))
+
+    def test_finds_conflicting_premises(self):
+        """Test a conflict hidden among unrelated premises."""
+        texts = ["A ∨ B", "P → Q", "C", "Q → R", "D ↔ C", "P", "E ∧ F", "¬R", "A → C"]
+        premises = [FormulaParser.parse(text) for text in texts]
+        core = MUSExtractor.extract(premises)
+        self.assertEqual(core.indices, [1, 3, 5, 7])
+        self.assertTrue(core.minimal)
+        self.assertIsNone(MUSExtractor.extract([premises[i] for i in (0, 1, 2, 3, 4, 6, 8)]))
+
+    def test_self_contradictory_premise(self):
+        """Test a single unsatisfiable premise."""
+        premises = [FormulaParser.parse(text) for text in ("P", "Q ∧ ¬Q", "¬P")]
+        self.assertEqual(MUSExtractor.extract(premises).indices, [1])
+
+    def test_random_cores_are_minimal(self):
+        """Test minimality against brute-force consistency checks."""
+        rng = random.Random(50)
+        atoms = [Proposition(name=name) for name in "ABCDE"]
+        found = 0
+        for _ in range(40):
+            premises = [random_clause(rng, atoms) for _ in range(14)]
+            core = MUSExtractor.extract(premises)
+            if core is None:
+                self.assertTrue(satisfiable(premises))
+                continue
+            found += 1
+            subset = [premises[i] for i in core.indices]
+            self.assertFalse(satisfiable(subset))
+            for position in range(len(subset)):
+                self.assertTrue(satisfiable(subset[:position] + subset[position + 1:]))
+        self.assertGreater(found, 5)
+
+    def test_budgeted_mode(self):
+        """Test that a check budget returns a conflicting, possibly larger subset."""
+        texts = ["P", "P → Q", "Q → R", "¬R", "R → S", "¬S", "¬P ∨ ¬S"]
+        premises = [FormulaParser.parse(text) for text in texts]
+        core = MUSExtractor.extract(premises, max_checks=0)
+        self.assertFalse(core.minimal)
+        self.assertEqual(core.checks, 1)
+        self.assertFalse(satisfiable([premises[i] for i in core.indices]))
+        exact = MUSExtractor.extract(premises)
+        self.assertTrue(exact.minimal)
+        self.assertLessEqual(len(exact.indices), len(core.indices))
+
+    def test_knowledge_base_conflict(self):
+        """Test conflict explanation by premise handles."""
+        kb = KnowledgeBase([FormulaParser.parse(text) for text in ("P → Q", "R", "P")])
+        self.assertIsNone(kb.conflict())
+        handle = kb.add(FormulaParser.parse("¬Q"))
+        self.assertEqual(kb.conflict(), [0, 2, handle])
+        kb.retract(0)
+        self.assertIsNone(kb.conflict())
+        self.assertTrue(kb.consistent())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+import itertools
+import unittest
+
+from agent_logic.core.base import LogicalExpression
+from agent_logic.core.factory import ExpressionFactory
+from agent_logic.core.operations import And, AndN, BinaryOp, NaryOp, Not, Or, OrN, Proposition
+from agent_logic.evaluation.cnf import CNFEncoder
+from agent_logic.evaluation.evaluator import Evaluator
+from agent_logic.evaluation.sat_solvers import CDCLSolver
+from agent_logic.evaluation.truth_table import TruthTable
+from agent_logic.serialization.binary import BinarySerializer
+from agent_logic.serialization.dag_json import ExpressionTable
+from agent_logic.transformations import to_cnf, to_dnf
+from agent_logic.transformations.canonical import Canonicalizer, Fingerprint
+
+
+def atoms(*names):
+    return [Proposition(name=name) for name in names]
+
+
+def assignments(names):
+    for values in itertools.product([False, True], repeat=len(names)):
+        yield dict(zip(names, values))
+
+
+class TestNaryOp(unittest.TestCase):
+
+    def setUp(self):
+        self.a, self.b, self.c, self.d = atoms("A", "B", "C", "D")
+
+    def test_constructors_flatten_chains(self):
+        """Test that AndN/OrN splice nested chains of the same operator."""
+        nested = AndN(And(self.a, self.b), AndN(self.c, self.d))
+        self.assertEqual(nested.operands, (self.a, self.b, self.c, self.d))
+        mixed = AndN(self.a, Or(self.b, self.c))
+        self.assertEqual(len(mixed.operands), 2)
+        self.assertEqual(OrN(self.a, OrN(self.b, self.c)).operands, (self.a, self.b, self.c))
+        with self.assertRaises(ValueError):
+            NaryOp(operands=(), operator="AND")
+
+    def test_evaluate_variables_depth(self):
+        """Test evaluation, variables and depth of a flat node."""
+        conjunction = AndN(self.a, Not(operand=self.b), self.c)
+        self.assertTrue(conjunction.evaluate({"A": True, "B": False, "C": True}))
+        self.assertFalse(conjunction.evaluate({"A": True, "B": True, "C": True}))
+        # Short-circuit: unassigned later operands are never looked at.
+        self.assertFalse(AndN(self.a, self.b).evaluate({"A": False}))
+        self.assertTrue(OrN(self.a, self.b).evaluate({"A": True}))
+        self.assertEqual(sorted(conjunction.variables()), ["A", "B", "C"])
+        self.assertEqual(conjunction.depth(), 2)
+
+    def test_partial_evaluate(self):
+        """Test folding of known operands out of n-ary nodes."""
+        disjunction = OrN(self.c, self.d)
+        conjunction = AndN(self.a, self.b, disjunction)
+        self.assertEqual(conjunction.partial_evaluate({"A": True}).operands, (self.b, disjunction))
+        self.assertIs(conjunction.partial_evaluate({"A": True, "B": True}), disjunction)
+        self.assertIs(conjunction.partial_evaluate({"B": False}), False)
+        self.assertIs(conjunction.partial_evaluate({"A": True, "B": True, "D": True}), True)
+        self.assertEqual(conjunction.partial_evaluate({"C": False}).operands[2], self.d)
+
+    def test_flatten_expand_round_trip(self):
+        """Test conversion between binary chains and n-ary nodes."""
+        chain = Or(And(And(self.a, self.b), And(self.c, self.d)), Not(operand=Or(self.a, Or(self.b, self.c))))
+        flat = NaryOp.flatten(chain)
+        self.assertIsInstance(flat, NaryOp)
+        self.assertEqual(flat.operator, "OR")
+        self.assertEqual(flat.operands[0].operands, (self.a, self.b, self.c, self.d))
+        self.assertEqual(flat.operands[1].operand.operands, (self.a, self.b, self.c))
+        expanded = NaryOp.expand(flat)
+        self.assertFalse(any(isinstance(node, NaryOp) for node in _walk(expanded)))
+        for context in assignments(["A", "B", "C", "D"]):
+            self.assertEqual(chain.evaluate(context), flat.evaluate(context))
+            self.assertEqual(chain.evaluate(context), expanded.evaluate(context))
+        self.assertIs(NaryOp.flatten(self.a), self.a)
+
+    def test_serialization(self):
+        """Test dictionary, binary and DAG round trips."""
+        expression = OrN(AndN(self.a, self.b, self.c), Not(operand=self.d), AndN(self.a, self.b, self.c))
+        data = expression.to_dict()
+        self.assertEqual(data["type"], "NaryOp")
+        self.assertEqual(LogicalExpression.from_dict(data).to_dict(), data)
+        trusted = LogicalExpression.from_dict(data, trusted=True)
+        self.assertEqual(trusted.to_dict(), data)
+        self.assertEqual(BinarySerializer.loads(BinarySerializer.dumps(expression)).to_dict(), data)
+        table = ExpressionTable()
+        root = table.add(expression)
+        self.assertEqual(len(table.nodes), 7)
+        self.assertEqual(ExpressionTable.decode(table.nodes)[root].to_dict(), data)
+
+    def test_evaluator_and_cnf_agree_with_binary_chain(self):
+        """Test that evaluators and CNF encoders treat n-ary nodes like chains."""
+        chain = Or(And(self.a, Not(operand=self.b)), And(self.c, Or(self.d, self.a)))
+        flat = NaryOp.flatten(chain)
+        names = ["A", "B", "C", "D"]
+        self.assertTrue(Evaluator.are_equivalent(chain, flat))
+        for context in assignments(names):
+            self.assertEqual(Evaluator.evaluate(flat, context), chain.evaluate(context))
+        direct = CNFEncoder.direct(flat)
+        tseitin = CNFEncoder.tseitin(flat)
+        for cnf in (direct, tseitin):
+            for context in assignments(names):
+                solver = CDCLSolver(clauses=cnf.clauses)
+                satisfiable = solver.solve(cnf.encode(context))
+                self.assertEqual(satisfiable, chain.evaluate(context))
+
+    def test_normal_forms_and_truth_table(self):
+        """Test that normal-form conversion and truth tables accept n-ary nodes."""
+        flat = AndN(self.a, Not(operand=OrN(self.b, Not(operand=self.c))), OrN(self.c, self.d))
+        for converted, outer, inner in ((to_cnf(flat), "AND", "OR"), (to_dnf(flat), "OR", "AND")):
+            self.assertIsInstance(converted, NaryOp)
+            self.assertEqual(converted.operator, outer)
+            for term in NaryOp.collect(outer, [converted]):
+                for literal in NaryOp.collect(inner, [term]):
+                    self.assertIsInstance(literal.operand if isinstance(literal, Not) else literal, Proposition)
+            rows = TruthTable(converted).generate()
+            self.assertEqual(len(rows), 16)
+            for row in rows:
+                context = {name: row[name] for name in ("A", "B", "C", "D")}
+                self.assertEqual(row["Result"], flat.evaluate(context))
+        expected = [flat.evaluate(context) for context in assignments(["A", "B", "C", "D"])]
+        self.assertEqual([row["Result"] for row in TruthTable(flat).generate()], expected)
+
+    def test_factory_and_canonical_form(self):
+        """Test interning and that n-ary and binary spellings canonicalize alike."""
+        factory = ExpressionFactory()
+        first = factory.nary("AND", [factory.proposition("A"), factory.proposition("B")])
+        second = factory.nary("AND", [factory.proposition("A"), factory.proposition("B")])
+        self.assertIs(first, second)
+        self.assertIsNot(first, factory.binary("AND", factory.proposition("A"), factory.proposition("B")))
+        flat = AndN(self.c, self.a, self.b, self.a)
+        chain = And(And(self.a, self.b), self.c)
+        self.assertEqual(Canonicalizer.fingerprint(flat), Canonicalizer.fingerprint(chain))
+        self.assertNotEqual(Fingerprint.of(flat), Fingerprint.of(chain))
+        self.assertIsInstance(Canonicalizer.canonicalize(flat), BinaryOp)
+
+
+def _walk(expression):
+    stack = [expression]
+    while stack:
+        node = stack.pop()
+        yield node
+        if isinstance(node, BinaryOp):
+            stack.extend((node.left, node.right))
+        elif isinstance(node, NaryOp):
+            stack.extend(node.operands)
+        elif isinstance(node, Not):
+            stack.append(node.operand)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+import random
+import unittest
+
+from agent_logic.core.operations import AndN, BinaryOp, NaryOp, Not, OrN, Proposition
+from agent_logic.evaluation.bdd import BDD
+from agent_logic.parsing.formula_parser import FormulaParser
+from agent_logic.transformations import NormalForms, to_cnf, to_dnf
+
+from helpers import random_expression
+
+
+def is_normal_form(expr, outer):
+    """Checks that expr is an outer-chain of inner-chains of literals."""
+    inner = "OR" if outer == "AND" else "AND"
+
+    for term in NaryOp.collect(outer, [expr]):
+        for literal in NaryOp.collect(inner, [term]):
+            atom = literal.operand if isinstance(literal, Not) else literal
+            if not isinstance(atom, Proposition):
+                return False
+    return True
+
+
+def to_nary(expr):
+    """Rewrites AND/OR chains of a binary expression as NaryOp nodes."""
+    if isinstance(expr, Not):
+        return Not(operand=to_nary(expr.operand))
+    if isinstance(expr, BinaryOp):
+        if expr.operator in ("AND", "OR"):
+            operands = [to_nary(operand) for operand in NaryOp.collect(expr.operator, [expr])]
+            return NaryOp(operands=operands, operator=expr.operator)
+        return BinaryOp(left=to_nary(expr.left), right=to_nary(expr.right), operator=expr.operator)
+    return expr
+
+
+class TestNormalForms(unittest.TestCase):
+
+    def test_conversions_are_equivalent(self):
+        """Test CNF, DNF and NNF against the input function."""
+        rng = random.Random(43)
+        atoms = [Proposition(name=name) for name in "ABCD"]
+        for _ in range(100):
+            expr = random_expression(rng, atoms, 4)
+            bdd = BDD()
+            root = bdd.compile(expr)
+            cnf, dnf = to_cnf(expr), to_dnf(expr)
+            self.assertEqual(bdd.compile(cnf), root)
+            self.assertEqual(bdd.compile(dnf), root)
+            self.assertEqual(bdd.compile(NormalForms.to_nnf(expr)), root)
+            self.assertTrue(is_normal_form(cnf, "AND"), cnf)
+            self.assertTrue(is_normal_form(dnf, "OR"), dnf)
+
+    def test_nary_conversions_have_normal_form_shape(self):
+        """Test the shape of CNF and DNF for inputs mixing n-ary and binary chains."""
+        rng = random.Random(46)
+        atoms = [Proposition(name=name) for name in "ABCD"]
+        for _ in range(300):
+            expr = random_expression(rng, atoms, 4)
+            for candidate in (to_nary(expr), BinaryOp(left=to_nary(expr), right=atoms[0], operator="OR")):
+                cnf, dnf = to_cnf(candidate), to_dnf(candidate)
+                self.assertTrue(is_normal_form(cnf, "AND"), cnf)
+                self.assertTrue(is_normal_form(dnf, "OR"), dnf)
+                bdd = BDD()
+                root = bdd.compile(candidate)
+                self.assertEqual(bdd.compile(cnf), root)
+                self.assertEqual(bdd.compile(dnf), root)
+
+        q, p, r = (Proposition(name=name) for name in "QPR")
+        expr = BinaryOp(left=OrN(q, FormulaParser.parse("¬Q ∧ P")), right=r, operator="OR")
+        cnf = to_cnf(expr)
+        self.assertTrue(is_normal_form(cnf, "AND"), cnf)
+        self.assertEqual(cnf.to_dict(), BinaryOp(left=OrN(q, p), right=r, operator="OR").to_dict())
+
+    def test_normal_form_input_is_returned_unchanged(self):
+        """Test that conversions allocate nothing for inputs already in normal form."""
+        cnf = FormulaParser.parse("(A ∨ ¬B) ∧ (C ∨ D) ∧ ¬E")
+        dnf = FormulaParser.parse("(A ∧ ¬B) ∨ (C ∧ D) ∨ ¬E")
+        self.assertIs(to_cnf(cnf), cnf)
+        self.assertIs(to_dnf(dnf), dnf)
+        self.assertIs(NormalForms.to_nnf(cnf), cnf)
+        converted = to_cnf(dnf)
+        self.assertIs(to_cnf(converted), converted)
+
+    def test_unchanged_subtrees_are_shared(self):
+        """Test copy-on-write conversion of partially normalized inputs."""
+        clause = FormulaParser.parse("A ∨ ¬B")
+        expr = BinaryOp(left=clause, right=FormulaParser.parse("¬(C ∧ D)"), operator="AND")
+        result = to_cnf(expr)
+        self.assertIs(result.left, clause)
+        self.assertIsNot(result.right, expr.right)
+
+        cnf = to_cnf(FormulaParser.parse("(A ∧ B) ∨ (C → D)"))
+        self.assertIs(to_cnf(cnf), cnf)
+
+    def test_shared_subtrees_are_converted_once(self):
+        """Test that the memo table preserves sharing in the output."""
+        shared = FormulaParser.parse("¬(A ∨ B)")
+        expr = BinaryOp(
+            left=BinaryOp(left=shared, right=Proposition(name="C"), operator="OR"),
+            right=BinaryOp(left=shared, right=Proposition(name="D"), operator="IFF"),
+            operator="AND",
+        )
+        nnf = NormalForms.to_nnf(expr)
+        # Both occurrences of the shared subtree map to one converted node.
+        self.assertIs(nnf.left.left, nnf.right.right.left)
+
+    def test_nary_operations(self):
+        """Test normal forms of n-ary operations."""
+        a, b, c, d = (Proposition(name=name) for name in "ABCD")
+        expr = OrN(AndN(a, b), AndN(c, d))
+        cnf = to_cnf(expr)
+        self.assertIsInstance(cnf, NaryOp)
+        self.assertEqual(len(cnf.operands), 4)
+        self.assertIs(to_dnf(expr), expr)
+        bdd = BDD()
+        self.assertEqual(bdd.compile(cnf), bdd.compile(expr))
+
+
+if __name__ == "__main__":
+    unittest.main()
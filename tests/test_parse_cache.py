@@ -0,0 +1,79 @@
+import unittest
+
+from agent_logic.core.factory import ExpressionFactory
+from agent_logic.core.operations import BinaryOp, Not, Proposition
+from agent_logic.parsing.cache import ParseCache
+from agent_logic.parsing.formula_parser import FormulaSyntaxError
+
+
+class TestParseCache(unittest.TestCase):
+
+    def test_text_hits_and_misses(self):
+        """Test that repeated strings return the same object and are counted."""
+        cache = ParseCache()
+        first = cache.parse("P ∧ ¬Q")
+        self.assertIs(cache.parse("P ∧ ¬Q"), first)
+        self.assertEqual(first, BinaryOp(
+            left=Proposition(name="P"), right=Not(operand=Proposition(name="Q")), operator="AND"
+        ))
+        info = cache.cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (1, 1, 1))
+
+    def test_dict_key_is_canonical(self):
+        """Test that key order does not affect dictionary lookups."""
+        cache = ParseCache()
+        first = cache.from_dict({"type": "Proposition", "name": "P"})
+        second = cache.from_dict({"name": "P", "type": "Proposition"})
+        self.assertIs(first, second)
+        self.assertEqual(first, Proposition(name="P"))
+
+    def test_shared_subexpressions(self):
+        """Test that text and dict results share nodes through the factory."""
+        cache = ParseCache()
+        from_text = cache.parse("P ∨ Q")
+        from_dict = cache.from_dict(Not(operand=Proposition(name="P")).to_dict())
+        self.assertIs(from_text.left, from_dict.operand)
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted."""
+        cache = ParseCache(maxsize=2)
+        a = cache.parse("A")
+        cache.parse("B")
+        cache.parse("A")
+        cache.parse("C")
+        self.assertIs(cache.parse("A"), a)
+        cache.parse("B")
+        self.assertEqual(cache.cache_info().currsize, 2)
+        self.assertEqual(cache.cache_info().misses, 4)
+
+    def test_memory_is_bounded(self):
+        """Test that the private factory does not keep evicted entries alive."""
+        cache = ParseCache(maxsize=10)
+        for index in range(2000):
+            cache.parse(f"(P{index} ∧ Q{index}) → ¬R{index}")
+        self.assertEqual(cache.cache_info().currsize, 10)
+        # Six nodes per formula, for at most one generation of misses.
+        self.assertLessEqual(len(cache.factory), 6 * 10)
+
+        factory = ExpressionFactory()
+        shared = ParseCache(maxsize=2, factory=factory)
+        for text in ("A", "B", "C"):
+            shared.parse(text)
+        self.assertIs(shared.factory, factory)
+        self.assertEqual(len(factory), 3)
+
+    def test_errors_not_cached(self):
+        """Test that failures propagate and are not stored."""
+        cache = ParseCache()
+        for _ in range(2):
+            with self.assertRaises(FormulaSyntaxError):
+                cache.parse("P ∧")
+        self.assertEqual(cache.cache_info().currsize, 0)
+        cache.clear()
+        self.assertEqual(cache.cache_info().misses, 0)
+        with self.assertRaises(ValueError):
+            ParseCache(maxsize=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
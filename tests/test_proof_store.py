@@ -0,0 +1,84 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from agent_logic.cli import validate_proof, validate_store
+from agent_logic.core.operations import BinaryOp, Proposition
+from agent_logic.proofs.proof_system import Proof, ProofStep
+from agent_logic.serialization.proof_store import ProofStore
+
+
+class TestProofStore(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "corpus.algs")
+        p = Proposition(name="P")
+        q = Proposition(name="Q")
+        self.valid = Proof(steps=[
+            ProofStep(step_number=1, statement=p, justification="Given"),
+            ProofStep(
+                step_number=2,
+                statement=BinaryOp(left=p, right=q, operator="IMPLIES"),
+                justification="Given",
+            ),
+            ProofStep(
+                step_number=3, statement=q, justification="Modus Ponens", dependencies=[1, 2]
+            ),
+        ])
+        self.invalid = Proof(steps=[
+            ProofStep(step_number=1, statement=p, justification="Given"),
+            ProofStep(
+                step_number=2,
+                statement=Proposition(name="R"),
+                justification="Modus Ponens",
+                dependencies=[1],
+            ),
+        ])
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_append_and_fetch(self):
+        """Test random access, appends after reads, and reopening."""
+        with ProofStore(self.path, mode="a") as store:
+            ids = [store.append(self.valid if i % 2 else self.invalid) for i in range(10)]
+            self.assertEqual(ids, list(range(10)))
+            self.assertEqual(store[3].steps, self.valid.steps)
+            self.assertEqual(store.append(self.valid), 10)
+            self.assertEqual(store[10].steps, self.valid.steps)
+        with ProofStore(self.path) as store:
+            self.assertEqual(len(store), 11)
+            self.assertEqual(store.get(4).steps, self.invalid.steps)
+            self.assertEqual([pid for pid, _ in store.scan(2, 5)], [2, 3, 4])
+            self.assertEqual(sum(proof.is_valid() for proof in store), 6)
+            with self.assertRaises(IndexError):
+                store.get(11)
+            with self.assertRaises(ValueError):
+                store.append(self.valid)
+
+    def test_rejects_other_files(self):
+        """Test opening errors."""
+        other = os.path.join(self.directory.name, "proof.json")
+        with open(other, "w") as f:
+            f.write("{}")
+        with self.assertRaises(ValueError):
+            ProofStore(other)
+        with self.assertRaises(FileNotFoundError):
+            ProofStore(os.path.join(self.directory.name, "missing.algs"))
+        self.assertFalse(ProofStore.is_store(other))
+
+    def test_cli_validates_store(self):
+        """Test the validate command with a store as the input source."""
+        with ProofStore(self.path, mode="a") as store:
+            store.append(self.valid)
+            store.append(self.invalid)
+        with patch("builtins.print"):
+            self.assertEqual(validate_proof(self.path), 1)
+            self.assertEqual(validate_store(self.path, proof_ids=[0]), 0)
+            self.assertEqual(validate_store(self.path, proof_ids=[7]), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -191,3 +191,25 @@ class TestProofSystem(unittest.TestCase):
             reconstructed_proof.steps[2].dependencies,
             original_proof.steps[2].dependencies,
         )
+
+    def test_from_dict_trusted(self):
+        """Test that trusted proof loading matches validated loading."""
+        p = Proposition(name="P")
+        q = Proposition(name="Q")
+        steps = [
+            ProofStep(step_number=1, statement=p, justification="Given"),
+            ProofStep(
+                step_number=2,
+                statement=BinaryOp(left=p, right=q, operator="IMPLIES"),
+                justification="Given",
+            ),
+            ProofStep(
+                step_number=3, statement=q, justification="Modus Ponens", dependencies=[1, 2]
+            ),
+        ]
+        proof_dict = Proof(steps=steps).to_dict()
+        validated = Proof.from_dict(proof_dict)
+        trusted = Proof.from_dict(proof_dict, trusted=True)
+        self.assertEqual(trusted.steps, validated.steps)
+        self.assertTrue(trusted.is_valid())
+        self.assertIsInstance(proof_dict["steps"][0]["statement"], dict)
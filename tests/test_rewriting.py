@@ -0,0 +1,154 @@
+import random
+import unittest
+
+from agent_logic.core.operations import AndN, BinaryOp, NaryOp, Not, Proposition
+from agent_logic.evaluation.bdd import BDD
+from agent_logic.parsing.formula_parser import FormulaParser
+from agent_logic.transformations import DISTRIBUTIVE_RULES, STANDARD_RULES, RewriteSystem
+
+from helpers import random_expression
+
+NNF_RULES = [rule for rule in STANDARD_RULES if rule[0] in ("double_negation", "de_morgan_and", "de_morgan_or")]
+
+
+def negation_is_atomic(expr):
+    if isinstance(expr, Not):
+        return isinstance(expr.operand, Proposition)
+    if isinstance(expr, BinaryOp):
+        return negation_is_atomic(expr.left) and negation_is_atomic(expr.right)
+    return True
+
+
+class TestRewriting(unittest.TestCase):
+
+    def test_negation_normal_form(self):
+        """Test exhaustive rewriting with De Morgan and double negation."""
+        system = RewriteSystem(NNF_RULES)
+        rng = random.Random(41)
+        atoms = [Proposition(name=name) for name in "ABCD"]
+        for _ in range(100):
+            expr = random_expression(rng, atoms, 5, operators=["AND", "OR"], negation=0.3)
+            result = system.rewrite(expr)
+            self.assertTrue(result.complete)
+            self.assertTrue(negation_is_atomic(result.expression))
+            bdd = BDD()
+            self.assertEqual(bdd.compile(expr), bdd.compile(result.expression))
+
+    def test_strategies(self):
+        """Test innermost, outermost and exhaustive traversal."""
+        system = RewriteSystem([("double_negation", "¬¬A", "A")])
+        expr = FormulaParser.parse("¬¬¬¬P")
+        innermost = system.rewrite(expr, strategy="innermost")
+        outermost = system.rewrite(expr, strategy="outermost")
+        exhaustive = system.rewrite(expr, strategy="exhaustive")
+        self.assertEqual(innermost.expression.to_dict(), {"type": "Proposition", "name": "P"})
+        self.assertEqual(innermost.steps, 2)
+        # The replacement ¬¬P at the root is not revisited in the same pass.
+        self.assertEqual(outermost.expression.to_dict(), FormulaParser.parse("¬¬P").to_dict())
+        self.assertEqual(outermost.steps, 1)
+        self.assertEqual(exhaustive.expression.to_dict(), {"type": "Proposition", "name": "P"})
+        with self.assertRaises(ValueError):
+            system.rewrite(expr, strategy="random")
+
+    def test_nonlinear_patterns_and_constants(self):
+        """Test repeated variables and non-variable propositions in patterns."""
+        system = RewriteSystem([("idempotence", "A ∧ A", "A")])
+        self.assertEqual(
+            system.rewrite(FormulaParser.parse("(P ∨ Q) ∧ (P ∨ Q)")).expression.to_dict(),
+            FormulaParser.parse("P ∨ Q").to_dict(),
+        )
+        self.assertEqual(system.rewrite(FormulaParser.parse("(P ∨ Q) ∧ (Q ∨ P)")).steps, 0)
+
+        system = RewriteSystem()
+        system.add_rule("rain", "Rain → A", "¬A → ¬Rain", variables=["A"])
+        result = system.rewrite(FormulaParser.parse("(Rain → Wet) ∧ (Snow → Wet)"))
+        self.assertEqual(
+            result.expression.to_dict(),
+            FormulaParser.parse("(¬Wet → ¬Rain) ∧ (Snow → Wet)").to_dict(),
+        )
+        with self.assertRaises(ValueError):
+            system.add_rule("bad", "A ∧ B", "A ∨ C", variables=["A", "B", "C"])
+
+    def test_priority_and_match(self):
+        """Test that the earliest matching rule wins."""
+        system = RewriteSystem([
+            ("specific", "¬(A ∧ A)", "¬A"),
+            ("general", "¬(A ∧ B)", "¬A ∨ ¬B"),
+        ])
+        rule, bindings = system.match(FormulaParser.parse("¬(P ∧ P)"))
+        self.assertEqual(rule.name, "specific")
+        self.assertEqual(bindings["A"].to_dict(), {"type": "Proposition", "name": "P"})
+        rule, _ = system.match(FormulaParser.parse("¬(P ∧ Q)"))
+        self.assertEqual(rule.name, "general")
+        self.assertIsNone(system.match(FormulaParser.parse("¬(P ∨ Q)")))
+        self.assertEqual(len(system), 2)
+
+    def test_unrelated_rules_do_not_change_matching(self):
+        """Test that many rules with other heads leave results unchanged."""
+        system = RewriteSystem(NNF_RULES)
+        for index in range(300):
+            system.add_rule(f"custom_{index}", f"R{index} ↔ A", "A", variables=["A"])
+        rule, _ = system.match(FormulaParser.parse("¬¬(P ↔ Q)"))
+        self.assertEqual(rule.name, "double_negation")
+        result = system.rewrite(FormulaParser.parse("R7 ↔ ¬(P ∨ Q)"))
+        self.assertEqual(result.rewrites, {"de_morgan_or": 1, "custom_7": 1})
+
+    def test_nary_patterns(self):
+        """Test patterns over n-ary operations."""
+        p, q, r = (Proposition(name=name) for name in "PQR")
+        a, b = Proposition(name="A"), Proposition(name="B")
+        system = RewriteSystem([("absorb", AndN(a, Not(operand=a), b), "A ∧ ¬A")])
+        result = system.rewrite(AndN(q, Not(operand=q), r))
+        self.assertEqual(result.expression.to_dict(), FormulaParser.parse("Q ∧ ¬Q").to_dict())
+        self.assertEqual(system.rewrite(AndN(p, q)).steps, 0)
+        self.assertIsInstance(system.rewrite(AndN(p, q)).expression, NaryOp)
+
+    def test_unchanged_subtrees_are_shared(self):
+        """Test copy-on-write rewriting."""
+        system = RewriteSystem(NNF_RULES)
+        untouched = FormulaParser.parse("(P → Q) ∧ R")
+        expr = BinaryOp(left=untouched, right=FormulaParser.parse("¬¬S"), operator="OR")
+        result = system.rewrite(expr)
+        self.assertIs(result.expression.left, untouched)
+        self.assertIs(system.rewrite(untouched).expression, untouched)
+
+    def test_step_budget(self):
+        """Test that non-terminating rule sets stop at the budget."""
+        system = RewriteSystem(STANDARD_RULES + DISTRIBUTIVE_RULES)
+        expr = FormulaParser.parse("P ∧ (Q ∨ (R ∧ S))")
+        result = system.rewrite(expr, max_steps=50)
+        self.assertFalse(result.complete)
+        self.assertEqual(result.steps, 50)
+        bdd = BDD()
+        self.assertEqual(bdd.compile(expr), bdd.compile(result.expression))
+
+    def test_default_budget_on_growing_terms(self):
+        """Test that rules deepening the term run to the default budget without recursion errors."""
+        system = RewriteSystem(STANDARD_RULES + DISTRIBUTIVE_RULES)
+        expr = FormulaParser.parse("P ∧ (Q ∨ R)")
+        bdd = BDD()
+        for strategy in ("innermost", "outermost"):
+            result = system.rewrite(expr, strategy=strategy)
+            self.assertEqual(bdd.compile(expr), bdd.compile(result.expression))
+        result = system.rewrite(expr)
+        self.assertFalse(result.complete)
+        self.assertEqual(result.steps, RewriteSystem.DEFAULT_MAX_STEPS)
+
+    def test_standard_rules_terminate(self):
+        """Test that the standard rules reach a fixpoint with the default budget."""
+        system = RewriteSystem(STANDARD_RULES)
+        for text in ("P ∧ (Q ∨ R)", "¬(P ∧ (Q ∧ ¬(R ∨ (S ∨ T))))"):
+            expr = FormulaParser.parse(text)
+            result = system.rewrite(expr)
+            self.assertTrue(result.complete)
+            bdd = BDD()
+            self.assertEqual(bdd.compile(expr), bdd.compile(result.expression))
+        deep = FormulaParser.parse("P")
+        for _ in range(5000):
+            deep = Not(operand=deep)
+        result = system.rewrite(deep)
+        self.assertTrue(result.complete)
+        self.assertEqual(result.expression.to_dict(), {"type": "Proposition", "name": "P"})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,166 @@
+import itertools
+import random
+import unittest
+
+from agent_logic.core.operations import BinaryOp, Not, Proposition
+from agent_logic.evaluation.cnf import CNFEncoder
+from agent_logic.evaluation.evaluator import Evaluator
+from agent_logic.evaluation.sat_solvers import (
+    CDCLSolver,
+    HornSAT,
+    TwoSAT,
+    classify_clauses,
+)
+
+
+def brute_force_sat(clauses, num_vars):
+    for bits in itertools.product([False, True], repeat=num_vars):
+        if all(any(bits[abs(l) - 1] == (l > 0) for l in c) for c in clauses):
+            return True
+    return False
+
+
+def satisfies(clauses, model):
+    return all(any(model[abs(l)] == (l > 0) for l in c) for c in clauses)
+
+
+class TestSATSolvers(unittest.TestCase):
+
+    def test_classification(self):
+        """Test detection of Horn, dual-Horn and 2-CNF clause sets."""
+        self.assertEqual(classify_clauses([[-1, -2, 3], [1]]), ["Horn"])
+        self.assertEqual(classify_clauses([[1, 2, -3]]), ["dual-Horn"])
+        self.assertEqual(classify_clauses([[1, 2], [-1, -2]]), ["2-CNF"])
+        self.assertEqual(classify_clauses([[1, 2, 3], [-1, -2, -3]]), [])
+
+    def test_horn_sat(self):
+        """Test minimal-model Horn-SAT."""
+        clauses = [[1], [-1, 2], [-2, -3, 4]]
+        self.assertEqual(HornSAT.solve(clauses, 4), {1: True, 2: True, 3: False, 4: False})
+        self.assertIsNone(HornSAT.solve(clauses + [[-2]], 4))
+
+    def test_two_sat(self):
+        """Test the SCC-based 2-SAT procedure."""
+        clauses = [[1, 2], [-1, 2], [-2, 3]]
+        model = TwoSAT.solve(clauses, 3)
+        self.assertTrue(satisfies(clauses, model))
+        self.assertIsNone(TwoSAT.solve(clauses + [[-3]], 3))
+
+    def test_solvers_agree_with_brute_force(self):
+        """Test every procedure against enumeration on random clause sets."""
+        rng = random.Random(7)
+        for _ in range(500):
+            n = rng.randint(1, 7)
+            clauses = [
+                sorted({rng.choice([1, -1]) * rng.randint(1, n) for _ in range(rng.randint(1, 3))})
+                for _ in range(rng.randint(1, 25))
+            ]
+            expected = brute_force_sat(clauses, n)
+            solver = CDCLSolver(n, clauses)
+            self.assertEqual(solver.solve(), expected)
+            if expected:
+                self.assertTrue(satisfies(clauses, solver.model))
+            classes = classify_clauses(clauses)
+            if "Horn" in classes:
+                self.assertEqual(HornSAT.solve(clauses, n) is not None, expected)
+            if "dual-Horn" in classes:
+                self.assertEqual(HornSAT.solve_dual(clauses, n) is not None, expected)
+            if "2-CNF" in classes:
+                self.assertEqual(TwoSAT.solve(clauses, n) is not None, expected)
+
+    def test_cdcl_assumptions_and_core(self):
+        """Test incremental solving under assumptions."""
+        solver = CDCLSolver(clauses=[[-1, 2], [-2, 3]])
+        self.assertTrue(solver.solve([1]))
+        self.assertTrue(solver.model[3])
+        self.assertFalse(solver.solve([1, 4, -3]))
+        self.assertEqual(set(solver.core), {1, -3})
+        self.assertTrue(solver.solve([-3]))
+
+    def test_tseitin_preserves_satisfiability(self):
+        """Test that the Tseitin encoding agrees with the direct encoding."""
+        p, q, r = (Proposition(name=n) for n in "PQR")
+        expr = BinaryOp(
+            left=BinaryOp(left=p, right=q, operator="IFF"),
+            right=Not(operand=BinaryOp(left=q, right=r, operator="IMPLIES")),
+            operator="AND",
+        )
+        direct = CNFEncoder.direct(expr)
+        tseitin = CNFEncoder.tseitin(expr)
+        self.assertEqual(direct.variables, ["P", "Q", "R"])
+        self.assertEqual(
+            brute_force_sat(direct.clauses, direct.num_vars),
+            brute_force_sat(tseitin.clauses, tseitin.num_vars),
+        )
+
+    def test_extended_operators_encode_exactly(self):
+        """Test that XOR/NAND/NOR clauses admit exactly the satisfying assignments."""
+        p, q = Proposition(name="P"), Proposition(name="Q")
+        for operator in ("XOR", "NAND", "NOR"):
+            for expr in (
+                BinaryOp(left=p, right=q, operator=operator),
+                Not(operand=BinaryOp(left=p, right=q, operator=operator)),
+            ):
+                for cnf in (CNFEncoder.direct(expr), CNFEncoder.tseitin(expr)):
+                    for a in (False, True):
+                        for b in (False, True):
+                            solver = CDCLSolver(cnf.num_vars, cnf.clauses)
+                            result = solver.solve(cnf.encode({"P": a, "Q": b}))
+                            self.assertEqual(result, expr.evaluate({"P": a, "Q": b}))
+
+
+class TestEvaluatorRouting(unittest.TestCase):
+
+    def setUp(self):
+        self.names = [Proposition(name=f"X{i}") for i in range(10)]
+
+    def chain(self, operator, operands):
+        expr = operands[0]
+        for operand in operands[1:]:
+            expr = BinaryOp(left=expr, right=operand, operator=operator)
+        return expr
+
+    def test_horn_formula_routed_to_horn_sat(self):
+        """Test that implication chains are classified as Horn."""
+        x = self.names
+        rules = [BinaryOp(left=x[i], right=x[i + 1], operator="IMPLIES") for i in range(9)]
+        expr = self.chain("AND", [x[0]] + rules)
+        self.assertEqual(Evaluator.classify(expr), "Horn")
+        model = Evaluator.find_model(expr)
+        self.assertTrue(all(model[f"X{i}"] for i in range(10)))
+        self.assertFalse(Evaluator.is_satisfiable(self.chain("AND", [expr, Not(operand=x[9])])))
+
+    def test_small_and_general_routes(self):
+        """Test the truth-table and CDCL fallbacks."""
+        x = self.names
+        small = self.chain(
+            "AND",
+            [
+                self.chain("OR", [x[0], x[1], Not(operand=x[2])]),
+                self.chain("OR", [Not(operand=x[0]), Not(operand=x[1]), x[2]]),
+            ],
+        )
+        self.assertEqual(Evaluator.classify(small), "small")
+        self.assertTrue(Evaluator.is_satisfiable(small))
+        wide = self.chain(
+            "AND",
+            [self.chain("OR", x[i:i + 3]) for i in range(0, 8)]
+            + [self.chain("OR", [Not(operand=v) for v in x[i:i + 3]]) for i in range(0, 8)],
+        )
+        self.assertEqual(Evaluator.classify(wide), "general")
+        model = Evaluator.find_model(wide)
+        self.assertTrue(wide.evaluate(model))
+
+    def test_validity_and_equivalence(self):
+        """Test validity and equivalence through the router."""
+        p, q = self.names[:2]
+        self.assertTrue(Evaluator.is_valid(BinaryOp(left=p, right=Not(operand=p), operator="OR")))
+        self.assertFalse(Evaluator.is_valid(BinaryOp(left=p, right=q, operator="OR")))
+        de_morgan_left = Not(operand=BinaryOp(left=p, right=q, operator="AND"))
+        de_morgan_right = BinaryOp(left=Not(operand=p), right=Not(operand=q), operator="OR")
+        self.assertTrue(Evaluator.are_equivalent(de_morgan_left, de_morgan_right))
+        self.assertFalse(Evaluator.are_equivalent(de_morgan_left, p))
+
+
+if __name__ == "__main__":
+    unittest.main()
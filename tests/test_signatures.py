@@ -0,0 +1,66 @@
+import random
+import unittest
+
+from agent_logic.core.operations import Proposition
+from agent_logic.evaluation import Evaluator, SemanticSignatures
+from agent_logic.parsing.formula_parser import FormulaParser
+
+from helpers import random_expression
+
+
+class TestSemanticSignatures(unittest.TestCase):
+
+    def test_equivalent_formulas_share_signatures(self):
+        """Test that signatures depend only on the formula's meaning."""
+        first = SemanticSignatures.signature(FormulaParser.parse("P → Q"))
+        second = SemanticSignatures.signature(FormulaParser.parse("¬Q → ¬P"))
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, SemanticSignatures.signature(FormulaParser.parse("Q → P")))
+        # Tautologies over different atoms are equivalent.
+        self.assertEqual(
+            SemanticSignatures.signature(FormulaParser.parse("P ∨ ¬P")),
+            SemanticSignatures.signature(FormulaParser.parse("Q → Q")),
+        )
+        self.assertEqual(SemanticSignatures.signature(FormulaParser.parse("P ∨ ¬P"), width=64), (1 << 64) - 1)
+        self.assertNotEqual(
+            SemanticSignatures.signature(FormulaParser.parse("P"), seed=1),
+            SemanticSignatures.signature(FormulaParser.parse("P"), seed=2),
+        )
+
+    def test_equivalence_classes_are_exact(self):
+        """Test bucketed classes against pairwise equivalence checks."""
+        rng = random.Random(48)
+        atoms = [Proposition(name=name) for name in "ABC"]
+        expressions = [random_expression(rng, atoms, 3, operators=["AND", "OR", "IMPLIES", "IFF", "XOR"], leaf=0.25) for _ in range(60)]
+        classes = SemanticSignatures.equivalence_classes(expressions)
+        self.assertEqual(sorted(i for members in classes for i in members), list(range(60)))
+        representatives = [members[0] for members in classes]
+        self.assertEqual(representatives, sorted(representatives))
+        self.assertEqual(SemanticSignatures.deduplicate(expressions), representatives)
+        for members in classes:
+            for index in members[1:]:
+                self.assertTrue(Evaluator.are_equivalent(expressions[members[0]], expressions[index]))
+        for position, first in enumerate(representatives):
+            for second in representatives[position + 1:]:
+                self.assertFalse(Evaluator.are_equivalent(expressions[first], expressions[second]))
+
+    def test_colliding_signatures_are_split(self):
+        """Test that the exact check separates formulas with equal signatures."""
+        expressions = [FormulaParser.parse(text) for text in ("P ∧ Q", "Q ∧ P", "P ∧ R", "R ∧ P")]
+        # With one random assignment, many inequivalent formulas collide.
+        buckets = SemanticSignatures.buckets(expressions, width=1, seed=3)
+        classes = SemanticSignatures.equivalence_classes(expressions, width=1, seed=3)
+        self.assertLessEqual(len(buckets), 2)
+        self.assertEqual(classes, [[0, 1], [2, 3]])
+
+    def test_process_pool(self):
+        """Test that worker processes give the same classes."""
+        expressions = [FormulaParser.parse(text) for text in ("P ∧ Q", "Q ∧ P", "P ∨ Q", "¬(¬P ∧ ¬Q)", "P")]
+        self.assertEqual(
+            SemanticSignatures.equivalence_classes(expressions, workers=2, chunk_size=1),
+            [[0, 1], [2, 3], [4]],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
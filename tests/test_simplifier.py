@@ -0,0 +1,162 @@
+import random
+import unittest
+
+from agent_logic.core.operations import AndN, BinaryOp, NaryOp, Not, OrN, Proposition
+from agent_logic.evaluation.bdd import BDD, FALSE, TRUE
+from agent_logic.parsing.formula_parser import FormulaParser
+from agent_logic.transformations import Simplifier
+
+from helpers import random_expression
+
+
+def compile_node(bdd, expr):
+    if isinstance(expr, bool):
+        return TRUE if expr else FALSE
+    return bdd.compile(expr)
+
+
+def size(expr):
+    if isinstance(expr, bool):
+        return 0
+    if isinstance(expr, Not):
+        return 1 + size(expr.operand)
+    if isinstance(expr, BinaryOp):
+        return 1 + size(expr.left) + size(expr.right)
+    if isinstance(expr, NaryOp):
+        return 1 + sum(size(operand) for operand in expr.operands)
+    return 1
+
+
+class TestSimplifier(unittest.TestCase):
+
+    def test_random_expressions_stay_equivalent(self):
+        """Test that simplification preserves the function and never grows double negations."""
+        rng = random.Random(31)
+        atoms = [Proposition(name=name) for name in "ABCD"]
+        for _ in range(200):
+            expr = random_expression(rng, atoms, 5, negation=0.15, negated_atoms=0.3)
+            result = Simplifier.simplify(expr)
+            bdd = BDD()
+            self.assertEqual(compile_node(bdd, expr), compile_node(bdd, result.expression))
+            self.assertTrue(result.complete)
+            self.assertEqual(result.steps, sum(result.rewrites.values()))
+            # A second pass finds nothing left to do.
+            again = Simplifier.simplify(result.expression) if not isinstance(result.expression, bool) else None
+            if again is not None:
+                self.assertEqual(again.steps, 0, expr)
+
+    def test_rules(self):
+        """Test each rule on a small example."""
+        cases = [
+            ("¬¬P", "P", "double_negation"),
+            ("¬(P ∨ Q)", "¬P ∧ ¬Q", "de_morgan"),
+            ("P ∧ P", "P", "idempotence"),
+            ("P ∧ (P ∨ Q)", "P", "absorption"),
+            ("(P ∨ Q) ∧ (P ∨ Q ∨ R)", "P ∨ Q", "subsumption"),
+        ]
+        for text, expected, rule in cases:
+            result = Simplifier.simplify(FormulaParser.parse(text))
+            self.assertEqual(result.expression.to_dict(), FormulaParser.parse(expected).to_dict(), text)
+            self.assertIn(rule, result.rewrites, text)
+
+    def test_constants(self):
+        """Test tautologies, contradictions and folding into residuals."""
+        self.assertIs(Simplifier.simplify(FormulaParser.parse("P ∨ ¬P")).expression, True)
+        self.assertIs(Simplifier.simplify(FormulaParser.parse("Q ∧ (P ∧ ¬P)")).expression, False)
+        self.assertIs(Simplifier.simplify(FormulaParser.parse("(P ∧ Q) ∨ ¬(P ∧ Q)")).expression, True)
+        self.assertIs(Simplifier.simplify(FormulaParser.parse("P → P")).expression, True)
+        result = Simplifier.simplify(FormulaParser.parse("(P ∨ ¬P) → Q"))
+        self.assertEqual(result.expression.to_dict(), {"type": "Proposition", "name": "Q"})
+        self.assertIn("constant_folding", result.rewrites)
+
+    def test_rewrites_inside_subterms(self):
+        """Test that rules fire below the root."""
+        expr = FormulaParser.parse("R → (¬¬P ∧ (P ∨ Q))")
+        result = Simplifier.simplify(expr)
+        self.assertEqual(result.expression.to_dict(), FormulaParser.parse("R → P").to_dict())
+
+    def test_nary_chains(self):
+        """Test simplification of n-ary operations."""
+        p, q, r = (Proposition(name=name) for name in "PQR")
+        expr = AndN(p, OrN(p, q), q, Not(operand=Not(operand=r)), q)
+        result = Simplifier.simplify(expr)
+        self.assertIsInstance(result.expression, NaryOp)
+        self.assertEqual(result.expression.to_dict(), AndN(p, q, r).to_dict())
+
+    def test_shared_subterms_simplified_once(self):
+        """Test memoization over shared and repeated subtrees."""
+        shared = FormulaParser.parse("¬¬P ∧ ¬¬Q")
+        expr = BinaryOp(
+            left=BinaryOp(left=shared, right=Proposition(name="R"), operator="IMPLIES"),
+            right=BinaryOp(left=shared, right=Proposition(name="S"), operator="IMPLIES"),
+            operator="IFF",
+        )
+        self.assertEqual(Simplifier.simplify(expr).rewrites, {"double_negation": 2})
+        copies = FormulaParser.parse("(¬¬P → R) ↔ (¬¬P → S)")
+        self.assertEqual(Simplifier.simplify(copies).rewrites, {"double_negation": 1})
+
+    def test_shared_chains_simplified_in_dag_size(self):
+        """Test that chains sharing sub-chains are not walked as trees."""
+        for operator in ("AND", "OR"):
+            node = Proposition(name="P")
+            for _ in range(60):
+                node = BinaryOp(left=node, right=node, operator=operator)
+            expr = BinaryOp(left=node, right=Not(operand=node), operator="IFF")
+            result = Simplifier.simplify(expr)
+            self.assertIs(result.expression, False)
+            self.assertEqual(result.rewrites["idempotence"], 60)
+
+            tail = BinaryOp(left=node, right=Proposition(name="Q"), operator=operator)
+            mixed = BinaryOp(left=Not(operand=node), right=tail, operator=operator)
+            result = Simplifier.simplify(mixed, max_steps=10)
+            self.assertFalse(result.complete)
+            bdd = BDD()
+            self.assertEqual(bdd.compile(mixed), bdd.compile(result.expression))
+
+    def test_unchanged_expression_is_reused(self):
+        """Test that expressions with nothing to rewrite are returned as-is."""
+        expr = FormulaParser.parse("(P ∧ Q) → (R ∨ ¬S)")
+        result = Simplifier.simplify(expr)
+        self.assertIs(result.expression, expr)
+        self.assertEqual(result.steps, 0)
+
+    def test_step_budget(self):
+        """Test that a spent budget stops rewriting but keeps equivalence."""
+        rng = random.Random(37)
+        atoms = [Proposition(name=name) for name in "ABC"]
+        expr = random_expression(rng, atoms, 6, negation=0.15, negated_atoms=0.3)
+        full = Simplifier.simplify(expr)
+        limited = Simplifier.simplify(expr, max_steps=1)
+        bdd = BDD()
+        self.assertEqual(compile_node(bdd, expr), compile_node(bdd, limited.expression))
+        if full.steps > limited.steps:
+            self.assertFalse(limited.complete)
+        self.assertLessEqual(size(full.expression), size(limited.expression))
+        nothing = Simplifier.simplify(FormulaParser.parse("¬¬P"), max_steps=0)
+        self.assertFalse(nothing.complete)
+        self.assertEqual(nothing.steps, 0)
+
+    def test_deep_expressions_do_not_recurse(self):
+        """Test inputs and rewrite cascades deeper than the interpreter's recursion limit."""
+        atoms = [Proposition(name=f"P{i}") for i in range(5000)]
+        implications = atoms[0]
+        for atom in atoms[1:]:
+            implications = BinaryOp(left=implications, right=atom, operator="IMPLIES")
+        self.assertIs(Simplifier.simplify(implications).expression, implications)
+
+        # ¬(P0 ∨ (P1 ∧ (P2 ∨ ...))) pushes De Morgan through every level.
+        alternating = atoms[-1]
+        for index in range(len(atoms) - 2, -1, -1):
+            alternating = BinaryOp(left=atoms[index], right=alternating, operator="AND" if index % 2 else "OR")
+        result = Simplifier.simplify(Not(operand=alternating))
+        self.assertEqual(result.rewrites, {"de_morgan": len(atoms) - 1})
+        self.assertEqual(result.expression.left.to_dict(), Not(operand=atoms[0]).to_dict())
+
+        negations = atoms[0]
+        for _ in range(5000):
+            negations = Not(operand=negations)
+        self.assertIs(Simplifier.simplify(negations).expression, atoms[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import json
+import os
+import tempfile
+import unittest
+
+from agent_logic.core.factory import ExpressionFactory
+from agent_logic.core.operations import BinaryOp, Not, Proposition
+from agent_logic.parsing.ast_parser import ASTParser
+from agent_logic.parsing.stream_reader import FormulaReader
+
+
+class TestFormulaReader(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.p = Proposition(name="P")
+        self.q = Proposition(name="Q")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, name, content):
+        path = os.path.join(self.directory.name, name)
+        with open(path, "w", encoding="utf-8") as handle:
+            handle.write(content)
+        return path
+
+    def test_text_lines(self):
+        """Test that textual formulas are parsed line by line, skipping blanks."""
+        path = self.write("formulas.txt", "P ∧ Q\n\n¬P\n")
+        expressions = list(FormulaReader(path))
+        self.assertEqual(expressions, [
+            BinaryOp(left=self.p, right=self.q, operator="AND"),
+            Not(operand=self.p),
+        ])
+
+    def test_jsonl_with_errors(self):
+        """Test that malformed records are reported without aborting the scan."""
+        good = BinaryOp(left=self.p, right=self.q, operator="OR").to_dict()
+        path = self.write(
+            "formulas.jsonl",
+            json.dumps(good) + "\n{broken\nP ->\n" + json.dumps({"type": "Unknown"}) + "\nQ\n",
+        )
+        failures = []
+        reader = FormulaReader(path, on_error=failures.append)
+        expressions = list(reader)
+        self.assertEqual(expressions, [BinaryOp(left=self.p, right=self.q, operator="OR"), self.q])
+        self.assertEqual([record.location for record in failures], [2, 3, 4])
+        self.assertEqual(reader.record_count, 5)
+        self.assertEqual(reader.error_count, 3)
+
+    def test_json_array_streaming(self):
+        """Test incremental decoding of a JSON array with a tiny read size."""
+        items = [Proposition(name=f"P{i}").to_dict() for i in range(50)]
+        items.append(Not(operand=self.q).to_dict())
+        path = self.write("formulas.json", "  \n" + json.dumps(items, indent=2))
+        reader = FormulaReader(path, read_size=7, json_decoder=ASTParser.parse_dict)
+        expressions = list(reader)
+        self.assertEqual(len(expressions), 51)
+        self.assertEqual(expressions[10], Proposition(name="P10"))
+        self.assertEqual(expressions[-1], Not(operand=self.q))
+
+    def test_json_array_numbers_and_truncation(self):
+        """Test bad elements, chunk-spanning scalars and a truncated array."""
+        path = self.write("formulas.json", '[{"type": "Proposition", "name": "P"}, 123456789, {"type"')
+        records = list(FormulaReader(path, read_size=4).records())
+        self.assertTrue(records[0].ok)
+        self.assertFalse(records[1].ok)
+        self.assertFalse(records[2].ok)
+        self.assertIn("JSONDecodeError", records[2].error)
+
+    def test_factory_shares_nodes(self):
+        """Test that a factory hash-conses nodes across records."""
+        path = self.write("formulas.txt", "P ∧ Q\nQ ∨ P\n")
+        factory = ExpressionFactory()
+        first, second = FormulaReader(path, factory=factory)
+        self.assertIs(first.left, second.right)
+
+    def test_parallel_matches_serial(self):
+        """Test that worker processes return the same records in order."""
+        lines = [f"A{i} → (B{i} ∨ ¬C)" if i % 7 else "(" for i in range(200)]
+        path = self.write("formulas.txt", "\n".join(lines))
+        serial = list(FormulaReader(path).records())
+        parallel = list(FormulaReader(path, workers=2, chunk_size=16).records())
+        self.assertEqual(
+            [(r.location, r.expression, r.error) for r in serial],
+            [(r.location, r.expression, r.error) for r in parallel],
+        )
+
+    def test_invalid_options(self):
+        """Test argument validation."""
+        with self.assertRaises(ValueError):
+            FormulaReader("x", layout="xml")
+        with self.assertRaises(ValueError):
+            FormulaReader("x", workers=2, factory=ExpressionFactory())
+
+
+if __name__ == "__main__":
+    unittest.main()